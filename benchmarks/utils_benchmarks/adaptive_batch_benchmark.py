@@ -0,0 +1,134 @@
+# Type Checking Imports
+# ---------------------
+from typing import Any, Dict, List
+
+# Standard Library Imports
+# ------------------------
+import argparse
+import statistics
+import time
+
+# Third Party Imports
+# -------------------
+from qtpy import QtCore
+
+# Local Imports
+# -------------
+from blackboard.utils.data_fetch_manager import AdaptiveBatchController, BatchTelemetry, DataFetcher
+from blackboard.utils.thread_pool import ThreadPoolManager
+
+
+# Constant Definitions
+# --------------------
+DEFAULT_ITEM_COUNT = 20_000
+# Simulated time in milliseconds to insert one item into a tree widget on the GUI thread
+DEFAULT_ITEM_COST = 0.05
+HEARTBEAT_INTERVAL = 1
+
+
+# Class Definitions
+# -----------------
+class Receiver(QtCore.QObject):
+    """Insert the fetched items with a simulated cost, and record a 1 ms heartbeat that shows how long the event loop stalls.
+    """
+
+    def __init__(self, event_loop: QtCore.QEventLoop, item_cost: float):
+        super().__init__()
+        self.event_loop = event_loop
+        self.item_cost = item_cost / 1000
+        self.items: List[Any] = []
+        self.heartbeats: List[float] = []
+        self.telemetry: List[BatchTelemetry] = []
+        self.end_time = 0.0
+
+    @QtCore.Slot(object)
+    def on_data_batch_fetched(self, data_batch: List[Any]):
+        # Busy wait, as inserting items keeps the GUI thread busy
+        end_time = time.perf_counter() + self.item_cost * len(data_batch)
+        while time.perf_counter() < end_time:
+            pass
+        self.items.extend(data_batch)
+
+    @QtCore.Slot(object)
+    def on_telemetry_recorded(self, telemetry: BatchTelemetry):
+        self.telemetry.append(telemetry)
+
+    @QtCore.Slot()
+    def on_heartbeat(self):
+        self.heartbeats.append(time.perf_counter())
+
+    @QtCore.Slot()
+    def on_loaded_all(self):
+        self.end_time = time.perf_counter()
+        self.event_loop.quit()
+
+
+# Function Definitions
+# --------------------
+def generate_rows(item_count: int):
+    for index in range(item_count):
+        yield {'id': index, 'name': f'task_{index:06d}', 'status': 'wip', 'shot': index % 500}
+
+def measure(item_count: int, item_cost: float, frame_budget: float) -> Dict[str, float]:
+    """Fetch all rows through a `DataFetcher` with the given frame budget, returning the GUI stall times and slice sizes.
+    """
+    event_loop = QtCore.QEventLoop()
+    receiver = Receiver(event_loop, item_cost)
+
+    data_fetcher = DataFetcher()
+    data_fetcher.batch_controller.frame_budget = frame_budget
+    data_fetcher.data_batch_fetched.connect(receiver.on_data_batch_fetched)
+    data_fetcher.telemetry_recorded.connect(receiver.on_telemetry_recorded)
+    data_fetcher.loaded_all.connect(receiver.on_loaded_all)
+
+    heartbeat_timer = QtCore.QTimer()
+    heartbeat_timer.setTimerType(QtCore.Qt.PreciseTimer)
+    heartbeat_timer.timeout.connect(receiver.on_heartbeat)
+    heartbeat_timer.start(HEARTBEAT_INTERVAL)
+
+    start_time = time.perf_counter()
+    data_fetcher.set_generator(generate_rows(item_count))
+    data_fetcher.fetch_all()
+    event_loop.exec_()
+    heartbeat_timer.stop()
+
+    assert len(receiver.items) == item_count
+
+    checkpoints = [start_time] + receiver.heartbeats + [receiver.end_time]
+    gaps = sorted(later - earlier for earlier, later in zip(checkpoints, checkpoints[1:]))
+    insertion_times = [telemetry.insertion_time for telemetry in receiver.telemetry]
+    return {
+        'total_ms': (receiver.end_time - start_time) * 1000,
+        'max_stall_ms': gaps[-1] * 1000,
+        'p99_stall_ms': gaps[int(len(gaps) * 0.99)] * 1000,
+        'mean_slice': statistics.mean(telemetry.item_count for telemetry in receiver.telemetry),
+        'max_slice_ms': max(insertion_times),
+    }
+
+def run(item_count: int, item_cost: float, frame_budget: float):
+    app = QtCore.QCoreApplication.instance() or QtCore.QCoreApplication([])
+
+    print(f"{'slicing':>22} {'total (ms)':>12} {'max stall (ms)':>15} {'p99 stall (ms)':>15} {'mean slice':>11} {'max slice (ms)':>15}")
+    cases = (('whole worker batches', float(AdaptiveBatchController.MAX_BATCH_SIZE)), (f'{frame_budget:g} ms budget', frame_budget))
+    for case_name, case_frame_budget in cases:
+        results = measure(item_count, item_cost, case_frame_budget)
+        print(
+            f"{case_name:>22} {results['total_ms']:>12.1f} {results['max_stall_ms']:>15.1f} "
+            f"{results['p99_stall_ms']:>15.1f} {results['mean_slice']:>11.0f} {results['max_slice_ms']:>15.1f}"
+        )
+
+    ThreadPoolManager.thread_pool().waitForDone()
+    del app
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare inserting fetched items in whole batches and in slices sized to a frame budget.")
+    parser.add_argument('--items', type=int, default=DEFAULT_ITEM_COUNT, help="Number of items generated.")
+    parser.add_argument('--item-cost', type=float, default=DEFAULT_ITEM_COST, help="Time in milliseconds to insert one item.")
+    parser.add_argument('--frame-budget', type=float, default=AdaptiveBatchController.DEFAULT_FRAME_BUDGET, help="Target time in milliseconds per slice.")
+    args = parser.parse_args()
+
+    run(args.items, args.item_cost, args.frame_budget)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,92 @@
+# Type Checking Imports
+# ---------------------
+from typing import Callable, List, Tuple
+
+# Standard Library Imports
+# ------------------------
+import argparse
+import os
+import random
+import tempfile
+import time
+
+# Local Imports
+# -------------
+from blackboard.utils.database import DatabaseManager, SQLiteModel
+
+
+# Constant Definitions
+# --------------------
+DEFAULT_ROW_COUNT = 1_000_000
+STATUSES = ['wip', 'review', 'approved', 'omit', 'on_hold']
+
+
+# Function Definitions
+# --------------------
+def create_database(db_path: str, row_count: int) -> DatabaseManager:
+    """Create a table of `row_count` shots with a secondary index, as a production tracking table would have.
+    """
+    db_manager = DatabaseManager(db_path)
+    model = db_manager.create_table('shots', {
+        'id': 'INTEGER PRIMARY KEY', 'name': 'TEXT', 'status': 'TEXT', 'frame_count': 'INTEGER', 'description': 'TEXT',
+    })
+
+    rng = random.Random(0)
+    model.insert_many(
+        {
+            'name': f'shot_{index:07d}',
+            'status': rng.choice(STATUSES),
+            'frame_count': rng.randint(24, 480),
+            'description': f'shot {index} of sequence {index // 1000}',
+        }
+        for index in range(row_count)
+    )
+    db_manager.cursor.execute("CREATE INDEX shots_status ON shots(status)")
+    db_manager.db_connection.commit()
+
+    return db_manager
+
+def time_alter(alter: Callable[[Callable[[int, int], None]], None]) -> Tuple[float, float, int]:
+    """Return the total time in milliseconds, the longest time between progress callbacks and the number of callbacks.
+    """
+    callback_times: List[float] = []
+    start_time = time.perf_counter()
+    alter(lambda copied, total: callback_times.append(time.perf_counter()))
+    end_time = time.perf_counter()
+
+    checkpoints = [start_time] + callback_times + [end_time]
+    longest_gap = max(later - earlier for earlier, later in zip(checkpoints, checkpoints[1:]))
+    return (end_time - start_time) * 1000, longest_gap * 1000, len(callback_times)
+
+def run(row_count: int, chunk_size: int):
+    with tempfile.TemporaryDirectory() as temp_dir:
+        db_manager = create_database(os.path.join(temp_dir, 'benchmark.db'), row_count)
+        model: SQLiteModel = db_manager.get_model('shots')
+        model.REBUILD_CHUNK_SIZE = chunk_size
+
+        cases = {
+            'add_field (ADD COLUMN)': lambda callback: model.add_field('notes', 'TEXT', progress_callback=callback),
+            'delete_field (DROP COLUMN)': lambda callback: model.delete_field('notes', progress_callback=callback),
+            'add_field (rebuild)': lambda callback: model.add_field('notes', 'TEXT', progress_callback=callback, force_rebuild=True),
+            'delete_field (rebuild)': lambda callback: model.delete_field('notes', progress_callback=callback, force_rebuild=True),
+        }
+
+        print(f"{'case':>28} {'total (ms)':>12} {'longest step (ms)':>18} {'callbacks':>10}")
+        for case_name, alter in cases.items():
+            total_time, longest_gap, callback_count = time_alter(alter)
+            print(f"{case_name:>28} {total_time:>12.1f} {longest_gap:>18.1f} {callback_count:>10}")
+
+        assert model.get_field_names() == ['id', 'name', 'status', 'frame_count', 'description']
+        db_manager.db_connection.close()
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare in-place ALTER TABLE with rebuilding the table in SQLiteModel.add_field and delete_field.")
+    parser.add_argument('--rows', type=int, default=DEFAULT_ROW_COUNT, help="Number of rows in the table.")
+    parser.add_argument('--chunk-size', type=int, default=SQLiteModel.REBUILD_CHUNK_SIZE, help="Number of rows copied per chunk of a rebuild.")
+    args = parser.parse_args()
+
+    run(args.rows, args.chunk_size)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,95 @@
+# Type Checking Imports
+# ---------------------
+from typing import Callable, Dict, List
+
+# Standard Library Imports
+# ------------------------
+import argparse
+import os
+import tempfile
+import time
+
+# Local Imports
+# -------------
+from blackboard.utils.database import DatabaseManager
+from blackboard.utils.database.sqlite_database import SQLiteModel
+
+
+# Constant Definitions
+# --------------------
+DEFAULT_ROW_COUNT = 5_000
+JOURNAL_MODES = ['WAL', 'DELETE']
+FIELDS = {
+    'id': 'INTEGER PRIMARY KEY',
+    'name': 'TEXT',
+    'status': 'TEXT',
+    'start_frame': 'INTEGER',
+    'end_frame': 'INTEGER',
+}
+
+
+# Function Definitions
+# --------------------
+def generate_records(row_count: int) -> List[Dict[str, object]]:
+    return [
+        {'name': f'shot_{index:06d}', 'status': 'wip', 'start_frame': 1001, 'end_frame': 1001 + index % 200}
+        for index in range(row_count)
+    ]
+
+def insert_single(model: SQLiteModel, records: List[Dict[str, object]]):
+    for record in records:
+        model.insert_record(record)
+
+def insert_bulk(model: SQLiteModel, records: List[Dict[str, object]]):
+    model.insert_many(records)
+
+def update_single(model: SQLiteModel, records: List[Dict[str, object]]):
+    for rowid in range(1, len(records) + 1):
+        model.update_record({'status': 'done'}, pk_value=rowid)
+
+def update_bulk(model: SQLiteModel, records: List[Dict[str, object]]):
+    model.update_many({'rowid': rowid, 'status': 'done'} for rowid in range(1, len(records) + 1))
+
+def measure(journal_mode: str, row_count: int, prepare: Callable, write: Callable) -> float:
+    """Run `write` against a fresh table and return the throughput in rows per second.
+    """
+    with tempfile.TemporaryDirectory() as temp_dir:
+        db_manager = DatabaseManager(os.path.join(temp_dir, 'benchmark.db'))
+        db_manager.connection.execute(f'PRAGMA journal_mode={journal_mode}')
+        model = db_manager.create_table('shots', FIELDS)
+
+        records = generate_records(row_count)
+        prepare(model, records)
+
+        start_time = time.perf_counter()
+        write(model, records)
+        elapsed_time = time.perf_counter() - start_time
+
+        db_manager.connection.close()
+
+    return row_count / elapsed_time
+
+def run(row_count: int):
+    cases = {
+        'insert single': (lambda model, records: None, insert_single),
+        'insert bulk': (lambda model, records: None, insert_bulk),
+        'update single': (insert_bulk, update_single),
+        'update bulk': (insert_bulk, update_bulk),
+    }
+
+    print(f"{'journal':>8} {'case':>14} {'rows/s':>12}")
+    for journal_mode in JOURNAL_MODES:
+        for case_name, (prepare, write) in cases.items():
+            rows_per_second = measure(journal_mode, row_count, prepare, write)
+            print(f"{journal_mode:>8} {case_name:>14} {rows_per_second:>12,.0f}")
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure single-row and bulk write throughput of SQLiteModel.")
+    parser.add_argument('--rows', type=int, default=DEFAULT_ROW_COUNT, help="Number of rows to write per case.")
+    args = parser.parse_args()
+
+    run(args.rows)
+
+
+if __name__ == '__main__':
+    main()
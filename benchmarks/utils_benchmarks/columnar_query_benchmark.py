@@ -0,0 +1,131 @@
+# Type Checking Imports
+# ---------------------
+from typing import Any, Callable, Tuple
+
+# Standard Library Imports
+# ------------------------
+import argparse
+import os
+import random
+import tempfile
+import time
+import tracemalloc
+
+# Third Party Imports
+# -------------------
+import numpy as np
+
+# Local Imports
+# -------------
+from blackboard.utils.database import DatabaseManager, SQLiteModel
+
+
+# Constant Definitions
+# --------------------
+DEFAULT_ROW_COUNT = 100_000
+DEFAULT_REPEAT = 5
+STATUSES = ['wip', 'review', 'approved', 'omit', 'on_hold']
+FIELDS = ['id', 'name', 'status', 'frame_count', 'duration', 'shot.name']
+
+
+# Function Definitions
+# --------------------
+def create_database(db_path: str, row_count: int) -> DatabaseManager:
+    db_manager = DatabaseManager(db_path)
+    db_manager.create_table('shots', {'id': 'INTEGER PRIMARY KEY', 'name': 'TEXT'})
+    db_manager.create_table('tasks', {
+        'id': 'INTEGER PRIMARY KEY', 'name': 'TEXT', 'status': 'TEXT', 'frame_count': 'INTEGER',
+        'duration': 'REAL', 'shot': 'INTEGER REFERENCES shots(id)',
+    })
+
+    rng = random.Random(0)
+    shot_count = max(row_count // 10, 1)
+    db_manager.get_model('shots').insert_many({'name': f'sh{index:05d}'} for index in range(shot_count))
+    db_manager.get_model('tasks').insert_many(
+        {
+            'name': f'task_{index:06d}',
+            'status': rng.choice(STATUSES),
+            'frame_count': rng.randint(24, 480),
+            'duration': rng.uniform(0.5, 40.0),
+            'shot': rng.randint(1, shot_count),
+        }
+        for index in range(row_count)
+    )
+    return db_manager
+
+def fetch_rows(model: SQLiteModel) -> Any:
+    return list(model.query(fields=FIELDS))
+
+def fetch_columns(model: SQLiteModel) -> Any:
+    chunks = list(model.query(fields=FIELDS, result_format='columnar'))
+    return {field: np.concatenate([chunk[field] for chunk in chunks]) for field in FIELDS}
+
+def summarize_rows(rows) -> Tuple[Any, ...]:
+    """Min/max of the numeric fields and the sort order by duration, as the color-range and sorting code does.
+    """
+    frame_counts = [row['frame_count'] for row in rows]
+    durations = [row['duration'] for row in rows]
+    order = sorted(range(len(rows)), key=lambda index: rows[index]['duration'])
+    return min(frame_counts), max(frame_counts), min(durations), max(durations), order[0]
+
+def summarize_columns(columns) -> Tuple[Any, ...]:
+    order = np.argsort(columns['duration'], kind='stable')
+    return (
+        columns['frame_count'].min(), columns['frame_count'].max(),
+        columns['duration'].min(), columns['duration'].max(), columns['id'][order[0]] - 1,
+    )
+
+def measure(fetch: Callable[[SQLiteModel], Any], summarize: Callable[[Any], Tuple], model: SQLiteModel,
+            repeat: int) -> Tuple[float, float, float, Tuple]:
+    """Return the mean fetch and summarize times in milliseconds, the peak memory in MiB, and the summary.
+    """
+    fetch_time = summarize_time = 0.0
+    for _ in range(repeat):
+        start_time = time.perf_counter()
+        result = fetch(model)
+        fetch_time += time.perf_counter() - start_time
+
+        start_time = time.perf_counter()
+        summary = summarize(result)
+        summarize_time += time.perf_counter() - start_time
+        del result
+
+    tracemalloc.start()
+    result = fetch(model)
+    peak_memory = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    del result
+
+    return fetch_time / repeat * 1000, summarize_time / repeat * 1000, peak_memory / 2**20, summary
+
+def run(row_count: int, repeat: int):
+    with tempfile.TemporaryDirectory() as temp_dir:
+        db_manager = create_database(os.path.join(temp_dir, 'benchmark.db'), row_count)
+        model = db_manager.get_model('tasks')
+
+        row_results = measure(fetch_rows, summarize_rows, model, repeat)
+        column_results = measure(fetch_columns, summarize_columns, model, repeat)
+
+        # Both formats must hold the same data
+        assert np.allclose(row_results[3], column_results[3])
+
+        print(f"{'format':>10} {'fetch (ms)':>12} {'rows/s':>12} {'min/max/sort (ms)':>18} {'peak (MiB)':>12}")
+        for format_name, (fetch_time, summarize_time, peak_memory, _) in (('dict', row_results), ('columnar', column_results)):
+            print(
+                f"{format_name:>10} {fetch_time:>12.1f} {row_count / fetch_time * 1000:>12,.0f} "
+                f"{summarize_time:>18.1f} {peak_memory:>12.1f}"
+            )
+
+        db_manager.db_connection.close()
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare the dict and columnar result formats of SQLiteModel.query.")
+    parser.add_argument('--rows', type=int, default=DEFAULT_ROW_COUNT, help="Number of rows in the table.")
+    parser.add_argument('--repeat', type=int, default=DEFAULT_REPEAT, help="Number of times each format is fetched.")
+    args = parser.parse_args()
+
+    run(args.rows, args.repeat)
+
+
+if __name__ == '__main__':
+    main()
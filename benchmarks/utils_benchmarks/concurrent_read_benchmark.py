@@ -0,0 +1,108 @@
+# Type Checking Imports
+# ---------------------
+from typing import List, Tuple
+
+# Standard Library Imports
+# ------------------------
+import argparse
+import os
+import tempfile
+import threading
+import time
+
+# Local Imports
+# -------------
+from blackboard.utils.database import DatabaseManager
+
+
+# Constant Definitions
+# --------------------
+DEFAULT_READER_COUNTS = [1, 2, 4, 8]
+DEFAULT_DURATION_SEC = 3.0
+ROW_COUNT = 20_000
+PAGE_SIZE = 200
+JOURNAL_MODES = ['WAL', 'DELETE']
+
+
+# Function Definitions
+# --------------------
+def percentile(values: List[float], fraction: float) -> float:
+    if not values:
+        return 0.0
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * fraction))]
+
+def run_case(journal_mode: str, reader_count: int, duration_sec: float) -> Tuple[float, float, float]:
+    """Run `reader_count` reader threads against one writer thread for `duration_sec` seconds.
+
+    Returns:
+        Tuple[float, float, float]: Pages read per second, rows written per second and p99 read latency in milliseconds.
+    """
+    with tempfile.TemporaryDirectory() as temp_dir:
+        db_manager = DatabaseManager(os.path.join(temp_dir, 'benchmark.db'), journal_mode=journal_mode)
+        model = db_manager.create_table('shots', {'id': 'INTEGER PRIMARY KEY', 'name': 'TEXT', 'status': 'TEXT'})
+        model.insert_many({'name': f'shot_{index:06d}', 'status': 'wip'} for index in range(ROW_COUNT))
+
+        stop_event = threading.Event()
+        latencies: List[List[float]] = [[] for _ in range(reader_count)]
+        written_rows = [0]
+        errors = []
+
+        def read(reader_index: int):
+            try:
+                while not stop_event.is_set():
+                    start_time = time.perf_counter()
+                    rows = model.query(fields=['id', 'name', 'status'], conditions={'status': 'wip'})
+                    for _ in zip(range(PAGE_SIZE), rows):
+                        pass
+                    rows.close()
+                    latencies[reader_index].append(time.perf_counter() - start_time)
+            except Exception as e:
+                errors.append(e)
+
+        def write():
+            try:
+                index = 0
+                while not stop_event.is_set():
+                    model.insert_record({'name': f'new_{index:06d}', 'status': 'wip'})
+                    index += 1
+                written_rows[0] = index
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=read, args=(reader_index,)) for reader_index in range(reader_count)]
+        threads.append(threading.Thread(target=write))
+
+        for thread in threads:
+            thread.start()
+        time.sleep(duration_sec)
+        stop_event.set()
+        for thread in threads:
+            thread.join()
+
+        db_manager.db_connection.close()
+
+    if errors:
+        raise errors[0]
+
+    all_latencies = [latency for reader_latencies in latencies for latency in reader_latencies]
+    return len(all_latencies) / duration_sec, written_rows[0] / duration_sec, percentile(all_latencies, 0.99) * 1000
+
+def run(reader_counts: List[int], duration_sec: float):
+    print(f"{'journal':>8} {'readers':>8} {'pages/s':>10} {'writes/s':>10} {'p99 (ms)':>10}")
+    for journal_mode in JOURNAL_MODES:
+        for reader_count in reader_counts:
+            pages_per_second, writes_per_second, p99_latency = run_case(journal_mode, reader_count, duration_sec)
+            print(f"{journal_mode:>8} {reader_count:>8} {pages_per_second:>10,.0f} {writes_per_second:>10,.0f} {p99_latency:>10.2f}")
+
+def main():
+    parser = argparse.ArgumentParser(description="Stress N concurrent readers against one writer on SQLiteDatabase.")
+    parser.add_argument('--readers', type=int, nargs='+', default=DEFAULT_READER_COUNTS, help="Reader thread counts to run.")
+    parser.add_argument('--duration', type=float, default=DEFAULT_DURATION_SEC, help="Duration of each case in seconds.")
+    args = parser.parse_args()
+
+    run(args.readers, args.duration)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,98 @@
+# Type Checking Imports
+# ---------------------
+from typing import Callable, List, Optional
+
+# Standard Library Imports
+# ------------------------
+import argparse
+import os
+import struct
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+
+# Third Party Imports
+# -------------------
+import numpy as np
+
+# Local Imports
+# -------------
+from blackboard.utils.decode_service import DecodeService
+from blackboard.utils.image_utils import ImageReader
+
+
+# Constant Definitions
+# --------------------
+DEFAULT_FILE_COUNT = 48
+DEFAULT_SOURCE_SIZE = (2048, 1080)
+WORKER_COUNTS = (1, 2, 4, 8)
+
+
+# Function Definitions
+# --------------------
+def write_dpx_10bit(file_path: str, image_data: np.ndarray):
+    """Write a minimal big-endian, uncompressed RGB DPX file of 10-bit filled pixels.
+    """
+    height, width = image_data.shape[:2]
+    header = bytearray(2048)
+    header[0:4] = b'SDPX'
+    struct.pack_into('>I', header, 4, len(header))
+    struct.pack_into('>II', header, 772, width, height)
+    header[800] = 50    # RGB
+    header[803] = 10
+    struct.pack_into('>HH', header, 804, 1, 0)
+
+    pixels = image_data.astype(np.uint32)
+    pixel_data = ((pixels[..., 0] << 22) | (pixels[..., 1] << 12) | (pixels[..., 2] << 2)).astype('>u4')
+    with open(file_path, 'wb') as file:
+        file.write(bytes(header))
+        file.write(pixel_data.tobytes())
+
+def write_sources(directory: str, file_count: int, source_size) -> List[str]:
+    width, height = source_size
+    rng = np.random.default_rng(0)
+    file_paths = []
+    for index in range(file_count):
+        file_path = os.path.join(directory, f'frame.{index:04d}.dpx')
+        write_dpx_10bit(file_path, rng.integers(0, 0x400, size=(height, width, 3)))
+        file_paths.append(file_path)
+    return file_paths
+
+def measure(read_image: Callable, file_paths: List[str], thread_count: int, target_height: Optional[int]) -> float:
+    """Decode all files from `thread_count` threads, returning the frames per second.
+    """
+    with ThreadPoolExecutor(max_workers=thread_count) as executor:
+        start_time = time.perf_counter()
+        for image_data in executor.map(partial(read_image, target_height=target_height), file_paths):
+            assert image_data is not None
+        return len(file_paths) / (time.perf_counter() - start_time)
+
+def run(file_count: int, source_size, target_height: Optional[int]):
+    with tempfile.TemporaryDirectory() as directory:
+        file_paths = write_sources(directory, file_count, source_size)
+        decoded_size = f"reduced to {target_height} px" if target_height else "at full resolution"
+        print(f"{file_count} 10-bit DPX frames of {source_size[0]}x{source_size[1]} decoded {decoded_size} on {os.cpu_count()} CPUs")
+        print(f"{'workers':>8} {'threads (fps)':>14} {'processes (fps)':>16}")
+
+        for worker_count in WORKER_COUNTS:
+            thread_fps = measure(ImageReader.read_image, file_paths, worker_count, target_height)
+
+            decode_service = DecodeService(max_workers=worker_count, small_file_size=0)
+            process_fps = measure(decode_service.read_image, file_paths, worker_count, target_height)
+            decode_service.shutdown()
+
+            print(f"{worker_count:>8} {thread_fps:>14.1f} {process_fps:>16.1f}")
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare DPX decode throughput on threads and on DecodeService worker processes.")
+    parser.add_argument('--files', type=int, default=DEFAULT_FILE_COUNT, help="Number of frames decoded per measurement.")
+    parser.add_argument('--source-size', type=int, nargs=2, default=DEFAULT_SOURCE_SIZE, metavar=('WIDTH', 'HEIGHT'), help="Size of the frames.")
+    parser.add_argument('--target-height', type=int, default=None, help="Decode at reduced resolution for thumbnails of this height.")
+    args = parser.parse_args()
+
+    run(args.files, tuple(args.source_size), args.target_height)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,175 @@
+# Type Checking Imports
+# ---------------------
+from typing import Dict, Optional, Tuple
+
+# Standard Library Imports
+# ------------------------
+import argparse
+import multiprocessing
+import os
+import struct
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+# Third Party Imports
+# -------------------
+import numpy as np
+
+# Local Imports
+# -------------
+from blackboard.utils.image_utils import DPXReader
+
+
+# Constant Definitions
+# --------------------
+DEFAULT_SOURCE_SIZE = (2048, 1080)
+DEFAULT_REPEAT_COUNT = 5
+
+# Format name to bit depth, packing, run-length encoding and byte order
+FORMATS: Dict[str, Tuple[int, int, bool, str]] = {
+    '8-bit': (8, 0, False, '>'),
+    '8-bit rle': (8, 0, True, '>'),
+    '10-bit filled': (10, 1, False, '>'),
+    '10-bit packed': (10, 0, False, '>'),
+    '16-bit be': (16, 0, False, '>'),
+    '16-bit le': (16, 0, False, '<'),
+}
+
+
+# Function Definitions
+# --------------------
+def encode_lines(image_data: np.ndarray, depth: int, packing: int, rle: bool, endianness: str) -> bytes:
+    """Encode the pixels of an RGB image as DPX image data.
+    """
+    height = image_data.shape[0]
+    components = image_data.reshape(height, -1).astype(np.uint64)
+
+    if rle:
+        # Runs of up to the longest count a datum holds, for rows made of a few flat bands
+        max_count = (1 << (depth - 1)) - 1
+        pixels = image_data.reshape(-1, 3)
+        run_starts = np.flatnonzero(np.r_[True, np.any(pixels[1:] != pixels[:-1], axis=1)])
+        run_ends = np.r_[run_starts[1:], len(pixels)]
+        datums = []
+        for run_start, run_end in zip(run_starts, run_ends):
+            for chunk_start in range(run_start, run_end, max_count):
+                count = min(max_count, run_end - chunk_start)
+                datums += [count << 1 | 1, *pixels[run_start]]
+        return np.array(datums).astype(f'{endianness}u{depth // 8}').tobytes()
+
+    if depth == 10 and packing == 0:
+        # Components back to back from the least significant bit of 32-bit words
+        words_per_line = -(-components.shape[1] * 10 // 32)
+        bit_positions = np.arange(components.shape[1]) * 10
+        shifts = (bit_positions & 31).astype(np.uint64)
+        words = np.zeros((height, words_per_line + 1), dtype=np.uint64)
+        for line_index in range(height):
+            values = components[line_index] << shifts
+            np.bitwise_or.at(words[line_index], bit_positions >> 5, values & 0xFFFFFFFF)
+            np.bitwise_or.at(words[line_index], (bit_positions >> 5) + 1, values >> np.uint64(32))
+        return words[:, :words_per_line].astype(f'{endianness}u4').tobytes()
+
+    if depth == 10:
+        pixels = image_data.astype(np.uint32)
+        return ((pixels[..., 0] << 22) | (pixels[..., 1] << 12) | (pixels[..., 2] << 2)).astype(f'{endianness}u4').tobytes()
+
+    # Pad each line to a 32-bit word
+    lines = components.astype(f'{endianness}u{depth // 8}')
+    line_data = np.zeros((height, -(-lines.shape[1] * lines.itemsize // 4) * 4), dtype=np.uint8)
+    line_data[:, :lines.shape[1] * lines.itemsize] = lines.view(np.uint8)
+    return line_data.tobytes()
+
+def write_dpx(file_path: str, image_data: np.ndarray, depth: int, packing: int, rle: bool, endianness: str):
+    """Write a minimal RGB DPX file.
+    """
+    height, width = image_data.shape[:2]
+    header = bytearray(2048)
+    header[0:4] = b'SDPX' if endianness == '>' else b'XPDS'
+    struct.pack_into(f'{endianness}I', header, 4, len(header))
+    struct.pack_into(f'{endianness}II', header, 772, width, height)
+    header[800] = 50    # RGB
+    header[803] = depth
+    struct.pack_into(f'{endianness}HH', header, 804, packing, 1 if rle else 0)
+
+    with open(file_path, 'wb') as file:
+        file.write(bytes(header))
+        file.write(encode_lines(image_data, depth, packing, rle, endianness))
+
+def write_sources(directory: str, source_size: Tuple[int, int]) -> Dict[str, str]:
+    """Write a source image in each measured format, with vertical bands so run-length encoding pays off.
+    """
+    width, height = source_size
+    band_values = np.random.default_rng(0).random((1, 64, 3))
+    image_data = np.repeat(band_values, -(-width // 64), axis=1)[:, :width]
+    image_data = np.repeat(image_data, height, axis=0)
+
+    file_paths = {}
+    for format_name, (depth, packing, rle, endianness) in FORMATS.items():
+        file_path = os.path.join(directory, f"{format_name.replace(' ', '_')}.dpx")
+        write_dpx(file_path, (image_data * ((1 << depth) - 1)).astype(np.uint32), depth, packing, rle, endianness)
+        file_paths[format_name] = file_path
+    return file_paths
+
+def reset_peak_rss():
+    """Reset the peak resident set size of the process to its current size, on Linux.
+    """
+    with open('/proc/self/clear_refs', 'w') as file:
+        file.write('5')
+
+def get_peak_rss() -> int:
+    """Get the peak resident set size of the process in bytes, on Linux.
+    """
+    with open('/proc/self/status') as file:
+        for line in file:
+            if line.startswith('VmHWM:'):
+                return int(line.split()[1]) * 1024
+    return 0
+
+def measure(file_path: str, output_dtype: Optional[str], copy: bool, repeat_count: int) -> Tuple[float, float]:
+    """Read the file and touch every pixel, returning the throughput in MB/s of image data at its bit
+    depth and the peak RSS growth in MB.
+    """
+    with open(file_path, 'rb') as file:
+        meta = DPXReader.read_dpx_metadata(file)
+    image_size = meta['width'] * meta['height'] * 3 * meta['depth'] / 8
+
+    reset_peak_rss()
+    base_rss = get_peak_rss()
+
+    start_time = time.perf_counter()
+    for _ in range(repeat_count):
+        image_data = DPXReader.read_dpx(file_path, output_dtype=output_dtype, copy=copy)
+        # Mapped views are only read when touched
+        image_data.max()
+        del image_data
+    wall_time = (time.perf_counter() - start_time) / repeat_count
+
+    return image_size / wall_time / 1024 / 1024, (get_peak_rss() - base_rss) / 1024 / 1024
+
+def run(source_size: Tuple[int, int], repeat_count: int):
+    print(f"{source_size[0]}x{source_size[1]} RGB, default output (8-bit uint8, otherwise float32) and native integers without copy")
+    print(f"{'source':>14} {'output':>8} {'MB/s':>8} {'peak RSS (MB)':>14}")
+
+    spawn_context = multiprocessing.get_context('spawn')
+    with tempfile.TemporaryDirectory() as directory:
+        for format_name, file_path in write_sources(directory, source_size).items():
+            depth = FORMATS[format_name][0]
+            for output_dtype in (None, 'uint8' if depth == 8 else 'uint16'):
+                # Measure in a fresh process, so memory freed by earlier measurements is not reused
+                with ProcessPoolExecutor(max_workers=1, mp_context=spawn_context) as executor:
+                    throughput, peak_rss = executor.submit(measure, file_path, output_dtype, output_dtype is None, repeat_count).result()
+                output_name = output_dtype or 'default'
+                print(f"{format_name:>14} {output_name:>8} {throughput:>8.0f} {peak_rss:>14.1f}")
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure DPXReader throughput and peak memory per DPX format, on Linux.")
+    parser.add_argument('--source-size', type=int, nargs=2, default=DEFAULT_SOURCE_SIZE, metavar=('WIDTH', 'HEIGHT'), help="Size of the images.")
+    parser.add_argument('--repeat', type=int, default=DEFAULT_REPEAT_COUNT, help="Number of reads per measurement to average the time.")
+    args = parser.parse_args()
+
+    run(tuple(args.source_size), args.repeat)
+
+
+if __name__ == '__main__':
+    main()
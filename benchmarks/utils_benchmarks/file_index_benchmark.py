@@ -0,0 +1,103 @@
+# Standard Library Imports
+# ------------------------
+import argparse
+import os
+import tempfile
+import time
+
+# Local Imports
+# -------------
+from blackboard.utils.file_index import FileIndex
+from blackboard.utils.file_path_utils import FilePathWalker
+
+
+# Constant Definitions
+# --------------------
+DEFAULT_FILE_COUNT = 1_000_000
+DEFAULT_FILES_PER_DIRECTORY = 100
+DEFAULT_FAN_OUT = 10
+DEFAULT_CHANGED_DIRECTORY_COUNT = 10
+
+
+# Function Definitions
+# --------------------
+def create_tree(root: str, file_count: int, files_per_directory: int, fan_out: int) -> list:
+    """Create a tree of empty frames, filling directories breadth first with `fan_out` subdirectories each.
+
+    Returns:
+        list: The paths of the directories created, including the root.
+    """
+    directory_count = -(-file_count // files_per_directory)
+    directories = [root]
+    for index in range(1, directory_count):
+        directory = os.path.join(directories[(index - 1) // fan_out], f'dir_{index:06d}')
+        os.mkdir(directory)
+        directories.append(directory)
+
+    for index in range(file_count):
+        directory = directories[index // files_per_directory]
+        with open(os.path.join(directory, f'beauty.{1001 + index % files_per_directory:04d}.exr'), 'wb'):
+            pass
+
+    return directories
+
+def crawl(root: str) -> int:
+    """Walk and stat every file, as browsing without an index does.
+    """
+    file_count = 0
+    for file_path in FilePathWalker.traverse_files(root):
+        os.stat(file_path)
+        file_count += 1
+    return file_count
+
+def run(file_count: int, files_per_directory: int, fan_out: int, changed_directory_count: int):
+    with tempfile.TemporaryDirectory() as root, tempfile.TemporaryDirectory() as index_directory:
+        directories = create_tree(root, file_count, files_per_directory, fan_out)
+        db_path = os.path.join(index_directory, 'file_index.db')
+        print(f"{file_count} files in {len(directories)} directories, {os.cpu_count()} CPUs")
+        print(f"{'operation':>36} {'seconds':>8}")
+
+        start_time = time.perf_counter()
+        crawled_count = crawl(root)
+        print(f"{'crawl and stat':>36} {time.perf_counter() - start_time:>8.2f}")
+
+        file_index = FileIndex(db_path)
+        start_time = time.perf_counter()
+        file_index.refresh(root)
+        print(f"{'build index':>36} {time.perf_counter() - start_time:>8.2f}")
+        file_index.close()
+
+        # Re-open the project: open the index, check for changes and read every record
+        start_time = time.perf_counter()
+        file_index = FileIndex(db_path)
+        scanned_count = file_index.refresh(root)
+        refresh_time = time.perf_counter() - start_time
+        indexed_count = sum(1 for _ in file_index.iter_files(root))
+        print(f"{'re-open and refresh':>36} {refresh_time:>8.2f}")
+        print(f"{'re-open, refresh and read all files':>36} {time.perf_counter() - start_time:>8.2f}")
+        assert scanned_count == 0 and indexed_count == crawled_count == file_count
+
+        # Add a frame to some directories
+        step = max(len(directories) // changed_directory_count, 1)
+        for directory in directories[::step][:changed_directory_count]:
+            with open(os.path.join(directory, 'beauty.9999.exr'), 'wb'):
+                pass
+
+        start_time = time.perf_counter()
+        scanned_count = file_index.refresh(root)
+        print(f"{f'refresh {scanned_count} changed directories':>36} {time.perf_counter() - start_time:>8.2f}")
+        file_index.close()
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure re-opening a project from a FileIndex against crawling it.")
+    parser.add_argument('--files', type=int, default=DEFAULT_FILE_COUNT, help="Number of files of the synthetic tree.")
+    parser.add_argument('--files-per-directory', type=int, default=DEFAULT_FILES_PER_DIRECTORY, help="Number of files in each directory.")
+    parser.add_argument('--fan-out', type=int, default=DEFAULT_FAN_OUT, help="Number of subdirectories of each directory.")
+    parser.add_argument('--changed', type=int, default=DEFAULT_CHANGED_DIRECTORY_COUNT, help="Number of directories changed before the last refresh.")
+    args = parser.parse_args()
+
+    run(args.files, args.files_per_directory, args.fan_out, args.changed)
+
+
+if __name__ == '__main__':
+    main()
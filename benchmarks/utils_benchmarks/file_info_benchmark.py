@@ -0,0 +1,112 @@
+# Type Checking Imports
+# ---------------------
+from typing import Callable, Dict, List
+
+# Standard Library Imports
+# ------------------------
+import argparse
+import datetime
+import grp
+import os
+import pwd
+import tempfile
+import time
+
+# Local Imports
+# -------------
+from blackboard.utils.file_path_utils import FileUtil
+
+
+# Constant Definitions
+# --------------------
+DEFAULT_FILE_COUNT = 10000
+DEFAULT_LATENCY_MS = 1.0
+DEFAULT_VISIBLE_COUNT = 50
+
+
+# Function Definitions
+# --------------------
+def slow_down_name_service(latency: float):
+    """Replace the user and group lookups with stubs that wait `latency` seconds per call, like a remote
+    LDAP or NIS name service.
+    """
+    def delay(look_up: Callable) -> Callable:
+        def look_up_slowly(id_: int):
+            time.sleep(latency)
+            return look_up(id_)
+        return look_up_slowly
+
+    pwd.getpwuid = delay(pwd.getpwuid)
+    grp.getgrgid = delay(grp.getgrgid)
+
+def write_files(directory: str, file_count: int) -> List[str]:
+    file_paths = []
+    for index in range(file_count):
+        file_path = os.path.join(directory, f'file_{index:06d}.txt')
+        with open(file_path, 'w') as file:
+            file.write('x' * index)
+        file_paths.append(file_path)
+    return file_paths
+
+def extract_file_info_uncached(file_path: str) -> Dict[str, str]:
+    """Extract the information of a file the way `FileUtil.extract_file_info` did before the names were
+    cached: stat the file, look its owner up and format every field.
+    """
+    file_info = os.stat(file_path)
+    return {
+        "file_name": os.path.basename(file_path),
+        "file_path": file_path,
+        "file_size": FileUtil.format_size(file_info.st_size),
+        "file_extension": FileUtil.get_file_extension(file_path),
+        "last_modified": datetime.datetime.fromtimestamp(file_info.st_mtime).strftime(FileUtil.DEFAULT_DATE_TIME_FORMAT),
+        "file_owner": pwd.getpwuid(os.stat(file_path).st_uid).pw_name,
+    }
+
+def list_uncached(directory: str, visible_count: int) -> int:
+    return len([extract_file_info_uncached(entry.path) for entry in os.scandir(directory)])
+
+def list_extract_file_info(directory: str, visible_count: int) -> int:
+    FileUtil.clear_name_cache()
+    return len([FileUtil.extract_file_info(entry.path) for entry in os.scandir(directory)])
+
+def list_lazy(directory: str, visible_count: int) -> int:
+    """List the files with lazy information, reading the fields of the visible rows only, as a view does.
+    """
+    FileUtil.clear_name_cache()
+    with os.scandir(directory) as entries:
+        file_infos = list(FileUtil.extract_file_infos(entries))
+    for file_info in file_infos[:visible_count]:
+        dict(file_info)
+    return len(file_infos)
+
+def run(file_count: int, latency: float, visible_count: int):
+    slow_down_name_service(latency)
+
+    with tempfile.TemporaryDirectory() as directory:
+        write_files(directory, file_count)
+
+        print(f"{file_count} files, {latency * 1000:g} ms per name service lookup, {visible_count} visible rows")
+        print(f"{'listing':>28} {'time (s)':>9} {'files/s':>10}")
+
+        for method_name, list_files in (
+            ('uncached extract_file_info', list_uncached),
+            ('cached extract_file_info', list_extract_file_info),
+            ('lazy extract_file_infos', list_lazy),
+        ):
+            start_time = time.perf_counter()
+            listed_count = list_files(directory, visible_count)
+            elapsed_time = time.perf_counter() - start_time
+            print(f"{method_name:>28} {elapsed_time:>9.3f} {listed_count / elapsed_time:>10.0f}")
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure extracting file information with a slow user name service.")
+    parser.add_argument('--files', type=int, default=DEFAULT_FILE_COUNT, help="Number of files to list.")
+    parser.add_argument('--latency-ms', type=float, default=DEFAULT_LATENCY_MS, help="Simulated latency of each name service lookup.")
+    parser.add_argument('--visible', type=int, default=DEFAULT_VISIBLE_COUNT, help="Number of rows whose fields are read by the lazy listing.")
+    args = parser.parse_args()
+
+    run(args.files, args.latency_ms / 1000, args.visible)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,114 @@
+# Type Checking Imports
+# ---------------------
+from typing import Dict, List
+
+# Standard Library Imports
+# ------------------------
+import argparse
+import os
+import tempfile
+import time
+from itertools import product
+
+# Local Imports
+# -------------
+from blackboard.utils.file_path_utils import FilePatternQuery
+
+
+# Constant Definitions
+# --------------------
+PATTERN = '{project}/{sequence}/{shot}/{department}/{version}'
+# Number of directories per level of the pattern
+DEFAULT_LEVEL_SIZES = (3, 12, 30, 6, 4)
+
+
+# Function Definitions
+# --------------------
+def get_level_names(level_sizes: List[int]) -> Dict[str, List[str]]:
+    variable_names = ['project', 'sequence', 'shot', 'department', 'version']
+    prefixes = ['show', 'sq', 'sh', 'dept', 'v']
+    return {
+        variable_name: [f'{prefix}{index:03d}' for index in range(level_size)]
+        for variable_name, prefix, level_size in zip(variable_names, prefixes, level_sizes)
+    }
+
+def create_tree(root: str, level_names: Dict[str, List[str]]) -> int:
+    """Create a directory for each combination of the names of the levels, with a file in each leaf.
+
+    Returns:
+        int: The number of leaf directories.
+    """
+    leaf_count = 0
+    for names in product(*level_names.values()):
+        leaf_directory = os.path.join(root, *names)
+        os.makedirs(leaf_directory)
+        with open(os.path.join(leaf_directory, 'comp.nk'), 'wb'):
+            pass
+        leaf_count += 1
+    return leaf_count
+
+def get_filter_cases(level_names: Dict[str, List[str]]) -> Dict[str, Dict[str, List[str]]]:
+    """Get filters with dozens of values for several variables, literal and with wildcards.
+    """
+    return {
+        'no filters': {},
+        'literal values': {
+            'project': level_names['project'][:2],
+            'sequence': level_names['sequence'][::2],
+            'shot': level_names['shot'][::2],
+            'department': level_names['department'][:4],
+            'version': level_names['version'][-2:],
+        },
+        'values with wildcards': {
+            'sequence': ['sq00*', 'sq01[0-1]'],
+            'shot': [f'sh0{tens}?' for tens in range(3)],
+            'version': ['v00[13]'],
+        },
+        'dozens of wildcards': {
+            'sequence': [f'{name}*' for name in level_names['sequence']],
+            'shot': [f'{name}*' for name in level_names['shot'][::2]],
+            'department': ['dept*'],
+            'version': [f'{name}*' for name in level_names['version']],
+        },
+    }
+
+def run(level_sizes: List[int], repeat_count: int):
+    level_names = get_level_names(level_sizes)
+
+    with tempfile.TemporaryDirectory() as root:
+        leaf_count = create_tree(root, level_names)
+        file_pattern_query = FilePatternQuery(os.path.join(root, PATTERN))
+        print(f"{leaf_count} leaf directories for {PATTERN}")
+        print(f"{'filters':>22} {'globs':>7} {'matches':>8} {'product+glob (s)':>17} {'matcher (s)':>12} {'speedup':>8}")
+
+        for case_name, filters in get_filter_cases(level_names).items():
+            timings = {}
+            for method_name, method in (('glob', file_pattern_query.construct_search_paths),
+                                        ('matcher', file_pattern_query.match_search_paths)):
+                elapsed_times = []
+                for _ in range(repeat_count):
+                    start_time = time.perf_counter()
+                    search_paths = sorted(set(method(filters)))
+                    elapsed_times.append(time.perf_counter() - start_time)
+                timings[method_name] = (min(elapsed_times), search_paths)
+
+            assert timings['glob'][1] == timings['matcher'][1], f"Different search paths for {case_name}"
+            glob_count = 1
+            for variable_name in level_names:
+                glob_count *= len(filters.get(variable_name) or ['*'])
+
+            glob_time, matcher_time = timings['glob'][0], timings['matcher'][0]
+            print(f"{case_name:>22} {glob_count:>7} {len(timings['matcher'][1]):>8} {glob_time:>17.3f} "
+                  f"{matcher_time:>12.3f} {glob_time / matcher_time:>7.1f}x")
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure FilePatternQuery search paths with product+glob against the compiled matcher.")
+    parser.add_argument('--level-sizes', type=int, nargs=5, default=DEFAULT_LEVEL_SIZES, help="Number of directories per level of the pattern.")
+    parser.add_argument('--repeat', type=int, default=3, help="Number of runs per method, keeping the fastest.")
+    args = parser.parse_args()
+
+    run(args.level_sizes, args.repeat)
+
+
+if __name__ == '__main__':
+    main()
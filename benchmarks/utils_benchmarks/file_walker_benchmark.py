@@ -0,0 +1,94 @@
+# Type Checking Imports
+# ---------------------
+from typing import List, Tuple
+
+# Standard Library Imports
+# ------------------------
+import argparse
+import os
+import tempfile
+import time
+from unittest import mock
+
+# Local Imports
+# -------------
+from blackboard.utils.file_path_utils import FilePathWalker
+
+
+# Constant Definitions
+# --------------------
+DEFAULT_FILE_COUNT = 500_000
+DEFAULT_FILES_PER_DIRECTORY = 100
+DEFAULT_FAN_OUT = 10
+DEFAULT_WORKER_COUNTS = (1, 2, 4, 8, 16)
+
+
+# Function Definitions
+# --------------------
+def create_tree(root: str, file_count: int, files_per_directory: int, fan_out: int) -> int:
+    """Create a tree of empty files, filling directories breadth first with `fan_out` subdirectories each.
+
+    Returns:
+        int: The number of directories created.
+    """
+    directory_count = -(-file_count // files_per_directory)
+    directories = [root]
+    for index in range(1, directory_count):
+        directory = os.path.join(directories[(index - 1) // fan_out], f'dir_{index:06d}')
+        os.mkdir(directory)
+        directories.append(directory)
+
+    for index in range(file_count):
+        directory = directories[index // files_per_directory]
+        with open(os.path.join(directory, f'shot.{index % files_per_directory:04d}.exr'), 'wb'):
+            pass
+
+    return len(directories)
+
+def measure(root: str, max_workers: int, is_ordered: bool, latency: float) -> Tuple[int, float]:
+    """Walk the tree, returning the number of files found and the files per second.
+    """
+    scan_directory = FilePathWalker.scan_directory
+
+    def scan_directory_with_latency(*args, **kwargs):
+        # Emulate the round trip of reading a directory over a network file system
+        time.sleep(latency)
+        return scan_directory(*args, **kwargs)
+
+    with mock.patch.object(FilePathWalker, 'scan_directory', staticmethod(scan_directory_with_latency)):
+        start_time = time.perf_counter()
+        file_count = sum(1 for _ in FilePathWalker.traverse_files(root, max_workers=max_workers, is_ordered=is_ordered))
+        elapsed_time = time.perf_counter() - start_time
+
+    return file_count, file_count / elapsed_time
+
+def run(file_count: int, files_per_directory: int, fan_out: int, worker_counts: List[int], latency: float):
+    with tempfile.TemporaryDirectory() as root:
+        start_time = time.perf_counter()
+        directory_count = create_tree(root, file_count, files_per_directory, fan_out)
+        print(f"Created {file_count} files in {directory_count} directories in {time.perf_counter() - start_time:.1f}s, "
+              f"{latency * 1000:g} ms latency per directory, {os.cpu_count()} CPUs")
+        print(f"{'workers':>8} {'ordered files/s':>16} {'unordered files/s':>18}")
+
+        for max_workers in worker_counts:
+            rates = []
+            for is_ordered in (True, False):
+                found_count, files_per_second = measure(root, max_workers, is_ordered, latency)
+                assert found_count == file_count, f"Found {found_count} of {file_count} files"
+                rates.append(files_per_second)
+            print(f"{max_workers:>8} {rates[0]:>16.0f} {rates[1]:>18.0f}")
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure FilePathWalker.traverse_files throughput for a number of worker threads.")
+    parser.add_argument('--files', type=int, default=DEFAULT_FILE_COUNT, help="Number of files of the synthetic tree.")
+    parser.add_argument('--files-per-directory', type=int, default=DEFAULT_FILES_PER_DIRECTORY, help="Number of files in each directory.")
+    parser.add_argument('--fan-out', type=int, default=DEFAULT_FAN_OUT, help="Number of subdirectories of each directory.")
+    parser.add_argument('--workers', type=int, nargs='+', default=DEFAULT_WORKER_COUNTS, help="Worker counts to measure.")
+    parser.add_argument('--latency-ms', type=float, default=0.0, help="Delay added to each directory read, to emulate a network file system.")
+    args = parser.parse_args()
+
+    run(args.files, args.files_per_directory, args.fan_out, args.workers, args.latency_ms / 1000)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,97 @@
+# Type Checking Imports
+# ---------------------
+from typing import Callable, Optional
+
+# Standard Library Imports
+# ------------------------
+import argparse
+import os
+import random
+import tempfile
+import time
+
+# Local Imports
+# -------------
+from blackboard.utils.database import DatabaseManager
+
+
+# Constant Definitions
+# --------------------
+DEFAULT_ROW_COUNT = 1_000_000
+DEFAULT_REPEAT = 5
+WORDS = [
+    'forest', 'night', 'city', 'rain', 'fog', 'desert', 'street', 'river', 'castle', 'storm',
+    'bridge', 'market', 'harbor', 'tunnel', 'canyon', 'glacier', 'village', 'temple', 'meadow', 'ruins',
+]
+# Selective terms, as typed into a text filter: a shot number prefix, a rare word and a phrase
+SEARCH_TERMS = ['001234', 'take42', 'glacier storm canyon']
+
+
+# Function Definitions
+# --------------------
+def create_database(db_path: str, row_count: int) -> DatabaseManager:
+    """Create a table of `row_count` shots with random descriptions, indexed for full-text search.
+    """
+    db_manager = DatabaseManager(db_path)
+    model = db_manager.create_table('shots', {'id': 'INTEGER PRIMARY KEY', 'name': 'TEXT', 'description': 'TEXT'})
+
+    rng = random.Random(0)
+    model.insert_many(
+        {'name': f'shot_{index:07d}', 'description': ' '.join(rng.choices(WORDS, k=6)) + f' take{index % 97}'}
+        for index in range(row_count)
+    )
+    model.create_fts_index(['name', 'description'])
+
+    return db_manager
+
+def time_search(search: Callable[[str], int], repeat: int) -> float:
+    """Return the mean time in milliseconds of one search over all search terms.
+    """
+    start_time = time.perf_counter()
+    for _ in range(repeat):
+        for term in SEARCH_TERMS:
+            search(term)
+    return (time.perf_counter() - start_time) / (repeat * len(SEARCH_TERMS)) * 1000
+
+def run(row_count: int, repeat: int, limit: Optional[int]):
+    with tempfile.TemporaryDirectory() as temp_dir:
+        db_manager = create_database(os.path.join(temp_dir, 'benchmark.db'), row_count)
+        model = db_manager.get_model('shots')
+
+        def search_like(term: str) -> int:
+            conditions = {'OR': {'name': {'contains': term}, 'description': {'contains': term}}}
+            rows = model.query(fields=['id', 'name'], conditions=conditions, limit=limit)
+            return sum(1 for _ in rows)
+
+        def search_match(term: str) -> int:
+            conditions = {'OR': {'name': {'match': f'"{term}"*'}, 'description': {'match': f'"{term}"*'}}}
+            rows = model.query(fields=['id', 'name'], conditions=conditions, limit=limit)
+            return sum(1 for _ in rows)
+
+        def search_ranked(term: str) -> int:
+            return sum(1 for _ in model.search(f'"{term}"*', limit=limit))
+
+        cases = {
+            'LIKE': search_like,
+            'MATCH': search_match,
+            'search (bm25)': search_ranked,
+        }
+
+        print(f"{'case':>14} {'ms/search':>12}")
+        for case_name, search in cases.items():
+            print(f"{case_name:>14} {time_search(search, repeat):>12.2f}")
+
+        db_manager.db_connection.close()
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare LIKE and FTS5 text filtering on SQLiteModel.")
+    parser.add_argument('--rows', type=int, default=DEFAULT_ROW_COUNT, help="Number of rows in the table.")
+    parser.add_argument('--repeat', type=int, default=DEFAULT_REPEAT, help="Number of times each search term is run.")
+    parser.add_argument('--limit', type=int, default=None, help="Maximum number of rows per search, e.g. one page.")
+    args = parser.parse_args()
+
+    run(args.rows, args.repeat, args.limit)
+
+
+if __name__ == '__main__':
+    main()
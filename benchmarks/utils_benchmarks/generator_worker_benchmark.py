@@ -0,0 +1,124 @@
+# Type Checking Imports
+# ---------------------
+from typing import Any, Dict, List, Optional
+
+# Standard Library Imports
+# ------------------------
+import argparse
+import time
+
+# Third Party Imports
+# -------------------
+from qtpy import QtCore
+
+# Local Imports
+# -------------
+from blackboard.utils.thread_pool import GeneratorWorker, ThreadPoolManager
+
+
+# Constant Definitions
+# --------------------
+DEFAULT_ITEM_COUNT = 100_000
+HEARTBEAT_INTERVAL = 1
+
+
+# Class Definitions
+# -----------------
+class Receiver(QtCore.QObject):
+    """Collect the items delivered to the GUI thread and a 1 ms heartbeat that shows how long the event loop stalls.
+    """
+
+    def __init__(self, event_loop: QtCore.QEventLoop):
+        super().__init__()
+        self.event_loop = event_loop
+        self.items: List[Any] = []
+        self.heartbeats: List[float] = []
+        self.end_time = 0.0
+        self.end_thread_time = 0.0
+
+    @QtCore.Slot(object)
+    def on_result(self, item: Any):
+        self.items.append(item)
+
+    @QtCore.Slot(object)
+    def on_results_batch(self, batch: List[Any]):
+        self.items.extend(batch)
+
+    @QtCore.Slot()
+    def on_heartbeat(self):
+        self.heartbeats.append(time.perf_counter())
+
+    @QtCore.Slot()
+    def on_finished(self):
+        self.end_time = time.perf_counter()
+        self.end_thread_time = time.thread_time()
+        self.event_loop.quit()
+
+
+# Function Definitions
+# --------------------
+def generate_rows(item_count: int):
+    for index in range(item_count):
+        yield {'id': index, 'name': f'task_{index:06d}', 'status': 'wip', 'shot': index % 500}
+
+def measure(item_count: int, batch_size: Optional[int]) -> Dict[str, float]:
+    """Deliver `item_count` rows from a pool thread to the GUI thread, returning the throughput, the GUI stall
+    times and the CPU time spent by the GUI thread to receive the rows.
+    """
+    event_loop = QtCore.QEventLoop()
+    receiver = Receiver(event_loop)
+
+    worker = GeneratorWorker(generate_rows(item_count), batch_size=batch_size)
+    worker.result.connect(receiver.on_result)
+    worker.results_batch.connect(receiver.on_results_batch)
+    worker.finished.connect(receiver.on_finished)
+
+    heartbeat_timer = QtCore.QTimer()
+    heartbeat_timer.setTimerType(QtCore.Qt.PreciseTimer)
+    heartbeat_timer.timeout.connect(receiver.on_heartbeat)
+    heartbeat_timer.start(HEARTBEAT_INTERVAL)
+
+    start_time = time.perf_counter()
+    start_thread_time = time.thread_time()
+    ThreadPoolManager.thread_pool().start(worker.run)
+    event_loop.exec_()
+    heartbeat_timer.stop()
+
+    assert len(receiver.items) == item_count
+
+    checkpoints = [start_time] + receiver.heartbeats + [receiver.end_time]
+    gaps = sorted(later - earlier for earlier, later in zip(checkpoints, checkpoints[1:]))
+    total_time = receiver.end_time - start_time
+    return {
+        'items_per_second': item_count / total_time,
+        'total_ms': total_time * 1000,
+        'max_stall_ms': gaps[-1] * 1000,
+        'p99_stall_ms': gaps[int(len(gaps) * 0.99)] * 1000,
+        'gui_cpu_ms': (receiver.end_thread_time - start_thread_time) * 1000,
+    }
+
+def run(item_count: int, batch_size: int):
+    app = QtCore.QCoreApplication.instance() or QtCore.QCoreApplication([])
+
+    print(f"{'delivery':>10} {'items/s':>12} {'total (ms)':>12} {'max stall (ms)':>15} {'p99 stall (ms)':>15} {'GUI CPU (ms)':>13}")
+    for delivery, delivery_batch_size in (('per-item', None), ('batched', batch_size)):
+        results = measure(item_count, delivery_batch_size)
+        print(
+            f"{delivery:>10} {results['items_per_second']:>12,.0f} {results['total_ms']:>12.1f} "
+            f"{results['max_stall_ms']:>15.1f} {results['p99_stall_ms']:>15.1f} {results['gui_cpu_ms']:>13.1f}"
+        )
+
+    ThreadPoolManager.thread_pool().waitForDone()
+    del app
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare per-item and batched delivery of GeneratorWorker results to the GUI thread.")
+    parser.add_argument('--items', type=int, default=DEFAULT_ITEM_COUNT, help="Number of items generated.")
+    parser.add_argument('--batch-size', type=int, default=GeneratorWorker.DEFAULT_BATCH_SIZE, help="Number of items per batch.")
+    args = parser.parse_args()
+
+    run(args.items, args.batch_size)
+
+
+if __name__ == '__main__':
+    main()
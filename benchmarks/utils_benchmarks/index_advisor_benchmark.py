@@ -0,0 +1,144 @@
+# Type Checking Imports
+# ---------------------
+from typing import Any, Dict, List, Tuple
+
+# Standard Library Imports
+# ------------------------
+import argparse
+import os
+import random
+import tempfile
+import time
+
+# Local Imports
+# -------------
+from blackboard.utils.database import DatabaseManager
+
+
+# Constant Definitions
+# --------------------
+DEFAULT_TASK_COUNT = 200_000
+DEFAULT_REPEAT = 5
+PAGE_SIZE = 200
+STATUSES = ['wip', 'review', 'approved', 'omit', 'on_hold']
+
+# The production schema used by the `SQLQueryBuilder` example
+SCHEMA = {
+    'Projects': {'id': 'INTEGER PRIMARY KEY', 'name': 'TEXT'},
+    'Sequences': {'id': 'INTEGER PRIMARY KEY', 'name': 'TEXT', 'project': 'INTEGER REFERENCES Projects(id)'},
+    'Shots': {'id': 'INTEGER PRIMARY KEY', 'name': 'TEXT', 'status': 'TEXT', 'sequence': 'INTEGER REFERENCES Sequences(id)'},
+    'Users': {'id': 'INTEGER PRIMARY KEY', 'email': 'TEXT', 'role': 'TEXT'},
+    'Tasks': {
+        'id': 'INTEGER PRIMARY KEY', 'name': 'TEXT', 'status': 'TEXT', 'due_date': 'TEXT',
+        'shot': 'INTEGER REFERENCES Shots(id)', 'assigned_to': 'INTEGER REFERENCES Users(id)',
+    },
+    'Assets': {'id': 'INTEGER PRIMARY KEY', 'name': 'TEXT', 'task': 'INTEGER REFERENCES Tasks(id)'},
+}
+
+# Filters and sorts as applied from the filter bar and the column headers of a database view
+QUERIES: Dict[str, Dict[str, Any]] = {
+    'filter status': {'conditions': {'status': {'eq': 'review'}}},
+    'filter due date range': {'conditions': {'due_date': {'between': ['2025-03-01', '2025-03-07']}}},
+    'filter assigned_to': {'conditions': {'assigned_to': {'in': [3, 7, 11]}}},
+    'sort by shot (fk)': {'order_by': {'shot': 'ASC'}},
+    'filter shot.status': {'conditions': {'shot.status': {'eq': 'omit'}}, 'fields': ['name', 'shot.name']},
+    'one-to-many assets': {
+        'conditions': {'status': {'eq': 'approved'}},
+        'fields': ['id', 'name', 'assets.name'],
+        'relationships': {'Tasks.assets': 'Assets.task', 'Assets.task': 'Tasks.id'},
+    },
+}
+
+
+# Function Definitions
+# --------------------
+def create_database(db_path: str, task_count: int) -> DatabaseManager:
+    db_manager = DatabaseManager(db_path)
+    for table_name, fields in SCHEMA.items():
+        db_manager.create_table(table_name, fields)
+
+    rng = random.Random(0)
+    shot_count = max(task_count // 10, 1)
+    db_manager.get_model('Projects').insert_many({'name': f'project_{index}'} for index in range(10))
+    db_manager.get_model('Sequences').insert_many(
+        {'name': f'seq_{index:03d}', 'project': index % 10 + 1} for index in range(200)
+    )
+    db_manager.get_model('Shots').insert_many(
+        {'name': f'sh{index:05d}', 'status': rng.choice(STATUSES), 'sequence': index % 200 + 1} for index in range(shot_count)
+    )
+    db_manager.get_model('Users').insert_many(
+        {'email': f'user_{index}@studio.com', 'role': 'Artist'} for index in range(100)
+    )
+    db_manager.get_model('Tasks').insert_many(
+        {
+            'name': f'task_{index:06d}',
+            'status': rng.choice(STATUSES),
+            'due_date': f'2025-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}',
+            'shot': rng.randint(1, shot_count),
+            'assigned_to': rng.randint(1, 100),
+        }
+        for index in range(task_count)
+    )
+    db_manager.get_model('Assets').insert_many(
+        {'name': f'asset_{index:06d}', 'task': rng.randint(1, task_count)} for index in range(task_count // 4)
+    )
+
+    return db_manager
+
+def time_queries(db_manager: DatabaseManager, repeat: int) -> Dict[str, Tuple[float, float]]:
+    """Return the mean times in milliseconds to fetch the first page and all rows of each query.
+    """
+    model = db_manager.get_model('Tasks')
+    timings = {}
+    for query_name, query_kwargs in QUERIES.items():
+        query_kwargs = {'fields': ['id', 'name', 'status'], **query_kwargs}
+        query_timings = []
+        for limit in (PAGE_SIZE, None):
+            start_time = time.perf_counter()
+            for _ in range(repeat):
+                sum(1 for _ in model.query(limit=limit, **query_kwargs))
+            query_timings.append((time.perf_counter() - start_time) / repeat * 1000)
+        timings[query_name] = tuple(query_timings)
+    return timings
+
+def run(task_count: int, repeat: int):
+    with tempfile.TemporaryDirectory() as temp_dir:
+        db_manager = create_database(os.path.join(temp_dir, 'benchmark.db'), task_count)
+
+        before_timings = time_queries(db_manager, repeat)
+
+        suggestions: List[Tuple[str, str]] = [
+            (suggestion.index_name, suggestion.reason) for suggestion in db_manager.get_index_suggestions()
+        ]
+        db_manager.create_suggested_indexes()
+
+        after_timings = time_queries(db_manager, repeat)
+        advised_indexes = db_manager.get_advised_indexes()
+
+        db_manager.db_connection.close()
+
+    print("Suggested indexes:")
+    for index_name, reason in suggestions:
+        table_name, fields = advised_indexes.get(index_name, ('?', []))
+        print(f"  {index_name:<28} {table_name}({', '.join(fields)})  <- {reason}")
+
+    print()
+    print(f"{'':>24} {'first page (ms)':^30} {'all rows (ms)':^30}")
+    print(f"{'query':>24}" + f" {'before':>9} {'after':>9} {'speedup':>10}" * 2)
+    for query_name in QUERIES:
+        line = f"{query_name:>24}"
+        for before_time, after_time in zip(before_timings[query_name], after_timings[query_name]):
+            line += f" {before_time:>9.2f} {after_time:>9.2f} {before_time / after_time:>9.1f}x"
+        print(line)
+
+def main():
+    parser = argparse.ArgumentParser(description="Report query timings before and after creating the indexes suggested by the index advisor.")
+    parser.add_argument('--tasks', type=int, default=DEFAULT_TASK_COUNT, help="Number of rows in the Tasks table.")
+    parser.add_argument('--repeat', type=int, default=DEFAULT_REPEAT, help="Number of times each query is run.")
+    args = parser.parse_args()
+
+    run(args.tasks, args.repeat)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,82 @@
+# Type Checking Imports
+# ---------------------
+from typing import Callable, Dict, Optional, Tuple
+
+# Standard Library Imports
+# ------------------------
+import argparse
+import pickle
+import time
+
+# Third Party Imports
+# -------------------
+import numpy as np
+
+# Local Imports
+# -------------
+from blackboard.utils.lru_cache import LRUCache
+
+
+# Constant Definitions
+# --------------------
+# A 2K RGBA float32 frame, and a 4K one, about 34 MB and 134 MB
+FRAME_SHAPES = {'2K': (1080, 2048, 4), '4K': (2160, 4096, 4)}
+DEFAULT_FRAME_COUNT = 24
+DEFAULT_CACHED_FRAMES = 8
+
+
+# Function Definitions
+# --------------------
+def pickle_sizer(obj) -> int:
+    """The size measurement of the previous implementation, which serializes the whole object.
+    """
+    return len(pickle.dumps(obj))
+
+def measure(frames: Dict[int, np.ndarray], cached_frames: int, sizer: Optional[Callable]) -> Tuple[float, float]:
+    """Play the frames twice through a cache holding `cached_frames` frames, returning the mean time
+    per miss and per hit in milliseconds, excluding the time to produce the frames.
+    """
+    frame_size = next(iter(frames.values())).nbytes
+    cache = LRUCache(max_memory=frame_size * cached_frames, sizer=sizer)
+    read_frame = cache(frames.__getitem__)
+
+    # Every frame misses and is sized, then the cached frames are read again
+    start_time = time.perf_counter()
+    for frame in frames:
+        read_frame(frame)
+    miss_time = (time.perf_counter() - start_time) / len(frames)
+
+    recent_frames = list(frames)[-cached_frames:]
+    repeat_count = 1000
+    start_time = time.perf_counter()
+    for _ in range(repeat_count):
+        for frame in recent_frames:
+            read_frame(frame)
+    hit_time = (time.perf_counter() - start_time) / (repeat_count * len(recent_frames))
+
+    info = cache.cache_info()
+    assert info.misses == len(frames) and info.evictions == len(frames) - cached_frames
+    return miss_time * 1000, hit_time * 1000
+
+def run(frame_count: int, cached_frames: int, resolution: str):
+    rng = np.random.default_rng(0)
+    template = rng.random(FRAME_SHAPES[resolution], dtype=np.float32)
+    frames = {frame: template + frame for frame in range(frame_count)}
+
+    print(f"{'sizer':>10} {'miss overhead (ms)':>19} {'hit overhead (us)':>18}")
+    for sizer_name, sizer in (('pickle', pickle_sizer), ('nbytes', None)):
+        miss_time, hit_time = measure(frames, cached_frames, sizer)
+        print(f"{sizer_name:>10} {miss_time:>19.3f} {hit_time * 1000:>18.2f}")
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure the per-call overhead of LRUCache on NumPy frames, sized by pickling or by nbytes.")
+    parser.add_argument('--frames', type=int, default=DEFAULT_FRAME_COUNT, help="Number of distinct frames read.")
+    parser.add_argument('--cached-frames', type=int, default=DEFAULT_CACHED_FRAMES, help="Number of frames that fit in the cache.")
+    parser.add_argument('--resolution', choices=sorted(FRAME_SHAPES), default='2K', help="Resolution of the float32 RGBA frames.")
+    args = parser.parse_args()
+
+    run(args.frames, args.cached_frames, args.resolution)
+
+
+if __name__ == '__main__':
+    main()
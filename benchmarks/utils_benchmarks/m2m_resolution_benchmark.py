@@ -0,0 +1,94 @@
+# Type Checking Imports
+# ---------------------
+from typing import List
+
+# Standard Library Imports
+# ------------------------
+import argparse
+import os
+import random
+import tempfile
+import time
+
+# Local Imports
+# -------------
+from blackboard.utils.database import DatabaseManager
+
+
+# Constant Definitions
+# --------------------
+DEFAULT_ROW_COUNTS = [1_000, 10_000, 100_000]
+TAG_COUNT = 50
+TAGS_PER_SHOT = 3
+
+
+# Function Definitions
+# --------------------
+def create_database(db_path: str, row_count: int) -> DatabaseManager:
+    """Create a database with `row_count` shots, each linked to a few tags through a junction table.
+    """
+    db_manager = DatabaseManager(db_path)
+    db_manager.create_table('shots', {'id': 'INTEGER PRIMARY KEY', 'name': 'TEXT', 'status': 'TEXT'})
+    db_manager.create_table('tags', {'id': 'INTEGER PRIMARY KEY', 'name': 'TEXT'})
+    db_manager.create_junction_table(from_table='shots', to_table='tags', track_field_name='tags')
+
+    cursor = db_manager.connection.cursor()
+    cursor.executemany(
+        "INSERT INTO tags (id, name) VALUES (?, ?)",
+        ((tag_id, f'tag_{tag_id:02d}') for tag_id in range(1, TAG_COUNT + 1))
+    )
+    cursor.executemany(
+        "INSERT INTO shots (id, name, status) VALUES (?, ?, ?)",
+        ((shot_id, f'shot_{shot_id:06d}', 'wip') for shot_id in range(1, row_count + 1))
+    )
+
+    rng = random.Random(0)
+    cursor.executemany(
+        "INSERT INTO shots_tags (shots_id, tags_id) VALUES (?, ?)",
+        (
+            (shot_id, tag_id)
+            for shot_id in range(1, row_count + 1)
+            for tag_id in rng.sample(range(1, TAG_COUNT + 1), TAGS_PER_SHOT)
+        )
+    )
+    db_manager.connection.commit()
+    cursor.close()
+
+    return db_manager
+
+def time_query(db_manager: DatabaseManager, eager_m2m: bool) -> float:
+    """Consume a full `query(handle_m2m=True)` generator and return the elapsed time in seconds.
+    """
+    model = db_manager.get_model('shots')
+
+    start_time = time.perf_counter()
+    row_count = sum(1 for _ in model.query(handle_m2m=True, eager_m2m=eager_m2m))
+    elapsed_time = time.perf_counter() - start_time
+
+    assert row_count > 0
+    return elapsed_time
+
+def run(row_counts: List[int]):
+    print(f"{'rows':>10} {'per-row (s)':>14} {'batched (s)':>14} {'speedup':>10}")
+
+    for row_count in row_counts:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            db_manager = create_database(os.path.join(temp_dir, 'benchmark.db'), row_count)
+
+            per_row_time = time_query(db_manager, eager_m2m=False)
+            batched_time = time_query(db_manager, eager_m2m=True)
+
+            db_manager.connection.close()
+
+        print(f"{row_count:>10} {per_row_time:>14.3f} {batched_time:>14.3f} {per_row_time / batched_time:>9.1f}x")
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare per-row and batched many-to-many resolution in SQLiteModel.query.")
+    parser.add_argument('--rows', type=int, nargs='+', default=DEFAULT_ROW_COUNTS, help="Row counts to benchmark.")
+    args = parser.parse_args()
+
+    run(args.rows)
+
+
+if __name__ == '__main__':
+    main()
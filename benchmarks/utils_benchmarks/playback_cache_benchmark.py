@@ -0,0 +1,163 @@
+# Type Checking Imports
+# ---------------------
+from typing import List, Optional, Tuple
+
+# Standard Library Imports
+# ------------------------
+import argparse
+import os
+import struct
+import tempfile
+import time
+
+# Third Party Imports
+# -------------------
+import numpy as np
+from qtpy import QtCore, QtWidgets
+
+# Local Imports
+# -------------
+from blackboard.utils.image_utils import ImageSequence
+from blackboard.utils.playback_cache import PlaybackCache, FrameState
+from blackboard.utils.thread_pool import ThreadPoolManager
+
+
+# Constant Definitions
+# --------------------
+DEFAULT_FRAME_COUNT = 200
+DEFAULT_SOURCE_SIZE = (2048, 1080)
+FIRST_FRAME = 1001
+
+
+# Function Definitions
+# --------------------
+def write_dpx_10bit(file_path: str, image_data: np.ndarray):
+    """Write a minimal big-endian, uncompressed RGB DPX file of 10-bit filled pixels.
+    """
+    height, width = image_data.shape[:2]
+    header = bytearray(2048)
+    header[0:4] = b'SDPX'
+    struct.pack_into('>I', header, 4, len(header))
+    struct.pack_into('>II', header, 772, width, height)
+    header[800] = 50    # RGB
+    header[803] = 10
+    struct.pack_into('>HH', header, 804, 1, 0)
+
+    pixels = image_data.astype(np.uint32)
+    pixel_data = ((pixels[..., 0] << 22) | (pixels[..., 1] << 12) | (pixels[..., 2] << 2)).astype('>u4')
+    with open(file_path, 'wb') as file:
+        file.write(bytes(header))
+        file.write(pixel_data.tobytes())
+
+def write_sequence(directory: str, frame_count: int, source_size: Tuple[int, int]) -> List[str]:
+    width, height = source_size
+    image_data = np.random.default_rng(0).integers(0, 0x400, size=(height, width, 3))
+    file_paths = []
+    for frame in range(FIRST_FRAME, FIRST_FRAME + frame_count):
+        file_path = os.path.join(directory, f'plate.{frame:04d}.dpx')
+        write_dpx_10bit(file_path, image_data)
+        file_paths.append(file_path)
+    return file_paths
+
+def drop_from_disk_cache(file_paths: List[str]):
+    """Evict the files from the operating system page cache, so they are read from disk again.
+    """
+    for file_path in file_paths:
+        file_descriptor = os.open(file_path, os.O_RDONLY)
+        try:
+            os.fsync(file_descriptor)
+            os.posix_fadvise(file_descriptor, 0, 0, os.POSIX_FADV_DONTNEED)
+        finally:
+            os.close(file_descriptor)
+
+def play_synchronously(image_sequence: ImageSequence, frame_count: int) -> float:
+    """Decode each frame on demand, returning the frames per second.
+    """
+    start_time = time.perf_counter()
+    for frame in range(FIRST_FRAME, FIRST_FRAME + frame_count):
+        image_sequence.get_image_data(frame)
+    return frame_count / (time.perf_counter() - start_time)
+
+def play_with_cache(playback_cache: PlaybackCache, frame_count: int, fps: Optional[float]) -> Tuple[float, int]:
+    """Play the sequence from the playback cache, returning the frames per second and the number of
+    frames the playhead waited for. Without `fps`, each frame is shown as soon as it is cached.
+    """
+    event_loop = QtCore.QEventLoop()
+    last_frame = FIRST_FRAME + frame_count - 1
+    playback = {'frame': FIRST_FRAME, 'stall_count': 0, 'is_stalled': False}
+
+    def show_next_frame():
+        if playback['frame'] > last_frame:
+            event_loop.quit()
+            return
+        if playback_cache.get_frame(playback['frame']) is None:
+            if not playback['is_stalled']:
+                playback['stall_count'] += 1
+                playback['is_stalled'] = True
+            return
+
+        playback['is_stalled'] = False
+        playback['frame'] += 1
+        playback_cache.set_playhead(min(playback['frame'], last_frame), direction=1)
+        if playback['frame'] > last_frame:
+            event_loop.quit()
+        elif fps is None:
+            QtCore.QTimer.singleShot(0, show_next_frame)
+
+    def on_frame_state_changed(frame: int, state: FrameState):
+        if fps is None and frame == playback['frame'] and state is FrameState.CACHED:
+            show_next_frame()
+
+    playback_cache.frame_state_changed.connect(on_frame_state_changed)
+    frame_timer = QtCore.QTimer()
+    if fps is not None:
+        frame_timer.setTimerType(QtCore.Qt.PreciseTimer)
+        frame_timer.timeout.connect(show_next_frame)
+        frame_timer.start(int(1000 / fps))
+
+    start_time = time.perf_counter()
+    playback_cache.set_playhead(FIRST_FRAME, direction=1)
+    QtCore.QTimer.singleShot(0, show_next_frame)
+    event_loop.exec_()
+    elapsed_time = time.perf_counter() - start_time
+
+    frame_timer.stop()
+    playback_cache.clear()
+    return frame_count / elapsed_time, playback['stall_count']
+
+def run(frame_count: int, source_size: Tuple[int, int], memory_budget: int, fps: Optional[float]):
+    app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+
+    with tempfile.TemporaryDirectory() as directory:
+        file_paths = write_sequence(directory, frame_count, source_size)
+        sequence_path = os.path.join(directory, 'plate.####.dpx')
+
+        print(f"{frame_count} frames of 10-bit DPX at {source_size[0]}x{source_size[1]}, cold disk cache, "
+              f"{ThreadPoolManager.thread_pool().maxThreadCount()} threads on {os.cpu_count()} CPUs")
+        print(f"{'playback':>24} {'fps':>7} {'stalls':>7}")
+
+        drop_from_disk_cache(file_paths)
+        sync_fps = play_synchronously(ImageSequence(sequence_path), frame_count)
+        print(f"{'synchronous':>24} {sync_fps:>7.1f} {frame_count:>7}")
+
+        drop_from_disk_cache(file_paths)
+        playback_cache = PlaybackCache(ImageSequence(sequence_path), memory_budget=memory_budget)
+        cache_fps, stall_count = play_with_cache(playback_cache, frame_count, fps)
+        mode_name = f"playback cache @ {fps:g}" if fps else "playback cache"
+        print(f"{mode_name:>24} {cache_fps:>7.1f} {stall_count:>7}")
+
+    del app
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure sustained playback fps of an image sequence with a cold disk cache.")
+    parser.add_argument('--frames', type=int, default=DEFAULT_FRAME_COUNT, help="Number of frames of the sequence.")
+    parser.add_argument('--source-size', type=int, nargs=2, default=DEFAULT_SOURCE_SIZE, metavar=('WIDTH', 'HEIGHT'), help="Size of the frames.")
+    parser.add_argument('--budget', type=int, default=PlaybackCache.DEFAULT_MEMORY_BUDGET // 1024 ** 2, help="Memory budget of the cache in MB.")
+    parser.add_argument('--fps', type=float, default=None, help="Play at this frame rate instead of as fast as frames are cached.")
+    args = parser.parse_args()
+
+    run(args.frames, tuple(args.source_size), args.budget * 1024 ** 2, args.fps)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,103 @@
+# Type Checking Imports
+# ---------------------
+from typing import Any, Callable, Dict
+
+# Standard Library Imports
+# ------------------------
+import argparse
+import time
+
+# Local Imports
+# -------------
+from blackboard.utils.database import SQLQueryCompiler
+from blackboard.utils.database.sql_query_builder import SQLQueryBuilder
+
+
+# Constant Definitions
+# --------------------
+DEFAULT_ITERATIONS = 20_000
+MODEL = 'Tasks'
+FIELDS = [
+    'name',
+    'status',
+    'shot.name',
+    'shot.sequence.name',
+    'shot.sequence.episode.name',
+    'shot.sequence.episode.project.name',
+    'shot.sequence.episode.project.studio.name',
+    'assigned_to.email',
+]
+RELATIONSHIPS = {
+    'Tasks.shot': 'Shots.id',
+    'Shots.sequence': 'Sequences.id',
+    'Sequences.episode': 'Episodes.id',
+    'Episodes.project': 'Projects.id',
+    'Projects.studio': 'Studios.id',
+    'Tasks.assigned_to': 'Users.id',
+}
+ORDER_BY = {'shot.name': 'ASC', 'name': 'ASC'}
+
+
+# Function Definitions
+# --------------------
+def make_conditions(index: int) -> Dict[str, Any]:
+    """Build a filter of the same shape with different values, as a filter bar edit would.
+    """
+    return {
+        'AND': {
+            'shot.sequence.episode.project.studio.name': {'contains': f'studio_{index % 10}'},
+            'status': {'in': ['wip', 'review', f'status_{index % 5}']},
+            'OR': {
+                'shot.sequence.episode.project.name': {'eq': f'project_{index % 7}'},
+                'assigned_to.email': {'starts_with': f'user_{index % 3}'},
+            },
+        },
+    }
+
+def measure(build_query: Callable, iterations: int) -> float:
+    """Return the mean time per `build_query` call in microseconds.
+    """
+    start_time = time.perf_counter()
+    for index in range(iterations):
+        build_query(
+            model=MODEL,
+            fields=FIELDS,
+            conditions=make_conditions(index),
+            relationships=RELATIONSHIPS,
+            order_by=ORDER_BY,
+            limit=100,
+        )
+    return (time.perf_counter() - start_time) / iterations * 1e6
+
+def run(iterations: int):
+    query_compiler = SQLQueryCompiler()
+
+    # Both paths must produce the same query for the same input
+    expected_query, expected_values, _ = SQLQueryBuilder.build_query(
+        MODEL, FIELDS, make_conditions(0), RELATIONSHIPS, ORDER_BY, limit=100
+    )
+    compiled_query, compiled_values, _ = query_compiler.build_query(
+        MODEL, FIELDS, make_conditions(0), RELATIONSHIPS, ORDER_BY, limit=100
+    )
+    assert compiled_query == expected_query.replace('LIMIT\n\t100', 'LIMIT\n\t?')
+    assert compiled_values == expected_values + [100]
+
+    builder_time = measure(SQLQueryBuilder.build_query, iterations)
+    compiler_time = measure(query_compiler.build_query, iterations)
+
+    print(f"{'builder (us)':>14} {'compiler (us)':>14} {'speedup':>10} {'hits':>8} {'misses':>8}")
+    print(
+        f"{builder_time:>14.1f} {compiler_time:>14.1f} {builder_time / compiler_time:>9.1f}x "
+        f"{query_compiler.hits:>8} {query_compiler.misses:>8}"
+    )
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare SQLQueryBuilder.build_query with the memoized SQLQueryCompiler.")
+    parser.add_argument('--iterations', type=int, default=DEFAULT_ITERATIONS, help="Number of queries to build per case.")
+    args = parser.parse_args()
+
+    run(args.iterations)
+
+
+if __name__ == '__main__':
+    main()
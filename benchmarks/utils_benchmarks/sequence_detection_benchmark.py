@@ -0,0 +1,148 @@
+# Type Checking Imports
+# ---------------------
+from typing import Dict, List
+
+# Standard Library Imports
+# ------------------------
+import argparse
+import glob
+import os
+import tempfile
+import time
+
+# Local Imports
+# -------------
+from blackboard.utils.file_path_utils import FilePatternQuery, FileUtil, SequenceDetector, SequenceFileUtil
+
+
+# Constant Definitions
+# --------------------
+DEFAULT_FRAME_COUNT = 100_000
+DEFAULT_SEQUENCE_COUNT = 500
+DEFAULT_DIRECTORY_COUNT = 10
+FIRST_FRAME = 1001
+
+
+# Function Definitions
+# --------------------
+def create_sequences(root: str, frame_count: int, sequence_count: int, directory_count: int) -> List[str]:
+    """Create sequences of small frames spread over directories, with a version token in their names.
+
+    Returns:
+        List[str]: The paths of the directories.
+    """
+    directories = [os.path.join(root, f'sh{index:03d}') for index in range(directory_count)]
+    for directory in directories:
+        os.mkdir(directory)
+
+    frames_per_sequence = frame_count // sequence_count
+    for sequence_index in range(sequence_count):
+        directory = directories[sequence_index % directory_count]
+        for frame in range(FIRST_FRAME, FIRST_FRAME + frames_per_sequence):
+            with open(os.path.join(directory, f'layer{sequence_index:03d}_v001.{frame}.exr'), 'wb') as file:
+                file.write(b'\0' * 64)
+
+    return directories
+
+def extract_sequence_info_legacy(sequence_path_format: str) -> Dict[str, str]:
+    """Extract the size, modification time and range of a sequence the way `SequenceFileUtil.extract_file_info`
+    did before the detector: a glob, then `os.path.getsize` and `os.stat` for each frame.
+    """
+    sequence_files = sorted(glob.glob(sequence_path_format.replace('#', '?')))
+    total_size = sum(map(os.path.getsize, sequence_files))
+    latest_file = max(sequence_files, key=lambda file_path: os.stat(file_path).st_mtime)
+    file_info = os.stat(latest_file)
+    sequence_numbers = [SequenceFileUtil.extract_frame_number(file_path) for file_path in sequence_files]
+    return {
+        'file_path': sequence_path_format,
+        'file_size': FileUtil.format_size(total_size),
+        'last_modified': FileUtil.get_modified_time(file_info),
+        'sequence_range': ', '.join(SequenceFileUtil.get_sequence_ranges(sequence_numbers)),
+    }
+
+def list_legacy(directories: List[str]) -> List[Dict[str, str]]:
+    """List the sequences by converting the names of each directory to sequence formats, then extracting
+    the information of each sequence.
+    """
+    sequence_infos = []
+    for directory in directories:
+        file_paths = [os.path.join(directory, file_name) for file_name in os.listdir(directory)]
+        for sequence_path in SequenceFileUtil.convert_to_sequence_format(file_paths):
+            sequence_infos.append(extract_sequence_info_legacy(sequence_path))
+    return sequence_infos
+
+def list_extract_file_info(directories: List[str]) -> List[Dict[str, str]]:
+    """List the sequences like `list_legacy`, with the current `SequenceFileUtil.extract_file_info`.
+    """
+    sequence_infos = []
+    for directory in directories:
+        file_paths = [os.path.join(directory, file_name) for file_name in os.listdir(directory)]
+        for sequence_path in SequenceFileUtil.convert_to_sequence_format(file_paths):
+            sequence_infos.append(SequenceFileUtil.extract_file_info(sequence_path))
+    return sequence_infos
+
+def list_detector(directories: List[str]) -> List[Dict[str, str]]:
+    """List the sequences from one scan of each directory with a `SequenceDetector`.
+    """
+    sequence_detector = SequenceDetector()
+    for directory in directories:
+        with os.scandir(directory) as iterator:
+            sequence_detector.add_entries(iterator)
+
+    sequences, _single_entries = sequence_detector.get_results()
+    return [
+        {
+            'file_path': sequence.get_path(),
+            'file_size': FileUtil.format_size(sequence.total_size),
+            'last_modified': FileUtil.get_modified_time(sequence.latest_stat),
+            'sequence_range': ', '.join(sequence.ranges),
+        } for sequence in sequences
+    ]
+
+def list_query_files(directories: List[str]) -> List[Dict[str, str]]:
+    """List the sequences with `FilePatternQuery.query_files`, which detects the sequences of each directory
+    it walks.
+    """
+    pattern = os.path.join(os.path.dirname(directories[0]), '{shot_name}')
+    return list(FilePatternQuery(pattern).query_files(use_sequence_format=True))
+
+def run(frame_count: int, sequence_count: int, directory_count: int, repeat_count: int):
+    with tempfile.TemporaryDirectory() as root:
+        directories = create_sequences(root, frame_count, sequence_count, directory_count)
+        print(f"{frame_count} frames in {sequence_count} sequences over {directory_count} directories")
+        print(f"{'method':>40} {'seconds':>8} {'frames/s':>10}")
+
+        results = {}
+        for method_name, list_sequences in (
+            ('convert + glob/getsize/stat per frame', list_legacy),
+            ('convert + extract_file_info', list_extract_file_info),
+            ('SequenceDetector, one scandir', list_detector),
+            ('FilePatternQuery.query_files', list_query_files),
+        ):
+            elapsed_times = []
+            for _ in range(repeat_count):
+                start_time = time.perf_counter()
+                sequence_infos = list_sequences(directories)
+                elapsed_times.append(time.perf_counter() - start_time)
+
+            elapsed_time = min(elapsed_times)
+            results[method_name] = sorted(
+                (info['file_path'], info['file_size'], info['sequence_range']) for info in sequence_infos
+            )
+            print(f"{method_name:>40} {elapsed_time:>8.2f} {frame_count / elapsed_time:>10.0f}")
+
+        assert len({tuple(result) for result in results.values()}) == 1, "Methods found different sequences"
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure listing file sequences with their size, modification time and ranges.")
+    parser.add_argument('--frames', type=int, default=DEFAULT_FRAME_COUNT, help="Total number of frames.")
+    parser.add_argument('--sequences', type=int, default=DEFAULT_SEQUENCE_COUNT, help="Number of sequences.")
+    parser.add_argument('--directories', type=int, default=DEFAULT_DIRECTORY_COUNT, help="Number of directories the sequences are spread over.")
+    parser.add_argument('--repeat', type=int, default=3, help="Number of runs per method, keeping the fastest.")
+    args = parser.parse_args()
+
+    run(args.frames, args.sequences, args.directories, args.repeat)
+
+
+if __name__ == '__main__':
+    main()
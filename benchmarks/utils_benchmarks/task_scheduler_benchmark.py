@@ -0,0 +1,113 @@
+# Type Checking Imports
+# ---------------------
+from typing import Dict, List
+
+# Standard Library Imports
+# ------------------------
+import argparse
+import threading
+import time
+from functools import partial
+
+# Third Party Imports
+# -------------------
+import cv2
+import numpy as np
+from qtpy import QtCore
+
+# Local Imports
+# -------------
+from blackboard.utils.thread_pool import TaskPriority, TaskScheduler
+
+
+# Constant Definitions
+# --------------------
+DEFAULT_PREFETCH_COUNT = 1000
+DEFAULT_VISIBLE_COUNT = 40
+DEFAULT_THREAD_COUNT = 8
+# Time to read an image from a network share, in seconds
+READ_TIME = 0.002
+SOURCE_IMAGE = np.random.default_rng(0).integers(0, 255, (1080, 1920, 3), dtype=np.uint8)
+
+
+# Function Definitions
+# --------------------
+def load_thumbnail(submit_time: float, latencies: List[float], done: threading.Semaphore):
+    """Simulate a thumbnail load, a file read followed by a resize, and record its latency since submission.
+    """
+    time.sleep(READ_TIME)
+    cv2.resize(SOURCE_IMAGE, (256, 144), interpolation=cv2.INTER_AREA)
+    latencies.append(time.perf_counter() - submit_time)
+    done.release()
+
+def run_case(case: str, prefetch_count: int, visible_count: int, thread_count: int) -> Dict[str, float]:
+    """Queue the prefetch of a long list of thumbnails, then request the thumbnails of the visible rows,
+    as when a view is scrolled while prefetching, and return the latencies of the visible thumbnails.
+    """
+    thread_pool = QtCore.QThreadPool()
+    thread_pool.setMaxThreadCount(thread_count)
+    scheduler = TaskScheduler(thread_pool)
+
+    prefetch_latencies: List[float] = []
+    visible_latencies: List[float] = []
+    prefetch_done = threading.Semaphore(0)
+    visible_done = threading.Semaphore(0)
+
+    for _ in range(prefetch_count):
+        if case == 'QThreadPool':
+            thread_pool.start(partial(load_thumbnail, time.perf_counter(), prefetch_latencies, prefetch_done))
+        else:
+            scheduler.submit(
+                load_thumbnail, time.perf_counter(), prefetch_latencies, prefetch_done,
+                priority=TaskPriority.PREFETCH, category='thumbnail', group='prefetch',
+            )
+
+    # The user scrolls, a page of rows becomes visible
+    time.sleep(0.05)
+    if case == 'scheduler + new generation':
+        # The prefetch of the previous position is no longer needed
+        scheduler.next_generation('prefetch')
+
+    for _ in range(visible_count):
+        if case == 'QThreadPool':
+            thread_pool.start(partial(load_thumbnail, time.perf_counter(), visible_latencies, visible_done))
+        else:
+            scheduler.submit(
+                load_thumbnail, time.perf_counter(), visible_latencies, visible_done,
+                priority=TaskPriority.VISIBLE, category='thumbnail',
+            )
+
+    for _ in range(visible_count):
+        visible_done.acquire()
+
+    thread_pool.waitForDone()
+    latencies = np.array(visible_latencies) * 1000
+    return {
+        'mean_ms': latencies.mean(),
+        'p95_ms': np.percentile(latencies, 95),
+        'max_ms': latencies.max(),
+        'prefetched': len(prefetch_latencies),
+    }
+
+def run(prefetch_count: int, visible_count: int, thread_count: int):
+    print(f"{prefetch_count} prefetch tasks queued before {visible_count} visible tasks, {thread_count} threads")
+    print(f"{'case':>28} {'mean (ms)':>10} {'p95 (ms)':>10} {'max (ms)':>10} {'prefetched':>11}")
+    for case in ('QThreadPool', 'scheduler', 'scheduler + new generation'):
+        results = run_case(case, prefetch_count, visible_count, thread_count)
+        print(
+            f"{case:>28} {results['mean_ms']:>10.1f} {results['p95_ms']:>10.1f} "
+            f"{results['max_ms']:>10.1f} {results['prefetched']:>11}"
+        )
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare the latency of visible-row thumbnails queued behind background prefetching.")
+    parser.add_argument('--prefetch', type=int, default=DEFAULT_PREFETCH_COUNT, help="Number of prefetch tasks queued first.")
+    parser.add_argument('--visible', type=int, default=DEFAULT_VISIBLE_COUNT, help="Number of visible-row tasks queued after.")
+    parser.add_argument('--threads', type=int, default=DEFAULT_THREAD_COUNT, help="Number of threads of the pool.")
+    args = parser.parse_args()
+
+    run(args.prefetch, args.visible, args.threads)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,96 @@
+# Type Checking Imports
+# ---------------------
+from typing import List
+
+# Standard Library Imports
+# ------------------------
+import argparse
+import os
+import tempfile
+import time
+
+# Third Party Imports
+# -------------------
+from qtpy import QtGui, QtWidgets
+
+# Local Imports
+# -------------
+from blackboard.utils.qimage_utils import ThumbnailUtils
+from blackboard.utils.thumbnail_cache import ThumbnailCache
+
+
+# Constant Definitions
+# --------------------
+DEFAULT_ITEM_COUNT = 5000
+DEFAULT_SOURCE_SIZE = (1920, 1080)
+DEFAULT_THUMBNAIL_HEIGHT = 64
+
+
+# Function Definitions
+# --------------------
+def create_gallery(directory: str, item_count: int, source_size) -> List[str]:
+    """Write `item_count` distinct source images of `source_size` to `directory`.
+    """
+    width, height = source_size
+    file_paths = []
+    for index in range(item_count):
+        image = QtGui.QImage(width, height, QtGui.QImage.Format_RGB888)
+        image.fill(QtGui.QColor.fromHsv(index % 360, 200, 50 + index % 200))
+        file_path = os.path.join(directory, f'image_{index:05d}.png')
+        image.save(file_path)
+        file_paths.append(file_path)
+    return file_paths
+
+def load_gallery(file_paths: List[str], thumbnail_height: int, disk_cache: ThumbnailCache) -> float:
+    """Load the thumbnails of all files as on a fresh launch, returning the time in seconds.
+    """
+    ThumbnailUtils.set_disk_cache(disk_cache)
+    start_time = time.perf_counter()
+    for file_path in file_paths:
+        assert not ThumbnailUtils.get_pixmap_thumbnail(file_path, thumbnail_height).isNull()
+    return time.perf_counter() - start_time
+
+def run(item_count: int, source_size, thumbnail_height: int):
+    app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+
+    with tempfile.TemporaryDirectory() as directory:
+        print(f"Writing {item_count} images of {source_size[0]}x{source_size[1]}...")
+        file_paths = create_gallery(directory, item_count, source_size)
+        db_path = os.path.join(directory, 'thumbnails.db')
+
+        # Without the disk cache, every launch decodes every source image
+        ThumbnailUtils.set_disk_cache(None)
+        start_time = time.perf_counter()
+        for file_path in file_paths:
+            ThumbnailUtils.get_pixmap_thumbnail(file_path, thumbnail_height)
+        uncached_time = time.perf_counter() - start_time
+
+        disk_cache = ThumbnailCache(db_path)
+        cold_time = load_gallery(file_paths, thumbnail_height, disk_cache)
+        disk_cache.close()
+
+        # Reopen the store, as the next launch would
+        disk_cache = ThumbnailCache(db_path)
+        warm_time = load_gallery(file_paths, thumbnail_height, disk_cache)
+        store_size = disk_cache.total_size
+        disk_cache.close()
+        ThumbnailUtils.set_disk_cache(None)
+
+    print(f"{'launch':>16} {'total (s)':>10} {'per item (ms)':>14}")
+    for launch_name, launch_time in (('no disk cache', uncached_time), ('cold disk cache', cold_time), ('warm disk cache', warm_time)):
+        print(f"{launch_name:>16} {launch_time:>10.2f} {launch_time / item_count * 1000:>14.3f}")
+    print(f"Store size: {store_size / 1024 / 1024:.1f} MB for {item_count} thumbnails")
+    del app
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure cold and warm launch times of a thumbnail gallery with the persistent thumbnail cache.")
+    parser.add_argument('--items', type=int, default=DEFAULT_ITEM_COUNT, help="Number of images in the gallery.")
+    parser.add_argument('--source-size', type=int, nargs=2, default=DEFAULT_SOURCE_SIZE, metavar=('WIDTH', 'HEIGHT'), help="Size of the source images.")
+    parser.add_argument('--height', type=int, default=DEFAULT_THUMBNAIL_HEIGHT, help="Height of the thumbnails.")
+    args = parser.parse_args()
+
+    run(args.items, tuple(args.source_size), args.height)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,124 @@
+# Type Checking Imports
+# ---------------------
+from typing import Dict, Tuple
+
+# Standard Library Imports
+# ------------------------
+import argparse
+import os
+import struct
+import tempfile
+import time
+import tracemalloc
+
+# Third Party Imports
+# -------------------
+import cv2
+import numpy as np
+from qtpy import QtWidgets
+
+# Local Imports
+# -------------
+from blackboard.utils.image_utils import ImageReader
+from blackboard.utils.qimage_utils import ThumbnailUtils
+
+
+# Constant Definitions
+# --------------------
+RESOLUTIONS = {'2K': (2048, 1080), '4K': (4096, 2160)}
+DEFAULT_THUMBNAIL_HEIGHT = 64
+DEFAULT_REPEAT_COUNT = 5
+
+
+# Function Definitions
+# --------------------
+def write_dpx(file_path: str, image_data: np.ndarray, depth: int):
+    """Write a minimal big-endian, uncompressed RGB DPX file of 10-bit filled or 16-bit pixels.
+    """
+    height, width = image_data.shape[:2]
+    header = bytearray(2048)
+    header[0:4] = b'SDPX'
+    struct.pack_into('>I', header, 4, len(header))
+    struct.pack_into('>II', header, 772, width, height)
+    header[800] = 50    # RGB
+    header[803] = depth
+    struct.pack_into('>HH', header, 804, 1 if depth == 10 else 0, 0)
+
+    if depth == 10:
+        pixels = image_data.astype(np.uint32)
+        pixel_data = ((pixels[..., 0] << 22) | (pixels[..., 1] << 12) | (pixels[..., 2] << 2)).astype('>u4')
+    else:
+        pixel_data = image_data.astype('>u2')
+
+    with open(file_path, 'wb') as file:
+        file.write(bytes(header))
+        file.write(pixel_data.tobytes())
+
+def write_sources(directory: str, resolution: str) -> Dict[str, str]:
+    """Write a source image of the resolution in each measured format.
+    """
+    width, height = RESOLUTIONS[resolution]
+    rng = np.random.default_rng(0)
+    gradient = np.linspace(0.0, 1.0, width, dtype=np.float32)[np.newaxis, :, np.newaxis]
+    image_data = np.clip(gradient + rng.normal(0.0, 0.05, (height, width, 3)).astype(np.float32), 0.0, 1.0)
+
+    file_paths = {
+        'jpg': os.path.join(directory, f'{resolution}.jpg'),
+        'png': os.path.join(directory, f'{resolution}.png'),
+        'dpx 10-bit': os.path.join(directory, f'{resolution}_10bit.dpx'),
+        'dpx 16-bit': os.path.join(directory, f'{resolution}_16bit.dpx'),
+    }
+    cv2.imwrite(file_paths['jpg'], (image_data * 255).astype(np.uint8))
+    cv2.imwrite(file_paths['png'], (image_data * 255).astype(np.uint8))
+    write_dpx(file_paths['dpx 10-bit'], image_data * 0x3FF, 10)
+    write_dpx(file_paths['dpx 16-bit'], image_data * 0xFFFF, 16)
+    return file_paths
+
+def measure(file_path: str, thumbnail_height: int, reduced: bool, repeat_count: int) -> Tuple[float, float]:
+    """Generate a thumbnail of the file, returning the mean wall time in milliseconds and the peak
+    traced memory in megabytes.
+    """
+    target_height = thumbnail_height if reduced else None
+
+    start_time = time.perf_counter()
+    for _ in range(repeat_count):
+        image_data = ImageReader.read_image(file_path, target_height=target_height)
+        ThumbnailUtils.create_qpixmap_from_image_data(image_data, thumbnail_height)
+    wall_time = (time.perf_counter() - start_time) / repeat_count
+
+    # NumPy and OpenCV output arrays are allocated through the traced allocator
+    tracemalloc.start()
+    image_data = ImageReader.read_image(file_path, target_height=target_height)
+    ThumbnailUtils.create_qpixmap_from_image_data(image_data, thumbnail_height)
+    del image_data
+    _, peak_memory = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return wall_time * 1000, peak_memory / 1024 / 1024
+
+def run(thumbnail_height: int, repeat_count: int):
+    app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+
+    print(f"{'source':>16} {'full (ms)':>10} {'reduced (ms)':>13} {'full peak (MB)':>15} {'reduced peak (MB)':>18}")
+    with tempfile.TemporaryDirectory() as directory:
+        for resolution in RESOLUTIONS:
+            for format_name, file_path in write_sources(directory, resolution).items():
+                full_time, full_peak = measure(file_path, thumbnail_height, False, repeat_count)
+                reduced_time, reduced_peak = measure(file_path, thumbnail_height, True, repeat_count)
+                print(
+                    f"{resolution + ' ' + format_name:>16} {full_time:>10.1f} {reduced_time:>13.1f} "
+                    f"{full_peak:>15.1f} {reduced_peak:>18.1f}"
+                )
+    del app
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare generating thumbnails from full resolution decodes and from reduced resolution decodes.")
+    parser.add_argument('--height', type=int, default=DEFAULT_THUMBNAIL_HEIGHT, help="Height of the thumbnails.")
+    parser.add_argument('--repeat', type=int, default=DEFAULT_REPEAT_COUNT, help="Number of thumbnails generated per source to average the time.")
+    args = parser.parse_args()
+
+    run(args.height, args.repeat)
+
+
+if __name__ == '__main__':
+    main()
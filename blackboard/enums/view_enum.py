@@ -49,6 +49,8 @@ class FilterOperation(Enum):
     NOT_IN = ("Not In", "NOT IN", -1)                                   # Special case for NOT IN query, variable number of arguments
     BETWEEN = ("Between", "BETWEEN ? AND ?", 2)                         # Special case for BETWEEN operator, requires two values
     NOT_BETWEEN = ("Not Between", "NOT BETWEEN ? AND ?", 2)             # Special case for NOT BETWEEN operator, requires two values
+    MATCH = ("Matches", "MATCH ?", 1)                                   # Full-text search, requires a full-text index on the table
+    MATCH_RAW = ("Matches Query", "MATCH ?", 1)                         # Full-text search with an FTS5 query string, passed as is
 
     # Initialization and Setup
     # ------------------------
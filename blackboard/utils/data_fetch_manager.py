@@ -1,11 +1,14 @@
 # Type Checking Imports
 # ---------------------
-from typing import Optional, Generator, Deque, Dict, Any
+from typing import Optional, Generator, Deque, Dict, Any, List, Tuple
 
 # Standard Library Imports
 # ------------------------
+import math
+import time
 from itertools import islice
 from collections import deque
+from dataclasses import dataclass
 
 # Third Party Imports
 # -------------------
@@ -13,23 +16,215 @@ from qtpy import QtCore
 
 # Local Imports
 # -------------
-from blackboard.utils.thread_pool import ThreadPoolManager, GeneratorWorker
+from blackboard.utils.thread_pool import ThreadPoolManager, GeneratorWorker, ScheduledTask, TaskPriority
 from blackboard.widgets.button import DataFetchingButtons
 
 
 # Class Definitions
 # -----------------
+@dataclass
+class BatchTelemetry:
+    """Measurements of one slice of items inserted on the GUI thread, and the sizes chosen after it.
+    """
+    timestamp: float                # Time of the measurement, from `time.perf_counter`
+    item_count: int                 # The number of items inserted in the slice
+    insertion_time: float           # Time spent on the GUI thread inserting the slice, in milliseconds
+    item_cost: float                # Smoothed insertion time per item, in milliseconds
+    fetch_latency: float            # Smoothed time per item waiting for the generator, in milliseconds
+    scroll_velocity: float          # Smoothed forward scroll velocity, in rows per second
+    slice_size: int                 # The number of items of the next slice
+    fetch_size: int                 # The number of items of the next fetch
+    prefetch_distance: int          # The number of rows before the end at which the next fetch starts
+
+
+class AdaptiveBatchController:
+    """Choose batch sizes from the measured cost of inserting items on the GUI thread, the latency of the
+    generator and the scroll velocity.
+
+    - The slice size is the number of items inserted per GUI event, sized so that a slice takes at most
+      `frame_budget` milliseconds. It grows at most twofold per slice, so a cheap slice does not lead to
+      an oversized one, and shrinks right away when a slice runs over the budget.
+    - The fetch size covers `FETCH_HORIZON` seconds of scrolling at the current velocity.
+    - The prefetch distance is the number of rows scrolled while the next fetch is produced and inserted,
+      so the next fetch starts early enough to stay ahead of the scrolling.
+
+    Examples:
+        >>> controller = AdaptiveBatchController(frame_budget=8.0)
+        >>> telemetry = controller.record_insertion(100, 20.0)  # 0.2 ms per item
+        >>> controller.slice_size, telemetry.slice_size
+        (40, 40)
+    """
+
+    # Target time in milliseconds of the GUI thread per inserted slice, half of a 60 Hz frame
+    DEFAULT_FRAME_BUDGET = 8.0
+    DEFAULT_BATCH_SIZE = 50
+    MIN_BATCH_SIZE = 10
+    MAX_BATCH_SIZE = 5000
+    # Seconds of scrolling covered by one fetch, and the margin applied to the prefetch distance
+    FETCH_HORIZON = 1.0
+    PREFETCH_SAFETY_FACTOR = 1.5
+    # Weight of the latest measurement in the smoothed values
+    SMOOTHING = 0.3
+    # Seconds without scrolling after which the scroll velocity is reset
+    SCROLL_IDLE_TIMEOUT = 0.5
+    # Number of telemetry records kept
+    TELEMETRY_SIZE = 256
+
+    # Initialization and Setup
+    # ------------------------
+    def __init__(self, frame_budget: float = DEFAULT_FRAME_BUDGET, initial_batch_size: int = DEFAULT_BATCH_SIZE):
+        """Initialize the controller.
+
+        Args:
+            frame_budget (float): The target time of the GUI thread per slice, in milliseconds.
+            initial_batch_size (int): The slice and fetch size used until items have been measured.
+        """
+        self.frame_budget = frame_budget
+        self.initial_batch_size = initial_batch_size
+
+        self._item_cost: Optional[float] = None
+        self._fetch_latency: Optional[float] = None
+        self._scroll_velocity = 0.0
+        self._last_scroll: Optional[Tuple[float, float]] = None
+        self._slice_size = initial_batch_size
+        self._telemetry: Deque[BatchTelemetry] = deque(maxlen=self.TELEMETRY_SIZE)
+
+    # Public Methods
+    # --------------
+    def record_insertion(self, item_count: int, elapsed: float) -> Optional[BatchTelemetry]:
+        """Record the time spent on the GUI thread inserting a slice of items, and resize the next slice.
+
+        Args:
+            item_count (int): The number of inserted items.
+            elapsed (float): The time spent, in milliseconds.
+
+        Returns:
+            Optional[BatchTelemetry]: The telemetry record of the slice, or None if no item was inserted.
+        """
+        if item_count <= 0:
+            return None
+
+        self._item_cost = self._smooth(self._item_cost, elapsed / item_count)
+        target_size = int(self.frame_budget / self._item_cost) if self._item_cost > 0 else self.MAX_BATCH_SIZE
+        self._slice_size = self._clamp(min(target_size, self._slice_size * 2))
+
+        telemetry = BatchTelemetry(
+            timestamp=time.perf_counter(),
+            item_count=item_count,
+            insertion_time=elapsed,
+            item_cost=self._item_cost,
+            fetch_latency=self._fetch_latency or 0.0,
+            scroll_velocity=self._scroll_velocity,
+            slice_size=self.slice_size,
+            fetch_size=self.fetch_size,
+            prefetch_distance=self.prefetch_distance,
+        )
+        self._telemetry.append(telemetry)
+        return telemetry
+
+    def record_fetch(self, item_count: int, elapsed: float):
+        """Record the time waited for items of the generator.
+
+        Args:
+            item_count (int): The number of items received.
+            elapsed (float): The time waited for them, in milliseconds.
+        """
+        if item_count > 0:
+            self._fetch_latency = self._smooth(self._fetch_latency, elapsed / item_count)
+
+    def record_scroll(self, position: float, timestamp: Optional[float] = None):
+        """Record a scroll position to estimate the forward scroll velocity.
+
+        Args:
+            position (float): The scroll position, in rows.
+            timestamp (Optional[float]): The time of the position, from `time.perf_counter`. Defaults to now.
+        """
+        timestamp = time.perf_counter() if timestamp is None else timestamp
+        if self._last_scroll is not None:
+            last_position, last_timestamp = self._last_scroll
+            interval = timestamp - last_timestamp
+            if interval > self.SCROLL_IDLE_TIMEOUT:
+                self._scroll_velocity = 0.0
+            elif interval > 0:
+                velocity = max(position - last_position, 0.0) / interval
+                self._scroll_velocity = self._smooth(self._scroll_velocity, velocity)
+        self._last_scroll = (position, timestamp)
+
+    def reset(self):
+        """Forget the scroll position and velocity, e.g. when a new generator is set.
+
+        The measured costs are kept, as they mostly depend on the items and the view rather than the generator.
+        """
+        self._scroll_velocity = 0.0
+        self._last_scroll = None
+
+    # Class Properties
+    # ----------------
+    @property
+    def slice_size(self) -> int:
+        """The number of items to insert per GUI event.
+        """
+        return self._slice_size
+
+    @property
+    def fetch_size(self) -> int:
+        """The number of items to fetch from the generator at once.
+        """
+        scrolled_rows = math.ceil(self._scroll_velocity * self.FETCH_HORIZON)
+        return self._clamp(max(self.initial_batch_size, self._slice_size, scrolled_rows))
+
+    @property
+    def prefetch_distance(self) -> int:
+        """The number of rows before the end of the loaded rows at which the next fetch should start.
+        """
+        item_time = (self._fetch_latency or 0.0) + (self._item_cost or 0.0)
+        lead_time = self.fetch_size * item_time / 1000
+        return math.ceil(self._scroll_velocity * lead_time * self.PREFETCH_SAFETY_FACTOR)
+
+    @property
+    def scroll_velocity(self) -> float:
+        """The smoothed forward scroll velocity, in rows per second.
+        """
+        return self._scroll_velocity
+
+    @property
+    def telemetry(self) -> List[BatchTelemetry]:
+        """The telemetry records of the latest slices, oldest first.
+        """
+        return list(self._telemetry)
+
+    # Private Methods
+    # ---------------
+    def _smooth(self, previous: Optional[float], value: float) -> float:
+        return value if previous is None else previous + self.SMOOTHING * (value - previous)
+
+    def _clamp(self, size: int) -> int:
+        return max(self.MIN_BATCH_SIZE, min(self.MAX_BATCH_SIZE, size))
+
+
 class DataFetcher(QtCore.QObject):
     """A class to handle data fetching logic separately from the UI.
 
+    Fetched items are delivered from the worker thread in batches, see `GeneratorWorker`. They are
+    inserted in slices, one slice per event of the GUI thread, each emitted with `data_batch_fetched`
+    and then one by one with `data_fetched`. The slice and fetch sizes are chosen by `batch_controller`
+    from the time spent in the receivers of each slice, and each measurement is emitted with `telemetry_recorded`.
+
     Attributes:
         generator (Optional[Generator]): The data generator.
         has_more_items_to_fetch (bool): Indicates if there is more data to fetch.
     """
 
     DEFAULT_BATCH_SIZE = 50
-
-    data_fetched = QtCore.Signal(dict)
+    # Target time in milliseconds of the GUI thread per inserted slice
+    FRAME_BUDGET = AdaptiveBatchController.DEFAULT_FRAME_BUDGET
+    # Number of items and time in milliseconds per batch delivered from the worker thread
+    RESULTS_BATCH_SIZE = GeneratorWorker.DEFAULT_BATCH_SIZE
+    RESULTS_BATCH_INTERVAL = GeneratorWorker.DEFAULT_BATCH_INTERVAL
+
+    data_fetched = QtCore.Signal(object)
+    data_batch_fetched = QtCore.Signal(object)
+    telemetry_recorded = QtCore.Signal(object)
     started = QtCore.Signal()
     finished = QtCore.Signal()
     loaded_all = QtCore.Signal()
@@ -51,8 +246,16 @@ class DataFetcher(QtCore.QObject):
         #       This approach avoids issues with concurrent task handling, ensuring each task is stopped 
         #       before starting a new one, and prevents old tasks from running after a new task begins.
         self._current_tasks: Deque[GeneratorWorker] = deque()
+        self._scheduled_tasks: Dict[GeneratorWorker, ScheduledTask] = {}
         self._result_connection = None
 
+        self.batch_controller = AdaptiveBatchController(self.FRAME_BUDGET, self.DEFAULT_BATCH_SIZE)
+        # Items received from the worker but not inserted yet, and signals emitted once they are inserted
+        self._pending_items: Deque[Dict[Any, Any]] = deque()
+        self._deferred_signals: List[QtCore.SignalInstance] = []
+        self._is_slice_scheduled = False
+        self._last_batch_time = 0.0
+
     # Public Methods
     # --------------
     def set_generator(self, generator: Generator):
@@ -60,14 +263,15 @@ class DataFetcher(QtCore.QObject):
         self.stop_fetch()
         self.generator = generator
         self.has_more_items_to_fetch = True
+        self.batch_controller.reset()
 
     def fetch(self, batch_size: int):
         """Fetch more data in batches."""
         self._fetch_data(batch_size)
 
     def fetch_more(self):
-        """Fetch more data in batches."""
-        self._fetch_data(self.DEFAULT_BATCH_SIZE)
+        """Fetch more data, as many items as chosen by `batch_controller`."""
+        self._fetch_data(self.batch_controller.fetch_size)
 
     def fetch_all(self):
         """Fetch all remaining data."""
@@ -78,14 +282,21 @@ class DataFetcher(QtCore.QObject):
         while self._current_tasks:
             task = self._current_tasks.popleft()
             task.pause()
+            # Keep a task that has not started yet from consuming the generator
+            self._scheduled_tasks.pop(task).cancel()
 
     def stop_fetch(self):
         """Stop the current data fetching task."""
         while self._current_tasks:
             task = self._current_tasks.popleft()
-            task.result.disconnect(self._result_connection)
+            task.results_batch.disconnect(self._result_connection)
             self._result_connection = None
             task.stop()
+            self._scheduled_tasks.pop(task).cancel()
+
+        # Drop the items of the previous generator that are not inserted yet
+        self._pending_items.clear()
+        self._deferred_signals.clear()
 
     # Private Methods
     # ---------------
@@ -101,31 +312,86 @@ class DataFetcher(QtCore.QObject):
         items_to_fetch = islice(self.generator, batch_size) if batch_size else self.generator
 
         # Create the current_task
-        task = GeneratorWorker(items_to_fetch, desired_size=batch_size)
+        task = GeneratorWorker(
+            items_to_fetch, desired_size=batch_size,
+            batch_size=self.RESULTS_BATCH_SIZE, batch_interval=self.RESULTS_BATCH_INTERVAL,
+        )
         # Connect signals
-        self._result_connection = task.result.connect(self._on_data_fetched)
+        self._result_connection = task.results_batch.connect(self._on_data_batch_fetched)
         task.started.connect(self.started.emit)
         task.finished.connect(self._on_task_finished)
         task.loaded_all.connect(self._handle_no_more_items)
 
-        # Start the task
-        ThreadPoolManager.thread_pool().start(task.run)
+        # Start the task, ahead of background work such as thumbnail prefetching
+        self._scheduled_tasks[task] = ThreadPoolManager.scheduler().submit(
+            task.run, priority=TaskPriority.INTERACTIVE, category='fetch'
+        )
         self._current_tasks.append(task)
+        self._last_batch_time = time.perf_counter()
 
-    def _on_data_fetched(self, data: Dict[Any, Any]):
+    def _on_data_batch_fetched(self, data_batch: List[Dict[Any, Any]]):
         # NOTE: Prevents data from stopped tasks from incorrectly triggering further actions
         if self.sender() not in self._current_tasks:
             return
-        self.data_fetched.emit(data)
+
+        batch_time = time.perf_counter()
+        self.batch_controller.record_fetch(len(data_batch), (batch_time - self._last_batch_time) * 1000)
+        self._last_batch_time = batch_time
+
+        self._pending_items.extend(data_batch)
+        self._schedule_next_slice()
+
+    def _schedule_next_slice(self):
+        """Insert the next slice of pending items in a later event, so the GUI thread can paint in between.
+        """
+        if self._is_slice_scheduled:
+            return
+        self._is_slice_scheduled = True
+        QtCore.QTimer.singleShot(0, self._insert_next_slice)
+
+    def _insert_next_slice(self):
+        """Emit a slice of the pending items, measuring the time spent in the receivers.
+        """
+        self._is_slice_scheduled = False
+        slice_size = min(self.batch_controller.slice_size, len(self._pending_items))
+        data_slice = [self._pending_items.popleft() for _ in range(slice_size)]
+
+        if data_slice:
+            start_time = time.perf_counter()
+            self.data_batch_fetched.emit(data_slice)
+            for data in data_slice:
+                self.data_fetched.emit(data)
+            elapsed = (time.perf_counter() - start_time) * 1000
+
+            telemetry = self.batch_controller.record_insertion(len(data_slice), elapsed)
+            self.telemetry_recorded.emit(telemetry)
+
+        if self._pending_items:
+            self._schedule_next_slice()
+            return
+
+        # Signal completion once every fetched item is inserted
+        deferred_signals, self._deferred_signals = self._deferred_signals, []
+        for signal in deferred_signals:
+            signal.emit()
+
+    def _emit_when_inserted(self, signal: QtCore.SignalInstance):
+        """Emit a signal once the pending items are inserted, or right away if there are none.
+        """
+        if self._pending_items or self._is_slice_scheduled:
+            self._deferred_signals.append(signal)
+        else:
+            signal.emit()
 
     def _on_task_finished(self):
         if self.sender() in self._current_tasks:
             self._current_tasks.remove(self.sender())
-        self.finished.emit()
+            self._scheduled_tasks.pop(self.sender(), None)
+        self._emit_when_inserted(self.finished)
 
     def _handle_no_more_items(self):
         self.has_more_items_to_fetch = False
-        self.loaded_all.emit()
+        self._emit_when_inserted(self.loaded_all)
 
 
 class FetchManager(DataFetcher):
@@ -1,11 +1,17 @@
 from .abstract_database import AbstractDatabase, AbstractModel
 from .sqlite_database import SQLiteDatabase, SQLiteModel
+from .schema_catalog import SQLiteSchemaCatalog
+from .connection_manager import SQLiteConnectionManager
+from .query_compiler import SQLQueryCompiler, CompiledQuery
+from .index_advisor import SQLiteIndexAdvisor, IndexPolicy
+from .columnar import ColumnarConverter
 from .database_manager import DatabaseManager
-from .schema import FieldInfo, ForeignKey, ManyToManyField
+from .schema import FieldInfo, ForeignKey, ManyToManyField, PageCursor, IndexSuggestion
 
 __all__ = [
     'AbstractDatabase', 'AbstractModel',
-    'SQLiteDatabase', 'SQLiteModel',
+    'SQLiteDatabase', 'SQLiteModel', 'SQLiteSchemaCatalog', 'SQLiteConnectionManager',
+    'SQLQueryCompiler', 'CompiledQuery', 'SQLiteIndexAdvisor', 'IndexPolicy', 'ColumnarConverter',
     'DatabaseManager',
-    'FieldInfo', 'ForeignKey', 'ManyToManyField',
+    'FieldInfo', 'ForeignKey', 'ManyToManyField', 'PageCursor', 'IndexSuggestion',
 ]
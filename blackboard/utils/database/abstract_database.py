@@ -1,7 +1,7 @@
 
 # Type Checking Imports
 # ---------------------
-from typing import TYPE_CHECKING, Generator, List, Tuple, Union, Optional, Dict, Any
+from typing import TYPE_CHECKING, Generator, Iterable, List, Tuple, Union, Optional, Dict, Any
 if TYPE_CHECKING:
     from .schema import FieldInfo
 # Standard Library Imports
@@ -72,6 +72,11 @@ class AbstractDatabase(ABC):
         """
         return AbstractModel(self, table_name)
 
+    @abstractmethod
+    def transaction(self):
+        """Return a context manager that groups writes into a single transaction."""
+        pass
+
     @abstractmethod
     def close(self):
         """Close the database connection."""
@@ -188,6 +193,26 @@ class AbstractModel(ABC):
         """Delete a record from the database."""
         pass
 
+    @abstractmethod
+    def insert_many(self, records: Iterable[Dict[str, Union[int, str, float, None]]], chunk_size: Optional[int] = None, handle_m2m: bool = False) -> List[int]:
+        """Insert multiple records in a single transaction and return their IDs."""
+        pass
+
+    @abstractmethod
+    def update_many(self, records: Iterable[Dict[str, Union[int, str, float, None]]], pk_field: str = 'rowid', chunk_size: Optional[int] = None, handle_m2m: bool = False) -> int:
+        """Update multiple records in a single transaction."""
+        pass
+
+    @abstractmethod
+    def upsert_many(self, records: Iterable[Dict[str, Union[int, str, float, None]]], conflict_fields: Optional[List[str]] = None, chunk_size: Optional[int] = None) -> int:
+        """Insert multiple records, updating existing ones on conflict, in a single transaction."""
+        pass
+
+    @abstractmethod
+    def delete_many(self, pk_values: Iterable[Union[Dict[str, Union[int, str, float]], Union[int, str, float]]], pk_field: str = 'rowid', chunk_size: Optional[int] = None) -> int:
+        """Delete multiple records in a single transaction."""
+        pass
+
     @abstractmethod
     def get_unique_fields(self) -> List[str]:
         """Get a list of unique fields in the table."""
@@ -0,0 +1,107 @@
+# Type Checking Imports
+# ---------------------
+from typing import Any, Dict, List, Optional, Sequence
+
+# Third Party Imports
+# -------------------
+import numpy as np
+
+
+# Class Definitions
+# -----------------
+class ColumnarConverter:
+    """Convert rows fetched from SQLite into columns of NumPy arrays, typed by the declared types of their fields.
+    """
+
+    # Result formats of `SQLiteModel.query`
+    ROWS = 'rows'
+    COLUMNAR = 'columnar'
+    RESULT_FORMATS = (ROWS, COLUMNAR)
+
+    @staticmethod
+    def get_dtype(declared_type: Optional[str], nullable: bool = True) -> np.dtype:
+        """Get the NumPy dtype of a field from its declared SQLite type, following the type affinity rules of SQLite.
+
+        Fields with INTEGER affinity are int64 if they cannot hold nulls, and float64 with NaN for nulls
+        otherwise, so the dtype of a column is the same in every chunk whether or not the chunk has nulls.
+        Fields with REAL affinity are float64. Text, blob and NUMERIC fields, e.g. dates stored as text,
+        and fields of unknown type are object arrays.
+
+        Args:
+            declared_type (Optional[str]): The declared type of the field.
+            nullable (bool): Whether the field can hold nulls, e.g. it is not NOT NULL or it is joined. Defaults to True.
+
+        Examples:
+            >>> ColumnarConverter.get_dtype('INTEGER PRIMARY KEY', nullable=False)
+            dtype('int64')
+            >>> ColumnarConverter.get_dtype('INTEGER')
+            dtype('float64')
+            >>> ColumnarConverter.get_dtype('DOUBLE')
+            dtype('float64')
+            >>> ColumnarConverter.get_dtype('VARCHAR(255)')
+            dtype('O')
+            >>> ColumnarConverter.get_dtype('DATETIME')
+            dtype('O')
+        """
+        declared_type = (declared_type or '').upper()
+        if 'INT' in declared_type:
+            return np.dtype(np.float64 if nullable else np.int64)
+        if any(name in declared_type for name in ('CHAR', 'CLOB', 'TEXT', 'BLOB')):
+            return np.dtype(object)
+        if any(name in declared_type for name in ('REAL', 'FLOA', 'DOUB')):
+            return np.dtype(np.float64)
+        return np.dtype(object)
+
+    @staticmethod
+    def to_array(values: Sequence[Any], dtype: np.dtype) -> np.ndarray:
+        """Convert the values of a column to an array of `dtype`.
+
+        Nulls of float64 columns are NaN. Values that do not fit `dtype`, which the flexible typing of
+        SQLite allows, e.g. text stored in an INTEGER field, are the only case where the array is an
+        object array instead.
+
+        Examples:
+            >>> ColumnarConverter.to_array((1, 2, 3), np.dtype(np.int64))
+            array([1, 2, 3])
+            >>> ColumnarConverter.to_array((1, None, 3), np.dtype(np.float64))
+            array([ 1., nan,  3.])
+            >>> ColumnarConverter.to_array((1.5, 'n/a'), np.dtype(np.float64))
+            array([1.5, 'n/a'], dtype=object)
+        """
+        if dtype == np.int64:
+            try:
+                return np.fromiter(values, dtype=np.int64, count=len(values))
+            except (TypeError, ValueError, OverflowError):
+                pass
+
+        elif dtype == np.float64:
+            if not any(isinstance(value, (str, bytes)) for value in values):
+                try:
+                    return np.array(values, dtype=np.float64)
+                except (TypeError, ValueError):
+                    pass
+
+        # Assign into an empty array, so that list values, e.g. many-to-many data, are not expanded into dimensions
+        array = np.empty(len(values), dtype=object)
+        array[:] = values
+        return array
+
+    @staticmethod
+    def rows_to_columns(rows: List[Sequence[Any]], column_names: List[str], dtypes: Dict[str, np.dtype]) -> Dict[str, np.ndarray]:
+        """Convert rows to a mapping of column name to array, typed by `dtypes` with object arrays for other columns.
+
+        Examples:
+            >>> columns = ColumnarConverter.rows_to_columns([(1, 'a'), (2, 'b')], ['id', 'name'], {'id': np.dtype(np.int64)})
+            >>> columns['id'], columns['name']
+            (array([1, 2]), array(['a', 'b'], dtype=object))
+        """
+        columns = zip(*rows) if rows else ([] for _ in column_names)
+        return {
+            column_name: ColumnarConverter.to_array(values, dtypes.get(column_name, np.dtype(object)))
+            for column_name, values in zip(column_names, columns)
+        }
+
+
+if __name__ == '__main__':
+    import doctest
+    doctest.testmod()
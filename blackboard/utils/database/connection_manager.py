@@ -0,0 +1,121 @@
+# Type Checking Imports
+# ---------------------
+from typing import List, Optional
+
+# Standard Library Imports
+# ------------------------
+import sqlite3
+import threading
+from pathlib import Path
+
+
+# Class Definitions
+# -----------------
+class SQLiteConnectionManager:
+    """Manage one writer connection and a pool of per-thread read-only connections to a SQLite database.
+
+    Each thread that reads gets its own read-only connection, so concurrent fetches on worker threads
+    do not share a connection or cursor with the writer. Connections are opened with `check_same_thread=False`
+    because a query generator may be resumed on a different pool thread than the one that started it.
+
+    In-memory databases cannot be shared between connections, so all reads use the writer connection instead.
+    """
+
+    DEFAULT_JOURNAL_MODE = 'WAL'
+    DEFAULT_CACHE_SIZE = -64000             # Negative values are in KiB, i.e. 64 MB per connection
+    DEFAULT_MMAP_SIZE = 256 * 1024 * 1024   # 256 MB
+    DEFAULT_BUSY_TIMEOUT = 5000             # Milliseconds
+
+    # Initialization and Setup
+    # ------------------------
+    def __init__(self, db_name: str, read_only: bool = False, journal_mode: Optional[str] = DEFAULT_JOURNAL_MODE,
+                 cache_size: Optional[int] = DEFAULT_CACHE_SIZE, mmap_size: Optional[int] = DEFAULT_MMAP_SIZE,
+                 busy_timeout: Optional[int] = DEFAULT_BUSY_TIMEOUT):
+        """Open the writer connection and apply the connection pragmas.
+
+        Args:
+            db_name (str): The name of the database file.
+            read_only (bool): If True, the writer connection is also opened read-only.
+            journal_mode (Optional[str]): The journal mode to set on the database, e.g. 'WAL' or 'DELETE'.
+                If None, the journal mode of the database file is left unchanged.
+            cache_size (Optional[int]): The `cache_size` pragma applied to each connection.
+            mmap_size (Optional[int]): The `mmap_size` pragma applied to each connection.
+            busy_timeout (Optional[int]): The `busy_timeout` pragma in milliseconds applied to each connection.
+        """
+        self._db_name = db_name
+        self._read_only = read_only
+        self._pragmas = {
+            'cache_size': cache_size,
+            'mmap_size': mmap_size,
+            'busy_timeout': busy_timeout,
+        }
+
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._read_connections: List[sqlite3.Connection] = []
+
+        self._writer = self._connect(read_only=read_only)
+        if journal_mode and not read_only and self.is_shareable:
+            self._writer.execute(f'PRAGMA journal_mode={journal_mode}')
+
+    # Public Methods
+    # --------------
+    def get_read_connection(self) -> sqlite3.Connection:
+        """Get the read-only connection of the calling thread, opening it on first use.
+        """
+        if not self.is_shareable:
+            return self._writer
+
+        if (connection := getattr(self._local, 'connection', None)) is None:
+            connection = self._connect(read_only=True)
+            self._local.connection = connection
+            with self._lock:
+                self._read_connections.append(connection)
+
+        return connection
+
+    def close(self):
+        """Close the writer and all read connections.
+        """
+        with self._lock:
+            read_connections, self._read_connections = self._read_connections, []
+
+        for connection in read_connections:
+            connection.close()
+
+        if self._writer:
+            self._writer.close()
+            self._writer = None
+
+    # Class Properties
+    # ----------------
+    @property
+    def writer(self) -> sqlite3.Connection:
+        """Get the connection used for writes and schema changes.
+        """
+        return self._writer
+
+    @property
+    def is_shareable(self) -> bool:
+        """Check whether the database can be opened by more than one connection.
+        """
+        return self._db_name not in ('', ':memory:') and not self._db_name.startswith('file::memory:')
+
+    # Private Methods
+    # ---------------
+    def _connect(self, read_only: bool = False) -> sqlite3.Connection:
+        """Open a connection with the configured pragmas.
+        """
+        if read_only:
+            database_uri = f'{Path(self._db_name).resolve().as_uri()}?mode=ro'
+            connection = sqlite3.connect(database_uri, uri=True, check_same_thread=False)
+        else:
+            connection = sqlite3.connect(self._db_name, check_same_thread=False)
+
+        connection.row_factory = sqlite3.Row
+        for pragma_name, value in self._pragmas.items():
+            if value is None:
+                continue
+            connection.execute(f'PRAGMA {pragma_name}={int(value)}')
+
+        return connection
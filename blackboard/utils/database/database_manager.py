@@ -1,8 +1,9 @@
 # Type Checking Imports
 # ---------------------
-from typing import TYPE_CHECKING, List, Optional, Dict
+from typing import TYPE_CHECKING, List, Optional, Dict, Tuple
 if TYPE_CHECKING:
     from .abstract_database import AbstractModel
+    from .schema import IndexSuggestion
 
 # Standard Library Imports
 # ------------------------
@@ -26,18 +27,20 @@ class DatabaseManager:
         'sqlite': SQLiteDatabase
     }
 
-    def __init__(self, db_name: str, db_type: str = 'sqlite'):
+    def __init__(self, db_name: str, db_type: str = 'sqlite', **connection_options):
         """Initialize a DatabaseManager instance to interact with a SQLite database.
 
         Args:
             db_name (str): The name of the SQLite database file.
+            **connection_options: Extra options passed to the database connection class,
+                e.g. `journal_mode` or `busy_timeout` for `SQLiteDatabase`.
 
         Raises:
             sqlite3.Error: If there is an error connecting to the database.
         """
         self._db_name = db_name
 
-        self.db_connection = self.DB_TYPE_TO_DATABASE_CONNECTION.get(db_type)(db_name)
+        self.db_connection = self.DB_TYPE_TO_DATABASE_CONNECTION.get(db_type)(db_name, **connection_options)
         self.connection = self.db_connection.connection
         self.cursor = self.db_connection.cursor
 
@@ -107,6 +110,15 @@ class DatabaseManager:
 
     def get_model(self, table_name: str) -> 'AbstractModel':
         return self.db_connection.get_model(table_name)
+
+    def transaction(self):
+        """Group writes into a single transaction, deferring the commits of all model calls made inside it.
+
+        Examples:
+            >>> with db_manager.transaction():                             # doctest: +SKIP
+            ...     db_manager.get_model('shots').insert_many(records)
+        """
+        return self.db_connection.transaction()
     
     # Additional
     def create_junction_table(self, from_table: str, to_table: str, from_field: str = 'id', to_field: str = 'id',
@@ -135,6 +147,37 @@ class DatabaseManager:
         )
     # -------------
 
+    # Index Advisor
+    # -------------
+    def get_index_suggestions(self) -> List['IndexSuggestion']:
+        """Retrieve the indexes suggested from the plans of the queries executed so far, most used first.
+        """
+        return self.db_connection.index_advisor.get_suggestions()
+
+    def create_suggested_indexes(self, suggestions: Optional[List['IndexSuggestion']] = None) -> List[str]:
+        """Create the indexes of suggestions, all pending suggestions by default.
+
+        Returns:
+            List[str]: The names of the created indexes.
+        """
+        return self.db_connection.index_advisor.create_indexes(suggestions)
+
+    def get_advised_indexes(self) -> Dict[str, Tuple[str, List[str]]]:
+        """Retrieve the indexes created from suggestions, as a mapping of index name to its table name and fields.
+        """
+        return self.db_connection.index_advisor.get_created_indexes()
+
+    def drop_advised_index(self, index_name: str):
+        """Drop an index created from a suggestion.
+
+        Args:
+            index_name (str): The name of the index.
+
+        Raises:
+            ValueError: If the index was not created from a suggestion.
+        """
+        self.db_connection.index_advisor.drop_index(index_name)
+
     # TODO: May obsolete
     def get_existing_enum_tables(self) -> List[str]:
         """Get a list of existing enum tables.
@@ -148,18 +191,7 @@ class DatabaseManager:
     def get_enum_table_name(self, table_name: str, field_name: str) -> Optional[str]:
         """Retrieve the name of the enum table associated with a given field.
         """
-        try:
-            self.db_connection.cursor.execute('''
-                SELECT enum_table_name FROM _meta_enum_field
-                WHERE table_name = ? AND field_name = ?;
-            ''', (table_name, field_name))
-        except sqlite3.OperationalError:
-            pass
-
-        if not (results := self.db_connection.cursor.fetchone()):
-            return
-
-        return results[0]
+        return self.db_connection.schema_catalog.get_enum_table_name(table_name, field_name)
 
     def get_enum_values(self, enum_table_name: str) -> List[str]:
         """Retrieve all values from an enum table.
@@ -189,13 +221,14 @@ class DatabaseManager:
         if not table_name.isidentifier():
             raise ValueError("Invalid enum name")
 
-        self.db_connection.cursor.execute(f"CREATE TABLE IF NOT EXISTS {table_name} (id INTEGER PRIMARY KEY AUTOINCREMENT, value TEXT UNIQUE)")
+        with self.db_connection.transaction():
+            self.db_connection.cursor.execute(f"CREATE TABLE IF NOT EXISTS {table_name} (id INTEGER PRIMARY KEY AUTOINCREMENT, value TEXT UNIQUE)")
 
-        # Insert enum values
-        for value in values:
-            self.db_connection.cursor.execute(f"INSERT OR IGNORE INTO {table_name} (value) VALUES (?)", (value,))
+            # Insert enum values
+            for value in values:
+                self.db_connection.cursor.execute(f"INSERT OR IGNORE INTO {table_name} (value) VALUES (?)", (value,))
 
-        self.connection.commit()
+        self.db_connection.schema_catalog.invalidate()
 
 # NOTE: WIP
 class ViewModel:
@@ -0,0 +1,349 @@
+# Type Checking Imports
+# ---------------------
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set, Tuple
+if TYPE_CHECKING:
+    from .query_compiler import CompiledQuery
+    from .sqlite_database import SQLiteDatabase
+
+# Standard Library Imports
+# ------------------------
+import logging
+import re
+import sqlite3
+import threading
+from enum import Enum
+
+# Local Imports
+# -------------
+from .schema import IndexSuggestion
+
+
+# Class Definitions
+# -----------------
+class IndexPolicy(Enum):
+    """Determines what `SQLiteIndexAdvisor` does with the indexes it finds missing.
+    """
+    OFF = 'off'             # Do not analyze queries
+    SUGGEST = 'suggest'     # Collect suggestions to be reviewed and created on demand
+    CREATE = 'create'       # Create suggested indexes in the background as soon as they are found
+
+
+class SQLiteIndexAdvisor:
+    """Suggest secondary indexes from the query plans of queries built by `SQLQueryBuilder`.
+
+    Each distinct query template is analyzed once with `EXPLAIN QUERY PLAN`. An index is suggested when:
+
+    - a table is scanned while the query filters it on fields that an index can serve,
+    - SQLite builds an automatic index to join a table, e.g. for one-to-many relations,
+    - the rows are sorted in a temporary B-tree by fields of the queried table, e.g. foreign keys.
+
+    Indexes created from suggestions are named with the `IndexSuggestion.INDEX_NAME_PREFIX` prefix,
+    so they can be listed and dropped without touching the indexes of the schema itself.
+
+    With `IndexPolicy.CREATE`, indexes are created by a background thread once the write lock of the
+    database is free, so the query that found them is neither delayed nor run inside a write.
+    """
+
+    # Maximum number of query templates remembered as analyzed
+    MAX_ANALYZED_QUERIES = 1024
+
+    # Matches a step of the query plan, e.g. "SCAN _" or "SEARCH assets USING AUTOMATIC COVERING INDEX (task=?)"
+    PLAN_STEP_PATTERN = re.compile(r'^(SCAN|SEARCH) (\S+)(?: USING (.*))?')
+    AUTOMATIC_INDEX_PATTERN = re.compile(r'AUTOMATIC (?:PARTIAL )?(?:COVERING )?INDEX \((.*)\)')
+
+    # Initialization and Setup
+    # ------------------------
+    def __init__(self, database: 'SQLiteDatabase', policy: IndexPolicy = IndexPolicy.SUGGEST):
+        """Initialize the advisor for a database.
+
+        Args:
+            database (SQLiteDatabase): The database whose queries are analyzed.
+            policy (IndexPolicy): What to do with missing indexes. Defaults to `IndexPolicy.SUGGEST`.
+        """
+        self._database = database
+        self.policy = IndexPolicy(policy)
+
+        self._lock = threading.Lock()
+        self._analyzed_queries: Set[str] = set()
+        self._suggestions: Dict[str, IndexSuggestion] = {}
+        # Suggestions waiting to be created by the creation thread, with `IndexPolicy.CREATE`
+        self._pending_creations: Dict[str, IndexSuggestion] = {}
+        self._creation_thread: Optional[threading.Thread] = None
+
+    # Public Methods
+    # --------------
+    def observe(self, compiled_query: 'CompiledQuery', values: List[Any]):
+        """Analyze the plan of a query the first time its template is executed.
+
+        Args:
+            compiled_query (CompiledQuery): The compiled query about to be executed.
+            values (List[Any]): The values bound to the query.
+        """
+        if self.policy is IndexPolicy.OFF or not compiled_query.model:
+            return
+
+        with self._lock:
+            if compiled_query.sql in self._analyzed_queries:
+                return
+            if len(self._analyzed_queries) >= self.MAX_ANALYZED_QUERIES:
+                self._analyzed_queries.clear()
+            self._analyzed_queries.add(compiled_query.sql)
+
+        try:
+            suggestions = self.analyze(compiled_query, values)
+        except sqlite3.Error as e:
+            logging.warning(f"Could not analyze the query plan of a query on '{compiled_query.model}': {e}")
+            return
+
+        with self._lock:
+            for suggestion in suggestions:
+                if suggestion.index_name in self._suggestions:
+                    self._suggestions[suggestion.index_name].query_count += 1
+                else:
+                    self._suggestions[suggestion.index_name] = suggestion
+
+        if self.policy is IndexPolicy.CREATE and suggestions:
+            self._schedule_creation(suggestions)
+
+    def analyze(self, compiled_query: 'CompiledQuery', values: Optional[List[Any]] = None) -> List[IndexSuggestion]:
+        """Find the indexes missing for a query from its query plan.
+
+        Args:
+            compiled_query (CompiledQuery): The compiled query to analyze.
+            values (Optional[List[Any]]): The values bound to the query.
+
+        Returns:
+            List[IndexSuggestion]: The suggested indexes, excluding indexes that already exist.
+
+        Raises:
+            sqlite3.Error: If the query plan cannot be retrieved.
+        """
+        cursor = self._database.get_read_connection().cursor()
+        try:
+            cursor.execute(f"EXPLAIN QUERY PLAN {compiled_query.sql}", values or [])
+            plan_steps = [row[3] for row in cursor.fetchall()]
+        finally:
+            cursor.close()
+
+        model = compiled_query.model
+        plan_aliases = [match.group(2) for plan_step in plan_steps if (match := self.PLAN_STEP_PATTERN.match(plan_step))]
+        alias_to_table = self._resolve_aliases(model, compiled_query.relationships, plan_aliases)
+
+        # Group the indexable filter fields by the alias of their table
+        alias_to_filter_fields: Dict[str, List[str]] = {}
+        for field in compiled_query.filter_fields:
+            alias, _, field_name = field.rpartition('.')
+            alias_to_filter_fields.setdefault(alias or '_', []).append(field_name)
+
+        suggestions = []
+        for plan_step in plan_steps:
+            if plan_step.startswith('USE TEMP B-TREE FOR ORDER BY') and compiled_query.order_by:
+                # Only the leading sort fields of the queried table can be served by an index
+                sort_fields = []
+                for field in compiled_query.order_by:
+                    if '.' in field:
+                        break
+                    sort_fields.append(field)
+                if sort_fields and '_' not in alias_to_filter_fields:
+                    suggestions.append(IndexSuggestion(model, tuple(sort_fields), plan_step))
+                continue
+
+            if not (match := self.PLAN_STEP_PATTERN.match(plan_step)):
+                continue
+
+            operation, alias, using = match.groups()
+            if alias not in alias_to_table:
+                continue
+            table_name, join_field = alias_to_table[alias]
+
+            if operation == 'SEARCH' and using and (index_match := self.AUTOMATIC_INDEX_PATTERN.search(using)):
+                fields = tuple(term.split('=')[0].strip() for term in index_match.group(1).split(' AND '))
+                suggestions.append(IndexSuggestion(table_name, fields, plan_step))
+            elif alias in alias_to_filter_fields:
+                # Filtered fields of a table that is scanned, or only looked up by its join field,
+                # let SQLite start from that table instead of scanning the queried table
+                for field in alias_to_filter_fields[alias]:
+                    if operation == 'SCAN' or f'({field}' not in (using or ''):
+                        suggestions.append(IndexSuggestion(table_name, (field,), plan_step))
+            elif operation == 'SCAN' and join_field:
+                suggestions.append(IndexSuggestion(table_name, (join_field,), plan_step))
+
+        unique_suggestions = {suggestion.index_name: suggestion for suggestion in suggestions}
+        return [suggestion for suggestion in unique_suggestions.values() if not self._is_indexed(suggestion)]
+
+    def get_suggestions(self) -> List[IndexSuggestion]:
+        """Retrieve the pending suggestions, most used first.
+        """
+        with self._lock:
+            suggestions = [suggestion for suggestion in self._suggestions.values() if not self._is_indexed(suggestion)]
+        return sorted(suggestions, key=lambda suggestion: -suggestion.query_count)
+
+    def create_indexes(self, suggestions: Optional[List[IndexSuggestion]] = None) -> List[str]:
+        """Create the indexes of suggestions.
+
+        Args:
+            suggestions (Optional[List[IndexSuggestion]]): The suggestions to create. Defaults to all pending suggestions.
+
+        Returns:
+            List[str]: The names of the created indexes.
+        """
+        suggestions = self.get_suggestions() if suggestions is None else suggestions
+
+        index_names = []
+        with self._database.transaction():
+            # Use a cursor of our own, the shared cursor of the database may be in use by another thread
+            cursor = self._database.connection.cursor()
+            try:
+                for suggestion in suggestions:
+                    cursor.execute(suggestion.get_index_definition())
+                    index_names.append(suggestion.index_name)
+            finally:
+                cursor.close()
+        self._database.schema_catalog.invalidate()
+
+        with self._lock:
+            for index_name in index_names:
+                self._suggestions.pop(index_name, None)
+            # Plans change with the new indexes
+            self._analyzed_queries.clear()
+
+        return index_names
+
+    def get_created_indexes(self) -> Dict[str, Tuple[str, List[str]]]:
+        """Retrieve the indexes created from suggestions.
+
+        Returns:
+            Dict[str, Tuple[str, List[str]]]: A mapping of index name to its table name and indexed fields.
+        """
+        schema_catalog = self._database.schema_catalog
+        created_indexes = {}
+        for table_name in sorted(schema_catalog.get_table_names()):
+            for index_name, fields in schema_catalog.get_indexes(table_name).items():
+                if index_name.startswith(IndexSuggestion.INDEX_NAME_PREFIX):
+                    created_indexes[index_name] = (table_name, fields)
+        return created_indexes
+
+    def drop_index(self, index_name: str):
+        """Drop an index created from a suggestion.
+
+        Raises:
+            ValueError: If the index was not created from a suggestion.
+        """
+        if not index_name.isidentifier() or not index_name.startswith(IndexSuggestion.INDEX_NAME_PREFIX):
+            raise ValueError(f"Index '{index_name}' was not created by the index advisor")
+
+        with self._database.transaction():
+            self._database.connection.execute(f"DROP INDEX IF EXISTS {index_name}")
+        self._database.schema_catalog.invalidate()
+
+        with self._lock:
+            self._analyzed_queries.clear()
+
+    def wait_for_creations(self, timeout: Optional[float] = None) -> bool:
+        """Wait until the indexes scheduled with `IndexPolicy.CREATE` are created.
+
+        Args:
+            timeout (Optional[float]): The maximum time to wait, in seconds. Defaults to no limit.
+
+        Returns:
+            bool: True if no creation is pending anymore, False if the timeout expired.
+        """
+        with self._lock:
+            creation_thread = self._creation_thread
+        if creation_thread is not None:
+            creation_thread.join(timeout)
+            return not creation_thread.is_alive()
+        return True
+
+    def clear(self):
+        """Discard all suggestions and analyze every query again.
+        """
+        with self._lock:
+            self._suggestions.clear()
+            self._pending_creations.clear()
+            self._analyzed_queries.clear()
+
+    # Private Methods
+    # ---------------
+    def _schedule_creation(self, suggestions: List[IndexSuggestion]):
+        """Queue suggestions to be created by the creation thread, starting it if it is not running.
+        """
+        with self._lock:
+            for suggestion in suggestions:
+                self._pending_creations[suggestion.index_name] = suggestion
+
+            if self._creation_thread is None:
+                self._creation_thread = threading.Thread(
+                    target=self._create_pending_indexes, name='SQLiteIndexAdvisor', daemon=True
+                )
+                self._creation_thread.start()
+
+    def _create_pending_indexes(self):
+        """Create the queued suggestions until the queue is empty, waiting for the write lock of the database.
+        """
+        while True:
+            with self._lock:
+                suggestions = list(self._pending_creations.values())
+                self._pending_creations.clear()
+                if not suggestions:
+                    self._creation_thread = None
+                    return
+
+            try:
+                suggestions = [suggestion for suggestion in suggestions if not self._is_indexed(suggestion)]
+                if suggestions:
+                    self.create_indexes(suggestions)
+            except sqlite3.Error as e:
+                logging.warning(f"Could not create the suggested indexes {[suggestion.index_name for suggestion in suggestions]}: {e}")
+
+    def _resolve_aliases(self, model: str, relationships: Optional[Dict[str, str]],
+                         aliases: List[str]) -> Dict[str, Tuple[str, Optional[str]]]:
+        """Map table aliases used by `SQLQueryBuilder` to their table name and the field they are joined on.
+
+        Aliases of joined tables are relation chains, e.g. 'shot.sequence'. Aliases that are not
+        relation chains of `model`, e.g. tables of subqueries, are left out.
+        """
+        alias_to_table = {'_': (model, None)}
+        if not relationships:
+            return alias_to_table
+
+        relationships = {
+            f'{model}.{key}' if '.' not in key else key: value
+            for key, value in relationships.items()
+        }
+
+        def resolve(chain: str) -> Optional[Tuple[str, Optional[str]]]:
+            if chain in alias_to_table:
+                return alias_to_table[chain]
+
+            parent_chain, _, field = chain.rpartition('.')
+            parent = resolve(parent_chain or '_')
+            if parent is None or (right_table_field := relationships.get(f'{parent[0]}.{field}')) is None:
+                return None
+
+            right_table, right_field = right_table_field.rsplit('.', 1)
+            alias_to_table[chain] = (right_table, right_field)
+            return alias_to_table[chain]
+
+        for alias in aliases:
+            resolve(alias)
+
+        return alias_to_table
+
+    def _is_indexed(self, suggestion: IndexSuggestion) -> bool:
+        """Check whether the fields of a suggestion are already the leading fields of an index, or the rowid.
+        """
+        schema_catalog = self._database.schema_catalog
+        if not schema_catalog.has_table(suggestion.table_name):
+            return True
+
+        fields = list(suggestion.fields)
+        if len(fields) == 1:
+            primary_keys = [row[1] for row in schema_catalog.get_table_info(suggestion.table_name) if row[5]]
+            if fields[0] == 'rowid' or (primary_keys == fields):
+                return True
+
+        return any(
+            index_fields[:len(fields)] == fields
+            for index_fields in schema_catalog.get_indexes(suggestion.table_name).values()
+        )
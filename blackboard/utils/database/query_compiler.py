@@ -0,0 +1,289 @@
+# Type Checking Imports
+# ---------------------
+from typing import Any, Dict, Hashable, Iterable, List, Optional, Set, Tuple
+
+# Standard Library Imports
+# ------------------------
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+
+# Local Imports
+# -------------
+from blackboard.enums.view_enum import GroupOperator, SortOrder, FilterOperation
+from .sql_query_builder import SQLQueryBuilder
+
+
+# Class Definitions
+# -----------------
+@dataclass(frozen=True)
+class CompiledQuery:
+    """Represents a SQL template built by `SQLQueryBuilder.build_query` for one query shape.
+
+    LIMIT and OFFSET are bound as parameters, so queries that only differ by their
+    values, page position or keyset share the same template.
+    """
+    sql: str                                        # The SQL template with `?` placeholders
+    grouped_field_aliases: Set[str]                 # The aliases of one-to-many fields aggregated with JSON_GROUP_ARRAY
+    order_by: Optional[Dict[str, SortOrder]] = None # The sort fields, used to bind the keyset values
+    model: Optional[str] = None                     # The name of the queried table
+    relationships: Optional[Dict[str, str]] = None  # The relationships used to build the joins
+    filter_fields: Tuple[str, ...] = ()             # The fields compared in WHERE by operations that an index can serve
+    has_keyset: bool = False
+    not_null_fields: Tuple[str, ...] = ()           # The sort fields that cannot be null, used to bind the keyset values
+    has_limit: bool = False
+    has_offset: bool = False
+
+    def bind(self, condition_values: List[Any], keyset: Optional[Dict[str, Any]] = None,
+             limit: Optional[int] = None, offset: Optional[int] = None) -> List[Any]:
+        """Build the parameter list of the template.
+
+        Args:
+            condition_values (List[Any]): The values of the WHERE conditions, in placeholder order.
+            keyset (Optional[Dict[str, Any]]): The `order_by` values of the last row of the previous page.
+            limit (Optional[int]): The maximum number of rows.
+            offset (Optional[int]): The number of rows to skip.
+
+        Returns:
+            List[Any]: The values to pass to `cursor.execute` along with `sql`.
+        """
+        values = list(condition_values)
+        if self.has_keyset:
+            values.extend(SQLQueryBuilder.build_keyset_values(self.order_by, keyset, self.not_null_fields))
+        if self.has_limit or self.has_offset:
+            values.append(limit if self.has_limit else -1)
+        if self.has_offset:
+            values.append(offset)
+        return values
+
+
+class SQLQueryCompiler:
+    """Memoize `SQLQueryBuilder.build_query` by the structural shape of the query.
+
+    The shape covers the model, fields, relationships, the condition tree with its operators
+    (and the number of values of IN operators), the sort order, and whether a keyset, limit or
+    offset is used. Queries that only differ by their values reuse the cached template, and only
+    the condition tree is walked to collect the new values.
+    """
+
+    # Maximum number of cached templates
+    DEFAULT_MAX_SIZE = 256
+
+    # Operations that can be served by a B-tree index, unlike e.g. `contains` with its leading wildcard
+    INDEXABLE_OPERATIONS = {
+        FilterOperation.EQ, FilterOperation.LT, FilterOperation.GT, FilterOperation.LTE, FilterOperation.GTE,
+        FilterOperation.BEFORE, FilterOperation.AFTER, FilterOperation.IN, FilterOperation.BETWEEN,
+        FilterOperation.IS_NULL,
+    }
+
+    # Initialization and Setup
+    # ------------------------
+    def __init__(self, max_size: int = DEFAULT_MAX_SIZE):
+        """Initialize an empty compiler cache.
+
+        Args:
+            max_size (int): The maximum number of cached templates. The least recently used
+                template is discarded when it is exceeded.
+        """
+        self.max_size = max_size
+
+        self._lock = threading.Lock()
+        self._compiled_queries: OrderedDict[Hashable, CompiledQuery] = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+
+    # Public Methods
+    # --------------
+    def compile(self, model: str, fields = None, conditions = None, relationships = None,
+                order_by: Optional[Dict[str, SortOrder]] = None, has_keyset: bool = False,
+                has_limit: bool = False, has_offset: bool = False,
+                not_null_fields: Optional[Iterable[str]] = None) -> Tuple[CompiledQuery, List[Any]]:
+        """Get the compiled template of a query, building it on a cache miss.
+
+        Args:
+            model, fields, conditions, relationships, order_by, not_null_fields: See `SQLQueryBuilder.build_query`.
+            has_keyset (bool): Whether the query seeks after a keyset.
+            has_limit (bool): Whether the query has a LIMIT.
+            has_offset (bool): Whether the query has an OFFSET.
+
+        Returns:
+            Tuple[CompiledQuery, List[Any]]: The compiled template and the values extracted from `conditions`.
+
+        Raises:
+            ValueError: If a multi-value operation is not given an iterable of values.
+        """
+        condition_shape, condition_values = self._extract_condition_shape(conditions)
+        not_null_fields = tuple(field for field in order_by or () if field in set(not_null_fields or ())) if has_keyset else ()
+        key = (
+            model,
+            self._make_fields_key(fields),
+            frozenset(relationships.items()) if relationships else None,
+            condition_shape,
+            self._make_order_by_key(order_by),
+            has_keyset,
+            not_null_fields,
+            has_limit,
+            has_offset,
+        )
+
+        with self._lock:
+            compiled_query = self._compiled_queries.get(key)
+            if compiled_query is not None:
+                self._compiled_queries.move_to_end(key)
+                self._hits += 1
+                return compiled_query, condition_values
+            self._misses += 1
+
+        sql, _values, grouped_field_aliases = SQLQueryBuilder.build_query(
+            model=model,
+            fields=fields,
+            conditions=conditions,
+            relationships=relationships,
+            order_by=order_by,
+            keyset=dict.fromkeys(order_by) if has_keyset else None,
+            not_null_fields=not_null_fields,
+        )
+
+        # LIMIT and OFFSET are always the last clauses, so they are appended as placeholders
+        if has_limit or has_offset:
+            sql += '\nLIMIT\n\t?'
+        if has_offset:
+            sql += '\nOFFSET\n\t?'
+
+        compiled_query = CompiledQuery(
+            sql=sql,
+            grouped_field_aliases=grouped_field_aliases,
+            order_by=dict(order_by) if isinstance(order_by, dict) else None,
+            model=model,
+            relationships=dict(relationships) if relationships else None,
+            filter_fields=tuple(self._extract_filter_fields(condition_shape)),
+            has_keyset=has_keyset,
+            not_null_fields=not_null_fields,
+            has_limit=has_limit,
+            has_offset=has_offset,
+        )
+
+        with self._lock:
+            self._compiled_queries[key] = compiled_query
+            while len(self._compiled_queries) > self.max_size:
+                self._compiled_queries.popitem(last=False)
+
+        return compiled_query, condition_values
+
+    def build_query(self, model: str, fields = None, conditions = None, relationships = None,
+                    order_by: Optional[Dict[str, SortOrder]] = None, limit: int = None, values = None,
+                    offset: Optional[int] = None, keyset: Optional[Dict[str, Any]] = None,
+                    not_null_fields: Optional[Iterable[str]] = None):
+        """Cached equivalent of `SQLQueryBuilder.build_query`, returning the same (query, values, grouped_field_aliases) tuple.
+        """
+        compiled_query, condition_values = self.compile(
+            model=model,
+            fields=fields,
+            conditions=conditions,
+            relationships=relationships,
+            order_by=order_by,
+            has_keyset=bool(keyset),
+            has_limit=bool(limit),
+            has_offset=bool(offset),
+            not_null_fields=not_null_fields,
+        )
+        values = compiled_query.bind(values or condition_values, keyset=keyset, limit=limit, offset=offset)
+        return compiled_query.sql, values, compiled_query.grouped_field_aliases
+
+    def clear(self):
+        """Discard all cached templates and reset the counters.
+        """
+        with self._lock:
+            self._compiled_queries.clear()
+            self._hits = 0
+            self._misses = 0
+
+    # Class Properties
+    # ----------------
+    @property
+    def hits(self) -> int:
+        """Get the number of queries served from the cache.
+        """
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        """Get the number of queries that had to be built.
+        """
+        return self._misses
+
+    # Private Methods
+    # ---------------
+    @classmethod
+    def _extract_condition_shape(cls, conditions) -> Tuple[Hashable, List[Any]]:
+        """Walk a condition tree in the same order as `SQLQueryBuilder.build_where_clause`, returning
+        its shape without the values, and the values in placeholder order.
+        """
+        if not conditions:
+            return None, []
+
+        if isinstance(conditions, str):
+            return conditions, []
+
+        shape = []
+        values = []
+        for key, value in SQLQueryBuilder._extract_key_value_pairs(conditions):
+            if isinstance(key, GroupOperator) or GroupOperator.is_valid(key):
+                sub_shape, sub_values = cls._extract_condition_shape(value)
+                shape.append((key, sub_shape))
+                values.extend(sub_values)
+                continue
+
+            if not isinstance(value, dict):
+                operator = FilterOperation.EQ
+            else:
+                operator, value = next(iter(value.items()))
+
+            if not isinstance(operator, FilterOperation):
+                operator = FilterOperation.from_string(operator)
+
+            value_count = None
+            if operator.is_multi_value():
+                if not isinstance(value, Iterable) or isinstance(value, (str, bytes)):
+                    raise ValueError(f"For '{operator}' operation, value should be an iterable (but not a string or bytes)")
+                value = list(value)
+                value_count = len(value)
+
+            shape.append((key, operator, value_count))
+            value = SQLQueryBuilder._build_condition_value(operator, value)
+
+            if operator.is_multi_value() or operator.num_values > 1:
+                values.extend(value)
+            elif operator.requires_value():
+                values.append(value)
+
+        return tuple(shape), values
+
+    @classmethod
+    def _extract_filter_fields(cls, condition_shape: Hashable) -> List[str]:
+        """Collect the fields of a condition shape that are compared by an operation that an index can serve.
+        """
+        if not condition_shape or isinstance(condition_shape, str):
+            return []
+
+        filter_fields = []
+        for key, *shape in condition_shape:
+            if len(shape) == 1:
+                filter_fields.extend(field for field in cls._extract_filter_fields(shape[0]) if field not in filter_fields)
+            elif shape[0] in cls.INDEXABLE_OPERATIONS and key not in filter_fields:
+                filter_fields.append(key)
+        return filter_fields
+
+    @staticmethod
+    def _make_fields_key(fields) -> Hashable:
+        if not fields or isinstance(fields, str):
+            return fields
+        if isinstance(fields, dict):
+            return tuple(fields.items())
+        return tuple(field if isinstance(field, str) else tuple(field.items()) for field in fields)
+
+    @staticmethod
+    def _make_order_by_key(order_by) -> Hashable:
+        if not order_by or isinstance(order_by, str):
+            return order_by
+        return tuple((field, str(direction).upper()) for field, direction in order_by.items())
@@ -1,6 +1,6 @@
 # Type Checking Imports
 # ---------------------
-from typing import TYPE_CHECKING, List, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
 if TYPE_CHECKING:
     from .database_manager import DatabaseManager
 
@@ -89,6 +89,36 @@ class FieldInfo:
         """
         return self.m2m is not None
 
+@dataclass
+class PageCursor:
+    """Represents the position after the last row of a page returned by `SQLiteModel.query_page`.
+
+    Holds only plain values, so a page can be re-fetched from a new connection.
+    """
+    offset: int = 0                                 # Number of rows before the next page, used as the OFFSET fallback
+    keyset: Optional[Dict[str, Any]] = None         # The sort field values of the last row, used for keyset pagination
+
+@dataclass
+class IndexSuggestion:
+    """Represents a secondary index suggested by `SQLiteIndexAdvisor` from a query plan.
+    """
+    table_name: str                                 # The name of the table to index
+    fields: Tuple[str, ...]                         # The names of the fields to index, in index order
+    reason: str                                     # The query plan step that led to the suggestion, e.g. 'SCAN _'
+    query_count: int = 1                            # The number of distinct queries that would use the index
+
+    # Prefix of the names of indexes created from suggestions
+    INDEX_NAME_PREFIX = '_idx_'
+
+    @property
+    def index_name(self) -> str:
+        return f"{self.INDEX_NAME_PREFIX}{self.table_name}_{'_'.join(self.fields)}"
+
+    def get_index_definition(self) -> str:
+        """Generate the SQL statement that creates the index.
+        """
+        return f"CREATE INDEX IF NOT EXISTS {self.index_name} ON {self.table_name} ({', '.join(self.fields)})"
+
 # NOTE: WIP
 @dataclass
 class RelationStep:
@@ -0,0 +1,250 @@
+# Type Checking Imports
+# ---------------------
+from typing import TYPE_CHECKING, List, Optional, Dict, Tuple, Set
+if TYPE_CHECKING:
+    from .sqlite_database import SQLiteDatabase
+
+# Standard Library Imports
+# ------------------------
+import sqlite3
+import threading
+import time
+
+# Local Imports
+# -------------
+from .schema import ManyToManyField, ForeignKey
+
+
+# Class Definitions
+# -----------------
+class SQLiteSchemaCatalog:
+    """Per-database cache of schema metadata.
+
+    Holds table fields, foreign keys, unique indexes, many-to-many junctions and display/enum
+    metadata, loading each piece lazily on first access. Schema changes made through `SQLiteDatabase`
+    and `SQLiteModel` call `invalidate` directly. Changes made by other connections are detected
+    through `PRAGMA schema_version`, which is checked at most once every `check_interval` seconds.
+    """
+
+    # Interval in seconds between `PRAGMA schema_version` staleness checks
+    DEFAULT_CHECK_INTERVAL = 1.0
+
+    # Initialization and Setup
+    # ------------------------
+    def __init__(self, database: 'SQLiteDatabase', check_interval: Optional[float] = DEFAULT_CHECK_INTERVAL):
+        """Initialize the catalog for a database.
+
+        Args:
+            database (SQLiteDatabase): The database to cache metadata for.
+            check_interval (Optional[float]): The interval in seconds between staleness checks.
+                If None, the catalog is only refreshed by explicit invalidation.
+        """
+        self._database = database
+        self.check_interval = check_interval
+
+        self._lock = threading.RLock()
+        self._schema_version = None
+        self._last_checked_time = 0.0
+
+        self.__init_cache()
+
+    def __init_cache(self):
+        """Reset all cached metadata.
+        """
+        self._table_names: Optional[Set[str]] = None
+        self._table_infos: Dict[str, List[Tuple]] = {}
+        self._foreign_keys: Dict[str, List[ForeignKey]] = {}
+        self._unique_fields: Dict[str, List[str]] = {}
+        self._indexes: Dict[str, Dict[str, List[str]]] = {}
+        self._junction_tables: Optional[Dict[str, Dict[str, str]]] = None
+        self._many_to_many_fields: Dict[str, Dict[str, ManyToManyField]] = {}
+        self._display_fields: Optional[Dict[Tuple[str, str], str]] = None
+        self._enum_table_names: Optional[Dict[Tuple[str, str], str]] = None
+
+    # Public Methods
+    # --------------
+    def invalidate(self):
+        """Discard all cached metadata so it is reloaded on next access.
+        """
+        with self._lock:
+            self.__init_cache()
+            self._schema_version = None
+            self._last_checked_time = 0.0
+
+    def validate(self, force: bool = False):
+        """Invalidate the cache if the schema version changed since the metadata was loaded.
+
+        Args:
+            force (bool): Check the schema version even if `check_interval` has not elapsed.
+        """
+        current_time = time.monotonic()
+        if not force and (self.check_interval is None or current_time - self._last_checked_time < self.check_interval):
+            return
+
+        with self._lock:
+            self._last_checked_time = current_time
+            schema_version = self._execute('PRAGMA schema_version')[0][0]
+            if self._schema_version is not None and schema_version != self._schema_version:
+                self.__init_cache()
+            self._schema_version = schema_version
+
+    def get_table_names(self) -> Set[str]:
+        """Retrieve the names of all tables in the database.
+        """
+        with self._lock:
+            self.validate()
+            if self._table_names is None:
+                rows = self._execute("SELECT name FROM sqlite_master WHERE type='table'")
+                self._table_names = {row[0] for row in rows}
+            return self._table_names
+
+    def has_table(self, table_name: str) -> bool:
+        """Check whether a table exists in the database.
+        """
+        return table_name in self.get_table_names()
+
+    def get_table_info(self, table_name: str) -> List[Tuple]:
+        """Retrieve the `PRAGMA table_info` rows of a table as tuples of
+        (cid, name, type, notnull, dflt_value, pk).
+        """
+        with self._lock:
+            self.validate()
+            if table_name not in self._table_infos:
+                rows = self._execute(f"PRAGMA table_info({table_name})")
+                self._table_infos[table_name] = [tuple(row) for row in rows]
+            return self._table_infos[table_name]
+
+    def get_foreign_keys(self, table_name: str) -> List[ForeignKey]:
+        """Retrieve the foreign key constraints of a table.
+        """
+        with self._lock:
+            self.validate()
+            if table_name not in self._foreign_keys:
+                foreign_keys = []
+                for row in self._execute(f"PRAGMA foreign_key_list('{table_name}')"):
+                    constraint_id, sequence, referenced_table, local_field, referenced_field, on_update, on_delete, match = row
+                    foreign_keys.append(ForeignKey(
+                        constraint_id=constraint_id,
+                        sequence=sequence,
+                        local_table=table_name,
+                        local_field=local_field,
+                        referenced_table=referenced_table,
+                        referenced_field=referenced_field,
+                        on_update=on_update,
+                        on_delete=on_delete,
+                        match=match,
+                    ))
+                self._foreign_keys[table_name] = foreign_keys
+            return self._foreign_keys[table_name]
+
+    def get_unique_fields(self, table_name: str) -> List[str]:
+        """Retrieve the names of fields covered by unique indexes of a table.
+        """
+        with self._lock:
+            self.validate()
+            if table_name not in self._unique_fields:
+                unique_fields = []
+                for index in self._execute(f"PRAGMA index_list({table_name})"):
+                    index_name = index[1]
+                    if not index[2]:
+                        continue
+                    unique_fields.extend(field[2] for field in self._execute(f"PRAGMA index_info({index_name})"))
+                self._unique_fields[table_name] = unique_fields
+            return self._unique_fields[table_name]
+
+    def get_indexes(self, table_name: str) -> Dict[str, List[str]]:
+        """Retrieve the indexes of a table as a mapping of index name to indexed field names, in index order.
+        """
+        with self._lock:
+            self.validate()
+            if table_name not in self._indexes:
+                self._indexes[table_name] = {
+                    index[1]: [field[2] for field in self._execute(f"PRAGMA index_info('{index[1]}')")]
+                    for index in self._execute(f"PRAGMA index_list('{table_name}')")
+                }
+            return self._indexes[table_name]
+
+    def get_many_to_many_fields(self, table_name: str) -> Dict[str, ManyToManyField]:
+        """Retrieve the many-to-many relationships of a table, keyed by track field name.
+
+        Raises:
+            ValueError: If a junction table does not reference both related tables.
+        """
+        with self._lock:
+            self.validate()
+            if table_name in self._many_to_many_fields:
+                return self._many_to_many_fields[table_name]
+
+            many_to_many_fields = {}
+            for track_field_name, junction_table in self._get_junction_tables().get(table_name, {}).items():
+                local_fk = None
+                remote_fk = None
+                for fk in self.get_foreign_keys(junction_table):
+                    if fk.referenced_table == table_name:
+                        local_fk = fk
+                    else:
+                        remote_fk = fk
+
+                if not local_fk or not remote_fk:
+                    raise ValueError(f"Foreign keys referencing '{table_name}' and its related table not found in '{junction_table}'.")
+
+                many_to_many_fields[track_field_name] = ManyToManyField(
+                    track_field_name=track_field_name,
+                    local_table=table_name,
+                    remote_table=remote_fk.referenced_table,
+                    junction_table=junction_table,
+                    local_fk=local_fk,
+                    remote_fk=remote_fk
+                )
+
+            self._many_to_many_fields[table_name] = many_to_many_fields
+            return many_to_many_fields
+
+    def get_display_field(self, table_name: str, field_name: str) -> Optional[str]:
+        """Retrieve the display field name registered for a field, if any.
+        """
+        with self._lock:
+            self.validate()
+            if self._display_fields is None:
+                rows = self._execute_meta('SELECT table_name, field_name, display_foreign_field_name FROM _meta_display_field')
+                self._display_fields = {(row[0], row[1]): row[2] for row in rows}
+            return self._display_fields.get((table_name, field_name))
+
+    def get_enum_table_name(self, table_name: str, field_name: str) -> Optional[str]:
+        """Retrieve the name of the enum table associated with a field, if any.
+        """
+        with self._lock:
+            self.validate()
+            if self._enum_table_names is None:
+                rows = self._execute_meta('SELECT table_name, field_name, enum_table_name FROM _meta_enum_field')
+                self._enum_table_names = {(row[0], row[1]): row[2] for row in rows}
+            return self._enum_table_names.get((table_name, field_name))
+
+    # Private Methods
+    # ---------------
+    def _get_junction_tables(self) -> Dict[str, Dict[str, str]]:
+        """Retrieve the `_meta_many_to_many` entries as a mapping of from_table to {track_field_name: junction_table}.
+        """
+        if self._junction_tables is None:
+            junction_tables = {}
+            rows = self._execute_meta('SELECT from_table, track_field_name, junction_table FROM _meta_many_to_many')
+            for from_table, track_field_name, junction_table in rows:
+                junction_tables.setdefault(from_table, {})[track_field_name] = junction_table
+            self._junction_tables = junction_tables
+        return self._junction_tables
+
+    def _execute(self, sql: str) -> List[sqlite3.Row]:
+        cursor = self._database.connection.cursor()
+        try:
+            cursor.execute(sql)
+            return cursor.fetchall()
+        finally:
+            cursor.close()
+
+    def _execute_meta(self, sql: str) -> List[sqlite3.Row]:
+        """Execute a query against a meta table, returning no rows if the meta table does not exist.
+        """
+        try:
+            return self._execute(sql)
+        except sqlite3.OperationalError:
+            return []
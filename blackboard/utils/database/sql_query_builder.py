@@ -2,6 +2,10 @@
 # ---------------------
 from typing import Dict, Any, List, Tuple, Optional, Union, Generator, Iterable, Set
 
+# Standard Library Imports
+# ------------------------
+import re
+
 # Local Imports
 # -------------
 from blackboard.enums.view_enum import GroupOperator, SortOrder, FilterOperation
@@ -11,6 +15,9 @@ from blackboard.enums.view_enum import GroupOperator, SortOrder, FilterOperation
 # -----------------
 class SQLQueryBuilder:
 
+    # Prefix of the FTS5 tables that index the text fields of a table
+    FTS_TABLE_PREFIX = '_fts_'
+
     # Utility Methods
     # ---------------
     @staticmethod
@@ -269,9 +276,12 @@ ON 'shot.sequence'.project = 'shot.sequence.project'.id\\nLEFT JOIN\\n\\tAssets
     @staticmethod
     def build_where_clause(conditions: Optional[Dict[Union[GroupOperator, str], Any]], 
                            group_operator: Union[GroupOperator, str] = GroupOperator.AND,
-                           build_where_root: bool = True) -> Tuple[str, Set[str], List[Any]]:
+                           build_where_root: bool = True, model: Optional[str] = None) -> Tuple[str, Set[str], List[Any]]:
         """Build the WHERE clause of the query.
 
+        The `match` operation searches the full-text index of `model` for search text, see `build_match_clause`
+        and `build_match_expression`. The `match_raw` operation takes an FTS5 query string as is.
+
         Examples:
             >>> SQLQueryBuilder.build_where_clause({"name": "John"})
             ('WHERE\\n\\t_.name = ?', ['John'])
@@ -322,6 +332,12 @@ ON 'shot.sequence'.project = 'shot.sequence.project'.id\\nLEFT JOIN\\n\\tAssets
             ...     }
             ... })
             ('WHERE\\n\\t(_.age < ? OR (_.status = ? AND _.id >= ?))', [18, 'inactive', 100])
+
+            >>> SQLQueryBuilder.build_where_clause({"name": {"match": 'comp-v2 fore'}}, model="shots", build_where_root=False)
+            ('_.rowid IN (SELECT rowid FROM _fts_shots WHERE name MATCH ?)', {'name'}, ['"comp-v2" "fore"*'])
+
+            >>> SQLQueryBuilder.build_where_clause({"name": {"match_raw": 'forest NOT fog'}}, model="shots", build_where_root=False)[2]
+            ['forest NOT fog']
         """
         where_clauses = []
         values = []
@@ -337,7 +353,7 @@ ON 'shot.sequence'.project = 'shot.sequence.project'.id\\nLEFT JOIN\\n\\tAssets
             # Handle key as `GroupOperator`
             if isinstance(key, GroupOperator) or GroupOperator.is_valid(key):
                 sub_where_clause, sub_fields, sub_values = SQLQueryBuilder.build_where_clause(
-                    value, group_operator=key, build_where_root=False
+                    value, group_operator=key, build_where_root=False, model=model
                 )
                 where_clauses.append(f"({sub_where_clause})")
                 fields.update(sub_fields)
@@ -363,7 +379,11 @@ ON 'shot.sequence'.project = 'shot.sequence.project'.id\\nLEFT JOIN\\n\\tAssets
                 sql_operator = operator.sql_operator
 
             fields.add(key)
-            where_clause = f"{SQLQueryBuilder._build_inner_alias(key)} {sql_operator}"
+            value = SQLQueryBuilder._build_condition_value(operator, value)
+            if operator in (FilterOperation.MATCH, FilterOperation.MATCH_RAW):
+                where_clause = SQLQueryBuilder.build_match_clause(key, model)
+            else:
+                where_clause = f"{SQLQueryBuilder._build_inner_alias(key)} {sql_operator}"
             where_clauses.append(where_clause)
 
             # Handle special case for IN and NOT IN
@@ -378,6 +398,70 @@ ON 'shot.sequence'.project = 'shot.sequence.project'.id\\nLEFT JOIN\\n\\tAssets
 
         return where_clauses_str, fields, values
 
+    @staticmethod
+    def build_match_clause(field: str, model: Optional[str]) -> str:
+        """Build a condition that matches rows of `model` whose `field` matches a full-text query.
+
+        The condition looks up the rowids in the FTS5 table of `model`, created by
+        `SQLiteModel.create_fts_index`, so it uses the full-text index instead of scanning the table.
+        The bound value is an FTS5 query string, see `build_match_expression`.
+
+        Raises:
+            ValueError: If `model` is not given or `field` is a related field.
+
+        Examples:
+            >>> SQLQueryBuilder.build_match_clause("name", "shots")
+            '_.rowid IN (SELECT rowid FROM _fts_shots WHERE name MATCH ?)'
+        """
+        if not model or '.' in field:
+            raise ValueError(f"The match operation is only supported on fields of the queried table, got '{field}'.")
+
+        return f"_.rowid IN (SELECT rowid FROM {SQLQueryBuilder.get_fts_table_name(model)} WHERE {field} MATCH ?)"
+
+    @staticmethod
+    def build_match_expression(text: str, prefix: bool = True) -> str:
+        """Convert search text into an FTS5 query.
+
+        Each word is quoted, so punctuation in the text is not parsed as FTS5 syntax. Text in double
+        quotes is kept as a phrase, and words ending with `*` are prefix queries. All terms must match.
+
+        Args:
+            text (str): The search text.
+            prefix (bool): Whether the last word is also a prefix query, for search-as-you-type.
+
+        Returns:
+            str: The FTS5 query.
+
+        Examples:
+            >>> SQLQueryBuilder.build_match_expression('forest nig')
+            '"forest" "nig"*'
+
+            >>> SQLQueryBuilder.build_match_expression('"forest night" sh01* comp-v2 "sh01"*', prefix=False)
+            '"forest night" "sh01"* "comp-v2" "sh01"*'
+        """
+        terms = []
+        for phrase, phrase_prefix, word in re.findall(r'"([^"]*)"(\*?)|(\S+)', text):
+            if phrase:
+                terms.append(f'"{phrase}"{phrase_prefix}')
+                continue
+
+            is_prefix = word.endswith('*')
+            word = word.rstrip('*').replace('"', '""')
+            if word:
+                terms.append(f'"{word}"*' if is_prefix else f'"{word}"')
+
+        # Treat the word being typed as a prefix
+        if prefix and terms and not text.rstrip().endswith(('"', '*')) and not text[-1:].isspace():
+            terms[-1] += '*'
+
+        return ' '.join(terms)
+
+    @staticmethod
+    def get_fts_table_name(model: str) -> str:
+        """Get the name of the FTS5 table that indexes `model`.
+        """
+        return f'{SQLQueryBuilder.FTS_TABLE_PREFIX}{model}'
+
     @staticmethod
     def build_order_by_clause(order_by: Optional[Dict[str, SortOrder]]) -> str:
         """Build the ORDER BY clause of the query.
@@ -408,8 +492,92 @@ ON 'shot.sequence'.project = 'shot.sequence.project'.id\\nLEFT JOIN\\n\\tAssets
         return f"ORDER BY\n\t{order_by_clause}"
 
     @staticmethod
-    def build_query(model: str, fields = None, conditions = None, relationships = None, order_by: Optional[Dict[str, SortOrder]] = None, limit: int = None, values = None):
-        
+    def build_keyset_clause(order_by: Dict[str, SortOrder], keyset: Dict[str, Any],
+                            not_null_fields: Optional[Iterable[str]] = None) -> Tuple[str, List[Any]]:
+        """Build the seek condition that selects the rows after `keyset` in `order_by` order.
+
+        The `order_by` fields should end with a unique field, e.g. the primary key, so that rows with
+        equal sort values are not skipped. The keyset values are assumed to be non-null.
+
+        SQLite sorts nulls first in ascending and last in descending order, so the rows after a
+        non-null value of a descending field include its nulls. Descending fields that are not in
+        `not_null_fields` are compared with an explicit `IS NULL` branch for that reason.
+
+        Args:
+            order_by (Dict[str, SortOrder]): The fields and sort directions of the query.
+            keyset (Dict[str, Any]): The values of the `order_by` fields in the last row of the previous page.
+            not_null_fields (Optional[Iterable[str]]): The `order_by` fields that cannot be null, e.g. the primary key.
+
+        Returns:
+            Tuple[str, List[Any]]: The condition, without the WHERE keyword, and its values.
+
+        Examples:
+            >>> SQLQueryBuilder.build_keyset_clause({"name": "asc", "id": "asc"}, {"name": "sh010", "id": 7})
+            ('(_.name, _.id) > (?, ?)', ['sh010', 7])
+
+            >>> SQLQueryBuilder.build_keyset_clause({"shot.name": SortOrder.DESC, "id": SortOrder.ASC}, {"shot.name": "sh010", "id": 7})
+            ("('shot'.name <= ? OR 'shot'.name IS NULL) AND (('shot'.name < ? OR 'shot'.name IS NULL) OR ('shot'.name = ? AND _.id > ?))", ['sh010', 'sh010', 'sh010', 7])
+
+            >>> SQLQueryBuilder.build_keyset_clause({"id": "desc"}, {"id": 7}, not_null_fields=["id"])
+            ('(_.id) < (?)', [7])
+        """
+        aliases = [SQLQueryBuilder._build_inner_alias(field) for field in order_by]
+        operators = SQLQueryBuilder._get_keyset_operators(order_by)
+        values = SQLQueryBuilder.build_keyset_values(order_by, keyset, not_null_fields)
+
+        # Use a row value comparison when all fields sort in the same direction, so SQLite can seek on an index
+        if SQLQueryBuilder._use_row_value_comparison(order_by, not_null_fields):
+            placeholders = ', '.join(['?'] * len(aliases))
+            return f"({', '.join(aliases)}) {operators[0]} ({placeholders})", values
+
+        not_null_fields = set(not_null_fields or [])
+
+        def compare(field: str, alias: str, operator: str) -> str:
+            if operator.startswith('<') and field not in not_null_fields:
+                return f"({alias} {operator} ? OR {alias} IS NULL)"
+            return f"{alias} {operator} ?"
+
+        # Otherwise, expand into "a > ? OR (a = ? AND b < ?) OR ...", bounded by the first field
+        seek_clauses = []
+        for index, (field, alias, operator) in enumerate(zip(order_by, aliases, operators)):
+            equal_clauses = [f"{equal_alias} = ?" for equal_alias in aliases[:index]]
+            seek_clause = ' AND '.join(equal_clauses + [compare(field, alias, operator)])
+            seek_clauses.append(f"({seek_clause})" if equal_clauses else seek_clause)
+
+        first_field = next(iter(order_by))
+        return f"{compare(first_field, aliases[0], operators[0] + '=')} AND ({' OR '.join(seek_clauses)})", values
+
+    @staticmethod
+    def build_keyset_values(order_by: Dict[str, SortOrder], keyset: Dict[str, Any],
+                            not_null_fields: Optional[Iterable[str]] = None) -> List[Any]:
+        """Build the values of the condition returned by `build_keyset_clause`, in placeholder order.
+
+        Examples:
+            >>> SQLQueryBuilder.build_keyset_values({"name": "desc", "id": "asc"}, {"name": "sh010", "id": 7})
+            ['sh010', 'sh010', 'sh010', 7]
+        """
+        keyset_values = [keyset[field] for field in order_by]
+        if SQLQueryBuilder._use_row_value_comparison(order_by, not_null_fields):
+            return keyset_values
+
+        values = [keyset_values[0]]
+        for index in range(len(keyset_values)):
+            values.extend(keyset_values[:index + 1])
+        return values
+
+    @staticmethod
+    def build_query(model: str, fields = None, conditions = None, relationships = None, order_by: Optional[Dict[str, SortOrder]] = None,
+                    limit: int = None, values = None, offset: Optional[int] = None, keyset: Optional[Dict[str, Any]] = None,
+                    not_null_fields: Optional[Iterable[str]] = None):
+        """Build a SELECT query over `model` with joins for related fields.
+
+        Args:
+            offset (Optional[int]): The number of rows to skip. Prefer `keyset` for deep pages.
+            keyset (Optional[Dict[str, Any]]): The `order_by` values of the last row of the previous page.
+                If given, only rows after it are selected, see `build_keyset_clause`.
+            not_null_fields (Optional[Iterable[str]]): The `order_by` fields that cannot be null, see `build_keyset_clause`.
+        """
+
         # Fill relationships
         if relationships:
             relationships = {
@@ -425,7 +593,7 @@ ON 'shot.sequence'.project = 'shot.sequence.project'.id\\nLEFT JOIN\\n\\tAssets
             SQLQueryBuilder.build_from_clause(model),
         ]
 
-        where_clause, where_fields, extracted_values = SQLQueryBuilder.build_where_clause(conditions)
+        where_clause, where_fields, extracted_values = SQLQueryBuilder.build_where_clause(conditions, model=model)
         if where_fields:
             if fields:
                 fields = list(where_fields) + list(fields)
@@ -436,6 +604,14 @@ ON 'shot.sequence'.project = 'shot.sequence.project'.id\\nLEFT JOIN\\n\\tAssets
         values = values or extracted_values
         order_by_clause = SQLQueryBuilder.build_order_by_clause(order_by)
 
+        if keyset:
+            keyset_clause, keyset_values = SQLQueryBuilder.build_keyset_clause(order_by, keyset, not_null_fields)
+            if where_clause:
+                where_condition = where_clause.split('\n\t', 1)[1]
+                keyset_clause = f"({where_condition}) AND {keyset_clause}"
+            where_clause = f"WHERE\n\t{keyset_clause}"
+            values = list(values or []) + keyset_values
+
         if join_clause:
             query_clauses.append(join_clause)
         if where_clause:
@@ -446,10 +622,25 @@ ON 'shot.sequence'.project = 'shot.sequence.project'.id\\nLEFT JOIN\\n\\tAssets
             query_clauses.append(order_by_clause)
         if limit:
             query_clauses.append(f'LIMIT\n\t{limit}')
+        if offset:
+            if not limit:
+                query_clauses.append('LIMIT\n\t-1')
+            query_clauses.append(f'OFFSET\n\t{offset}')
 
         # NOTE: Handle indirect relational fields, such as one-to-many relationships.
         return '\n'.join(query_clauses), values, grouped_field_aliases
 
+    @staticmethod
+    def _build_condition_value(operator: FilterOperation, value: Any) -> Any:
+        """Convert the value of a condition to the value bound to its placeholder.
+
+        Search text of the `match` operation is converted to an FTS5 query, so punctuation is not parsed
+        as FTS5 syntax. Empty search text becomes an empty phrase, which matches no rows.
+        """
+        if operator is FilterOperation.MATCH:
+            return SQLQueryBuilder.build_match_expression(str(value or '')) or '""'
+        return value
+
     @staticmethod
     def _extract_key_value_pairs(conditions: Union[Dict[str, Any], List[Dict[str, Any]]]) -> Generator[Tuple[str, Any], None, None]:
         if isinstance(conditions, dict):  # Case where `where` is a dictionary
@@ -458,6 +649,20 @@ ON 'shot.sequence'.project = 'shot.sequence.project'.id\\nLEFT JOIN\\n\\tAssets
             for condition_dict in conditions:
                 yield next(iter(condition_dict.items()))
 
+    @staticmethod
+    def _get_keyset_operators(order_by: Dict[str, SortOrder]) -> List[str]:
+        return ['<' if str(direction).upper() == 'DESC' else '>' for direction in order_by.values()]
+
+    @staticmethod
+    def _use_row_value_comparison(order_by: Dict[str, SortOrder], not_null_fields: Optional[Iterable[str]] = None) -> bool:
+        """Check whether the keyset condition can be a single row value comparison, i.e. all fields sort
+        in the same direction, and descending fields cannot be null.
+        """
+        operators = set(SQLQueryBuilder._get_keyset_operators(order_by))
+        if len(operators) != 1:
+            return False
+        return operators == {'>'} or set(order_by) <= set(not_null_fields or [])
+
     @staticmethod
     def _parse_relationship(relationship: str, separator: str = '.'):
         """Parse a simplified relationship string into components.
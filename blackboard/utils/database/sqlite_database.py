@@ -1,44 +1,97 @@
 
 # Type Checking Imports
 # ---------------------
-from typing import TYPE_CHECKING, Generator, List, Tuple, Union, Optional, Dict, Any
+from typing import TYPE_CHECKING, Callable, Generator, Iterable, List, Tuple, Union, Optional, Dict, Any
 if TYPE_CHECKING:
     from blackboard.enums.view_enum import SortOrder
 
 # Standard Library Imports
 # ------------------------
 import logging
+import re
 import sqlite3
+import threading
+from contextlib import contextmanager
+from functools import wraps
+from itertools import groupby, islice
+
+# Third Party Imports
+# -------------------
+import numpy as np
 
 # Local Imports
 # -------------
 from .abstract_database import AbstractDatabase, AbstractModel
-from .schema import FieldInfo, ManyToManyField, ForeignKey
+from .columnar import ColumnarConverter
+from .connection_manager import SQLiteConnectionManager
+from .index_advisor import IndexPolicy, SQLiteIndexAdvisor
+from .schema import FieldInfo, ManyToManyField, ForeignKey, PageCursor
+from .schema_catalog import SQLiteSchemaCatalog
+from .query_compiler import SQLQueryCompiler
 from .sql_query_builder import SQLQueryBuilder
 
 
+# Function Definitions
+# --------------------
+def serialize_writes(method: Callable) -> Callable:
+    """Decorate a write method of `SQLiteDatabase` or `SQLiteModel` to hold the write lock of the database.
+
+    A write from another thread then waits for an open `transaction` block to end, instead of running
+    inside it and being committed or rolled back with it.
+    """
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        database = self if isinstance(self, SQLiteDatabase) else self._database
+        with database.write_lock:
+            return method(self, *args, **kwargs)
+    return wrapper
+
+
 # Class Definitions
 # -----------------
 class SQLiteDatabase(AbstractDatabase):
 
     # Initialization and Setup
     # ------------------------
-    def __init__(self, db_name: str, read_only: bool = False):
+    def __init__(self, db_name: str, read_only: bool = False,
+                 journal_mode: Optional[str] = SQLiteConnectionManager.DEFAULT_JOURNAL_MODE,
+                 cache_size: Optional[int] = SQLiteConnectionManager.DEFAULT_CACHE_SIZE,
+                 mmap_size: Optional[int] = SQLiteConnectionManager.DEFAULT_MMAP_SIZE,
+                 busy_timeout: Optional[int] = SQLiteConnectionManager.DEFAULT_BUSY_TIMEOUT,
+                 index_policy: IndexPolicy = IndexPolicy.SUGGEST):
         """Initialize the AbstractDatabase with a database name.
 
         Args:
             db_name (str): The name of the database file or connection string.
+            read_only (bool): If True, open the database in read-only mode.
+            journal_mode (Optional[str]): The journal mode of the database. Defaults to 'WAL'.
+                If None, the journal mode of the database file is left unchanged.
+            cache_size (Optional[int]): The `cache_size` pragma of each connection.
+            mmap_size (Optional[int]): The `mmap_size` pragma of each connection.
+            busy_timeout (Optional[int]): The `busy_timeout` pragma of each connection, in milliseconds.
+            index_policy (IndexPolicy): What the index advisor does with the indexes missing for queries.
+                Defaults to `IndexPolicy.SUGGEST`.
         """
         self._db_name = db_name
-        if read_only:
-            self._connection = sqlite3.connect(f'file:///{self._db_name}?mode=ro' ,uri=True, check_same_thread=False)
-        else:
-            self._connection = sqlite3.connect(self._db_name, check_same_thread=False)
-        self._connection.row_factory = sqlite3.Row
+        self._connection_manager = SQLiteConnectionManager(
+            db_name, read_only=read_only, journal_mode=journal_mode,
+            cache_size=cache_size, mmap_size=mmap_size, busy_timeout=busy_timeout,
+        )
+        self._connection = self._connection_manager.writer
         self._cursor = self._connection.cursor()
 
+        self._schema_catalog = SQLiteSchemaCatalog(self)
+        self._query_compiler = SQLQueryCompiler()
+        self._index_advisor = SQLiteIndexAdvisor(self, policy=index_policy)
+        # Held by the thread writing, for the whole duration of a `transaction` block
+        self._write_lock = threading.RLock()
+        # Depth of the `transaction` blocks of the thread holding the write lock
+        self._transaction_depth = 0
+        self._transaction_thread_id = None
+
     # Public Methods
     # --------------
+    @serialize_writes
     def create_junction_table(self, from_table: str, to_table: str, from_field: str = 'id', to_field: str = 'id',
                               junction_table_name: Optional[str] = None, track_field_name: str = None, track_field_vice_versa_name: str = None,
                               from_display_field: Optional[str] = None, to_display_field: Optional[str] = None,
@@ -80,7 +133,7 @@ class SQLiteDatabase(AbstractDatabase):
 
         # Execute the SQL command
         self._cursor.execute(sql)
-        self._connection.commit()
+        self.commit()
 
         self._create_meta_many_to_many_table()
 
@@ -90,6 +143,7 @@ class SQLiteDatabase(AbstractDatabase):
                 from_table, track_field_name, junction_table
             ) VALUES (?, ?, ?);
         ''', (from_table, track_field_name, junction_table_name))
+        self._schema_catalog.invalidate()
 
         # Add display field metadata for the "to" table
         if to_display_field:
@@ -115,10 +169,74 @@ class SQLiteDatabase(AbstractDatabase):
                 to_model = self.get_model(to_table)
                 to_model.add_display_field(track_field_vice_versa_name, from_display_field)
 
-        self._connection.commit()
+        self.commit()
+        self._schema_catalog.invalidate()
 
         return self.get_model(junction_table_name)
 
+    @contextmanager
+    def transaction(self) -> Generator['SQLiteDatabase', None, None]:
+        """Group writes into a single transaction, deferring the commits of all model calls made inside it.
+
+        The transaction is committed when the outermost block exits and rolled back if it raises.
+        Nested blocks use savepoints, so an exception caught inside an outer block only rolls back
+        the writes of the nested block. The block holds the write lock of the database, so writes and
+        transactions of other threads wait until it exits.
+
+        Examples:
+            >>> with database.transaction():                               # doctest: +SKIP
+            ...     shot_model.insert_record({'name': 'sh010'})
+            ...     task_model.update_record({'status': 'wip'}, pk_value=1)
+        """
+        with self._write_lock:
+            savepoint_name = f'_transaction_{self._transaction_depth}'
+            if self._transaction_depth:
+                self._connection.execute(f'SAVEPOINT {savepoint_name}')
+            else:
+                self._transaction_thread_id = threading.get_ident()
+                if not self._connection.in_transaction:
+                    self._connection.execute('BEGIN')
+
+            self._transaction_depth += 1
+            try:
+                yield self
+            except BaseException:
+                self._transaction_depth -= 1
+                if self._transaction_depth:
+                    self._connection.execute(f'ROLLBACK TO {savepoint_name}')
+                    self._connection.execute(f'RELEASE {savepoint_name}')
+                else:
+                    self._connection.rollback()
+                    self._transaction_thread_id = None
+                # Schema changes may have been rolled back
+                self._schema_catalog.invalidate()
+                raise
+            else:
+                self._transaction_depth -= 1
+                if self._transaction_depth:
+                    self._connection.execute(f'RELEASE {savepoint_name}')
+                else:
+                    self._connection.commit()
+                    self._transaction_thread_id = None
+
+    def get_read_connection(self) -> sqlite3.Connection:
+        """Get a connection for reads on the calling thread.
+
+        Returns the writer connection inside a `transaction` block on the same thread, so uncommitted
+        writes stay visible. Otherwise, returns the read-only connection of the calling thread.
+        """
+        if self.in_transaction:
+            return self._connection
+        return self._connection_manager.get_read_connection()
+
+    def commit(self):
+        """Commit the current transaction, unless it is deferred by a `transaction` block of the calling thread.
+        """
+        with self._write_lock:
+            if self.in_transaction:
+                return
+            self._connection.commit()
+
     # Private Methods
     # ---------------
     def _create_meta_many_to_many_table(self):
@@ -136,14 +254,50 @@ class SQLiteDatabase(AbstractDatabase):
     # ----------------
     @property
     def connection(self):
-        """Get the current database connection.
+        """Get the writer connection of the database.
         """
         return self._connection
 
+    @property
+    def connection_manager(self) -> SQLiteConnectionManager:
+        """Get the manager of the writer and per-thread read connections.
+        """
+        return self._connection_manager
+
     @property
     def cursor(self):
         return self._cursor
 
+    @property
+    def in_transaction(self) -> bool:
+        """Check whether a `transaction` block is active on the calling thread.
+        """
+        return self._transaction_depth > 0 and self._transaction_thread_id == threading.get_ident()
+
+    @property
+    def write_lock(self) -> threading.RLock:
+        """Get the lock held by the thread writing to the database, see `serialize_writes`.
+        """
+        return self._write_lock
+
+    @property
+    def schema_catalog(self) -> SQLiteSchemaCatalog:
+        """Get the schema metadata cache of the database.
+        """
+        return self._schema_catalog
+
+    @property
+    def query_compiler(self) -> SQLQueryCompiler:
+        """Get the cache of compiled query templates of the database.
+        """
+        return self._query_compiler
+
+    @property
+    def index_advisor(self) -> SQLiteIndexAdvisor:
+        """Get the advisor that suggests indexes from the plans of executed queries.
+        """
+        return self._index_advisor
+
     # Overridden Methods
     # ------------------
     def is_table_exists(self, table_name: str) -> bool:
@@ -158,15 +312,9 @@ class SQLiteDatabase(AbstractDatabase):
         if not table_name.isidentifier():
             raise ValueError("Invalid table name")
 
-        cursor = self._connection.cursor()
-        cursor.execute('''
-            SELECT name
-            FROM sqlite_master
-            WHERE type='table' AND name=?
-        ''', (table_name,))
-
-        return cursor.fetchone() is not None
+        return self._schema_catalog.has_table(table_name)
 
+    @serialize_writes
     def create_table(self, table_name: str, fields: Dict[str, str]) -> 'AbstractModel':
         """Create a new table in the database with specified fields.
 
@@ -183,10 +331,12 @@ class SQLiteDatabase(AbstractDatabase):
 
         fields_str = ', '.join([f"{name} {type_}" for name, type_ in fields.items()])
         self._cursor.execute(f"CREATE TABLE IF NOT EXISTS {table_name} ({fields_str})")
-        self._connection.commit()
+        self.commit()
+        self._schema_catalog.invalidate()
 
         return self.get_model(table_name)
 
+    @serialize_writes
     def delete_table(self, table_name: str):
         """Delete an entire table from the database.
 
@@ -201,7 +351,9 @@ class SQLiteDatabase(AbstractDatabase):
             raise ValueError("Invalid table name")
 
         self._cursor.execute(f"DROP TABLE IF EXISTS {table_name}")
-        self._connection.commit()
+        self._cursor.execute(f"DROP TABLE IF EXISTS {SQLQueryBuilder.get_fts_table_name(table_name)}")
+        self.commit()
+        self._schema_catalog.invalidate()
 
     def get_table_names(self) -> List[str]:
         """Retrieve the names of all tables in the database.
@@ -212,8 +364,7 @@ class SQLiteDatabase(AbstractDatabase):
         Raises:
             sqlite3.Error: If there is an error executing the SQL command.
         """
-        self._cursor.execute("SELECT name FROM sqlite_master WHERE type='table'")
-        return [row[0] for row in self._cursor.fetchall()]
+        return list(self._schema_catalog.get_table_names())
 
     def get_view_names(self) -> List[str]:
         """Retrieve the names of all views in the database.
@@ -244,13 +395,9 @@ class SQLiteDatabase(AbstractDatabase):
         if not table_name.isidentifier() or not field_name.isidentifier():
             raise ValueError("Invalid table name or field name")
 
-        self._cursor.execute(
-            f"SELECT type FROM pragma_table_info(?) WHERE name = ?",
-            (table_name, field_name)
-        )
-
-        row = self._cursor.fetchone()
-        return row[0]
+        for _cid, name, data_type, *_ in self._schema_catalog.get_table_info(table_name):
+            if name == field_name:
+                return data_type
 
     def get_model(self, table_name: str):
         return SQLiteModel(self, table_name)
@@ -276,7 +423,7 @@ class SQLiteDatabase(AbstractDatabase):
 
         try:
             if self._connection:
-                self._connection.close()
+                self._connection_manager.close()
                 self._connection = None
                 print("Connection closed successfully.")
         except sqlite3.Error as e:
@@ -284,12 +431,26 @@ class SQLiteDatabase(AbstractDatabase):
             raise
 
 class SQLiteModel(AbstractModel):
+
+    # Number of rows resolved per many-to-many batch query, kept below SQLite's default
+    # limit of 999 bound parameters per statement
+    M2M_BATCH_SIZE = 500
+    # Default number of rows per chunk in the columnar result format
+    COLUMNAR_CHUNK_SIZE = 10_000
+    # Number of records passed to each `executemany` call by the bulk write methods
+    BULK_CHUNK_SIZE = 1000
+    # Default number of rows per page returned by `query_page`
+    DEFAULT_PAGE_SIZE = 100
+    # Number of rows copied per statement when a table is rebuilt
+    REBUILD_CHUNK_SIZE = 50_000
+
     def __init__(self, database: SQLiteDatabase, table_name: str):
         self._database = database
         self._table_name = table_name
 
         self._connection = self._database.connection
         self._cursor = self._connection.cursor()
+        self._schema_catalog = self._database.schema_catalog
 
     def get_unique_fields(self) -> List[str]:
         """Retrieve the names of fields with unique constraints in a specified table.
@@ -304,24 +465,7 @@ class SQLiteModel(AbstractModel):
         if not self._table_name.isidentifier():
             raise ValueError("Invalid table name")
 
-        # Retrieve the list of indexes for the table
-        cursor = self._connection.cursor()
-        cursor.execute(f"PRAGMA index_list({self._table_name})")
-        indexes = cursor.fetchall()
-
-        unique_fields = []
-
-        # Iterate over the indexes and find those that are unique
-        for index in indexes:
-            index_name = index[1]
-            if index[2]:  # If the index is unique
-                cursor.execute(f"PRAGMA index_info({index_name})")
-                index_fields = cursor.fetchall()
-                for field in index_fields:
-                    unique_fields.append(field[2])  # Add the field name to the set
-        cursor.close()
-
-        return unique_fields
+        return list(self._schema_catalog.get_unique_fields(self._table_name))
 
     def get_fields(self, include_many_to_many: bool = False) -> Dict[str, 'FieldInfo']:
         """Retrieve all fields of the specified table, including unique constraints and many-to-many relationships.
@@ -341,10 +485,7 @@ class SQLiteModel(AbstractModel):
             raise ValueError("Invalid table name")
 
         # Retrieve field information
-        cursor = self._connection.cursor()
-        cursor.execute(f"PRAGMA table_info({self._table_name})")
-        fields = cursor.fetchall()
-        cursor.close()
+        fields = self._schema_catalog.get_table_info(self._table_name)
 
         # Get unique fields using the new method
         unique_fields = self.get_unique_fields()
@@ -386,14 +527,8 @@ class SQLiteModel(AbstractModel):
         if not field_name.isidentifier():
             raise ValueError("Invalid table or field name")
 
-        cursor = self._connection.cursor()
-
         # Try to retrieve field information for the specific field from the table's columns
-        cursor.execute(
-            f"SELECT * FROM pragma_table_info(?) WHERE name = ?",
-            (self._table_name, field_name)
-        )
-        row = cursor.fetchone()
+        row = next((field for field in self._schema_catalog.get_table_info(self._table_name) if field[1] == field_name), None)
 
         if row is not None:
             # Field exists in the table columns
@@ -429,10 +564,8 @@ class SQLiteModel(AbstractModel):
                 )
             except ValueError:
                 # Field is neither a column nor a many-to-many relationship
-                cursor.close()
                 raise ValueError(f"Field '{field_name}' does not exist in table '{self._table_name}'")
 
-        cursor.close()
         return field_info
 
     def get_field_names(self, include_fk: bool = True, include_m2m: bool = False,
@@ -507,26 +640,7 @@ class SQLiteModel(AbstractModel):
         if not table_name.isidentifier():
             raise ValueError("Invalid table name")
 
-        cursor = self._connection.cursor()
-        cursor.execute(f"PRAGMA foreign_key_list('{table_name}')")
-        foreign_keys = []
-        for row in cursor.fetchall():
-            constraint_id, sequence, referenced_table, local_field, referenced_field, on_update, on_delete, match = row
-            fk_info = ForeignKey(
-                constraint_id=constraint_id,
-                sequence=sequence,
-                local_table=table_name,
-                local_field=local_field,
-                referenced_table=referenced_table,
-                referenced_field=referenced_field,
-                on_update=on_update,
-                on_delete=on_delete,
-                match=match,
-            )
-            foreign_keys.append(fk_info)
-        cursor.close()
-
-        return foreign_keys
+        return list(self._schema_catalog.get_foreign_keys(table_name))
 
     def get_foreign_key(self, field_name: str) -> Optional['ForeignKey']:
         """Retrieve the foreign key constraint for a specific field in the specified table.
@@ -545,27 +659,11 @@ class SQLiteModel(AbstractModel):
         if not self._table_name.isidentifier() or not field_name.isidentifier():
             raise ValueError("Invalid table name or field name")
 
-        cursor = self._connection.cursor()
-        cursor.execute(f"PRAGMA foreign_key_list('{self._table_name}')")
-        foreign_key = None
-        for row in cursor.fetchall():
-            constraint_id, sequence, referenced_table, local_field, referenced_field, on_update, on_delete, match = row
-            if local_field == field_name:
-                foreign_key = ForeignKey(
-                    constraint_id=constraint_id,
-                    sequence=sequence,
-                    local_table=self._table_name,
-                    local_field=local_field,
-                    referenced_table=referenced_table,
-                    referenced_field=referenced_field,
-                    on_update=on_update,
-                    on_delete=on_delete,
-                    match=match,
-                )
-                break  # Assuming one foreign key per field
-        cursor.close()
-
-        return foreign_key
+        # Assuming one foreign key per field
+        return next(
+            (fk for fk in self._schema_catalog.get_foreign_keys(self._table_name) if fk.local_field == field_name),
+            None
+        )
 
     def get_relationships(self) -> Dict[str, str]:
         related_table = set()
@@ -594,54 +692,7 @@ class SQLiteModel(AbstractModel):
         if not self._table_name.isidentifier():
             raise ValueError("Invalid table name")
 
-        # Return an empty dictionary if the _meta_many_to_many table does not exist
-        if not self._database.is_table_exists('_meta_many_to_many'):
-            return {}
-
-        # Fetch all many-to-many relationships for the table
-        cursor = self._connection.cursor()
-        cursor.execute('''
-            SELECT track_field_name, junction_table
-            FROM _meta_many_to_many
-            WHERE from_table = ?
-        ''', (self._table_name,))
-        
-        records = cursor.fetchall()
-        cursor.close()
-
-        many_to_many_relationships = {}
-
-        for record in records:
-            track_field_name, junction_table = record
-
-            # Retrieve foreign keys from the junction table
-            foreign_keys = self.get_foreign_keys(junction_table)
-            local_fk = None
-            remote_fk = None
-
-            for fk in foreign_keys:
-                if fk.referenced_table == self._table_name:
-                    local_fk = fk
-                else:
-                    remote_fk = fk
-
-            if not local_fk or not remote_fk:
-                raise ValueError(f"Foreign keys referencing '{self._table_name}' and '{remote_fk.referenced_table}' not found in '{junction_table}'.")
-
-            # Create the ManyToManyField instance
-            many_to_many_field = ManyToManyField(
-                track_field_name=track_field_name,
-                local_table=self._table_name,
-                remote_table=remote_fk.referenced_table,
-                junction_table=junction_table,
-                local_fk=local_fk,
-                remote_fk=remote_fk
-            )
-
-            # Use track_field_name as the key in the dictionary
-            many_to_many_relationships[track_field_name] = many_to_many_field
-
-        return many_to_many_relationships
+        return dict(self._schema_catalog.get_many_to_many_fields(self._table_name))
 
     def get_many_to_many_field(self, field_name: str) -> 'ManyToManyField':
         """Retrieve a specific many-to-many relationship for a specified table and field.
@@ -664,46 +715,10 @@ class SQLiteModel(AbstractModel):
             return
 
         # Fetch the specific many-to-many relationship
-        cursor = self._connection.cursor()
-        cursor.execute('''
-            SELECT track_field_name, junction_table
-            FROM _meta_many_to_many
-            WHERE from_table = ? AND track_field_name = ?
-        ''', (self._table_name, field_name))
-
-        record = cursor.fetchone()
-        cursor.close()
-
-        if not record:
+        many_to_many_field = self._schema_catalog.get_many_to_many_fields(self._table_name).get(field_name)
+        if not many_to_many_field:
             raise ValueError(f"No many-to-many relationship found for field '{field_name}' in table '{self._table_name}'.")
 
-        track_field_name, junction_table = record
-
-        # Retrieve foreign keys from the junction table
-        foreign_keys = self.get_foreign_keys(junction_table)
-        local_fk = None
-        remote_fk = None
-
-        for fk in foreign_keys:
-            if fk.referenced_table == self._table_name:
-                local_fk = fk  # Foreign key referencing the local table
-            else:
-                remote_fk = fk  # Foreign key referencing the remote table
-                remote_table = remote_fk.referenced_table
-
-        if not local_fk or not remote_fk:
-            raise ValueError(f"Foreign keys referencing '{self._table_name}' and '{remote_table}' not found in '{junction_table}'.")
-
-        # Create the ManyToManyField instance
-        many_to_many_field = ManyToManyField(
-            track_field_name=track_field_name,
-            local_table=self._table_name,
-            remote_table=remote_table,
-            junction_table=junction_table,
-            local_fk=local_fk,
-            remote_fk=remote_fk
-        )
-
         return many_to_many_field
 
     def get_many_to_many_field_names(self) -> List[str]:
@@ -726,10 +741,7 @@ class SQLiteModel(AbstractModel):
         if not self._table_name.isidentifier():
             raise ValueError("Invalid table name")
 
-        cursor = self._connection.cursor()
-        cursor.execute(f"PRAGMA table_info({self._table_name})")
-        fields = cursor.fetchall()
-        cursor.close()
+        fields = self._schema_catalog.get_table_info(self._table_name)
 
         # Filter fields to include only those that are part of the primary key
         primary_keys = [field[1] for field in fields if field[5]]
@@ -748,7 +760,7 @@ class SQLiteModel(AbstractModel):
         Returns:
             List[Dict[str, Union[int, str, float]]]: A list of dictionaries, each containing the 'id' from the original table and the corresponding list of related tags or other display fields.
         """
-        cursor = self._connection.cursor()
+        cursor = self._database.get_read_connection().cursor()
 
         m2m = self.get_many_to_many_field(track_field_name)
 
@@ -802,10 +814,19 @@ class SQLiteModel(AbstractModel):
 
     def query(self, fields: Optional[List[str]] = None, conditions: Optional[str] = None,
               values: Optional[List[Any]] = None, as_dict: bool = True, handle_m2m: bool = False,
-              order_by: Optional[Dict[str, 'SortOrder']] = None, relationships=None
-              ) -> Union[Generator[Tuple, None, None], Generator[Dict[str, Union[int, str, float, None]], None, None]]:
+              order_by: Optional[Dict[str, 'SortOrder']] = None, relationships=None,
+              eager_m2m: bool = True, m2m_batch_size: Optional[int] = None,
+              limit: Optional[int] = None, offset: Optional[int] = None, keyset: Optional[Dict[str, Any]] = None,
+              result_format: str = ColumnarConverter.ROWS, chunk_size: Optional[int] = None,
+              ) -> Union[Generator[Tuple, None, None], Generator[Dict[str, Union[int, str, float, None]], None, None],
+                         Generator[Dict[str, np.ndarray], None, None]]:
         """Retrieve data from a specified table as a generator.
 
+        With `result_format='columnar'`, chunks of rows are yielded as a mapping of field name to NumPy array
+        instead of one row at a time, see `ColumnarConverter.get_dtype` for the dtype of each field. Integer fields that
+        can hold nulls, including related fields, are float64 with NaN for nulls in every chunk, and text,
+        JSON-array and many-to-many fields are object arrays. Rows without many-to-many records have empty lists.
+
         Args:
             fields (Optional[List[str]]): Specific fields to retrieve. Defaults to all fields.
             conditions (Optional[str]): Optional SQL WHERE clause to filter results. Defaults to None.
@@ -813,16 +834,34 @@ class SQLiteModel(AbstractModel):
             as_dict (bool): If True, yield rows as dictionaries. Defaults to False.
             handle_m2m (bool): Whether to retrieve many-to-many related data as well. Defaults to False.
             order_by (Optional[List[Tuple[str, str]]]): A list of tuples specifying fields and sort direction ("ASC" or "DESC"). Defaults to None.
+            eager_m2m (bool): If True, resolve many-to-many data for a whole page of rows with one query per
+                junction table instead of one query per row. Only used when `handle_m2m` is True. Defaults to True.
+            m2m_batch_size (Optional[int]): The number of rows per page when `eager_m2m` is enabled, and per
+                many-to-many lookup of a columnar chunk.
+                Defaults to `M2M_BATCH_SIZE`.
+            limit (Optional[int]): The maximum number of rows to retrieve. Defaults to None.
+            offset (Optional[int]): The number of rows to skip. Defaults to None.
+            keyset (Optional[Dict[str, Any]]): The `order_by` values of the last row of a previous page.
+                If given, only rows after it are retrieved. Defaults to None.
+            result_format (str): 'rows' to yield each row, or 'columnar' to yield chunks of columns. Defaults to 'rows'.
+            chunk_size (Optional[int]): The number of rows per chunk in the columnar format.
+                Defaults to `COLUMNAR_CHUNK_SIZE`.
 
         Yields:
-            Union[Tuple[Any, ...], Dict[str, Any]]: Each row from the query result.
+            Union[Tuple[Any, ...], Dict[str, Any], Dict[str, np.ndarray]]: Each row from the query result.
                 - If `as_dict` is False (default), yields a tuple of field values.
                 - If `as_dict` is True, yields a dictionary mapping field names to their values.
+                - If `result_format` is 'columnar', yields a dictionary mapping field names to arrays of
+                  the values of a chunk of rows, ignoring `as_dict`.
 
         Raises:
-            ValueError: If the table name, field names, or order_by fields are invalid Python identifiers.
+            ValueError: If the table name, field names, or order_by fields are invalid Python identifiers,
+                or `result_format` is not supported.
             sqlite3.Error: If there is an error executing the SQL command.
         """
+        if result_format not in ColumnarConverter.RESULT_FORMATS:
+            raise ValueError(f"Invalid result format '{result_format}', expected one of {ColumnarConverter.RESULT_FORMATS}")
+
         fields = fields or self.field_names
         if relationships:
             relationships = self.get_relationships() | relationships
@@ -832,23 +871,73 @@ class SQLiteModel(AbstractModel):
         many_to_many_field_names = self.get_many_to_many_field_names() if handle_m2m else []
         fields = [field for field in fields if field not in many_to_many_field_names]
 
-        query, values, grouped_field_aliases = SQLQueryBuilder.build_query(
+        compiled_query, condition_values = self._database.query_compiler.compile(
             model=self._table_name,
             fields=fields,
             conditions=conditions,
             relationships=relationships,
             order_by=order_by,
-            values=values
+            has_keyset=bool(keyset),
+            has_limit=bool(limit),
+            has_offset=bool(offset),
+            not_null_fields=self._get_not_null_field_names() if keyset else None,
         )
+        query = compiled_query.sql
+        grouped_field_aliases = compiled_query.grouped_field_aliases
+        values = compiled_query.bind(values or condition_values, keyset=keyset, limit=limit, offset=offset)
+        self._database.index_advisor.observe(compiled_query, values)
 
-        cursor = self._connection.cursor()
+        # Each generator gets its own cursor on the read connection of the thread that starts it
+        cursor = self._database.get_read_connection().cursor()
         try:
+            if result_format == ColumnarConverter.COLUMNAR and not handle_m2m:
+                # Plain tuples are cheaper to fetch than rows, and are only transposed into columns
+                cursor.row_factory = None
+
             if values:
                 cursor.execute(query, values)
             else:
                 cursor.execute(query)
 
-            if handle_m2m:
+            if result_format == ColumnarConverter.COLUMNAR:
+                column_names = [column[0] for column in cursor.description]
+                dtypes = self._get_field_dtypes(fields, relationships, grouped_field_aliases)
+                chunk_size = chunk_size or self.COLUMNAR_CHUNK_SIZE
+                key_field = self.get_primary_keys()[0] if handle_m2m else None
+                m2m_batch_size = m2m_batch_size or self.M2M_BATCH_SIZE
+
+                if handle_m2m:
+                    # Rows without related records lack the many-to-many fields, so the columns are named up front
+                    column_names += many_to_many_field_names
+
+                while rows := cursor.fetchmany(chunk_size):
+                    if handle_m2m:
+                        row_dicts = list(map(dict, rows))
+                        # Resolve in batches, to keep each lookup within the limit of SQL variables
+                        for batch_start in range(0, len(row_dicts), m2m_batch_size):
+                            self._resolve_many_to_many_batch(
+                                row_dicts[batch_start:batch_start + m2m_batch_size], many_to_many_field_names, key_field
+                            )
+                        rows = [
+                            tuple(row_dict.get(column_name, []) for column_name in column_names)
+                            for row_dict in row_dicts
+                        ]
+                    yield ColumnarConverter.rows_to_columns(rows, column_names, dtypes)
+
+            elif handle_m2m and eager_m2m:
+                key_field = self.get_primary_keys()[0]
+                m2m_batch_size = m2m_batch_size or self.M2M_BATCH_SIZE
+
+                while rows := cursor.fetchmany(m2m_batch_size):
+                    row_dicts = list(map(dict, rows))
+                    self._resolve_many_to_many_batch(row_dicts, many_to_many_field_names, key_field)
+
+                    if as_dict:
+                        yield from row_dicts
+                    else:
+                        yield from (tuple(row_dict.values()) for row_dict in row_dicts)
+
+            elif handle_m2m:
                 for row in cursor:
                     row_dict = dict(row)
                     for m2m_field in many_to_many_field_names:
@@ -871,12 +960,89 @@ class SQLiteModel(AbstractModel):
         finally:
             cursor.close()
 
+    def query_page(self, cursor: Optional[PageCursor] = None, page_size: int = DEFAULT_PAGE_SIZE,
+                   fields: Optional[List[str]] = None, conditions: Optional[str] = None, values: Optional[List[Any]] = None,
+                   as_dict: bool = True, handle_m2m: bool = False, order_by: Optional[Dict[str, 'SortOrder']] = None,
+                   relationships=None, use_keyset: bool = True,
+                   ) -> Tuple[List[Union[Tuple, Dict[str, Union[int, str, float, None]]]], Optional[PageCursor]]:
+        """Retrieve one page of rows and the cursor of the next page.
+
+        Pages are fetched with keyset (seek) pagination on the `order_by` fields plus the primary key,
+        so the cost of a page does not grow with its depth. If the last row has a null sort value, or
+        `use_keyset` is False, the next page falls back to OFFSET. Each page is a separate query, so no
+        statement is kept open between pages.
+
+        Args:
+            cursor (Optional[PageCursor]): The cursor returned with the previous page. Defaults to the first page.
+            page_size (int): The maximum number of rows in the page. Defaults to `DEFAULT_PAGE_SIZE`.
+            fields, conditions, values, as_dict, handle_m2m, order_by, relationships: See `query`.
+                These should be the same for every page of the same result.
+            use_keyset (bool): Whether to use keyset pagination when possible. Defaults to True.
+
+        Returns:
+            Tuple[List[Union[Tuple, Dict[str, Union[int, str, float, None]]]], Optional[PageCursor]]: The rows of
+                the page and the cursor of the next page, or None if this is the last page.
+
+        Examples:
+            >>> cursor = None                                                  # doctest: +SKIP
+            >>> while True:
+            ...     rows, cursor = model.query_page(cursor, page_size=100, order_by={'name': SortOrder.ASC})
+            ...     process(rows)
+            ...     if cursor is None:
+            ...         break
+        """
+        cursor = cursor or PageCursor()
+
+        # Append a unique field so the sort order is total and no row is skipped between pages
+        order_by = dict(order_by or {})
+        primary_keys = self.get_primary_keys()
+        unique_field = primary_keys[0] if len(primary_keys) == 1 else 'rowid'
+        order_by.setdefault(unique_field, 'ASC')
+
+        # Make sure the sort values of the last row can be read back from the page
+        fields = list(fields or self.field_names)
+        key_fields = [field for field in order_by if field not in fields]
+
+        keyset = None
+        offset = cursor.offset
+        if use_keyset and cursor.keyset and None not in cursor.keyset.values():
+            keyset = cursor.keyset
+            offset = None
+
+        rows = list(self.query(
+            fields=fields + key_fields, conditions=conditions, values=values,
+            handle_m2m=handle_m2m, order_by=order_by, relationships=relationships,
+            limit=page_size + 1, offset=offset, keyset=keyset,
+        ))
+
+        next_cursor = None
+        if len(rows) > page_size:
+            rows = rows[:page_size]
+            next_cursor = PageCursor(
+                offset=cursor.offset + page_size,
+                keyset={field: rows[-1][field] for field in order_by},
+            )
+
+        for row in rows:
+            for field in key_fields:
+                row.pop(field, None)
+
+        if not as_dict:
+            rows = [tuple(row.values()) for row in rows]
+
+        return rows, next_cursor
+
     def query_one(self, fields=None, conditions=None, relationships=None, values=None, order_by=None, as_dict=True):
         return next(self.query(fields=fields, conditions=conditions, relationships=relationships, values=values, order_by=order_by, as_dict=as_dict), None)
 
-    def add_field(self, field_name: str, field_definition: str, foreign_key: Optional[str] = None, enum_values: Optional[List[str]] = None, enum_table_name: Optional[str] = None):
+    @serialize_writes
+    def add_field(self, field_name: str, field_definition: str, foreign_key: Optional[str] = None, enum_values: Optional[List[str]] = None, enum_table_name: Optional[str] = None,
+                  progress_callback: Optional[Callable[[int, int], None]] = None, force_rebuild: bool = False):
         """Add a new field to an existing table, optionally with a foreign key or enum constraint.
 
+        The field is added in place with `ALTER TABLE ADD COLUMN` when its constraints allow it,
+        see `can_add_column`. Otherwise the table is rebuilt, see `_rebuild_table`.
+
         Args:
             table_name (str): The name of the table to add the field to.
             field_name (str): The name of the new field.
@@ -884,6 +1050,9 @@ class SQLiteModel(AbstractModel):
             foreign_key (Optional[str]): A foreign key constraint in the form of "referenced_table(referenced_field)".
             enum_values (Optional[List[str]]): A list of enum values if the field is of enum type.
             enum_table_name (Optional[str]): The name of an existing enum table if the field is an enum.
+            progress_callback (Optional[Callable[[int, int], None]]): Called with the number of copied rows and
+                the total number of rows after each chunk, if the table is rebuilt.
+            force_rebuild (bool): Rebuild the table even if the field could be added in place.
 
         Raises:
             ValueError: If the table name or field name is not a valid Python identifier.
@@ -902,6 +1071,16 @@ class SQLiteModel(AbstractModel):
             foreign_key = f"{enum_table_name}(id)"
             self._add_enum_metadata(field_name, enum_table_name)
 
+        if not force_rebuild and self.can_add_column(field_definition, foreign_key):
+            column_definition = f"{field_name} {field_definition}"
+            if foreign_key:
+                column_definition += f" REFERENCES {foreign_key}"
+
+            self._cursor.execute(f"ALTER TABLE {self._table_name} ADD COLUMN {column_definition}")
+            self._database.commit()
+            self._schema_catalog.invalidate()
+            return
+
         # Fetch existing fields and foreign keys
         fields = self.get_fields()
         foreign_keys = self.get_foreign_keys()
@@ -919,27 +1098,23 @@ class SQLiteModel(AbstractModel):
         if foreign_key:
             new_fields.append(f"FOREIGN KEY({field_name}) REFERENCES {foreign_key}")
 
-        new_fields_str = ', '.join(new_fields)
-
-        temp_table_name = f"{self._table_name}_temp"
-        self._cursor.execute(f"CREATE TABLE {temp_table_name} ({new_fields_str})")
-
-        # Copy data from the old table to the new table
-        old_fields_str = ', '.join(fields.keys())
-        self._cursor.execute(f"INSERT INTO {temp_table_name} ({old_fields_str}) SELECT {old_fields_str} FROM {self._table_name}")
-
-        # Drop the old table and rename the new table
-        self._cursor.execute(f"DROP TABLE {self._table_name}")
-        self._cursor.execute(f"ALTER TABLE {temp_table_name} RENAME TO {self._table_name}")
+        self._rebuild_table(new_fields, list(fields.keys()), progress_callback=progress_callback)
 
-        self._connection.commit()
+    @serialize_writes
+    def delete_field(self, field_name: str, progress_callback: Optional[Callable[[int, int], None]] = None,
+                     force_rebuild: bool = False):
+        """Delete a field from a table.
 
-    def delete_field(self, field_name: str):
-        """Delete a field from a table by recreating the table without that field.
+        The field is dropped in place with `ALTER TABLE DROP COLUMN` on SQLite 3.35.0 or later, unless it is
+        a primary key, unique or foreign key field. Otherwise the table is rebuilt without the field, see
+        `_rebuild_table`. Secondary indexes on the field are dropped with it.
 
         Args:
             table_name (str): The name of the table to delete the field from.
             field_name (str): The name of the field to delete.
+            progress_callback (Optional[Callable[[int, int], None]]): Called with the number of copied rows and
+                the total number of rows after each chunk, if the table is rebuilt.
+            force_rebuild (bool): Rebuild the table even if the field could be dropped in place.
 
         Raises:
             ValueError: If the table name or field name is not a valid Python identifier.
@@ -949,44 +1124,95 @@ class SQLiteModel(AbstractModel):
             raise ValueError("Invalid table name or field name")
 
         # Retrieve the table information
-        fields = self.get_fields(self._table_name)
+        fields = self.get_fields()
+        foreign_keys = self.get_foreign_keys()
+        fts_fields = self.get_fts_fields()
+
+        field = fields.get(field_name)
+        can_drop_column = (
+            not force_rebuild and field is not None and sqlite3.sqlite_version_info >= (3, 35, 0)
+            and not field.is_primary_key and not field.is_unique
+            and all(fk.local_field != field_name for fk in foreign_keys)
+        )
 
-        # Disable foreign key constraints temporarily
-        self._cursor.execute("PRAGMA foreign_keys=off;")
         try:
-            # Filter out the field to be deleted
-            new_fields = [field for field in fields.values() if field.name != field_name]
-            field_names_str = ', '.join([field.name for field in new_fields])
-
-            # Retrieve and filter foreign key constraints
-            field_definitions = [field.get_field_definition() for field in new_fields]
-            foreign_keys = self.get_foreign_keys()
-            field_definitions.extend([fk.get_field_definition() for fk in foreign_keys if fk.from_field != field_name])
-            field_definitions_str = ', '.join(field_definitions)
-
-            # Create a temporary table with the new schema
-            temp_table_name = f"{self._table_name}_temp"
-            self._cursor.execute(f"CREATE TABLE {temp_table_name} ({field_definitions_str})")
-            self._cursor.execute(f"INSERT INTO {temp_table_name} ({field_names_str}) SELECT {field_names_str} FROM {self._table_name}")
-            # Replace the old table with the new one
-            self._cursor.execute(f"DROP TABLE {self._table_name}")
-            self._cursor.execute(f"ALTER TABLE {temp_table_name} RENAME TO {self._table_name}")
+            # Triggers of the full-text index reference its fields
+            if field_name in fts_fields:
+                self.drop_fts_index()
+
+            if can_drop_column:
+                try:
+                    with self._database.transaction():
+                        for index_name, index_fields in self._schema_catalog.get_indexes(self._table_name).items():
+                            if field_name in index_fields:
+                                self._cursor.execute(f"DROP INDEX {index_name}")
+                        self._cursor.execute(f"ALTER TABLE {self._table_name} DROP COLUMN {field_name}")
+                except sqlite3.OperationalError as e:
+                    # E.g. the field is used by a view, a trigger or a CHECK constraint
+                    logging.info(f"Rebuilding table '{self._table_name}' to delete field '{field_name}': {e}")
+                    can_drop_column = False
+
+            if not can_drop_column:
+                # Filter out the field to be deleted, and its foreign key constraints
+                new_fields = [field for field in fields.values() if field.name != field_name]
+                field_definitions = [field.get_field_definition() for field in new_fields]
+                field_definitions.extend([fk.get_field_definition() for fk in foreign_keys if fk.local_field != field_name])
+                self._rebuild_table(field_definitions, [field.name for field in new_fields], progress_callback=progress_callback)
 
             # Remove the display field metadata
             self._remove_display_field(field_name)
 
-            # Commit the transaction
-            self._connection.commit()
+            # Recreate the full-text index without the field
+            if field_name in fts_fields:
+                if remaining_fts_fields := [field for field in fts_fields if field != field_name]:
+                    self.create_fts_index(remaining_fts_fields)
+                else:
+                    self.drop_fts_index()
 
         except sqlite3.Error as e:
             logging.error(f"Error deleting field '{field_name}' from table '{self._table_name}': {e}")
-            self._connection.rollback()
             raise
 
         finally:
-            # Re-enable foreign key constraints
-            self._cursor.execute("PRAGMA foreign_keys=on;")
-
+            self._schema_catalog.invalidate()
+
+    @staticmethod
+    def can_add_column(field_definition: str, foreign_key: Optional[str] = None) -> bool:
+        """Check whether a field can be added with `ALTER TABLE ADD COLUMN` instead of rebuilding the table.
+
+        SQLite cannot add a primary key, unique or stored generated column in place, nor a column whose
+        default is not a constant, a NOT NULL column without a default, or a foreign key with a non-null default.
+
+        Examples:
+            >>> SQLiteModel.can_add_column("TEXT")
+            True
+            >>> SQLiteModel.can_add_column("INTEGER NOT NULL DEFAULT 0")
+            True
+            >>> SQLiteModel.can_add_column("TEXT UNIQUE")
+            False
+            >>> SQLiteModel.can_add_column("INTEGER NOT NULL")
+            False
+            >>> SQLiteModel.can_add_column("TEXT DEFAULT CURRENT_TIMESTAMP")
+            False
+            >>> SQLiteModel.can_add_column("INTEGER DEFAULT 1", foreign_key="shots(id)")
+            False
+        """
+        definition = ' '.join(field_definition.upper().split())
+        default_match = re.search(r'\bDEFAULT\s+(\S+)', definition)
+        default_value = default_match.group(1) if default_match else None
+
+        if re.search(r'\b(PRIMARY\s+KEY|UNIQUE|STORED)\b', definition):
+            return False
+        if default_value and (default_value.startswith('(') or default_value.startswith('CURRENT_')):
+            return False
+        if re.search(r'\bNOT\s+NULL\b', definition) and default_value in (None, 'NULL'):
+            return False
+        if (foreign_key or 'REFERENCES' in definition) and default_value not in (None, 'NULL'):
+            return False
+
+        return True
+
+    @serialize_writes
     def insert_record(self, data_dict: Dict[str, Union[int, str, float, None]],
                       handle_m2m: bool = False) -> int:
         """Insert a new record into a table.
@@ -1019,7 +1245,7 @@ class SQLiteModel(AbstractModel):
         placeholders = ', '.join(['?'] * len(data_dict))
         sql = f"INSERT INTO {self._table_name} ({field_names}) VALUES ({placeholders})"
         self._cursor.execute(sql, list(data_dict.values()))
-        self._connection.commit()
+        self._database.commit()
 
         # Get the primary key of the newly inserted record
         rowid = self._cursor.lastrowid
@@ -1031,6 +1257,7 @@ class SQLiteModel(AbstractModel):
 
         return rowid
     
+    @serialize_writes
     def delete_record(self, pk_values: Union[Dict[str, Any], Any], pk_field: Optional[str] = None):
         """Delete a specific record from a table by primary key, including related data in many-to-many junction tables.
 
@@ -1079,9 +1306,10 @@ class SQLiteModel(AbstractModel):
         # Then, delete the main record from the table
         query = f"DELETE FROM {self._table_name} WHERE {where_clause}"
         self._cursor.execute(query, where_values)
-        self._connection.commit()
+        self._database.commit()
 
     # TODO: Handle composite pks
+    @serialize_writes
     def update_record(self, data_dict: Dict[str, Union[int, str, float, None]], 
                       pk_value: Union[int, str, float], pk_field: str = 'rowid', handle_m2m: bool = False):
         """Update an existing record in a table by primary key.
@@ -1115,13 +1343,232 @@ class SQLiteModel(AbstractModel):
             set_clause = ', '.join([f"{field} = ?" for field in data_dict.keys()])
             sql = f"UPDATE {self._table_name} SET {set_clause} WHERE {pk_field} = ?"
             self._cursor.execute(sql, list(data_dict.values()) + [pk_value])
-            self._connection.commit()
+            self._database.commit()
 
         # Update M2M data in the junction table(s) if handling M2M relationships
         if handle_m2m:
             for track_field_name, selected_values in m2m_data.items():
                 self._update_junction_table(track_field_name, pk_value, selected_values)
 
+    @serialize_writes
+    def insert_many(self, records: Iterable[Dict[str, Union[int, str, float, None]]], chunk_size: Optional[int] = None,
+                    handle_m2m: bool = False) -> List[int]:
+        """Insert multiple records in a single transaction using `executemany`.
+
+        Consecutive records with the same fields share one statement and are sent in chunks of `chunk_size`.
+
+        Args:
+            records (Iterable[Dict[str, Union[int, str, float, None]]]): The records to insert, as field-value dictionaries.
+            chunk_size (Optional[int]): The number of records per `executemany` call. Defaults to `BULK_CHUNK_SIZE`.
+            handle_m2m (bool): Whether to handle many-to-many relationships. Defaults to False.
+
+        Returns:
+            List[int]: The rowids of the inserted records, in input order.
+
+        Raises:
+            ValueError: If the field names are not valid Python identifiers.
+            sqlite3.Error: If there is an error executing the SQL command. No records are inserted in this case.
+        """
+        m2m_field_names = self.get_many_to_many_field_names() if handle_m2m else []
+        rowid_fields = {'rowid', self._get_rowid_alias()}
+
+        rowids = []
+        m2m_records = []
+
+        with self._database.transaction():
+            cursor = self._connection.cursor()
+            try:
+                for field_names, chunk in self._iter_record_chunks(records, chunk_size, m2m_field_names, m2m_records):
+                    if field_names:
+                        placeholders = ', '.join(['?'] * len(field_names))
+                        sql = f"INSERT INTO {self._table_name} ({', '.join(field_names)}) VALUES ({placeholders})"
+                    else:
+                        sql = f"INSERT INTO {self._table_name} DEFAULT VALUES"
+
+                    rowid_field = next((field for field in field_names if field in rowid_fields), None)
+
+                    if not field_names or (rowid_field and any(record[rowid_field] is None for record in chunk)):
+                        # Mixed explicit and generated rowids, insert one by one to capture each rowid
+                        for record in chunk:
+                            cursor.execute(sql, tuple(record.values()))
+                            rowids.append(cursor.lastrowid)
+                        continue
+
+                    cursor.executemany(sql, [tuple(record.values()) for record in chunk])
+
+                    if rowid_field:
+                        rowids.extend(record[rowid_field] for record in chunk)
+                    else:
+                        # Generated rowids are consecutive, as no other writer can insert while the transaction is open
+                        last_rowid = cursor.execute('SELECT last_insert_rowid()').fetchone()[0]
+                        rowids.extend(range(last_rowid - len(chunk) + 1, last_rowid + 1))
+
+            finally:
+                cursor.close()
+
+            # Insert M2M data into the junction table(s) if handling M2M relationships
+            for rowid, m2m_data in zip(rowids, m2m_records):
+                for track_field_name, selected_values in m2m_data.items():
+                    self._update_junction_table(track_field_name, rowid, selected_values, is_rowid=True)
+
+        return rowids
+
+    @serialize_writes
+    def update_many(self, records: Iterable[Dict[str, Union[int, str, float, None]]], pk_field: str = 'rowid',
+                    chunk_size: Optional[int] = None, handle_m2m: bool = False) -> int:
+        """Update multiple records by primary key in a single transaction using `executemany`.
+
+        Args:
+            records (Iterable[Dict[str, Union[int, str, float, None]]]): The records to update. Each record must
+                contain `pk_field` along with the fields to set.
+            pk_field (str): The name of the primary key field. Defaults to 'rowid'.
+            chunk_size (Optional[int]): The number of records per `executemany` call. Defaults to `BULK_CHUNK_SIZE`.
+            handle_m2m (bool): Whether to handle many-to-many relationships. Defaults to False.
+
+        Returns:
+            int: The number of updated rows.
+
+        Raises:
+            ValueError: If the field names are not valid Python identifiers or a record has no `pk_field` value.
+            sqlite3.Error: If there is an error executing the SQL command. No records are updated in this case.
+        """
+        if not pk_field.isidentifier():
+            raise ValueError("Invalid primary key field")
+
+        m2m_field_names = self.get_many_to_many_field_names() if handle_m2m else []
+
+        updated_count = 0
+        m2m_records = []
+        pk_values = []
+
+        with self._database.transaction():
+            cursor = self._connection.cursor()
+            try:
+                for field_names, chunk in self._iter_record_chunks(records, chunk_size, m2m_field_names, m2m_records):
+                    if pk_field not in field_names:
+                        raise ValueError(f"Each record must contain the primary key field '{pk_field}'")
+
+                    pk_values.extend(record[pk_field] for record in chunk)
+
+                    set_field_names = [field for field in field_names if field != pk_field]
+                    if not set_field_names:
+                        continue
+
+                    set_clause = ', '.join([f"{field} = ?" for field in set_field_names])
+                    sql = f"UPDATE {self._table_name} SET {set_clause} WHERE {pk_field} = ?"
+                    cursor.executemany(sql, [
+                        [record[field] for field in set_field_names] + [record[pk_field]]
+                        for record in chunk
+                    ])
+                    updated_count += cursor.rowcount
+
+            finally:
+                cursor.close()
+
+            # Update M2M data in the junction table(s) if handling M2M relationships
+            for pk_value, m2m_data in zip(pk_values, m2m_records):
+                for track_field_name, selected_values in m2m_data.items():
+                    self._update_junction_table(track_field_name, pk_value, selected_values, is_rowid=pk_field == 'rowid')
+
+        return updated_count
+
+    @serialize_writes
+    def upsert_many(self, records: Iterable[Dict[str, Union[int, str, float, None]]], conflict_fields: Optional[List[str]] = None,
+                    chunk_size: Optional[int] = None) -> int:
+        """Insert multiple records, updating existing rows that conflict on `conflict_fields`, in a single transaction.
+
+        Args:
+            records (Iterable[Dict[str, Union[int, str, float, None]]]): The records to insert or update.
+            conflict_fields (Optional[List[str]]): The fields of a primary key or unique constraint that identify
+                an existing row. Defaults to the primary keys of the table.
+            chunk_size (Optional[int]): The number of records per `executemany` call. Defaults to `BULK_CHUNK_SIZE`.
+
+        Returns:
+            int: The number of inserted or updated rows.
+
+        Raises:
+            ValueError: If the field names are not valid Python identifiers.
+            sqlite3.Error: If there is an error executing the SQL command. No records are written in this case.
+        """
+        conflict_fields = conflict_fields or self.get_primary_keys()
+        if not all(field.isidentifier() for field in conflict_fields):
+            raise ValueError("Invalid conflict field names")
+
+        written_count = 0
+
+        with self._database.transaction():
+            cursor = self._connection.cursor()
+            try:
+                for field_names, chunk in self._iter_record_chunks(records, chunk_size):
+                    placeholders = ', '.join(['?'] * len(field_names))
+                    update_field_names = [field for field in field_names if field not in conflict_fields]
+                    if update_field_names:
+                        set_clause = ', '.join([f"{field} = excluded.{field}" for field in update_field_names])
+                        conflict_action = f"DO UPDATE SET {set_clause}"
+                    else:
+                        conflict_action = "DO NOTHING"
+
+                    sql = (f"INSERT INTO {self._table_name} ({', '.join(field_names)}) VALUES ({placeholders}) "
+                           f"ON CONFLICT({', '.join(conflict_fields)}) {conflict_action}")
+                    cursor.executemany(sql, [tuple(record.values()) for record in chunk])
+                    written_count += cursor.rowcount
+
+            finally:
+                cursor.close()
+
+        return written_count
+
+    @serialize_writes
+    def delete_many(self, pk_values: Iterable[Union[Dict[str, Any], Any]], pk_field: str = 'rowid',
+                    chunk_size: Optional[int] = None) -> int:
+        """Delete multiple records by primary key in a single transaction, including related data in many-to-many junction tables.
+
+        Args:
+            pk_values (Iterable[Union[Dict[str, Any], Any]]): The primary key values of the records to delete.
+                Each value can be a single value or a dictionary of field-value pairs for composite keys.
+            pk_field (str): The name of the primary key field, used for single values. Defaults to 'rowid'.
+            chunk_size (Optional[int]): The number of records per `executemany` call. Defaults to `BULK_CHUNK_SIZE`.
+
+        Returns:
+            int: The number of deleted rows.
+
+        Raises:
+            ValueError: If the primary key fields are not valid Python identifiers.
+            sqlite3.Error: If there is an error executing the SQL command. No records are deleted in this case.
+        """
+        if not pk_field.isidentifier():
+            raise ValueError("Invalid primary key field")
+
+        m2m_fields = self.get_many_to_many_fields()
+        records = (pk_value if isinstance(pk_value, dict) else {pk_field: pk_value} for pk_value in pk_values)
+
+        deleted_count = 0
+
+        with self._database.transaction():
+            cursor = self._connection.cursor()
+            try:
+                for field_names, chunk in self._iter_record_chunks(records, chunk_size):
+                    where_clause = " AND ".join(f"{field} = ?" for field in field_names)
+                    parameters = [tuple(record.values()) for record in chunk]
+
+                    # First, delete related data in the many-to-many junction tables
+                    for m2m_field in m2m_fields.values():
+                        cursor.executemany(f'''
+                            DELETE FROM {m2m_field.junction_table}
+                            WHERE {m2m_field.local_fk.local_field} IN (
+                                SELECT {m2m_field.local_fk.referenced_field} FROM {self._table_name} WHERE {where_clause}
+                            )
+                        ''', parameters)
+
+                    # Then, delete the main records from the table
+                    cursor.executemany(f"DELETE FROM {self._table_name} WHERE {where_clause}", parameters)
+                    deleted_count += cursor.rowcount
+
+            finally:
+                cursor.close()
+
+        return deleted_count
+
     def fetch_one(self, field_name: str, reference_field_name: str, reference_value: Union[int, str, float]) -> Optional[Union[int, str, float]]:
         """Retrieve a value from a related table based on a foreign key.
 
@@ -1142,9 +1589,13 @@ class SQLiteModel(AbstractModel):
 
         # Use the fetch_one method to retrieve the related row
         query = f"SELECT {field_name} FROM {self._table_name} WHERE {reference_field_name} = ? LIMIT 1"
-        self._cursor.execute(query, (reference_value,))
+        cursor = self._database.get_read_connection().cursor()
+        try:
+            results = cursor.execute(query, (reference_value,)).fetchone()
+        finally:
+            cursor.close()
 
-        if not (results := self._cursor.fetchone()):
+        if not results:
             return
 
         return results[0]
@@ -1167,9 +1618,14 @@ class SQLiteModel(AbstractModel):
             raise ValueError(f"Field '{field}' does not exist in table '{self._table_name}'")
 
         # Execute query to get the unique values for the display field
-        self._cursor.execute(f"SELECT DISTINCT {field} FROM {self._table_name} ORDER BY {field}")
-        return [row[0] for row in self._cursor.fetchall()]
+        cursor = self._database.get_read_connection().cursor()
+        try:
+            cursor.execute(f"SELECT DISTINCT {field} FROM {self._table_name} ORDER BY {field}")
+            return [row[0] for row in cursor.fetchall()]
+        finally:
+            cursor.close()
 
+    @serialize_writes
     def add_display_field(self, field_name: str, display_field_name: str, display_format: str = None):
         """Add a display field entry to the meta table.
         """
@@ -1178,27 +1634,355 @@ class SQLiteModel(AbstractModel):
             INSERT OR REPLACE INTO _meta_display_field (table_name, field_name, display_foreign_field_name, display_format)
             VALUES (?, ?, ?, ?);
         ''', (self._table_name, field_name, display_field_name, display_format))
-        self._connection.commit()
+        self._database.commit()
+        self._schema_catalog.invalidate()
 
     def get_display_field(self, field_name: str) -> Optional[Tuple[str, str]]:
         """Retrieve the display field name and format for a specific field.
         """
-        try:
-            self._cursor.execute('''
-                SELECT display_foreign_field_name, display_format
-                FROM _meta_display_field
-                WHERE table_name = ? AND field_name = ?;
-            ''', (self._table_name, field_name))
-        except sqlite3.OperationalError:
-            pass
+        return self._schema_catalog.get_display_field(self._table_name, field_name)
 
-        if not (results := self._cursor.fetchone()):
+    @serialize_writes
+    def create_fts_index(self, fields: List[str]):
+        """Create an FTS5 full-text index over text fields of the table.
+
+        The index is an external content FTS5 table that stores only the index, kept in sync by
+        insert, update and delete triggers on the table. Existing rows are indexed immediately.
+        Calling it again replaces the index with one over the given fields.
+
+        Args:
+            fields (List[str]): The names of the fields to index.
+
+        Raises:
+            ValueError: If a field name is not a valid Python identifier or not a field of the table.
+            sqlite3.Error: If there is an error executing the SQL command, e.g. SQLite was built without FTS5.
+        """
+        if not fields or not all(field.isidentifier() for field in fields):
+            raise ValueError("Invalid field names")
+        if missing_fields := set(fields) - set(self.get_field_names()):
+            raise ValueError(f"Fields {sorted(missing_fields)} do not exist in table '{self._table_name}'")
+
+        fts_table_name = self.fts_table_name
+        fields_str = ', '.join(fields)
+        new_fields_str = ', '.join(f'new.{field}' for field in fields)
+        old_fields_str = ', '.join(f'old.{field}' for field in fields)
+
+        with self._database.transaction():
+            self._drop_fts_objects()
+            self._cursor.execute(f"""
+                CREATE VIRTUAL TABLE {fts_table_name}
+                USING fts5({fields_str}, content='{self._table_name}', content_rowid='rowid')
+            """)
+            self._cursor.execute(f"""
+                CREATE TRIGGER {fts_table_name}_insert AFTER INSERT ON {self._table_name} BEGIN
+                    INSERT INTO {fts_table_name} (rowid, {fields_str}) VALUES (new.rowid, {new_fields_str});
+                END
+            """)
+            self._cursor.execute(f"""
+                CREATE TRIGGER {fts_table_name}_delete AFTER DELETE ON {self._table_name} BEGIN
+                    INSERT INTO {fts_table_name} ({fts_table_name}, rowid, {fields_str}) VALUES ('delete', old.rowid, {old_fields_str});
+                END
+            """)
+            # Only re-index when an indexed field changes
+            self._cursor.execute(f"""
+                CREATE TRIGGER {fts_table_name}_update AFTER UPDATE OF {fields_str} ON {self._table_name} BEGIN
+                    INSERT INTO {fts_table_name} ({fts_table_name}, rowid, {fields_str}) VALUES ('delete', old.rowid, {old_fields_str});
+                    INSERT INTO {fts_table_name} (rowid, {fields_str}) VALUES (new.rowid, {new_fields_str});
+                END
+            """)
+            self._cursor.execute(f"INSERT INTO {fts_table_name} ({fts_table_name}) VALUES ('rebuild')")
+
+        self._schema_catalog.invalidate()
+
+    @serialize_writes
+    def drop_fts_index(self):
+        """Drop the full-text index of the table and its triggers, if any.
+        """
+        with self._database.transaction():
+            self._drop_fts_objects()
+
+        self._schema_catalog.invalidate()
+
+    def get_fts_fields(self) -> List[str]:
+        """Retrieve the names of the fields in the full-text index, or an empty list if the table has no index.
+        """
+        if not self._schema_catalog.has_table(self.fts_table_name):
+            return []
+        return [row[1] for row in self._schema_catalog.get_table_info(self.fts_table_name)]
+
+    def search(self, text: str, fields: Optional[List[str]] = None, limit: Optional[int] = None,
+               as_dict: bool = True, raw: bool = False,
+               ) -> Union[Generator[Tuple, None, None], Generator[Dict[str, Union[int, str, float, None]], None, None]]:
+        """Search the full-text index and yield matching rows, best match first.
+
+        Rows are ranked with the bm25 function of FTS5.
+
+        Args:
+            text (str): The search text, see `SQLQueryBuilder.build_match_expression`.
+            fields (Optional[List[str]]): The indexed fields to search. Defaults to all indexed fields.
+            limit (Optional[int]): The maximum number of rows to retrieve. Defaults to None.
+            as_dict (bool): If True, yield rows as dictionaries. Defaults to True.
+            raw (bool): If True, `text` is used as an FTS5 query as is. Defaults to False.
+
+        Yields:
+            Union[Tuple[Any, ...], Dict[str, Any]]: Each matching row of the table.
+
+        Raises:
+            ValueError: If the table has no full-text index or `fields` are not indexed.
+            sqlite3.Error: If there is an error executing the SQL command, e.g. an invalid raw query.
+        """
+        fts_fields = self.get_fts_fields()
+        if not fts_fields:
+            raise ValueError(f"Table '{self._table_name}' has no full-text index")
+        if fields and (missing_fields := set(fields) - set(fts_fields)):
+            raise ValueError(f"Fields {sorted(missing_fields)} are not in the full-text index of table '{self._table_name}'")
+
+        match_expression = text if raw else SQLQueryBuilder.build_match_expression(text)
+        if not match_expression:
             return
 
-        return results[0]
+        # Restrict the query to the given fields with an FTS5 column filter
+        if fields:
+            match_expression = f"{{{' '.join(fields)}}} : ({match_expression})"
+
+        fts_table_name = self.fts_table_name
+        sql = f"""
+            SELECT _.* FROM {fts_table_name}
+            JOIN {self._table_name} AS _ ON _.rowid = {fts_table_name}.rowid
+            WHERE {fts_table_name} MATCH ?
+            ORDER BY bm25({fts_table_name})
+        """
+        values = [match_expression]
+        if limit:
+            sql += "LIMIT ?"
+            values.append(limit)
+
+        cursor = self._database.get_read_connection().cursor()
+        try:
+            cursor.execute(sql, values)
+            for row in cursor:
+                yield dict(row) if as_dict else tuple(row)
+        finally:
+            cursor.close()
+
+    # Class Properties
+    # ----------------
+    @property
+    def fts_table_name(self) -> str:
+        """Get the name of the FTS5 table that indexes this table.
+        """
+        return SQLQueryBuilder.get_fts_table_name(self._table_name)
 
     # Private Methods
     # ---------------
+    def _rebuild_table(self, field_definitions: List[str], field_names: List[str],
+                       progress_callback: Optional[Callable[[int, int], None]] = None, chunk_size: Optional[int] = None):
+        """Recreate the table with new field definitions and copy the rows of `field_names` over.
+
+        Rows are copied in rowid order in chunks of `chunk_size`, calling `progress_callback` after each
+        chunk, and keep their rowids. The whole rebuild runs in one transaction, so readers see either the
+        old or the new table. Secondary indexes on the remaining fields and the full-text index are recreated.
+
+        Args:
+            field_definitions (List[str]): The field and table constraint definitions of the new table.
+            field_names (List[str]): The names of the fields to copy from the old table.
+            progress_callback (Optional[Callable[[int, int], None]]): Called with the number of copied rows and
+                the total number of rows after each chunk.
+            chunk_size (Optional[int]): The number of rows per chunk. Defaults to `REBUILD_CHUNK_SIZE`.
+
+        Raises:
+            sqlite3.Error: If there is an error executing the SQL command. The table is left unchanged in this case.
+        """
+        chunk_size = chunk_size or self.REBUILD_CHUNK_SIZE
+        temp_table_name = f"{self._table_name}_temp"
+
+        # Keep the rowids, unless they are already copied through an INTEGER PRIMARY KEY field
+        copy_fields = list(field_names)
+        if self._get_rowid_alias() not in copy_fields:
+            copy_fields.insert(0, 'rowid')
+        copy_fields_str = ', '.join(copy_fields)
+
+        # Secondary indexes and triggers are dropped with the old table
+        fts_fields = self.get_fts_fields()
+        self._cursor.execute(
+            "SELECT name, sql FROM sqlite_master WHERE type = 'index' AND tbl_name = ? AND sql IS NOT NULL",
+            (self._table_name,)
+        )
+        index_sqls = [
+            sql for index_name, sql in self._cursor.fetchall()
+            if set(self._schema_catalog.get_indexes(self._table_name).get(index_name, [])) <= set(field_names)
+        ]
+
+        self._cursor.execute(f"SELECT COUNT(*) FROM {self._table_name}")
+        total_rows = self._cursor.fetchone()[0]
+
+        # Disable foreign key constraints, so dropping the old table does not cascade to referencing rows
+        foreign_keys_enabled = self._cursor.execute("PRAGMA foreign_keys").fetchone()[0]
+        self._cursor.execute("PRAGMA foreign_keys=off")
+        try:
+            with self._database.transaction():
+                self._cursor.execute(f"CREATE TABLE {temp_table_name} ({', '.join(field_definitions)})")
+
+                copied_rows = 0
+                last_rowid = None
+                while True:
+                    seek_clause = "WHERE rowid > ?" if last_rowid is not None else ""
+                    self._cursor.execute(
+                        f"INSERT INTO {temp_table_name} ({copy_fields_str}) "
+                        f"SELECT {copy_fields_str} FROM {self._table_name} {seek_clause} ORDER BY rowid LIMIT ?",
+                        ([last_rowid] if last_rowid is not None else []) + [chunk_size]
+                    )
+                    chunk_rows = self._cursor.rowcount
+                    if chunk_rows <= 0:
+                        break
+
+                    copied_rows += chunk_rows
+                    last_rowid = self._cursor.execute(f"SELECT MAX(rowid) FROM {temp_table_name}").fetchone()[0]
+                    if progress_callback:
+                        progress_callback(copied_rows, total_rows)
+                    if chunk_rows < chunk_size:
+                        break
+
+                # Replace the old table with the new one
+                self._cursor.execute(f"DROP TABLE {self._table_name}")
+                self._cursor.execute(f"ALTER TABLE {temp_table_name} RENAME TO {self._table_name}")
+
+                for index_sql in index_sqls:
+                    self._cursor.execute(index_sql)
+
+        finally:
+            if foreign_keys_enabled:
+                self._cursor.execute("PRAGMA foreign_keys=on")
+            self._schema_catalog.invalidate()
+
+        if fts_fields:
+            self.create_fts_index(fts_fields)
+
+    def _drop_fts_objects(self):
+        """Drop the full-text index table and its triggers without committing.
+        """
+        fts_table_name = self.fts_table_name
+        for action in ('insert', 'delete', 'update'):
+            self._cursor.execute(f"DROP TRIGGER IF EXISTS {fts_table_name}_{action}")
+        self._cursor.execute(f"DROP TABLE IF EXISTS {fts_table_name}")
+
+    def _get_field_dtypes(self, fields: Union[List[Union[str, Dict[str, str]]], Dict[str, str]],
+                          relationships: Dict[str, str], grouped_field_aliases: Iterable[str]) -> Dict[str, np.dtype]:
+        """Map the aliases of queried fields to the dtypes of their declared types, resolving related fields
+        through `relationships`. One-to-many fields aggregated as JSON arrays are object arrays.
+
+        Related fields are treated as nullable, since rows without a related record are joined to nulls.
+        """
+        if isinstance(fields, dict):
+            field_aliases = list(fields.items())
+        else:
+            field_aliases = [
+                field_alias for field in fields
+                for field_alias in (field.items() if isinstance(field, dict) else [(field, field)])
+            ]
+
+        not_null_field_names = set(self._get_not_null_field_names())
+
+        dtypes = {}
+        for field, alias in field_aliases:
+            if alias in grouped_field_aliases:
+                continue
+
+            table_name = self._table_name
+            *relation_chain, field_name = field.split('.')
+            for relation_field in relation_chain:
+                if (referenced_field := relationships.get(f'{table_name}.{relation_field}')) is None:
+                    break
+                table_name = referenced_field.split('.')[0]
+            else:
+                declared_types = {row[1]: row[2] for row in self._schema_catalog.get_table_info(table_name)}
+                if field_name in declared_types:
+                    nullable = bool(relation_chain) or field_name not in not_null_field_names
+                    dtypes[alias] = ColumnarConverter.get_dtype(declared_types[field_name], nullable=nullable)
+
+        return dtypes
+
+    def _get_rowid_alias(self) -> Optional[str]:
+        """Retrieve the field that aliases the rowid, i.e. a single `INTEGER PRIMARY KEY` field, if any.
+        """
+        primary_key_fields = [field for field in self._schema_catalog.get_table_info(self._table_name) if field[5]]
+        if len(primary_key_fields) == 1 and primary_key_fields[0][2].upper() == 'INTEGER':
+            return primary_key_fields[0][1]
+
+    def _get_not_null_field_names(self) -> List[str]:
+        """Retrieve the fields that cannot hold nulls, i.e. `NOT NULL` fields, the rowid and its alias.
+        """
+        not_null_field_names = [field[1] for field in self._schema_catalog.get_table_info(self._table_name) if field[3]]
+        rowid_alias = self._get_rowid_alias()
+        if rowid_alias:
+            not_null_field_names.append(rowid_alias)
+        return not_null_field_names + ['rowid']
+
+    def _iter_record_chunks(self, records: Iterable[Dict[str, Any]], chunk_size: Optional[int] = None,
+                            m2m_field_names: Optional[List[str]] = None, m2m_records: Optional[List[Dict[str, Any]]] = None,
+                            ) -> Generator[Tuple[Tuple[str, ...], List[Dict[str, Any]]], None, None]:
+        """Split records into chunks of consecutive records sharing the same fields.
+
+        Args:
+            records (Iterable[Dict[str, Any]]): The records to split.
+            chunk_size (Optional[int]): The maximum number of records per chunk. Defaults to `BULK_CHUNK_SIZE`.
+            m2m_field_names (Optional[List[str]]): Many-to-many fields to separate from each record.
+            m2m_records (Optional[List[Dict[str, Any]]]): A list that receives the separated many-to-many data
+                of each record, in input order.
+
+        Yields:
+            Tuple[Tuple[str, ...], List[Dict[str, Any]]]: The field names and the records of each chunk.
+
+        Raises:
+            ValueError: If the field names are not valid Python identifiers.
+        """
+        chunk_size = chunk_size or self.BULK_CHUNK_SIZE
+
+        def split_record(record: Dict[str, Any]) -> Dict[str, Any]:
+            record = dict(record)
+            if m2m_records is not None:
+                m2m_records.append({
+                    track_field_name: record.pop(track_field_name)
+                    for track_field_name in m2m_field_names or []
+                    if track_field_name in record
+                })
+            return record
+
+        for field_names, group in groupby(map(split_record, records), key=lambda record: tuple(record.keys())):
+            if not all(field.isidentifier() for field in field_names):
+                raise ValueError("Invalid table name or field names")
+
+            while chunk := list(islice(group, chunk_size)):
+                yield field_names, chunk
+
+    def _resolve_many_to_many_batch(self, row_dicts: List[Dict[str, Any]], many_to_many_field_names: List[str], key_field: str):
+        """Resolve many-to-many data for a page of rows in place, using one query per junction table.
+
+        Rows without related records are left untouched, matching the per-row resolution.
+
+        Args:
+            row_dicts (List[Dict[str, Any]]): The rows to update.
+            many_to_many_field_names (List[str]): The track field names of the many-to-many relationships to resolve.
+            key_field (str): The field in each row that is referenced by the junction tables.
+        """
+        if not row_dicts:
+            return
+
+        from_values = list({row_dict[key_field] for row_dict in row_dicts})
+
+        for m2m_field in many_to_many_field_names:
+            m2m_data = self.get_many_to_many_data(m2m_field, from_values)
+            if not m2m_data:
+                continue
+
+            referenced_field = self.get_many_to_many_field(m2m_field).local_fk.referenced_field
+            key_to_values = {data[referenced_field]: data[m2m_field] for data in m2m_data}
+
+            for row_dict in row_dicts:
+                if (related_values := key_to_values.get(row_dict[key_field])) is None:
+                    continue
+                row_dict[m2m_field] = related_values
+
     def _create_meta_enum_field_table(self):
         """Create the meta table to store enum field information.
         """
@@ -1211,7 +1995,7 @@ class SQLiteModel(AbstractModel):
                 PRIMARY KEY (table_name, field_name)
             );
         ''')
-        self._connection.commit()
+        self._database.commit()
 
     def _update_junction_table(self, track_field_name: str, from_value: Union[int, str, float], 
                             selected_values: List[Union[int, str, float]], is_rowid: bool = False):
@@ -1241,13 +2025,12 @@ class SQLiteModel(AbstractModel):
         ''', (from_value,))
 
         # Insert new entries into the junction table
-        for value in selected_values:
-            self._cursor.execute(f'''
-                INSERT INTO {m2m.junction_table} ({m2m.local_fk.local_field}, {m2m.remote_fk.local_field})
-                VALUES (?, ?)
-            ''', (from_value, value))
+        self._cursor.executemany(f'''
+            INSERT INTO {m2m.junction_table} ({m2m.local_fk.local_field}, {m2m.remote_fk.local_field})
+            VALUES (?, ?)
+        ''', [(from_value, value) for value in selected_values])
         
-        self._connection.commit()
+        self._database.commit()
 
     def _add_enum_metadata(self, table_name: str, field_name: str, enum_table_name: str, description: str = ""):
         self._create_meta_enum_field_table()
@@ -1255,7 +2038,8 @@ class SQLiteModel(AbstractModel):
             INSERT INTO _meta_enum_field (table_name, field_name, enum_table_name, description)
             VALUES (?, ?, ?, ?);
         ''', (table_name, field_name, enum_table_name, description))
-        self._connection.commit()
+        self._database.commit()
+        self._schema_catalog.invalidate()
 
     def _remove_display_field(self, field_name: str):
         """Remove a display field entry from the meta table.
@@ -1265,7 +2049,8 @@ class SQLiteModel(AbstractModel):
                 DELETE FROM _meta_display_field
                 WHERE table_name = ? AND field_name = ?;
             ''', (self._table_name, field_name))
-            self._connection.commit()
+            self._database.commit()
+            self._schema_catalog.invalidate()
         except sqlite3.OperationalError:
             pass
 
@@ -0,0 +1,334 @@
+# Type Checking Imports
+# ---------------------
+from typing import List, Optional, Set, Tuple, Union
+
+# Standard Library Imports
+# ------------------------
+import multiprocessing
+import os
+import queue
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import partial
+from multiprocessing import resource_tracker, shared_memory
+from pathlib import Path
+
+# Third Party Imports
+# -------------------
+import numpy as np
+
+# Local Imports
+# -------------
+from blackboard.utils.image_utils import ImageReader
+
+
+# Worker Process State
+# --------------------
+# Shared memory blocks attached by the worker process, kept mapped so that reusing them does not fault in new pages
+_attached_blocks: 'OrderedDict[str, shared_memory.SharedMemory]' = OrderedDict()
+_max_attached_blocks = 1
+
+
+# Function Definitions
+# --------------------
+def _init_worker(max_attached_blocks: int):
+    """Initialize a worker process.
+    """
+    global _max_attached_blocks
+    _max_attached_blocks = max_attached_blocks
+
+def _warm_up() -> int:
+    """Run once in each worker process, so the first decodes do not pay for starting the process.
+    """
+    return os.getpid()
+
+def _get_worker_block(block_name: Optional[str], size: int) -> shared_memory.SharedMemory:
+    """Get a block of at least `size` bytes in a worker process, reusing the given block if it is large enough.
+    """
+    if block_name is not None:
+        shared_block = _attached_blocks.get(block_name)
+        if shared_block is None:
+            shared_block = shared_memory.SharedMemory(name=block_name)
+        _attached_blocks[block_name] = shared_block
+        _attached_blocks.move_to_end(block_name)
+        if shared_block.size >= size:
+            return shared_block
+
+    # The service adopts the new block in place of the given one
+    shared_block = shared_memory.SharedMemory(create=True, size=size)
+    _attached_blocks[shared_block.name] = shared_block
+
+    while len(_attached_blocks) > _max_attached_blocks:
+        _, oldest_block = _attached_blocks.popitem(last=False)
+        oldest_block.close()
+
+    return shared_block
+
+def _decode_to_shared_memory(file_path: str, target_height: Optional[int], single_channel: bool,
+                             block_name: Optional[str]) -> Optional[Tuple[str, Tuple[int, ...], str]]:
+    """Decode an image in a worker process and copy its pixels into a shared memory block.
+
+    Args:
+        block_name (Optional[str]): The block to copy the pixels into. A new block is created if it is
+            None or too small.
+
+    Returns:
+        Optional[Tuple[str, Tuple[int, ...], str]]: The name of the block holding the pixels, the shape and the
+            dtype of the image, or None if the image could not be read.
+    """
+    image_data = ImageReader.read_image(file_path, target_height=target_height, single_channel=single_channel)
+    if image_data is None:
+        return None
+
+    image_data = np.ascontiguousarray(image_data)
+    shared_block = _get_worker_block(block_name, max(image_data.nbytes, 1))
+    np.ndarray(image_data.shape, dtype=image_data.dtype, buffer=shared_block.buf)[...] = image_data
+    return shared_block.name, image_data.shape, image_data.dtype.str
+
+
+# Class Definitions
+# -----------------
+class DecodeService:
+    """Decode images with `ImageReader` in a pool of warm worker processes.
+
+    Decoding EXR, DPX and video frames is CPU-bound Python and NumPy work, which does not scale across
+    threads because of the GIL. The service runs it in worker processes instead, and the pixels come
+    back through `multiprocessing.shared_memory` rather than being pickled. Each of the `max_pending`
+    slots keeps its shared memory block, so blocks are only mapped once and then reused.
+
+    Files smaller than `small_file_size` are decoded in the calling thread, where the round trip to a
+    process would cost more than the decode. The number of decodes queued or running is bounded by
+    `max_pending`, and decodes fall back to the calling thread if the process pool breaks.
+
+    Examples:
+        >>> decode_service = DecodeService(max_workers=4)
+        >>> future = decode_service.submit('shot_010.1001.exr', target_height=64)
+        >>> image_data = future.result()
+        >>> decode_service.shutdown()
+    """
+
+    DEFAULT_SMALL_FILE_SIZE = 1024 * 1024   # 1 MB
+    DEFAULT_MAX_PENDING = 16
+
+    # Initialization and Setup
+    # ------------------------
+    def __init__(self, max_workers: Optional[int] = None, max_pending: int = DEFAULT_MAX_PENDING,
+                 small_file_size: int = DEFAULT_SMALL_FILE_SIZE,
+                 mp_context: Optional[Union[str, multiprocessing.context.BaseContext]] = 'spawn'):
+        """Start the worker processes.
+
+        Args:
+            max_workers (Optional[int]): The number of worker processes. Defaults to the number of CPUs.
+            max_pending (int): The maximum number of decodes queued or running in the workers at once.
+            small_file_size (int): Files smaller than this size in bytes are decoded in the calling thread.
+            mp_context (Optional[Union[str, multiprocessing.context.BaseContext]]): The start method or context
+                of the workers. Defaults to 'spawn', as forking a process running Qt threads is unsafe.
+        """
+        if isinstance(mp_context, str):
+            mp_context = multiprocessing.get_context(mp_context)
+
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.max_pending = max_pending
+        self.small_file_size = small_file_size
+
+        # Share one resource tracker with the workers, so blocks are only unlinked by the service or at its exit
+        resource_tracker.ensure_running()
+        self._executor = ProcessPoolExecutor(
+            max_workers=self.max_workers, mp_context=mp_context,
+            initializer=_init_worker, initargs=(max_pending,),
+        )
+        self._pending_slots = threading.BoundedSemaphore(max_pending)
+        self._lock = threading.Lock()
+        self._futures: Set[Future] = set()
+        # Blocks of the free slots; a slot gets its block from the first image decoded into it
+        self._free_blocks: List[Optional[shared_memory.SharedMemory]] = [None] * max_pending
+        self._is_broken = False
+
+        self._warm_up()
+
+    def _warm_up(self):
+        """Start all worker processes now, instead of on the first decodes.
+        """
+        warm_up_futures = [self._executor.submit(_warm_up) for _ in range(self.max_workers)]
+        for warm_up_future in warm_up_futures:
+            try:
+                warm_up_future.result()
+            except BrokenProcessPool:
+                self._is_broken = True
+                return
+
+    # Public Methods
+    # --------------
+    def submit(self, file_path: Union[str, Path], target_height: Optional[int] = None, single_channel: bool = False,
+               block: bool = True, timeout: Optional[float] = None) -> Future:
+        """Decode an image, see `ImageReader.read_image` for the arguments.
+
+        Args:
+            file_path (Union[str, Path]): The path to the image or video file.
+            target_height (Optional[int]): The height the image may be reduced to while decoding.
+            single_channel (bool): If True, only a single channel is decoded.
+            block (bool): If True, wait for a free slot when `max_pending` decodes are pending.
+            timeout (Optional[float]): The maximum time to wait for a free slot, in seconds.
+
+        Returns:
+            Future: The future of the image data. Cancelling it drops the decode if it has not started yet.
+
+        Raises:
+            queue.Full: If no slot became free, when not blocking or within the timeout.
+        """
+        if isinstance(file_path, Path):
+            file_path = file_path.as_posix()
+
+        if self._is_broken or self._is_small_file(file_path):
+            return self._decode_in_thread(file_path, target_height, single_channel)
+
+        has_slot = self._pending_slots.acquire(timeout=timeout) if block else self._pending_slots.acquire(blocking=False)
+        if not has_slot:
+            raise queue.Full(f"{self.max_pending} decodes are already pending")
+
+        with self._lock:
+            slot_block = self._free_blocks.pop()
+
+        future = Future()
+        try:
+            process_future = self._executor.submit(
+                _decode_to_shared_memory, file_path, target_height, single_channel,
+                slot_block.name if slot_block else None,
+            )
+        except (BrokenProcessPool, RuntimeError):
+            self._release_slot(slot_block)
+            self._is_broken = True
+            return self._decode_in_thread(file_path, target_height, single_channel)
+
+        with self._lock:
+            self._futures.add(future)
+
+        # Cancelling the returned future cancels the decode if it is still queued
+        future.add_done_callback(partial(self._on_future_done, process_future))
+        process_future.add_done_callback(
+            partial(self._on_decoded, future, slot_block, file_path, target_height, single_channel)
+        )
+
+        return future
+
+    def read_image(self, file_path: Union[str, Path], target_height: Optional[int] = None,
+                   single_channel: bool = False) -> Optional[np.ndarray]:
+        """Decode an image and wait for the result, see `ImageReader.read_image` for the arguments.
+        """
+        return self.submit(file_path, target_height, single_channel).result()
+
+    def cancel_all(self):
+        """Cancel all decodes that have not started yet.
+        """
+        with self._lock:
+            futures = list(self._futures)
+
+        for future in futures:
+            future.cancel()
+
+    def shutdown(self, wait: bool = True):
+        """Cancel the pending decodes, stop the worker processes and release the shared memory.
+        """
+        self.cancel_all()
+        self._executor.shutdown(wait=wait, cancel_futures=True)
+
+        with self._lock:
+            free_blocks, self._free_blocks = self._free_blocks, []
+        for shared_block in free_blocks:
+            if shared_block is not None:
+                self._unlink_block(shared_block)
+
+    # Class Properties
+    # ----------------
+    @property
+    def pending_count(self) -> int:
+        """Get the number of decodes queued or running in the worker processes.
+        """
+        with self._lock:
+            return len(self._futures)
+
+    # Private Methods
+    # ---------------
+    def _is_small_file(self, file_path: str) -> bool:
+        """Check whether a file is small enough to be decoded in the calling thread.
+        """
+        try:
+            return os.path.getsize(file_path) < self.small_file_size
+        except OSError:
+            # Let `ImageReader` raise the error of a missing file
+            return True
+
+    def _decode_in_thread(self, file_path: str, target_height: Optional[int], single_channel: bool) -> Future:
+        """Decode an image in the calling thread, returning a completed future.
+        """
+        future = Future()
+        try:
+            future.set_result(ImageReader.read_image(file_path, target_height=target_height, single_channel=single_channel))
+        except Exception as error:
+            future.set_exception(error)
+        return future
+
+    def _release_slot(self, slot_block: Optional[shared_memory.SharedMemory]):
+        """Return a slot and its block for the next decode.
+        """
+        with self._lock:
+            self._free_blocks.append(slot_block)
+        self._pending_slots.release()
+
+    @staticmethod
+    def _on_future_done(process_future: Future, future: Future):
+        """Cancel the decode in the worker process when its future is cancelled.
+        """
+        if future.cancelled():
+            process_future.cancel()
+
+    def _on_decoded(self, future: Future, slot_block: Optional[shared_memory.SharedMemory], file_path: str,
+                    target_height: Optional[int], single_channel: bool, process_future: Future):
+        """Copy the decoded pixels out of shared memory and release the slot.
+        """
+        with self._lock:
+            self._futures.discard(future)
+
+        if process_future.cancelled():
+            self._release_slot(slot_block)
+            future.cancel()
+            return
+
+        image_data, error = None, process_future.exception()
+        if isinstance(error, BrokenProcessPool):
+            # A worker died, e.g. killed for memory, so decode in threads from now on
+            self._is_broken = True
+            try:
+                image_data, error = ImageReader.read_image(file_path, target_height=target_height, single_channel=single_channel), None
+            except Exception as read_error:
+                error = read_error
+        elif error is None and process_future.result() is not None:
+            block_name, shape, dtype = process_future.result()
+            if slot_block is None or block_name != slot_block.name:
+                # The worker created a larger block, which replaces the block of the slot
+                if slot_block is not None:
+                    self._unlink_block(slot_block)
+                slot_block = shared_memory.SharedMemory(name=block_name)
+            image_data = np.ndarray(shape, dtype=np.dtype(dtype), buffer=slot_block.buf).copy()
+
+        # The slot is released before delivering, even if the caller cancelled meanwhile
+        self._release_slot(slot_block)
+
+        if not future.set_running_or_notify_cancel():
+            return
+        if error is not None:
+            future.set_exception(error)
+        else:
+            future.set_result(image_data)
+
+    @staticmethod
+    def _unlink_block(shared_block: shared_memory.SharedMemory):
+        """Close and remove a block owned by the service.
+        """
+        shared_block.close()
+        try:
+            shared_block.unlink()
+        except FileNotFoundError:
+            pass
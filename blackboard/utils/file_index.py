@@ -0,0 +1,479 @@
+# Type Checking Imports
+# ---------------------
+from typing import Callable, Dict, Generator, Iterable, List, Mapping, Optional, Set, Tuple
+
+# Standard Library Imports
+# ------------------------
+import datetime
+import os
+import sqlite3
+import threading
+from dataclasses import dataclass
+
+# Third Party Imports
+# -------------------
+from qtpy import QtCore
+
+# Local Imports
+# -------------
+from blackboard.utils.file_path_utils import FileInfo, FileUtil, FilePathWalker, SequenceFileUtil
+
+
+# Class Definitions
+# -----------------
+@dataclass
+class FileRecord:
+    """The metadata of a file stored in a `FileIndex`.
+    """
+    path: str
+    directory: str
+    name: str
+    size: int
+    mtime_ns: Optional[int]     # None for broken symbolic links
+    uid: Optional[int]
+    extension: str
+    sequence: Optional[str]     # Name of the sequence in hash format, e.g. 'image.####.exr', if the file is a frame of one
+
+class FileIndex:
+    """A persistent index of the files under root directories, in a single SQLite file.
+
+    The index stores the path, size, modification time, owner uid, extension and sequence membership of
+    each file, so browsing a project reads the index instead of walking and statting the file system.
+
+    `refresh` brings the index up to date incrementally: only the directories whose modification time
+    changed since they were indexed are scanned again, the others only take a `stat`. A directory's
+    modification time changes when entries are added, removed or renamed, but not when a file is rewritten
+    in place, which only a full refresh or a `FileIndexWatcher` picks up.
+
+    Examples:
+        >>> file_index = FileIndex(':memory:')
+        >>> file_index.refresh('/projects/show')
+        >>> records = list(file_index.iter_files('/projects/show/shots'))
+    """
+
+    # Number of rows inserted per statement when scanning directories
+    INSERT_BATCH_SIZE = 4096
+
+    # Initialization and Setup
+    # ------------------------
+    def __init__(self, db_path: Optional[str] = None):
+        """Open the index, creating it and its directory if needed.
+
+        Args:
+            db_path (Optional[str]): The path of the SQLite file. Defaults to `get_default_path()`.
+        """
+        self.db_path = db_path or self.get_default_path()
+
+        if self.db_path != ':memory:':
+            os.makedirs(os.path.dirname(os.path.abspath(self.db_path)), exist_ok=True)
+
+        self._lock = threading.RLock()
+
+        self._connection = sqlite3.connect(self.db_path, check_same_thread=False)
+        if self.db_path != ':memory:':
+            self._connection.execute('PRAGMA journal_mode=WAL')
+            self._connection.execute('PRAGMA synchronous=NORMAL')
+        self._connection.execute(
+            'CREATE TABLE IF NOT EXISTS directories ('
+            'path TEXT PRIMARY KEY, parent TEXT, mtime_ns INTEGER NOT NULL)'
+        )
+        self._connection.execute(
+            # Clustered by directory, so the files of a tree are read sequentially
+            'CREATE TABLE IF NOT EXISTS files ('
+            'directory TEXT NOT NULL, name TEXT NOT NULL, size INTEGER NOT NULL, mtime_ns INTEGER, uid INTEGER, '
+            'extension TEXT NOT NULL, sequence TEXT, PRIMARY KEY (directory, name)) WITHOUT ROWID'
+        )
+        self._connection.execute('CREATE INDEX IF NOT EXISTS directories_parent ON directories (parent)')
+        self._connection.commit()
+
+    # Public Methods
+    # --------------
+    @staticmethod
+    def get_default_path() -> str:
+        """Get the default path of the index, in the user cache directory.
+        """
+        cache_home = os.environ.get('XDG_CACHE_HOME') or os.path.expanduser('~/.cache')
+        return os.path.join(cache_home, 'blackboard', 'file_index.db')
+
+    def refresh(self, root: str, is_full: bool = False) -> int:
+        """Bring the index of a directory tree up to date, scanning only the directories that changed.
+
+        Args:
+            root (str): The root directory of the tree, added to the index if it is not indexed yet.
+            is_full (bool): Whether to scan every directory again, to pick up files rewritten in place.
+
+        Returns:
+            int: The number of directories scanned.
+        """
+        return self._refresh(os.path.normpath(root), is_full=is_full, is_root_forced=is_full)
+
+    def refresh_directory(self, directory: str) -> int:
+        """Scan a directory again, and bring the index of its subdirectories up to date.
+
+        Returns:
+            int: The number of directories scanned.
+        """
+        return self._refresh(os.path.normpath(directory), is_full=False, is_root_forced=True)
+
+    def remove(self, root: str) -> None:
+        """Remove a directory tree from the index.
+        """
+        with self._lock:
+            self._remove_tree(os.path.normpath(root))
+            self._connection.commit()
+
+    def is_indexed(self, directory: str) -> bool:
+        """Check whether a directory is in the index.
+        """
+        with self._lock:
+            row = self._connection.execute(
+                'SELECT 1 FROM directories WHERE path = ?', (os.path.normpath(directory),)
+            ).fetchone()
+        return row is not None
+
+    def get_directories(self, root: str) -> List[str]:
+        """Get the indexed directories of a tree, including its root.
+        """
+        root = os.path.normpath(root)
+        with self._lock:
+            rows = self._connection.execute(
+                'SELECT path FROM directories WHERE path = ? OR (path >= ? AND path < ?) ORDER BY path',
+                (root, *self._get_subtree_range(root))
+            ).fetchall()
+        return [path for path, in rows]
+
+    def iter_files(self, root: str) -> Generator[FileRecord, None, None]:
+        """Iterate over the indexed files of a tree, ordered by directory and name.
+
+        The records are read in one query, so the index may be refreshed while iterating.
+        """
+        root = os.path.normpath(root)
+        with self._lock:
+            rows = self._connection.execute(
+                'SELECT directory, name, size, mtime_ns, uid, extension, sequence FROM files '
+                'WHERE directory = ? OR (directory >= ? AND directory < ?) ORDER BY directory, name',
+                (root, *self._get_subtree_range(root))
+            ).fetchall()
+
+        join = os.path.join
+        for directory, name, *metadata in rows:
+            yield FileRecord(join(directory, name), directory, name, *metadata)
+
+    def get_file_info(self, record: FileRecord, date_time_format: str = FileUtil.DEFAULT_DATE_TIME_FORMAT) -> 'FileRecordInfo':
+        """Get the information of a file from its record, in the format of `FileUtil.extract_file_info`,
+        with each field formatted on first access.
+        """
+        return FileRecordInfo(record, date_time_format=date_time_format)
+
+    def get_sequence_info(self, records: List[FileRecord],
+                          date_time_format: str = FileUtil.DEFAULT_DATE_TIME_FORMAT) -> Mapping[str, str]:
+        """Get the information of a sequence from the records of its frames, in the format of
+        `SequenceFileUtil.extract_file_info`.
+        """
+        if len(records) == 1:
+            return self.get_file_info(records[0], date_time_format)
+
+        latest_record = max(records, key=lambda record: record.mtime_ns or 0)
+        sequence_numbers = [self._get_frame_number(record) for record in records]
+
+        return {
+            "file_name": latest_record.name,
+            "file_path": os.path.join(latest_record.directory, latest_record.sequence),
+            "file_size": FileUtil.format_size(sum(record.size for record in records)),
+            "file_extension": latest_record.extension,
+            "last_modified": self._format_mtime(latest_record.mtime_ns, date_time_format),
+            "file_owner": self._get_owner_name(latest_record),
+            "sequence_range": ', '.join(SequenceFileUtil.get_sequence_ranges(sequence_numbers)),
+            "sequence_count": len(sequence_numbers),
+        }
+
+    def close(self) -> None:
+        """Close the index.
+        """
+        with self._lock:
+            if self._connection is None:
+                return
+            self._connection.close()
+            self._connection = None
+
+    # Class Properties
+    # ----------------
+    @property
+    def file_count(self) -> int:
+        """Get the number of indexed files.
+        """
+        with self._lock:
+            return self._connection.execute('SELECT COUNT(*) FROM files').fetchone()[0]
+
+    @property
+    def directory_count(self) -> int:
+        """Get the number of indexed directories.
+        """
+        with self._lock:
+            return self._connection.execute('SELECT COUNT(*) FROM directories').fetchone()[0]
+
+    # Private Methods
+    # ---------------
+    def _refresh(self, root: str, is_full: bool, is_root_forced: bool) -> int:
+        """Bring the index of a tree up to date, depth first, in one transaction.
+        """
+        scanned_count = 0
+        with self._lock:
+            stack = [(root, is_root_forced)]
+            while stack:
+                directory, is_forced = stack.pop()
+
+                try:
+                    mtime_ns = os.stat(directory).st_mtime_ns
+                except OSError:
+                    self._remove_tree(directory)
+                    continue
+
+                row = self._connection.execute('SELECT mtime_ns FROM directories WHERE path = ?', (directory,)).fetchone()
+                if row is not None and row[0] == mtime_ns and not is_forced:
+                    # Unchanged, only its subdirectories may have changed
+                    subdirectories = [path for path, in self._connection.execute(
+                        'SELECT path FROM directories WHERE parent = ?', (directory,)
+                    )]
+                else:
+                    subdirectories = self._scan_directory(directory, mtime_ns)
+                    scanned_count += 1
+
+                stack.extend((subdirectory, is_full) for subdirectory in subdirectories)
+
+            self._connection.commit()
+
+        return scanned_count
+
+    def _scan_directory(self, directory: str, mtime_ns: int) -> List[str]:
+        """Replace the indexed files of a directory with its current files. Must be called with the lock held.
+
+        Returns:
+            List[str]: The paths of the subdirectories.
+        """
+        file_entries, directory_entries = FilePathWalker.scan_directory(directory, is_skip_hidden=False)
+        subdirectories = [entry.path for entry in directory_entries]
+
+        # Remove the subdirectories that no longer exist
+        indexed_subdirectories = {path for path, in self._connection.execute(
+            'SELECT path FROM directories WHERE parent = ?', (directory,)
+        )}
+        for removed_directory in indexed_subdirectories.difference(subdirectories):
+            self._remove_tree(removed_directory)
+
+        self._connection.execute('DELETE FROM files WHERE directory = ?', (directory,))
+        sequences = self._get_sequences(file_entries)
+
+        rows = []
+        for entry in file_entries:
+            try:
+                stat_result = entry.stat()
+                size, file_mtime_ns, uid = stat_result.st_size, stat_result.st_mtime_ns, stat_result.st_uid
+            except OSError:
+                # Broken symbolic link
+                size, file_mtime_ns, uid = 0, None, None
+
+            rows.append((
+                directory, entry.name, size, file_mtime_ns, uid,
+                FileUtil.get_file_extension(entry.name), sequences.get(entry.name),
+            ))
+            if len(rows) >= self.INSERT_BATCH_SIZE:
+                self._insert_files(rows)
+                rows.clear()
+        self._insert_files(rows)
+
+        self._connection.execute(
+            'INSERT OR REPLACE INTO directories (path, parent, mtime_ns) VALUES (?, ?, ?)',
+            (directory, os.path.dirname(directory), mtime_ns)
+        )
+
+        return subdirectories
+
+    def _insert_files(self, rows: List[Tuple]) -> None:
+        self._connection.executemany(
+            'INSERT OR REPLACE INTO files (directory, name, size, mtime_ns, uid, extension, sequence) '
+            'VALUES (?, ?, ?, ?, ?, ?, ?)', rows
+        )
+
+    def _remove_tree(self, root: str) -> None:
+        """Remove a directory and its subdirectories from the index. Must be called with the lock held.
+        """
+        subtree_range = self._get_subtree_range(root)
+        self._connection.execute(
+            'DELETE FROM files WHERE directory = ? OR (directory >= ? AND directory < ?)', (root, *subtree_range)
+        )
+        self._connection.execute(
+            'DELETE FROM directories WHERE path = ? OR (path >= ? AND path < ?)', (root, *subtree_range)
+        )
+
+    @staticmethod
+    def _get_subtree_range(root: str) -> Tuple[str, str]:
+        """Get the bounds of the paths below a directory, so lookups use the indexes instead of a `LIKE` scan.
+        """
+        prefix = root if root.endswith(os.sep) else root + os.sep
+        return prefix, prefix[:-1] + chr(ord(os.sep) + 1)
+
+    @staticmethod
+    def _get_sequences(file_entries: List[os.DirEntry]) -> Dict[str, str]:
+        """Get the sequence of each file name that is a frame of a sequence, grouping the entries the same way
+        as `FilePathWalker.traverse_files` with `SequenceFileUtil.detect_sequences`.
+        """
+        sequences, _single_entries = SequenceFileUtil.detect_sequences(file_entries, is_stat_frames=False)
+
+        sequence_names = {}
+        for sequence in sequences:
+            sequence_name = os.path.basename(sequence.get_path())
+            for frame in sequence.frames:
+                sequence_names[f"{sequence.prefix}{frame:0{sequence.padding}}{sequence.suffix}"] = sequence_name
+
+        return sequence_names
+
+    @staticmethod
+    def _get_frame_number(record: FileRecord) -> str:
+        """Get the frame number of a record of a sequence frame, at the position of the hashes in its sequence name.
+        """
+        prefix, _hashes, _suffix = record.sequence.partition('#')
+        return record.name[len(prefix):len(prefix) + record.sequence.count('#')]
+
+    @staticmethod
+    def _format_mtime(mtime_ns: Optional[int], date_time_format: str) -> str:
+        if mtime_ns is None:
+            return 'N/A'
+        return datetime.datetime.fromtimestamp(mtime_ns / 1e9).strftime(date_time_format)
+
+    @staticmethod
+    def _get_owner_name(record: FileRecord) -> str:
+        """Get the name of the owner of a file, from the names cached by `FileUtil`.
+        """
+        if record.uid is None:
+            return 'N/A'
+        if os.name == 'nt':
+            return FileUtil.get_file_owner(record.path)
+
+        return FileUtil.get_user_name(record.uid)
+
+class FileRecordInfo(FileInfo):
+    """The information of an indexed file in the format of `FileUtil.extract_file_info`, with each field
+    formatted from its record on first access instead of statting the file.
+
+    Attributes:
+        record (FileRecord): The record of the file.
+    """
+
+    # Initialization and Setup
+    # ------------------------
+    def __init__(self, record: FileRecord, date_time_format: str = FileUtil.DEFAULT_DATE_TIME_FORMAT):
+        """Initialize the information of an indexed file.
+
+        Args:
+            record (FileRecord): The record of the file.
+            date_time_format (str): The format for the last modified timestamp.
+        """
+        super().__init__(record.path, date_time_format=date_time_format)
+
+        # Store the arguments
+        self.record = record
+
+    _FIELD_GETTERS: Dict[str, Callable[['FileRecordInfo'], str]] = {
+        'file_name': lambda file_info: file_info.record.name,
+        'file_path': lambda file_info: file_info.record.path,
+        'file_size': lambda file_info: FileUtil.format_size(file_info.record.size),
+        'file_extension': lambda file_info: file_info.record.extension,
+        'last_modified': lambda file_info: FileIndex._format_mtime(file_info.record.mtime_ns, file_info.date_time_format),
+        'file_owner': lambda file_info: FileIndex._get_owner_name(file_info.record),
+    }
+
+class FileIndexWatcher(QtCore.QObject):
+    """Keep a `FileIndex` up to date with the changes of watched directory trees.
+
+    Directories are watched with a `QFileSystemWatcher`, which uses inotify on Linux and the native
+    notifications of other platforms where available. Changes are collected for `UPDATE_DELAY` ms, so a
+    burst of new frames refreshes their directory once.
+
+    Signals:
+        directory_updated (str): Emitted with each directory refreshed after a change.
+    """
+
+    UPDATE_DELAY = 200
+
+    directory_updated = QtCore.Signal(str)
+
+    # Initialization and Setup
+    # ------------------------
+    def __init__(self, file_index: FileIndex, parent: Optional[QtCore.QObject] = None):
+        super().__init__(parent)
+
+        # Store the arguments
+        self.file_index = file_index
+
+        # Private Attributes
+        # ------------------
+        self._roots: Set[str] = set()
+        self._changed_directories: Set[str] = set()
+
+        self._file_system_watcher = QtCore.QFileSystemWatcher(self)
+        self._update_timer = QtCore.QTimer(self)
+        self._update_timer.setSingleShot(True)
+        self._update_timer.setInterval(self.UPDATE_DELAY)
+
+        self._file_system_watcher.directoryChanged.connect(self._on_directory_changed)
+        self._update_timer.timeout.connect(self._update_changed_directories)
+
+    # Public Methods
+    # --------------
+    def watch(self, root: str) -> None:
+        """Refresh the index of a directory tree and watch its directories.
+        """
+        root = os.path.normpath(root)
+        self._roots.add(root)
+        self.file_index.refresh(root)
+        self._add_watches(self.file_index.get_directories(root))
+
+    def unwatch(self, root: str) -> None:
+        """Stop watching a directory tree.
+        """
+        root = os.path.normpath(root)
+        self._roots.discard(root)
+        self._remove_watches(self._get_watched_directories(root))
+
+    def get_watched_directories(self) -> List[str]:
+        """Get the watched directories.
+        """
+        return self._file_system_watcher.directories()
+
+    # Private Methods
+    # ---------------
+    def _on_directory_changed(self, directory: str) -> None:
+        self._changed_directories.add(os.path.normpath(directory))
+        self._update_timer.start()
+
+    def _update_changed_directories(self) -> None:
+        """Refresh the changed directories, and watch their new subdirectories.
+        """
+        changed_directories, self._changed_directories = self._changed_directories, set()
+
+        for directory in sorted(changed_directories):
+            watched_directories = set(self._get_watched_directories(directory))
+            self.file_index.refresh_directory(directory)
+            indexed_directories = set(self.file_index.get_directories(directory))
+
+            self._remove_watches(watched_directories - indexed_directories)
+            self._add_watches(indexed_directories - watched_directories)
+            self.directory_updated.emit(directory)
+
+    def _get_watched_directories(self, root: str) -> List[str]:
+        root_prefix = root.rstrip(os.sep) + os.sep
+        return [
+            directory for directory in self._file_system_watcher.directories()
+            if directory == root or directory.startswith(root_prefix)
+        ]
+
+    def _add_watches(self, directories: List[str]) -> None:
+        if directories:
+            # Directories over the inotify watch limit are not watched
+            self._file_system_watcher.addPaths(directories)
+
+    def _remove_watches(self, directories: Iterable[str]) -> None:
+        directories = list(directories)
+        if directories:
+            self._file_system_watcher.removePaths(directories)
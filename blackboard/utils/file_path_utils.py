@@ -1,19 +1,25 @@
 # Type Checking Imports
 # ---------------------
-from typing import TYPE_CHECKING, Dict, List, Generator, Optional, Tuple, Union, Callable, Iterable
+from typing import TYPE_CHECKING, Dict, List, Generator, Optional, Pattern, Tuple, Union, Callable, Iterable
 if TYPE_CHECKING:
     from pathlib import Path
+    from blackboard.utils.file_index import FileIndex, FileRecord
 
 # Standard Library Imports
 # ------------------------
-import glob, os, datetime, re
+import glob, os, datetime, re, fnmatch, time
 from itertools import product
 from enum import Enum
-from collections import defaultdict
+from collections import ChainMap, defaultdict
+from collections.abc import Mapping
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from functools import partial
 
 if os.name == 'nt':
     import win32security
 else:
+    import grp
     import pwd
 
 # Local Imports
@@ -31,13 +37,23 @@ class FileUtil:
     UNITS = ['bytes', 'kB', 'MB', 'GB', 'TB', 'PB']
     FILE_INFO_FIELDS = ['file_name', 'file_path', 'file_size', 'file_extension', 'last_modified', 'file_owner']
 
+    # Seconds before a looked up user or group name is looked up again
+    NAME_CACHE_TTL = 300.0
+
+    # Id to name and expiry time, shared by all lookups as name services can take milliseconds per call
+    _user_names: Dict[int, Tuple[str, float]] = {}
+    _group_names: Dict[int, Tuple[str, float]] = {}
+
     @staticmethod
-    def extract_file_info(file_path: str, date_time_format: str = DEFAULT_DATE_TIME_FORMAT) -> Dict[str, str]:
+    def extract_file_info(file_path: str, date_time_format: str = DEFAULT_DATE_TIME_FORMAT,
+                          stat_result: Optional[os.stat_result] = None) -> Dict[str, str]:
         """Extract detailed information about a file.
 
         Args:
             file_path (str): Path to the file for extracting information.
             date_time_format (str): The format for the last modified timestamp.
+            stat_result (Optional[os.stat_result]): The stat result of the file if already known, otherwise
+                the file is statted.
 
         Returns:
             Dict[str, str]: A dictionary containing detailed file information, including:
@@ -48,32 +64,35 @@ class FileUtil:
                 - last_modified: The last modification timestamp in the specified format.
                 - file_owner: The owner of the file.
         """
-        try:
-            # Retrieve file statistics and details: file info, owner, last modified time, extension, and formatted size
-            file_info = os.stat(file_path)
-            owner = FileUtil.get_file_owner(file_path)
-            modified_time = FileUtil.get_modified_time(file_info, date_time_format=date_time_format)
-            extension = FileUtil.get_file_extension(file_path)
-            readable_size = FileUtil.format_size(file_info.st_size)
+        return dict(FileInfo(file_path, stat_result, date_time_format=date_time_format))
 
-        except FileNotFoundError:
-            # NOTE: Handle the case of an invalid symlink file path
-            owner = 'N/A'
-            modified_time = 'N/A'
-            extension = FileUtil.get_file_extension(file_path)
-            readable_size = '0 bytes'
+    @staticmethod
+    def extract_file_infos(files: Iterable[Union[str, os.DirEntry, Tuple[str, os.stat_result]]],
+                           date_time_format: str = DEFAULT_DATE_TIME_FORMAT) -> Generator['FileInfo', None, None]:
+        """Extract the information of many files, formatting each field only when it is first read.
 
-        # Compile the file details into a dictionary
-        details = {
-            "file_name": os.path.basename(file_path),
-            "file_path": file_path,
-            "file_size": readable_size,
-            "file_extension": extension,
-            "last_modified": modified_time,
-            "file_owner": owner,
-        }
+        Files given as paths or `os.DirEntry` are statted on first access of a field that needs it, reusing
+        the stat result cached by the entry. Owner names are looked up once per uid for all files.
 
-        return details
+        Args:
+            files (Iterable[Union[str, os.DirEntry, Tuple[str, os.stat_result]]]): The paths of the files,
+                their directory entries, or pairs of a path and its pre-fetched stat result.
+            date_time_format (str): The format for the last modified timestamp.
+
+        Yields:
+            FileInfo: The information of each file, in the format of `extract_file_info`.
+
+        Examples:
+            >>> with os.scandir('/shots/sh010/comp') as entries:                   # doctest: +SKIP
+            ...     file_infos = list(FileUtil.extract_file_infos(entries))
+            >>> file_infos[0]['file_owner']                                         # doctest: +SKIP
+            'alice'
+        """
+        for file in files:
+            if isinstance(file, tuple):
+                yield FileInfo(*file, date_time_format=date_time_format)
+            else:
+                yield FileInfo(file, date_time_format=date_time_format)
 
     @staticmethod
     def get_file_extension(file_path: str) -> str:
@@ -88,11 +107,13 @@ class FileUtil:
         return file_path.rsplit('.', 1)[-1] if '.' in file_path else ''
 
     @staticmethod
-    def get_file_owner(file_path: str) -> str:
+    def get_file_owner(file_path: str, stat_result: Optional[os.stat_result] = None) -> str:
         """Get the owner of a file.
 
         Args:
             file_path (str): Path to the file.
+            stat_result (Optional[os.stat_result]): The stat result of the file if already known, otherwise
+                the file is statted. Not used on Windows.
 
         Returns:
             str: The name of the file owner.
@@ -103,8 +124,57 @@ class FileUtil:
             name, domain, _type = win32security.LookupAccountSid(None, owner_sid)
             return f"{domain}\\{name}"
         else:
-            file_info = os.stat(file_path)
-            return pwd.getpwuid(file_info.st_uid).pw_name
+            stat_result = stat_result or os.stat(file_path)
+            return FileUtil.get_user_name(stat_result.st_uid)
+
+    @staticmethod
+    def get_user_name(uid: int) -> str:
+        """Get the name of a user from its uid, cached for `NAME_CACHE_TTL` seconds.
+
+        Args:
+            uid (int): The user id.
+
+        Returns:
+            str: The name of the user, or the uid as a string if it has no name.
+        """
+        return FileUtil._get_cached_name(FileUtil._user_names, uid, lambda: pwd.getpwuid(uid).pw_name)
+
+    @staticmethod
+    def get_group_name(gid: int) -> str:
+        """Get the name of a group from its gid, cached for `NAME_CACHE_TTL` seconds.
+
+        Args:
+            gid (int): The group id.
+
+        Returns:
+            str: The name of the group, or the gid as a string if it has no name.
+        """
+        return FileUtil._get_cached_name(FileUtil._group_names, gid, lambda: grp.getgrgid(gid).gr_name)
+
+    @staticmethod
+    def clear_name_cache():
+        """Forget the looked up user and group names, e.g. after accounts were renamed.
+        """
+        FileUtil._user_names.clear()
+        FileUtil._group_names.clear()
+
+    @staticmethod
+    def _get_cached_name(names: Dict[int, Tuple[str, float]], id_: int, look_up_name: Callable[[], str]) -> str:
+        """Get a name from the cache, looking it up if it is missing or expired.
+        """
+        current_time = time.monotonic()
+        cached_name = names.get(id_)
+        if cached_name is not None and cached_name[1] > current_time:
+            return cached_name[0]
+
+        try:
+            name = look_up_name()
+        except KeyError:
+            # The id has no entry in the name service, e.g. files extracted from an archive
+            name = str(id_)
+
+        names[id_] = (name, current_time + FileUtil.NAME_CACHE_TTL)
+        return name
 
     @staticmethod
     def get_modified_time(file_info: Union[str, os.stat_result], date_time_format: str = DEFAULT_DATE_TIME_FORMAT) -> str:
@@ -140,6 +210,111 @@ class FileUtil:
         return f"{size:.{precision}f} PB"
 
 
+class FileInfo(Mapping):
+    """The information of a file in the format of `FileUtil.extract_file_info`, with each field computed on
+    first access.
+
+    Listings of many files only pay for the stat, owner lookup and formatting of the rows that are read,
+    e.g. the rows shown in a view. A file that does not exist, such as an invalid symlink, has 'N/A' as
+    owner and last modified time and a size of '0 bytes'.
+
+    Attributes:
+        file_path (str): The path to the file.
+        date_time_format (str): The format for the last modified timestamp.
+    """
+
+    # Initialization and Setup
+    # ------------------------
+    def __init__(self, file: Union[str, os.DirEntry], stat_result: Optional[os.stat_result] = None,
+                 date_time_format: str = FileUtil.DEFAULT_DATE_TIME_FORMAT):
+        """Initialize the information of a file, without accessing the file system.
+
+        Args:
+            file (Union[str, os.DirEntry]): The path to the file, or its directory entry.
+            stat_result (Optional[os.stat_result]): The stat result of the file if already known.
+            date_time_format (str): The format for the last modified timestamp.
+        """
+        # Store the arguments
+        self.file_path = file.path if isinstance(file, os.DirEntry) else file
+        self.date_time_format = date_time_format
+
+        # Private Attributes
+        # ------------------
+        self._entry = file if isinstance(file, os.DirEntry) else None
+        self._stat_result = stat_result
+        self._is_statted = stat_result is not None
+        self._values: Dict[str, str] = {}
+
+    # Public Methods
+    # --------------
+    def get_stat_result(self) -> Optional[os.stat_result]:
+        """Get the stat result of the file, statting it on first call, or None if it does not exist.
+        """
+        if not self._is_statted:
+            try:
+                self._stat_result = self._entry.stat() if self._entry is not None else os.stat(self.file_path)
+            except FileNotFoundError:
+                self._stat_result = None
+            self._is_statted = True
+
+        return self._stat_result
+
+    # Class Properties
+    # ----------------
+    @property
+    def file_group(self) -> str:
+        """Get the name of the group of the file, which is not one of the fields as it is not set on Windows.
+        """
+        stat_result = self.get_stat_result()
+        if stat_result is None or os.name == 'nt':
+            return 'N/A'
+        return FileUtil.get_group_name(stat_result.st_gid)
+
+    # Special Methods
+    # ---------------
+    def __getitem__(self, field_name: str) -> str:
+        if field_name not in self._values:
+            if field_name not in self._FIELD_GETTERS:
+                raise KeyError(field_name)
+            self._values[field_name] = self._FIELD_GETTERS[field_name](self)
+
+        return self._values[field_name]
+
+    def __iter__(self):
+        return iter(FileUtil.FILE_INFO_FIELDS)
+
+    def __len__(self) -> int:
+        return len(FileUtil.FILE_INFO_FIELDS)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.file_path!r})"
+
+    # Private Methods
+    # ---------------
+    def _get_file_size(self) -> str:
+        stat_result = self.get_stat_result()
+        return FileUtil.format_size(stat_result.st_size) if stat_result is not None else '0 bytes'
+
+    def _get_last_modified(self) -> str:
+        stat_result = self.get_stat_result()
+        if stat_result is None:
+            return 'N/A'
+        return FileUtil.get_modified_time(stat_result, date_time_format=self.date_time_format)
+
+    def _get_file_owner(self) -> str:
+        stat_result = self.get_stat_result()
+        return FileUtil.get_file_owner(self.file_path, stat_result) if stat_result is not None else 'N/A'
+
+    _FIELD_GETTERS: Dict[str, Callable[['FileInfo'], str]] = {
+        'file_name': lambda file_info: os.path.basename(file_info.file_path),
+        'file_path': lambda file_info: file_info.file_path,
+        'file_size': _get_file_size,
+        'file_extension': lambda file_info: FileUtil.get_file_extension(file_info.file_path),
+        'last_modified': _get_last_modified,
+        'file_owner': _get_file_owner,
+    }
+
+
 class FormatStyle(Enum):
     """Enum for different placeholder formats for file sequences.
     """
@@ -707,6 +882,8 @@ class SequenceFileUtil(FileUtil):
     def extract_file_info(file_path: str, date_time_format: str = FileUtil.DEFAULT_DATE_TIME_FORMAT) -> Dict[str, str]:
         """Extract detailed information about a file, supporting sequence files.
 
+        The frames of a sequence are found in one scan of its directory and statted once each.
+
         Args:
             file_path (str): Path to the file or sequence path format for extracting information.
             date_time_format (str): The format for the last modified timestamp.
@@ -727,52 +904,348 @@ class SequenceFileUtil(FileUtil):
         if not format_style:
             return FileUtil.extract_file_info(file_path)
 
-        # Extract sequence files from the file path
-        sequence_files = SequenceFileUtil.extract_paths_from_format(file_path, format_style=format_style)
+        # Find the frames of the sequence on disk
+        sequence = SequenceFileUtil.find_sequence(file_path, format_style=format_style)
 
         # If there's only one file, handle it as a regular file
-        if len(sequence_files) == 1:
+        if sequence is None or sequence.frame_count < 2:
             return FileUtil.extract_file_info(file_path, date_time_format)
 
+        return SequenceFileUtil.get_sequence_info(sequence, file_path, date_time_format)
+
+    @staticmethod
+    def get_sequence_info(sequence: 'FileSequence', file_path: Optional[str] = None,
+                          date_time_format: str = FileUtil.DEFAULT_DATE_TIME_FORMAT) -> Dict[str, str]:
+        """Get the information of a sequence, in the format of `extract_file_info`, from the size and latest
+        frame accumulated by the sequence without accessing the file system again.
+
+        Args:
+            sequence (FileSequence): The sequence, e.g. from `detect_sequences`.
+            file_path (Optional[str]): The sequence path format to report, the hash format of the sequence if not provided.
+            date_time_format (str): The format for the last modified timestamp.
+
+        Returns:
+            Dict[str, str]: A dictionary containing detailed sequence information, see `extract_file_info`.
+        """
+        latest_file = sequence.latest_path
         try:
-            # Calculate the total size of the sequence files
-            total_size = sum(map(os.path.getsize, sequence_files))
-            latest_file = max(sequence_files, key=lambda f: os.stat(f).st_mtime)
-
-            # Retrieve file statistics and details: file info, owner, last modified time, extension, and formatted size
-            file_info = os.stat(latest_file)
-            owner = FileUtil.get_file_owner(latest_file)
-            modified_time = FileUtil.get_modified_time(file_info, date_time_format=date_time_format)
+            if sequence.latest_stat is None:
+                raise FileNotFoundError(latest_file)
+
+            # Retrieve file details from the stat result of the latest frame: owner, last modified time, extension, and formatted size
+            owner = FileUtil.get_file_owner(latest_file, sequence.latest_stat)
+            modified_time = FileUtil.get_modified_time(sequence.latest_stat, date_time_format=date_time_format)
             extension = FileUtil.get_file_extension(latest_file)
-            readable_size = FileUtil.format_size(total_size)
+            readable_size = FileUtil.format_size(sequence.total_size)
 
         except FileNotFoundError:
             # NOTE: Handle the case of an invalid symlink file path
             owner = 'N/A'
             modified_time = 'N/A'
-            extension = FileUtil.get_file_extension(sequence_files[0])
+            extension = FileUtil.get_file_extension(latest_file)
             readable_size = '0 bytes'
 
-        # Get the sequence ranges from the sequence files
-        sequence_numbers = [SequenceFileUtil.extract_frame_number(file_path) for file_path in sequence_files]
-        sequence_ranges = SequenceFileUtil.get_sequence_ranges(sequence_numbers)
-
         # Compile the details into a dictionary
         details = {
             "file_name": os.path.basename(latest_file),
-            "file_path": file_path,
+            "file_path": file_path or sequence.get_path(),
             "file_size": readable_size,
             "file_extension": extension,
             "last_modified": modified_time,
             "file_owner": owner,
-            "sequence_range": ', '.join(sequence_ranges),
-            "sequence_count": len(sequence_numbers),
+            "sequence_range": ', '.join(sequence.ranges),
+            "sequence_count": sequence.frame_count,
         }
         return details
 
+    @staticmethod
+    def find_sequence(sequence_path_format: str, format_style: Optional['FormatStyle'] = None) -> Optional['FileSequence']:
+        """Find the frames of a sequence path format on disk, in one scan of its directory.
+
+        Args:
+            sequence_path_format (str): The sequence path format.
+            format_style (Optional[FormatStyle]): The format style to use, if not provided, it will be detected.
+
+        Returns:
+            Optional[FileSequence]: The sequence of the frames found, or None if its directory cannot be read.
+        """
+        # Detect the format style if not provided
+        format_style = format_style or SequenceFileUtil.detect_sequence_format(sequence_path_format)
+        if not format_style:
+            raise ValueError("Unsupported format style")
+
+        # Extract details from the sequence path format
+        sequence_data = SequenceFileUtil.extract_sequence_details(sequence_path_format, format_style=format_style)
+        directory, name_prefix = os.path.split(sequence_data['base_name'])
+        extension = sequence_data['extension']
+        padding = SequenceFileUtil.get_padding(sequence_data, format_style=format_style)
+
+        # Match the frames of the range of formats that include one, or any frame with the padding otherwise
+        if format_style.requires_range() or format_style.requires_separate_ranges():
+            if format_style.requires_range():
+                frames = range(int(sequence_data['start_frame']), int(sequence_data['end_frame']) + 1)
+            else:
+                frames = SequenceFileUtil.ranges_to_sequence_numbers(sequence_data['ranges'].split(','))
+            frame_names = {f"{name_prefix}.{frame:0{padding}}.{extension}": frame for frame in frames}
+            get_frame = frame_names.get
+        else:
+            frame_regex = re.compile(rf"{re.escape(name_prefix)}\.(\d{{{padding}}})\.{re.escape(extension)}")
+            def get_frame(file_name: str) -> Optional[int]:
+                match = frame_regex.fullmatch(file_name)
+                return int(match.group(1)) if match else None
+
+        sequence = FileSequence(directory, f"{name_prefix}.", padding, f".{extension}")
+        try:
+            with os.scandir(directory or os.curdir) as iterator:
+                for entry in iterator:
+                    frame = get_frame(entry.name)
+                    if frame is not None:
+                        sequence.add_frame(frame, entry)
+        except OSError:
+            return None
+
+        sequence.frames.sort()
+        return sequence
+
+    @staticmethod
+    def detect_sequences(entries: Iterable[os.DirEntry], is_skip_hidden: bool = True, is_stat_frames: bool = True
+                        ) -> Tuple[List['FileSequence'], List[os.DirEntry]]:
+        """Detect the sequences of directory entries, see `SequenceDetector`.
+
+        Args:
+            entries (Iterable[os.DirEntry]): The entries of files, e.g. from `os.scandir`.
+            is_skip_hidden (bool): Whether to skip hidden files.
+            is_stat_frames (bool): Whether to stat the frames for the size and latest frame of each sequence.
+
+        Returns:
+            Tuple[List[FileSequence], List[os.DirEntry]]: The sequences, and the entries of the files that are not frames of one.
+        """
+        sequence_detector = SequenceDetector(is_skip_hidden=is_skip_hidden, is_stat_frames=is_stat_frames)
+        sequence_detector.add_entries(entries)
+        return sequence_detector.get_results()
+
+
+@dataclass
+class FileSequence:
+    """A sequence of frames in a directory, with the total size and latest frame of its frames.
+
+    Frame names are made of a prefix, the frame number padded to `padding` digits, and a suffix,
+    e.g. 'beauty.' + '1001' + '.exr'.
+    """
+    directory: str
+    prefix: str
+    padding: int
+    suffix: str
+    frames: List[int] = field(default_factory=list)
+    total_size: int = 0
+    latest_path: Optional[str] = None
+    # Stat result of the most recently modified frame, None if no frame could be statted
+    latest_stat: Optional[os.stat_result] = None
+
+    def add_frame(self, frame: int, entry: os.DirEntry, is_stat: bool = True) -> None:
+        """Add a frame, reusing the stat result cached by its directory entry.
+
+        Args:
+            frame (int): The frame number.
+            entry (os.DirEntry): The directory entry of the frame.
+            is_stat (bool): Whether to stat the frame for the total size and latest frame of the sequence.
+        """
+        self.frames.append(frame)
+        if self.latest_path is None:
+            self.latest_path = entry.path
+        if not is_stat:
+            return
+
+        try:
+            stat_result = entry.stat()
+        except OSError:
+            # NOTE: Handle the case of an invalid symlink file path
+            return
+
+        self.total_size += stat_result.st_size
+        if self.latest_stat is None or stat_result.st_mtime > self.latest_stat.st_mtime:
+            self.latest_path, self.latest_stat = entry.path, stat_result
+
+    def get_path(self, format_style: FormatStyle = FormatStyle.HASH) -> str:
+        """Get the path of the sequence in a format style.
+
+        Examples:
+            >>> FileSequence('shot', 'beauty_', 4, '.exr', [1001, 1002, 1004]).get_path(FormatStyle.BRACKETS_SEPARATE_RANGES)
+            'shot/beauty_[1001-1002,1004].exr'
+        """
+        # Format the frames between placeholders of the base name and extension, to support any prefix and suffix
+        sequence_name = SequenceFileUtil.construct_sequence_file_path(
+            format_style, '\0', self.frames, '\0', padding=self.padding,
+        )
+        sequence_name = sequence_name.replace('\0.', self.prefix, 1).replace('.\0', self.suffix, 1)
+        return os.path.join(self.directory, sequence_name)
+
+    @property
+    def frame_count(self) -> int:
+        return len(self.frames)
+
+    @property
+    def extension(self) -> str:
+        return FileUtil.get_file_extension(self.suffix)
+
+    @property
+    def ranges(self) -> List[str]:
+        """Get the ranges of the frames, e.g. ['1001-1002', '1004'].
+        """
+        return SequenceFileUtil.get_sequence_ranges(self.frames)
+
+    @property
+    def missing_frames(self) -> List[int]:
+        """Get the frames missing between the first and last frames.
+        """
+        if not self.frames:
+            return []
+        frame_set = set(self.frames)
+        return [frame for frame in range(min(self.frames), max(self.frames) + 1) if frame not in frame_set]
+
+
+class SequenceDetector:
+    """Detect the sequences of a stream of directory entries, in a single pass.
+
+    Names are split into text and frame number tokens with one compiled regex, where a frame number
+    is a run of digits between separators ('.', '_' or '-') or at the ends of the name. The last token
+    is the frame number, so frames are grouped by (prefix, padding, suffix) with the other tokens in
+    the prefix, e.g. 'sh010_v002.1001.exr'. The size and latest modification time of each sequence are
+    accumulated as entries are added, from the stat result cached by each `DirEntry`.
+
+    Names left without another frame in their group are grouped again on their earlier tokens when
+    getting the results, e.g. 'plate.1001.0.exr' and 'plate.1002.0.exr'.
+
+    Examples:
+        >>> sequence_detector = SequenceDetector()
+        >>> with os.scandir('/shots/sh010/render') as iterator:                 # doctest: +SKIP
+        ...     sequence_detector.add_entries(iterator)
+        >>> sequences, single_entries = sequence_detector.get_results()
+    """
+
+    FRAME_NUMBER_PATTERN = re.compile(r'(?:(?<=[._-])|^)(\d+)(?=[._-]|$)')
+
+    # Initialization and Setup
+    # ------------------------
+    def __init__(self, is_skip_hidden: bool = True, is_stat_frames: bool = True):
+        """Initialize the detector.
+
+        Args:
+            is_skip_hidden (bool): Whether to skip hidden files.
+            is_stat_frames (bool): Whether to stat the frames for the size and latest frame of each sequence,
+                which is not needed to only list the sequences.
+        """
+        # Store the arguments
+        self.is_skip_hidden = is_skip_hidden
+        self.is_stat_frames = is_stat_frames
+
+        # Private Attributes
+        # ------------------
+        # Sequences by directory, prefix, padding and suffix, with the first entry of each
+        self._sequences: Dict[Tuple[str, str, int, str], FileSequence] = {}
+        self._first_entries: Dict[Tuple[str, str, int, str], os.DirEntry] = {}
+        self._single_entries: List[os.DirEntry] = []
+
+    # Public Methods
+    # --------------
+    def add(self, entry: os.DirEntry) -> None:
+        """Add the entry of a file.
+        """
+        file_name = entry.name
+        if self.is_skip_hidden and file_name.startswith('.'):
+            return
+
+        tokens = self.FRAME_NUMBER_PATTERN.split(file_name)
+        if len(tokens) == 1:
+            self._single_entries.append(entry)
+            return
+
+        frame_number = tokens[-2]
+        key = (os.path.dirname(entry.path), ''.join(tokens[:-2]), len(frame_number), tokens[-1])
+
+        sequence = self._sequences.get(key)
+        if sequence is None:
+            sequence = self._sequences[key] = FileSequence(*key)
+            self._first_entries[key] = entry
+        sequence.add_frame(int(frame_number), entry, is_stat=self.is_stat_frames)
+
+    def add_entries(self, entries: Iterable[os.DirEntry]) -> None:
+        """Add the entries of files.
+        """
+        for entry in entries:
+            self.add(entry)
+
+    def get_results(self) -> Tuple[List[FileSequence], List[os.DirEntry]]:
+        """Get the detected sequences, with their frames in ascending order, and the entries of the files
+        that are not frames of a sequence.
+        """
+        sequences, single_entries = [], list(self._single_entries)
+        leftover_entries: Dict[Tuple[str, Tuple[str, ...]], List[os.DirEntry]] = defaultdict(list)
+
+        for key, sequence in self._sequences.items():
+            if sequence.frame_count > 1:
+                sequence.frames.sort()
+                sequences.append(sequence)
+                continue
+
+            entry = self._first_entries[key]
+            tokens = self.FRAME_NUMBER_PATTERN.split(entry.name)
+            if len(tokens) > 3:
+                # Names with the same text between their numbers may vary on an earlier token
+                leftover_entries[(key[0], tuple(tokens[::2]))].append(entry)
+            else:
+                single_entries.append(entry)
+
+        for (directory, _texts), entries in leftover_entries.items():
+            remaining_entries = self._group_earlier_tokens(directory, entries, sequences)
+            single_entries.extend(remaining_entries)
+
+        return sequences, single_entries
+
+    # Private Methods
+    # ---------------
+    def _group_earlier_tokens(self, directory: str, entries: List[os.DirEntry], sequences: List[FileSequence]
+                             ) -> List[os.DirEntry]:
+        """Group entries into sequences on each of their earlier tokens, from the last, adding the sequences found.
+
+        Returns:
+            List[os.DirEntry]: The entries that are still not frames of a sequence.
+        """
+        token_count = len(self.FRAME_NUMBER_PATTERN.split(entries[0].name)) // 2
+        for token_index in range(token_count - 2, -1, -1):
+            if len(entries) < 2:
+                break
+
+            groups: Dict[Tuple[str, int, str], List[Tuple[int, os.DirEntry]]] = defaultdict(list)
+            for entry in entries:
+                tokens = self.FRAME_NUMBER_PATTERN.split(entry.name)
+                frame_position = token_index * 2 + 1
+                frame_number = tokens[frame_position]
+                groups[(''.join(tokens[:frame_position]), len(frame_number), ''.join(tokens[frame_position + 1:]))].append(
+                    (int(frame_number), entry)
+                )
+
+            entries = []
+            for (prefix, padding, suffix), frames in groups.items():
+                if len(frames) == 1:
+                    entries.append(frames[0][1])
+                    continue
+
+                sequence = FileSequence(directory, prefix, padding, suffix)
+                for frame, entry in sorted(frames, key=lambda frame_entry: frame_entry[0]):
+                    sequence.add_frame(frame, entry, is_stat=self.is_stat_frames)
+                sequences.append(sequence)
+
+        return entries
+
 
 class FilePathWalker:
 
+    # Default number of threads scanning directories at once, as reading directories on network file systems is latency bound
+    DEFAULT_MAX_WORKERS = 8
+    # Number of directory scans started ahead of the consumer per worker thread
+    SCANS_AHEAD_PER_WORKER = 4
+
     @staticmethod
     def traverse_directories(root: str, target_depth: Optional[int] = None, is_skip_hidden: bool = True,
                              is_return_relative: bool = False, excluded_folders: List[str] = list(),
@@ -817,12 +1290,15 @@ class FilePathWalker:
                 yield path
                 return
 
-            # Check if the directory can be accessed, skip if not 
-            if not os.access(directory, os.R_OK):
+            # Skip the directory if it cannot be read
+            try:
+                with os.scandir(directory) as iterator:
+                    entries = list(iterator)
+            except OSError:
                 return
 
             # Continue traversal for subdirectories
-            for entry in os.scandir(directory):
+            for entry in entries:
                 # Skip non-directories, hidden directories, and excluded folders
                 if not entry.is_dir() or FilePathWalker._is_skip_directory(entry.name, is_skip_hidden, excluded_folders):
                     continue
@@ -836,9 +1312,15 @@ class FilePathWalker:
                        excluded_folders: Optional[List[str]] = None, excluded_extensions: Optional[List[str]] = None,
                        use_sequence_format: bool = False, max_depth: Optional[int] = None,
                        sort_key: Optional[Callable[[os.DirEntry], any]] = None, reverse_sort: bool = False,
+                       max_workers: int = 1, is_ordered: bool = True,
                       ) -> Generator[str, None, None]:
         """Traverse file paths from a root directory, optionally returning relative paths and supporting depth limit.
 
+        Directories are walked with `walk_directories`, on `max_workers` threads. The files of each directory
+        are yielded together, before the files of its subdirectories when `is_ordered` is True. With
+        `use_sequence_format`, the sequences of each directory are detected from its entries by a
+        `SequenceDetector`, and yielded in hash format before the files that are not frames of one.
+
         Args:
             root (str): A string specifying the root directory path.
             is_skip_hidden (bool): A boolean indicating whether to skip hidden files and directories (those starting with '.').
@@ -849,6 +1331,8 @@ class FilePathWalker:
             max_depth (Optional[int]): Maximum depth of directory traversal. None for no limit.
             sort_key (Optional[Callable[[os.DirEntry], any]]): A callable to extract a sort key from a directory entry.
             reverse_sort (bool): A boolean indicating whether to sort in reverse order. Default is False.
+            max_workers (int): The number of threads scanning directories at once. 1 scans in the calling thread.
+            is_ordered (bool): Whether to yield directories in depth-first order, or as soon as they are scanned.
 
         Yields:
             Generator[str, None, None]: File paths from the root, either absolute or relative.
@@ -857,62 +1341,174 @@ class FilePathWalker:
         root = os.path.normpath(root)
         root_len = len(root) + 1
 
-        def _traverse(directory: str, current_depth: int = 0) -> Generator[str, None, None]:
-            """Helper function to recursively traverse files.
+        directories = FilePathWalker.walk_directories(
+            root, max_workers=max_workers, is_ordered=is_ordered, max_depth=max_depth, is_skip_hidden=is_skip_hidden,
+            excluded_folders=excluded_folders, excluded_extensions=excluded_extensions,
+            sort_key=sort_key, reverse_sort=reverse_sort,
+        )
 
-            Args:
-                directory (str): The current directory path.
-                current_depth (int): The current depth of the traversal.
+        for _directory, file_entries in directories:
+            # Detect the sequences of the directory from its entries if applicable, without statting the frames
+            if use_sequence_format:
+                sequences, file_entries = SequenceFileUtil.detect_sequences(
+                    file_entries, is_skip_hidden=is_skip_hidden, is_stat_frames=False,
+                )
+                file_paths = [sequence.get_path() for sequence in sequences]
+                file_paths.extend(entry.path for entry in file_entries)
+            else:
+                file_paths = [entry.path for entry in file_entries]
 
-            Yields:
-                Generator[str, None, None]: File paths based on the specified criteria.
+            # Determine the paths to yield (relative or absolute)
+            yield from (file_path[root_len:] for file_path in file_paths) if is_return_relative else file_paths
+
+    @staticmethod
+    def walk_directories(root: Union['Path', str], max_workers: int = DEFAULT_MAX_WORKERS, is_ordered: bool = True,
+                         max_depth: Optional[int] = None, is_skip_hidden: bool = True,
+                         excluded_folders: Optional[List[str]] = None, included_extensions: Optional[List[str]] = None,
+                         excluded_extensions: Optional[List[str]] = None,
+                         directory_filter: Optional[Callable[[os.DirEntry], bool]] = None,
+                         sort_key: Optional[Callable[[os.DirEntry], any]] = None, reverse_sort: bool = False,
+                         is_prefetch_stat: bool = False,
+                        ) -> Generator[Tuple[str, List[os.DirEntry]], None, None]:
+        """Walk a directory tree, scanning directories on a bounded number of threads.
+
+        Reading directories on network file systems is dominated by the latency of each request, so
+        several directories are scanned at once. At most `SCANS_AHEAD_PER_WORKER` scans per thread are
+        started ahead of the consumer, and the scans still queued are cancelled when the generator is
+        closed. The file entries are `os.DirEntry` objects, whose file type, and stat result once
+        fetched, are reused instead of statting the files again.
+
+        Args:
+            root (Union[Path, str]): The root directory path.
+            max_workers (int): The number of threads scanning directories at once. 1 scans in the calling thread.
+            is_ordered (bool): Whether to yield directories in depth-first order, each directory before its
+                subdirectories, or as soon as they are scanned.
+            max_depth (Optional[int]): Maximum depth of directory traversal. None for no limit.
+            is_skip_hidden (bool): Whether to skip hidden files and directories (starting with '.').
+            excluded_folders (Optional[List[str]]): Names of entries to exclude, pruning excluded directories.
+            included_extensions (Optional[List[str]]): File extensions to include.
+            excluded_extensions (Optional[List[str]]): File extensions to exclude.
+            directory_filter (Optional[Callable[[os.DirEntry], bool]]): Called with each subdirectory on the scanning
+                threads, returning False to prune it.
+            sort_key (Optional[Callable[[os.DirEntry], any]]): A callable to extract a sort key from a directory entry,
+                ordering the files and the subdirectories of each directory.
+            reverse_sort (bool): Whether to sort in reverse order.
+            is_prefetch_stat (bool): Whether to fetch the stat results of the files on the scanning threads,
+                so that `entry.stat()` does not block the consumer.
+
+        Yields:
+            Tuple[str, List[os.DirEntry]]: Each directory path with the entries of its files.
+        """
+        root = os.path.normpath(root)
+        scan = partial(
+            FilePathWalker.scan_directory, is_skip_hidden=is_skip_hidden, excluded_folders=excluded_folders,
+            included_extensions=included_extensions, excluded_extensions=excluded_extensions,
+            directory_filter=directory_filter, sort_key=sort_key, reverse_sort=reverse_sort,
+            is_prefetch_stat=is_prefetch_stat,
+        )
+
+        def get_subdirectories(directory_entries: List[os.DirEntry], depth: int) -> List[Tuple[str, int]]:
+            """Get the subdirectories to walk into, with their depth.
             """
-            # Initialize a list to collect file paths if sequence format is used
-            file_paths = []
+            if max_depth is not None and depth >= max_depth:
+                return []
+            return [(entry.path, depth + 1) for entry in directory_entries]
+
+        if max_workers <= 1:
+            # Scan in the calling thread, depth first
+            stack = [(root, 0)]
+            while stack:
+                directory, depth = stack.pop()
+                file_entries, directory_entries = scan(directory)
+                stack.extend(reversed(get_subdirectories(directory_entries, depth)))
+                yield directory, file_entries
+            return
 
-            # Check if the directory can be accessed, skip if not 
-            if not os.access(directory, os.R_OK):
-                return
+        max_scans_ahead = max_workers * FilePathWalker.SCANS_AHEAD_PER_WORKER
+        executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='FilePathWalker')
+        try:
+            if is_ordered:
+                # Stack of [directory, depth, scan future], where the scans of the directories on top of the stack,
+                # which are yielded next, are started first
+                stack = [[root, 0, None]]
+                while stack:
+                    for item in reversed(stack[-max_scans_ahead:]):
+                        if item[2] is None:
+                            item[2] = executor.submit(scan, item[0])
+
+                    directory, depth, future = stack.pop()
+                    file_entries, directory_entries = future.result()
+                    stack.extend([path, depth, None] for path, depth in reversed(get_subdirectories(directory_entries, depth)))
+                    yield directory, file_entries
 
-            # Retrieve and optionally sort directory entries
-            if sort_key:
-                entries = sorted(os.scandir(directory), key=sort_key, reverse=reverse_sort)
             else:
-                entries = os.scandir(directory)
+                # Directories waiting to be scanned, taken last in first out to keep the waiting list short
+                waiting_directories = [(root, 0)]
+                futures = {}
+                while waiting_directories or futures:
+                    while waiting_directories and len(futures) < max_scans_ahead:
+                        directory, depth = waiting_directories.pop()
+                        futures[executor.submit(scan, directory)] = (directory, depth)
+
+                    done_futures, _ = wait(futures, return_when=FIRST_COMPLETED)
+                    for future in done_futures:
+                        directory, depth = futures.pop(future)
+                        file_entries, directory_entries = future.result()
+                        waiting_directories.extend(get_subdirectories(directory_entries, depth))
+                        yield directory, file_entries
+
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
 
-            # Iterate over each directory entry
-            for entry in entries:
-                # Skip hidden files/directories and excluded folders
-                if FilePathWalker._is_skip_directory(entry.name, is_skip_hidden, excluded_folders):
-                    continue
+    @staticmethod
+    def scan_directory(directory: str, is_skip_hidden: bool = True, excluded_folders: Optional[List[str]] = None,
+                       included_extensions: Optional[List[str]] = None, excluded_extensions: Optional[List[str]] = None,
+                       directory_filter: Optional[Callable[[os.DirEntry], bool]] = None,
+                       sort_key: Optional[Callable[[os.DirEntry], any]] = None, reverse_sort: bool = False,
+                       is_prefetch_stat: bool = False) -> Tuple[List[os.DirEntry], List[os.DirEntry]]:
+        """Scan the entries of a directory, see `walk_directories` for the arguments.
 
-                if entry.is_dir():
-                    # Check if the max depth limit is reached
-                    if max_depth is not None and current_depth >= max_depth:
-                        continue
-                    # Recurse into subdirectories
-                    yield from _traverse(entry.path, current_depth + 1)
+        Returns:
+            Tuple[List[os.DirEntry], List[os.DirEntry]]: The entries of the files and of the subdirectories that
+                are not skipped, or empty lists if the directory cannot be read.
+        """
+        try:
+            with os.scandir(directory) as iterator:
+                entries = list(iterator)
+        except OSError:
+            return [], []
+
+        if sort_key:
+            entries.sort(key=sort_key, reverse=reverse_sort)
+
+        file_entries, directory_entries = [], []
+        for entry in entries:
+            # Skip hidden files/directories and excluded folders
+            if FilePathWalker._is_skip_directory(entry.name, is_skip_hidden, excluded_folders):
+                continue
 
-                else:
-                    # Check file extension
-                    if FilePathWalker._is_skip_file(entry.name, is_skip_hidden, excluded_extensions):
-                        continue
+            try:
+                is_directory = entry.is_dir()
+            except OSError:
+                continue
 
-                    # Determine the path to yield (relative or absolute)
-                    path = entry.path[root_len:] if is_return_relative else entry.path
+            if is_directory:
+                if directory_filter is None or directory_filter(entry):
+                    directory_entries.append(entry)
+                continue
 
-                    # If using sequence format, collect file paths to process later
-                    if use_sequence_format:
-                        file_paths.append(path)
-                        continue
+            if FilePathWalker._is_skip_file(entry.name, is_skip_hidden, excluded_extensions, included_extensions):
+                continue
 
-                    yield path
+            if is_prefetch_stat:
+                try:
+                    entry.stat()
+                except OSError:
+                    pass
 
-            # Convert and yield the formatted file paths if applicable
-            if use_sequence_format:
-                yield from SequenceFileUtil.convert_to_sequence_format(file_paths)
+            file_entries.append(entry)
 
-        yield from _traverse(root)
+        return file_entries, directory_entries
 
     @staticmethod
     def traverse_files_walk(search_root: str, is_skip_hidden: bool = True, use_sequence_format: bool = False,
@@ -1021,18 +1617,24 @@ class FilePathWalker:
 
 class FilePatternQuery:
     """Query files matching a specified pattern.
+
+    With a `FileIndex`, files are queried from the index instead of the file system. Directories that
+    are not indexed yet are indexed on the first query; keeping them up to date is left to
+    `FileIndex.refresh` or a `FileIndexWatcher`.
     """
 
     # Initialization and Setup
     # ------------------------
-    def __init__(self, pattern: str) -> None:
+    def __init__(self, pattern: str, file_index: Optional['FileIndex'] = None) -> None:
         """Initialize a FilePatternQuery instance.
 
         Args:
             pattern (str): The pattern to match files with.
+            file_index (Optional[FileIndex]): The index to query files from, instead of the file system.
         """
         # Store the arguments
         self.pattern = pattern
+        self.file_index = file_index
 
     # Public Methods
     # --------------
@@ -1060,9 +1662,74 @@ class FilePatternQuery:
         """
         return PathPattern.extract_variables(self._regex_pattern, path, is_regex=True)
 
+    def match_search_paths(self, filters: Dict[str, List[str]] = None) -> Generator[str, None, None]:
+        """Walk the directories matching the pattern and filters, and yield them as search paths.
+
+        The pattern is compiled into a matcher per path segment, holding the names a segment may take
+        and a regular expression of its wildcards, so the file system is walked once, from the deepest
+        directory without variables, and subtrees are pruned as soon as a segment does not match.
+        Segments whose filter values have no wildcards are checked with a `stat` without listing their
+        directory. Wildcards keep the semantics of `glob`, so the same search paths as
+        `construct_search_paths` are found in the same order, each once even when filter values overlap.
+
+        Args:
+            filters (Dict[str, List[str]], optional): A dictionary where keys are field names extracted from the pattern,
+                and values are lists of strings that specify the filter values for each field. Defaults to None.
+
+        Yields:
+            Generator[str, None, None]: Paths of the matching directories, ending with a separator like glob results.
+        """
+        segment_matchers = self._compile_segment_matchers(filters)
+        if segment_matchers is None:
+            # Filter values spanning several segments can only be matched by glob
+            yield from dict.fromkeys(self.construct_search_paths(filters))
+            return
+
+        root, segment_matchers = segment_matchers[0], segment_matchers[1:]
+        # Keep with each directory the index of the first name matching each of its segments, i.e. its
+        # combination of filter values, and its position in the listing of each parent, to sort the
+        # search paths in the order `construct_search_paths` globs them
+        directories = [(root, (), ())] if os.path.isdir(root or os.curdir) else []
+
+        for names, name_regex in segment_matchers:
+            matching_directories = []
+            for directory, name_indexes, positions in directories:
+                # Check names without wildcards directly, instead of listing the directory
+                if name_regex is None:
+                    matching_directories.extend(
+                        (path, name_indexes + (name_index,), positions + (0,))
+                        for name_index, path in enumerate(map(partial(os.path.join, directory), names))
+                        if os.path.isdir(path)
+                    )
+                    continue
+
+                try:
+                    with os.scandir(directory or os.curdir) as iterator:
+                        entries = list(iterator)
+                except OSError:
+                    continue
+
+                for position, entry in enumerate(entries):
+                    if not (names.get(entry.name, False) is None or name_regex.match(entry.name)):
+                        continue
+                    if self._is_directory(entry):
+                        name_index = self._get_name_index(names, entry.name)
+                        matching_directories.append(
+                            (os.path.join(directory, entry.name), name_indexes + (name_index,), positions + (position,))
+                        )
+
+            directories = matching_directories
+
+        directories.sort(key=lambda directory: directory[1] + directory[2])
+        for directory, _name_indexes, _positions in directories:
+            yield os.path.join(directory, '')
+
     def construct_search_paths(self, filters: Dict[str, List[str]] = None) -> Generator[str, None, None]:
         """Construct and yield search paths based on provided filters and the pattern.
 
+        Each combination of filter values is searched with `glob.iglob`, see `match_search_paths` for a
+        single walk of the file system.
+
         Args:
             filters (Dict[str, List[str]], optional): A dictionary where keys are field names extracted from the pattern, 
                 and values are lists of strings that specify the filter values for each field. Defaults to None.
@@ -1070,10 +1737,23 @@ class FilePatternQuery:
         Yields:
             Generator[str, None, None]: Paths to files that match the constructed search patterns.
         """
+        # Iterate through search paths and yield matching files
+        for search_path in self.construct_glob_patterns(filters):
+            yield from glob.iglob(search_path)
+
+    def construct_glob_patterns(self, filters: Dict[str, List[str]] = None) -> Generator[str, None, None]:
+        """Construct and yield the glob patterns of the search paths, based on provided filters and the pattern.
+
+        Args:
+            filters (Dict[str, List[str]], optional): Filter values for each field. Defaults to None.
+
+        Yields:
+            Generator[str, None, None]: Glob patterns of the search paths.
+        """
         if not filters:
             # No filters provided, short-circuit to wildcard search
             wildcard_values = ['*'] * len(re.findall(PathPattern.VARIABLE_PLACEHOLDER_PATTERN, self.pattern))
-            yield from glob.iglob(self.format_for_glob(wildcard_values))
+            yield self.format_for_glob(wildcard_values)
             return
 
         # Construct combinations using specific filter values or wildcard '*' for each field
@@ -1082,17 +1762,18 @@ class FilePatternQuery:
         # Generate all possible paths based on combinations of field values
         all_value_combinations = product(*values_combinations)
         # Using map to apply format for glob for each combination of values
-        search_paths = map(self.format_for_glob, all_value_combinations)
-
-        # Iterate through search paths and yield matching files
-        for search_path in search_paths:
-            yield from glob.iglob(search_path)
+        yield from map(self.format_for_glob, all_value_combinations)
 
     def query_files(self, filters: Optional[Dict[str, List[str]]] = None, use_sequence_format: bool = False, 
                     excluded_extensions: Optional[List[str]] = None, is_skip_hidden: bool = True
-                   ) -> Generator[Dict[str, str], None, None]:
+                   ) -> Generator[Mapping[str, str], None, None]:
         """Query files matching the pattern and filters, returning their info.
 
+        The information of each file is a `FileInfo` merged with the variables of its search path, so its
+        fields are formatted and its owner looked up on first access. The files are statted while walking
+        their directories, so reading the fields does not access the file system again, e.g. on the thread
+        of a view the results are fetched for.
+
         Args:
             filters (Dict[str, List[str]]): Filters for querying files.
             use_sequence_format (bool): Whether to use the sequence format. Defaults to False.
@@ -1100,28 +1781,235 @@ class FilePatternQuery:
             is_skip_hidden (bool): Whether to skip hidden files. Defaults to True.
 
         Yields:
-            Generator[Dict[str, str], None, None]: File information for each matching file.
+            Generator[Mapping[str, str], None, None]: File information for each matching file, which can be
+                updated like a dictionary.
         """
-        # Construct search paths based on the filters
-        search_paths = self.construct_search_paths(filters)
+        if self.file_index is not None:
+            yield from self._query_file_index(filters, use_sequence_format, excluded_extensions, is_skip_hidden)
+            return
+
+        # Walk the directories matching the pattern and filters
+        search_paths = self.match_search_paths(filters)
 
         # Iterate over the paths and extract file information
         for search_path in search_paths:
-            file_paths = FilePathWalker.traverse_files(
-                search_path, use_sequence_format=use_sequence_format, 
-                excluded_extensions=excluded_extensions, is_skip_hidden=is_skip_hidden
+            # Extract variables once per search path, the pattern matches the same prefix of each file path
+            variables = self.extract_variables(search_path)
+
+            # Scan each directory once, building the information from its entries and their stat results
+            directories = FilePathWalker.walk_directories(
+                os.path.normpath(search_path), max_workers=1,
+                excluded_extensions=excluded_extensions, is_skip_hidden=is_skip_hidden, is_prefetch_stat=True,
             )
-            for file_path in file_paths:
-                file_path = os.path.normpath(file_path)
+            for _directory, file_entries in directories:
+                yield from self._get_file_infos(file_entries, variables, use_sequence_format, is_skip_hidden)
+
+    # Private Methods
+    # ---------------
+    @staticmethod
+    def _get_file_infos(file_entries: List[os.DirEntry], variables: Dict[str, str], use_sequence_format: bool,
+                        is_skip_hidden: bool) -> Generator[Mapping[str, str], None, None]:
+        """Get the information of the files of a directory merged with the variables of its search path,
+        detecting the sequences of the entries if applicable.
+        """
+        file_infos: List[Mapping[str, str]] = []
+        if use_sequence_format:
+            sequences, file_entries = SequenceFileUtil.detect_sequences(file_entries, is_skip_hidden=is_skip_hidden)
+            file_infos.extend(SequenceFileUtil.get_sequence_info(sequence) for sequence in sequences)
+        # Reuse the stat result cached by each entry
+        file_infos.extend(FileUtil.extract_file_infos(file_entries))
+
+        for file_info in file_infos:
+            yield FilePatternQuery._merge_variables(file_info, variables)
+
+    @staticmethod
+    def _merge_variables(file_info: Mapping[str, str], variables: Dict[str, str]) -> ChainMap:
+        """Merge the variables with file information, without reading its fields. The file information takes
+        precedence, and updates go to a new dictionary.
+        """
+        return ChainMap({}, file_info, variables)
+
+    def _compile_segment_matchers(self, filters: Optional[Dict[str, List[str]]]
+                                 ) -> Optional[List[Union[str, Tuple[Dict[str, Optional[Pattern]], Optional[Pattern]]]]]:
+        """Compile the pattern and filters into the root directory, followed by a matcher per path segment below it.
+
+        A matcher holds the names a segment may take, in the order of the combinations of the filter values,
+        each with the regular expression of its wildcards or None if it has none, and a regular expression of
+        all its names with wildcards, or None if it has none. As with `glob`, wildcards do not match hidden
+        names, unless the name pattern starts with a dot.
 
-                # Extract file information dict from the path
-                file_info = SequenceFileUtil.extract_file_info(file_path) if use_sequence_format else FileUtil.extract_file_info(file_path)
+        Returns:
+            Optional[List[Union[str, Tuple[Dict[str, Optional[Pattern]], Optional[Pattern]]]]]: The root and the
+                matchers, or None if a filter value contains a path separator.
+        """
+        filters = filters or {}
+        if any(os.sep in value or (os.altsep and os.altsep in value) for values in filters.values() for value in values):
+            return None
+
+        # Split the pattern, normalized with a trailing separator, into its segments
+        segments = self._pattern.split(os.sep)[:-1]
+
+        # The root is made of the leading segments without variables nor wildcards
+        root_segment_count = 0
+        for segment in segments:
+            if re.search(PathPattern.VARIABLE_PLACEHOLDER_PATTERN, segment) or glob.has_magic(segment):
+                break
+            root_segment_count += 1
+        root = os.sep.join(segments[:root_segment_count])
+        if not root and segments and not segments[0]:
+            root = os.sep
+        elif root and not os.path.splitdrive(root)[1]:
+            # Keep a drive root absolute, e.g. 'C:\\'
+            root += os.sep
+
+        segment_matchers = [root]
+        for segment in segments[root_segment_count:]:
+            # Substitute each combination of the filter values of the variables of the segment
+            values_combinations = [
+                filters.get(variable_name) or ['*']
+                for variable_name in PathPattern.extract_variable_names(segment)
+            ]
+            names = dict.fromkeys(PathPattern.format_by_index(segment, values) for values in product(*values_combinations))
+            names.pop('', None)
+
+            name_regexes = {
+                name: fnmatch.translate(name) if name.startswith('.') else rf'(?!\.){fnmatch.translate(name)}'
+                for name in names if glob.has_magic(name)
+            }
+            names.update((name, re.compile(regex_pattern)) for name, regex_pattern in name_regexes.items())
+            name_regex = re.compile('|'.join(name_regexes.values())) if name_regexes else None
+            segment_matchers.append((names, name_regex))
+
+        return segment_matchers
+
+    @staticmethod
+    def _get_name_index(names: Dict[str, Optional[Pattern]], name: str) -> int:
+        """Get the index of the first of the names of a segment matcher that matches a name.
+        """
+        for name_index, (segment_name, name_regex) in enumerate(names.items()):
+            if name == segment_name if name_regex is None else name_regex.match(name):
+                return name_index
+        return len(names)
+
+    @staticmethod
+    def _is_directory(entry: os.DirEntry) -> bool:
+        try:
+            return entry.is_dir()
+        except OSError:
+            return False
+
+    def _query_file_index(self, filters: Optional[Dict[str, List[str]]], use_sequence_format: bool,
+                          excluded_extensions: Optional[List[str]], is_skip_hidden: bool
+                         ) -> Generator[Mapping[str, str], None, None]:
+        """Query the files matching the pattern and filters from the file index, see `query_files`.
+
+        The files below the deepest directory without variables are read once, in directory order, and
+        the directory of each file is matched against all combinations of the filter values at once,
+        with the segment matchers of `match_search_paths`.
+        """
+        segment_matchers = self._compile_segment_matchers(filters)
+        if segment_matchers is None:
+            # Filter values spanning several segments are matched with the regular expressions of their glob patterns
+            glob_patterns = list(dict.fromkeys(self.construct_glob_patterns(filters)))
+            roots = [os.path.dirname(glob_pattern[:self._find_wildcard(glob_pattern)]) for glob_pattern in glob_patterns]
+            root = os.path.commonpath(roots) if all(roots) else ''
+            search_path_regex = re.compile('|'.join(f'(?:{self._convert_glob_to_regex(glob_pattern)})' for glob_pattern in glob_patterns))
+
+            def match_search_path(directory: str) -> Optional[str]:
+                search_path_match = search_path_regex.match(os.path.join(directory, ''))
+                return search_path_match.group() if search_path_match else None
+        else:
+            root, segment_matchers = segment_matchers[0], segment_matchers[1:]
+            match_search_path = partial(self._match_segments, root, segment_matchers)
+
+        if not self.file_index.is_indexed(root):
+            self.file_index.refresh(root)
+
+        directory = search_path = variables = None
+        records_by_sequence: Dict[str, List['FileRecord']] = defaultdict(list)
+        for record in self.file_index.iter_files(root):
+            # Match each directory once, the records of a directory are read together
+            if record.directory != directory:
+                yield from self._get_index_infos(records_by_sequence, variables, use_sequence_format)
+                records_by_sequence.clear()
+
+                directory = record.directory
+                search_path = match_search_path(directory)
+                variables = self.extract_variables(search_path) if search_path is not None else None
+
+            if search_path is None:
+                continue
+
+            # Apply the filters of `FilePathWalker.traverse_files` below the search path
+            relative_path = record.path[len(search_path):]
+            if is_skip_hidden and (relative_path.startswith('.') or f'{os.sep}.' in relative_path):
+                continue
+            if excluded_extensions and record.extension in excluded_extensions:
+                continue
+
+            # Group the frames of each sequence
+            records_by_sequence[record.sequence or record.name].append(record)
+
+        yield from self._get_index_infos(records_by_sequence, variables, use_sequence_format)
+
+    def _get_index_infos(self, records_by_sequence: Dict[str, List['FileRecord']], variables: Optional[Dict[str, str]],
+                         use_sequence_format: bool) -> Generator[Mapping[str, str], None, None]:
+        """Get the information of the files of a directory from their records, merged with the variables of its search path.
+        """
+        for records in records_by_sequence.values():
+            if use_sequence_format:
+                yield self._merge_variables(self.file_index.get_sequence_info(records), variables)
+                continue
+
+            for record in records:
+                yield self._merge_variables(self.file_index.get_file_info(record), variables)
+
+    @staticmethod
+    def _match_segments(root: str, segment_matchers: List[Tuple[Dict[str, Optional[Pattern]], Optional[Pattern]]],
+                        directory: str) -> Optional[str]:
+        """Get the search path a directory is in, from the root and the segment matchers of `_compile_segment_matchers`.
 
-                # Extract variables from the path based on the pattern and merge it with file information
-                data_dict = self.extract_variables(file_path)
-                data_dict.update(file_info)
+        Returns:
+            Optional[str]: The search path, ending with a separator, or None if the directory is not in a search path.
+        """
+        relative_directory = directory[len(root):].lstrip(os.sep)
+        names = relative_directory.split(os.sep) if relative_directory else []
+        if len(names) < len(segment_matchers):
+            return None
+
+        for name, (segment_names, name_regex) in zip(names, segment_matchers):
+            # Names without wildcards are mapped to None
+            if segment_names.get(name, False) is not None and (name_regex is None or not name_regex.match(name)):
+                return None
+
+        return os.path.join(root, *names[:len(segment_matchers)], '')
+
+    @staticmethod
+    def _find_wildcard(glob_pattern: str) -> int:
+        """Find the index of the first wildcard of a glob pattern, or its length if it has none.
+        """
+        wildcard_match = re.search(r'[*?\[]', glob_pattern)
+        return wildcard_match.start() if wildcard_match else len(glob_pattern)
 
-                yield data_dict
+    @staticmethod
+    def _convert_glob_to_regex(glob_pattern: str) -> str:
+        """Convert a glob pattern to a regular expression with the semantics of `glob.iglob`, where
+        wildcards do not match path separators nor hidden names.
+        """
+        separator = re.escape(os.sep)
+        regex_parts = []
+        for token in filter(None, re.split(r'(\*|\?|\[[^\]]+\])', glob_pattern)):
+            is_segment_start = not regex_parts or regex_parts[-1].endswith(separator)
+            hidden_guard = r'(?!\.)' if is_segment_start else ''
+            if token == '*':
+                regex_parts.append(f'{hidden_guard}[^{separator}]*')
+            elif token == '?':
+                regex_parts.append(f'{hidden_guard}[^{separator}]')
+            elif token.startswith('[') and token.endswith(']') and len(token) > 2:
+                regex_parts.append('[^' + token[2:] if token[1] == '!' else token)
+            else:
+                regex_parts.append(re.escape(token))
+        return ''.join(regex_parts)
 
     # Class Properties
     # ----------------
@@ -6,7 +6,7 @@ if TYPE_CHECKING:
 
 # Standard Library Imports
 # ------------------------
-import os, math
+import os, math, struct
 from pathlib import Path
 import numpy as np
 
@@ -35,8 +35,26 @@ class ImageReader:
 
     MOVIE_CLIP_FORMATS = ['mov', 'mp4', 'avi']
 
+    # Formats whose size can be read from the header, so that OpenCV can decode them at reduced resolution
+    REDUCED_DECODE_FORMATS = ['jpg', 'jpeg', 'png']
+    _REDUCED_COLOR_FLAGS = {
+        2: cv2.IMREAD_REDUCED_COLOR_2,
+        4: cv2.IMREAD_REDUCED_COLOR_4,
+        8: cv2.IMREAD_REDUCED_COLOR_8,
+    }
+    _REDUCED_GRAYSCALE_FLAGS = {
+        2: cv2.IMREAD_REDUCED_GRAYSCALE_2,
+        4: cv2.IMREAD_REDUCED_GRAYSCALE_4,
+        8: cv2.IMREAD_REDUCED_GRAYSCALE_8,
+    }
+
+    # Number of reduced scan lines read from an EXR file at once
+    EXR_BLOCK_LINES = 16
+    # Decimated images keep at least this many times the target height, for the final resize to filter
+    DECIMATION_OVERSAMPLING = 2
+
     @classmethod
-    def read_image(cls, file_path: Union[str, Path]):
+    def read_image(cls, file_path: Union[str, Path], target_height: Optional[int] = None, single_channel: bool = False):
         """Reads an image or video file based on its extension.
 
         This method determines the type of the file based on its extension and calls the appropriate
@@ -45,6 +63,9 @@ class ImageReader:
 
         Args:
             file_path: A string path to the image or video file.
+            target_height: If given, the image may be decoded at a reduced resolution, as long as
+                its height stays at least `target_height` pixels, e.g. to generate a thumbnail.
+            single_channel: If True, only a single channel is decoded, returned as a 2D array.
 
         Returns:
             The image or a video frame data read from the file.
@@ -57,6 +78,10 @@ class ImageReader:
             Supported image formats include 'exr' and 'dpx'. Supported video formats include 'mov',
             'mp4', and 'avi'. If an unsupported format is provided, the method defaults to using OpenCV's
             image reading capabilities, which supports a wide range of image formats.
+
+            JPEG and PNG are decoded at 1/2, 1/4 or 1/8 of their resolution by OpenCV. Uncompressed DPX
+            and EXR are decimated while reading, skipping whole scan lines, so the full resolution image
+            is never held in memory.
         """
         if isinstance(file_path, Path):
             file_path = file_path.as_posix()
@@ -74,18 +99,99 @@ class ImageReader:
 
         # Determine if the video file type supports
         if file_extension in cls.MOVIE_CLIP_FORMATS:
-            return cls.read_video(file_path)
+            image_data = cls.read_video(file_path)
+            return cls.to_single_channel(image_data) if single_channel and image_data is not None else image_data
 
         # Lookup read method for given file extension
         read_method = file_type_handlers.get(file_extension, cls.cv2_read_image)
 
-        return read_method(file_path)
+        step = cls.get_reduction_step(file_path, target_height) if target_height else 1
+
+        return read_method(file_path, step=step, single_channel=single_channel)
+
+    @classmethod
+    def get_reduction_step(cls, file_path: str, target_height: int) -> int:
+        """Get the factor by which an image can be reduced while decoding, keeping its height at least `target_height`.
+
+        JPEG and PNG are limited to the factors OpenCV can decode at. Decimated formats keep
+        `DECIMATION_OVERSAMPLING` times the target height, so the final resize still filters the image.
+        Formats that cannot be reduced, or whose size cannot be read from the header, return 1.
+        """
+        file_extension = FileUtil.get_file_extension(file_path)
+
+        if file_extension in cls.REDUCED_DECODE_FORMATS:
+            image_size = cls.read_image_size(file_path)
+            max_step, min_height = max(cls._REDUCED_COLOR_FLAGS), target_height
+        elif file_extension == 'dpx' or (file_extension == 'exr' and IS_SUPPORT_OPENEXR_LIB):
+            image_size = DPXReader.read_dpx_size(file_path) if file_extension == 'dpx' else cls.read_exr_size(file_path)
+            max_step, min_height = None, target_height * cls.DECIMATION_OVERSAMPLING
+        else:
+            return 1
+
+        if not image_size:
+            return 1
+
+        height = image_size[1]
+        step = 1
+        while (max_step is None or step * 2 <= max_step) and height // (step * 2) >= min_height:
+            step *= 2
+        return step
 
     @staticmethod
-    def cv2_read_image(file_path: str):
-        # Read file using OpenCV
+    def read_image_size(file_path: str) -> Optional[Tuple[int, int]]:
+        """Reads the width and height of a PNG or JPEG image from its header.
+
+        Returns:
+            Optional[Tuple[int, int]]: The width and height, or None if the header cannot be parsed.
+        """
+        with open(file_path, 'rb') as file:
+            header = file.read(26)
+            # PNG: the IHDR chunk follows the 8-byte signature
+            if header.startswith(b'\x89PNG\r\n\x1a\n') and header[12:16] == b'IHDR':
+                return struct.unpack('>II', header[16:24])
+
+            # JPEG: walk the markers until a start of frame marker
+            if not header.startswith(b'\xff\xd8'):
+                return None
+            file.seek(2)
+            while True:
+                marker = file.read(2)
+                if len(marker) < 2 or marker[0] != 0xFF:
+                    return None
+                if marker[1] in (0xD8, 0x01) or 0xD0 <= marker[1] <= 0xD7:
+                    continue
+                segment_length_bytes = file.read(2)
+                if len(segment_length_bytes) < 2:
+                    return None
+                segment_length = struct.unpack('>H', segment_length_bytes)[0]
+                # SOF0 to SOF15, except DHT, JPG and DAC
+                if 0xC0 <= marker[1] <= 0xCF and marker[1] not in (0xC4, 0xC8, 0xCC):
+                    frame_header = file.read(5)
+                    if len(frame_header) < 5:
+                        return None
+                    height, width = struct.unpack('>HH', frame_header[1:5])
+                    return width, height
+                file.seek(segment_length - 2, os.SEEK_CUR)
+
+    @staticmethod
+    def to_single_channel(image_data: np.ndarray) -> np.ndarray:
+        """Reduces an image to a single channel, the green channel of RGB images, for previews.
+        """
+        if image_data.ndim == 2:
+            return image_data
+        channel_index = 1 if image_data.shape[2] >= 3 else 0
+        return np.ascontiguousarray(image_data[..., channel_index])
+
+    @classmethod
+    def cv2_read_image(cls, file_path: str, step: int = 1, single_channel: bool = False):
+        # Read file using OpenCV, at reduced resolution if possible
+        if step in cls._REDUCED_COLOR_FLAGS:
+            read_flag = (cls._REDUCED_GRAYSCALE_FLAGS if single_channel else cls._REDUCED_COLOR_FLAGS)[step]
+        else:
+            read_flag = cv2.IMREAD_GRAYSCALE if single_channel else cv2.IMREAD_ANYCOLOR
+
         try:
-            image_data = cv2.imread(file_path, cv2.IMREAD_ANYCOLOR)
+            image_data = cv2.imread(file_path, read_flag)
         except cv2.error:
             image_data = None
 
@@ -94,16 +200,27 @@ class ImageReader:
             return image_data
             # raise FileNotFoundError(f"Unable to load image at {file_path}")
 
-        image_data = cv2.cvtColor(image_data, cv2.COLOR_BGR2RGB)
+        if image_data.ndim == 3:
+            image_data = cv2.cvtColor(image_data, cv2.COLOR_BGR2RGB)
 
         return image_data
 
+    @staticmethod
+    def read_exr_size(image_path: str) -> Tuple[int, int]:
+        """Reads the width and height of an EXR image from its header.
+        """
+        data_window = OpenEXR.InputFile(image_path).header()['dataWindow']
+        return data_window.max.x - data_window.min.x + 1, data_window.max.y - data_window.min.y + 1
+
     @classmethod
-    def read_exr(cls, image_path: str) -> np.ndarray:
+    def read_exr(cls, image_path: str, step: int = 1, single_channel: bool = False) -> np.ndarray:
         """Read an EXR image from file and return it as a NumPy array.
 
         Args:
             image_path (str): The path to the EXR image file.
+            step (int): Keep every `step`-th row and column. Rows are read in blocks of `EXR_BLOCK_LINES`
+                reduced lines, so the full resolution image is never held in memory.
+            single_channel (bool): If True, only read the Y channel, or the G channel if there is none.
 
         Returns:
             np.ndarray: The image data as a NumPy array.
@@ -127,19 +244,45 @@ class ImageReader:
         height = data_window.max.y - data_window.min.y + 1
 
         # Determine the channel keys
-        channel_keys = 'RGB' if len(channels.keys()) == 3 else channels.keys()
-
-        # Read all channels at once
-        channel_data = exr_file.channels(channel_keys, Imath.PixelType(Imath.PixelType.FLOAT))
-
-        # Using list comprehension to transform the channel data
-        channel_data = [
-            np.frombuffer(data, dtype=np.float32).reshape(height, width)
-            for data in channel_data
-        ]
-
-        # Convert to NumPy array
-        image_data = np.array(channel_data)
+        if single_channel:
+            channel_keys = [next((key for key in ('Y', 'G') if key in channels), next(iter(channels)))]
+        else:
+            channel_keys = 'RGB' if len(channels.keys()) == 3 else list(channels.keys())
+
+        pixel_type = Imath.PixelType(Imath.PixelType.FLOAT)
+
+        if step == 1:
+            # Read all channels at once
+            channel_data = exr_file.channels(channel_keys, pixel_type)
+
+            # Using list comprehension to transform the channel data
+            channel_data = [
+                np.frombuffer(data, dtype=np.float32).reshape(height, width)
+                for data in channel_data
+            ]
+
+            # Convert to NumPy array
+            image_data = np.array(channel_data)
+
+        else:
+            # Read blocks of scan lines starting at multiples of the step, keeping every step-th line and column
+            block_height = cls.EXR_BLOCK_LINES * step
+            blocks = []
+            for block_start in range(0, height, block_height):
+                block_end = min(block_start + block_height, height) - 1
+                channel_data = exr_file.channels(
+                    channel_keys, pixel_type, data_window.min.y + block_start, data_window.min.y + block_end
+                )
+                blocks.append([
+                    np.frombuffer(data, dtype=np.float32).reshape(-1, width)[::step, ::step]
+                    for data in channel_data
+                ])
+            image_data = np.concatenate([np.array(block) for block in blocks], axis=1)
+
+        exr_file.close()
+
+        if single_channel:
+            return image_data[0]
 
         return image_data.transpose(1, 2, 0)
 
@@ -171,7 +314,7 @@ class DPXReader:
     _DEPTH_PACKING_TO_METHOD: Dict[Tuple[int, int], str] = {
         (8, 0): 'read_dpx_8bit',
         (8, 1): 'read_dpx_8bit',
-        # (10, 0): 'read_dpx_10bit_packed',
+        (10, 0): 'read_dpx_10bit_packed',
         (10, 1): 'read_dpx_10bit_filled',
         (12, 0): 'read_dpx_12bit_packed',
         (12, 1): 'read_dpx_12bit_filled',
@@ -185,30 +328,80 @@ class DPXReader:
         52: 4,  # ABGR
     }
 
+    # Depths whose run-length encoded datums are whole bytes or halfwords
+    _RLE_DEPTH_TO_DTYPE = {
+        8: np.uint8,
+        16: np.uint16,
+    }
+
+    # Number of scan lines unpacked at once from 10-bit packed data, keeping the temporaries small
+    PACKED_BLOCK_LINES = 64
+
     @staticmethod
     def read_dpx_metadata(file: BinaryIO):
         return DPXMetadata.read_metadata(file)
 
     @classmethod
-    def read_dpx(cls, image_path: str) -> np.ndarray:
+    def read_dpx_size(cls, image_path: str) -> Optional[Tuple[int, int]]:
+        """Reads the width and height of a DPX image from its header.
+        """
+        with open(image_path, "rb") as file:
+            meta = cls.read_dpx_metadata(file)
+        return (meta['width'], meta['height']) if meta else None
+
+    @classmethod
+    def read_dpx(cls, image_path: str, step: int = 1, single_channel: bool = False,
+                 output_dtype: Optional[type] = None, copy: bool = True) -> np.ndarray:
+        """Reads a DPX image, uncompressed or run-length encoded.
+
+        Uncompressed image data is memory-mapped rather than read into a buffer. When the values are
+        kept as integers in the byte order and size they are stored in, e.g. 8-bit images or
+        little-endian 16-bit images read with `np.uint16`, and `copy` is False, the returned array is
+        a read-only view of the file, without any copy. The view keeps the file mapped for as long as
+        it is referenced, so it should not be cached.
+
+        Args:
+            image_path (str): The path to the DPX image file.
+            step (int): Keep every `step`-th row and column. Skipped rows are not read from the file.
+            single_channel (bool): If True, only the green channel is returned, as a 2D array.
+            output_dtype (Optional[type]): The dtype of the returned image. A floating dtype
+                normalizes the values to [0, 1], an integer dtype keeps the code values as they are
+                stored. Defaults to `np.uint8` for 8-bit images and to `np.float32` otherwise.
+            copy (bool): If True, the returned array always owns its data and is writable.
+
+        Raises:
+            ValueError: If the file is not a DPX file, its format is not supported, or `output_dtype`
+                cannot hold the values of the image.
+            NotImplementedError: If the image is run-length encoded at a depth other than 8 or 16 bits.
+        """
         with open(image_path, "rb") as file:
             meta = cls.read_dpx_metadata(file)
             if meta is None:
                 raise ValueError("Invalid DPX file")
 
-            encoding = meta['encoding']
-            if encoding != 0:
-                raise NotImplementedError("RLE compression is not supported")
-
             depth = meta['depth']
             packing = meta['packing']
 
-            reader_method_name = cls._DEPTH_PACKING_TO_METHOD.get((depth, packing))
-            if reader_method_name is None:
-                raise ValueError("Unsupported DPX format")
+            if meta['encoding'] == 1:
+                image_data = cls.read_dpx_rle(file, meta, step, output_dtype)
+            else:
+                reader_method_name = cls._DEPTH_PACKING_TO_METHOD.get((depth, packing))
+                if reader_method_name is None:
+                    raise ValueError("Unsupported DPX format")
+
+                reader_method = getattr(cls, reader_method_name)
+                image_data = reader_method(file, meta, step, output_dtype)
+
+        if single_channel:
+            image_data = ImageReader.to_single_channel(image_data)
+        elif step != 1:
+            image_data = np.ascontiguousarray(image_data)
 
-            reader_method = getattr(cls, reader_method_name)
-            return reader_method(file, meta)
+        # Only views of the mapped file are read-only
+        if copy and not image_data.flags.writeable:
+            image_data = image_data.copy()
+
+        return image_data
 
     @classmethod
     def get_channels_from_meta(cls, meta: Dict[str, Union[str, int]]) -> int:
@@ -218,61 +411,185 @@ class DPXReader:
         return cls._DESCRIPTOR_TO_CHANNELS[descriptor]
 
     @staticmethod
-    def read_dpx_8bit(file_obj: BinaryIO, meta: Dict[str, Union[str, int]]) -> np.ndarray:
-        width = meta['width']
-        height = meta['height']
-        offset = meta['offset']
-        components_per_pixel = DPXReader.get_channels_from_meta(meta)
+    def to_output_dtype(image_data: np.ndarray, depth: int, output_dtype: Optional[type] = None) -> np.ndarray:
+        """Converts integer code values of the given bit depth to the output dtype, see `read_dpx`.
 
-        file_obj.seek(offset)
-        raw = np.fromfile(file_obj, dtype=np.uint8, count=width * height * components_per_pixel)
-        raw = raw.reshape(height, width, components_per_pixel)
+        Integer images that already have the output dtype are returned as they are.
+        """
+        if output_dtype is None:
+            output_dtype = np.uint8 if depth == 8 else np.float32
+        output_dtype = np.dtype(output_dtype)
+        max_value = (1 << depth) - 1
+
+        if output_dtype.kind == 'f':
+            # Convert to float and normalize
+            image_data = image_data.astype(output_dtype)
+            image_data /= max_value
+            return image_data
 
-        if meta['endianness'] == '>':
-            raw.byteswap(True)
+        if output_dtype.kind not in 'ui' or np.iinfo(output_dtype).max < max_value:
+            raise ValueError(f"{output_dtype} cannot hold {depth}-bit values")
 
-        return raw
+        return image_data.astype(output_dtype, copy=False)
 
     @staticmethod
-    def read_dpx_10bit_filled(file_obj: BinaryIO, meta: Dict[str, Union[str, int]]) -> np.ndarray:
+    def read_scan_lines(file_obj: BinaryIO, meta: Dict[str, Union[str, int]], dtype: type, line_length: int, step: int = 1) -> np.ndarray:
+        """Maps every `step`-th scan line of the image data, in native byte order.
+
+        The file is memory-mapped, so skipped lines are never read. Each scan line is padded to a
+        32-bit word, followed by the end-of-line padding of the header if it is defined.
+
+        Returns:
+            np.ndarray: The scan lines, with shape (line count, `line_length`). It is a read-only view
+                of the file if the data is stored in native byte order, otherwise a byte-swapped copy.
+        """
+        dtype = np.dtype(dtype).newbyteorder(meta['endianness'])
+        line_size = -(-line_length * dtype.itemsize // 4) * 4
+        line_padding = meta.get('line_padding', 0)
+        if line_padding != 0xFFFFFFFF:
+            line_size += line_padding
+
+        mapped_data = np.memmap(file_obj, dtype=np.uint8, mode='r', offset=meta['offset'], shape=(meta['height'], line_size))
+        scan_lines = np.asarray(mapped_data)[::step, :line_length * dtype.itemsize].view(dtype)
+
+        if not dtype.isnative:
+            scan_lines = scan_lines.astype(dtype.newbyteorder('='))
+
+        return scan_lines
+
+    @classmethod
+    def read_dpx_rle(cls, file_obj: BinaryIO, meta: Dict[str, Union[str, int]], step: int = 1,
+                     output_dtype: Optional[type] = None) -> np.ndarray:
+        """Reads run-length encoded 8-bit or 16-bit image data.
+
+        Each run starts with a datum holding a flag in its least significant bit and a pixel count in
+        the other bits. A set flag repeats the following pixel `count` times, a cleared flag is followed
+        by `count` literal pixels. Runs are parsed as one stream over the whole image, and only the pixels
+        kept by `step` are copied out.
+        """
+        depth = meta['depth']
+        dtype = cls._RLE_DEPTH_TO_DTYPE.get(depth)
+        if dtype is None:
+            raise NotImplementedError(f"RLE compression is not supported for {depth}-bit images")
+
         width = meta['width']
         height = meta['height']
-        offset = meta['offset']
+        components_per_pixel = cls.get_channels_from_meta(meta)
+        dtype = np.dtype(dtype).newbyteorder(meta['endianness'])
+
+        file_obj.seek(meta['offset'])
+        datums = np.frombuffer(file_obj.read(), dtype=np.uint8)
+        datums = datums[:len(datums) // dtype.itemsize * dtype.itemsize].view(dtype)
+
+        # Find the runs, then gather the pixels of all runs at once
+        run_starts, run_counts, run_strides = [], [], []
+        position = 0
+        remaining_count = width * height
+        while remaining_count > 0:
+            if position >= len(datums):
+                raise ValueError("Truncated DPX run-length encoded data")
+
+            run_header = datums.item(position)
+            is_repeated, count = run_header & 1, min(run_header >> 1, remaining_count)
+            if count == 0:
+                raise ValueError("Invalid DPX run-length encoded data")
+
+            run_starts.append(position + 1)
+            run_counts.append(count)
+            run_strides.append(0 if is_repeated else components_per_pixel)
+            position += 1 + (components_per_pixel if is_repeated else count * components_per_pixel)
+            remaining_count -= count
+
+        if position > len(datums):
+            raise ValueError("Truncated DPX run-length encoded data")
+
+        # Index of the first datum of each pixel, built in place to keep the temporaries few and small
+        index_dtype = np.int32 if len(datums) < 2 ** 31 else np.int64
+        run_counts = np.array(run_counts)
+        pixel_starts = np.arange(width * height, dtype=index_dtype)
+        pixel_starts -= np.repeat((np.cumsum(run_counts) - run_counts).astype(index_dtype), run_counts)
+        pixel_starts *= np.repeat(np.array(run_strides, dtype=index_dtype), run_counts)
+        pixel_starts += np.repeat(np.array(run_starts, dtype=index_dtype), run_counts)
+        pixel_starts = pixel_starts.reshape(height, width)[::step, ::step]
+
+        image_data = np.empty(pixel_starts.shape + (components_per_pixel,), dtype=dtype)
+        for component_index in range(components_per_pixel):
+            image_data[..., component_index] = datums[pixel_starts + component_index]
+        image_data = image_data.astype(dtype.newbyteorder('='))
+
+        return cls.to_output_dtype(image_data, depth, output_dtype)
+
+    @staticmethod
+    def read_dpx_8bit(file_obj: BinaryIO, meta: Dict[str, Union[str, int]], step: int = 1,
+                      output_dtype: Optional[type] = None) -> np.ndarray:
+        width = meta['width']
+        components_per_pixel = DPXReader.get_channels_from_meta(meta)
 
-        file_obj.seek(offset)
-        raw = np.fromfile(file_obj, dtype=np.int32, count=width * height)
-        raw = raw.reshape(height, width)
+        raw = DPXReader.read_scan_lines(file_obj, meta, np.uint8, width * components_per_pixel, step)
+        raw = raw.reshape(-1, width, components_per_pixel)[:, ::step]
 
-        if meta['endianness'] == '>':
-            raw.byteswap(True)
+        return DPXReader.to_output_dtype(raw, 8, output_dtype)
 
-        image_data = np.array([raw >> 22, raw >> 12, raw >> 2], dtype=np.uint16)
-        image_data &= 0x3FF
+    @staticmethod
+    def read_dpx_10bit_filled(file_obj: BinaryIO, meta: Dict[str, Union[str, int]], step: int = 1,
+                              output_dtype: Optional[type] = None) -> np.ndarray:
+        width = meta['width']
 
-        # NOTE: to uint8
-        # image_data = (image_data >> 2).astype(np.uint8)
+        raw = DPXReader.read_scan_lines(file_obj, meta, np.uint32, width, step)
+        raw = raw[:, ::step]
 
-        # Convert to float32 and normalize
-        image_data = image_data.astype(np.float32)
-        image_data /= 0x3FF
+        # Extract the components into a single pixel-interleaved array, reusing one temporary buffer
+        image_data = np.empty(raw.shape + (3,), dtype=np.uint16)
+        components = np.empty(raw.shape, dtype=np.uint32)
+        for channel_index, shift in enumerate((22, 12, 2)):
+            np.right_shift(raw, shift, out=components)
+            components &= 0x3FF
+            image_data[..., channel_index] = components
 
-        return image_data.transpose(1, 2, 0)
+        return DPXReader.to_output_dtype(image_data, 10, output_dtype)
 
     @staticmethod
-    def read_dpx_12bit_packed(file_obj: BinaryIO, meta: Dict[str, Union[str, int]]) -> np.ndarray:
+    def read_dpx_10bit_packed(file_obj: BinaryIO, meta: Dict[str, Union[str, int]], step: int = 1,
+                              output_dtype: Optional[type] = None) -> np.ndarray:
         width = meta['width']
-        height = meta['height']
-        offset = meta['offset']
         components_per_pixel = DPXReader.get_channels_from_meta(meta)
 
-        file_obj.seek(offset)
-        words_per_line = math.ceil(width * 9 / 4)
-        raw = np.fromfile(file_obj, dtype=np.uint16, count=words_per_line * height)
+        component_count = width * components_per_pixel
+        words_per_line = math.ceil(component_count * 10 / 32)
+        word_lines = DPXReader.read_scan_lines(file_obj, meta, np.uint32, words_per_line, step)
+        height = word_lines.shape[0]
+
+        # Components are packed back to back from the least significant bit of each word, so every 5 words
+        # hold 16 components, and a component starting at bit 23 or above continues in the next word
+        group_count = math.ceil(words_per_line / 5)
+        image_data = np.empty((height, group_count, 16), dtype=np.uint16)
+        for block_start in range(0, height, DPXReader.PACKED_BLOCK_LINES):
+            block_lines = word_lines[block_start:block_start + DPXReader.PACKED_BLOCK_LINES]
+            # Pad the lines to whole groups
+            block = np.zeros((len(block_lines), group_count * 5), dtype=np.uint32)
+            block[:, :words_per_line] = block_lines
+
+            for component_index in range(16):
+                word_index, shift = divmod(component_index * 10, 32)
+                values = block[:, word_index:word_index + group_count * 5:5] >> shift
+                if shift > 22:
+                    values |= block[:, word_index + 1:word_index + 1 + group_count * 5:5] << (32 - shift)
+                image_data[block_start:block_start + len(block), :, component_index] = values & 0x3FF
+
+        image_data = image_data.reshape(height, -1)[:, :component_count].reshape(height, width, components_per_pixel)
+        image_data = image_data[:, ::step]
+
+        return DPXReader.to_output_dtype(image_data, 10, output_dtype)
 
-        if meta['endianness'] == '>':
-            raw.byteswap(True)
+    @staticmethod
+    def read_dpx_12bit_packed(file_obj: BinaryIO, meta: Dict[str, Union[str, int]], step: int = 1,
+                              output_dtype: Optional[type] = None) -> np.ndarray:
+        width = meta['width']
+        components_per_pixel = DPXReader.get_channels_from_meta(meta)
 
-        word_lines = raw.reshape(height, words_per_line)
+        words_per_line = math.ceil(width * 9 / 4)
+        word_lines = DPXReader.read_scan_lines(file_obj, meta, np.uint16, words_per_line, step)
+        height = word_lines.shape[0]
 
         # Extract 8 components from 6 halfwords (read as 16bit)
         # Word 1: | B05 B06 B07 B08 B09 B10 B11 B12|G01 G02 G03 G04 G05 G06 G07 G08 || G09 G10 G11 G12|R01 R02 R03 R04 R05 R06 R07 R08 R09 R10 R11 R12 |
@@ -288,55 +605,34 @@ class DPXReader:
             ((word_lines[:, 4::6] & 0xF) << 8) | (word_lines[:, 5::6] >> 8),
             (word_lines[:, 4::6] >> 4 & 0xFFF)
         ], dtype=np.uint16).transpose(1, 2, 0).reshape(height, width, components_per_pixel)
+        image_data = image_data[:, ::step]
 
-        # Convert to float32 and normalize
-        image_data = image_data.astype(np.float32)
-        image_data /= 0x0FFF
-
-        return image_data
+        return DPXReader.to_output_dtype(image_data, 12, output_dtype)
 
     @staticmethod
-    def read_dpx_12bit_filled(file_obj: BinaryIO, meta: Dict[str, Union[str, int]]) -> np.ndarray:
+    def read_dpx_12bit_filled(file_obj: BinaryIO, meta: Dict[str, Union[str, int]], step: int = 1,
+                              output_dtype: Optional[type] = None) -> np.ndarray:
         width = meta['width']
-        height = meta['height']
-        offset = meta['offset']
         components_per_pixel = DPXReader.get_channels_from_meta(meta)
 
-        file_obj.seek(offset)
-        raw = np.fromfile(file_obj, dtype=np.uint16, count=width * height * components_per_pixel)
-        raw = raw.reshape(height, width, components_per_pixel)
-
-        if meta['endianness'] == '>':
-            raw.byteswap(True)
+        raw = DPXReader.read_scan_lines(file_obj, meta, np.uint16, width * components_per_pixel, step)
+        raw = raw.reshape(-1, width, components_per_pixel)[:, ::step]
 
         # Extract the 12-bit pixel values
         image_data = raw >> 4  # Right shift by 4 bits to discard the lower 4 bits
 
-        # Convert to float32 and normalize
-        image_data = image_data.astype(np.float32)
-        image_data /= 0xFFF
-
-        return image_data
+        return DPXReader.to_output_dtype(image_data, 12, output_dtype)
 
     @staticmethod
-    def read_dpx_16bit(file_obj: BinaryIO, meta: Dict[str, Union[str, int]]) -> np.ndarray:
+    def read_dpx_16bit(file_obj: BinaryIO, meta: Dict[str, Union[str, int]], step: int = 1,
+                       output_dtype: Optional[type] = None) -> np.ndarray:
         width = meta['width']
-        height = meta['height']
-        offset = meta['offset']
         components_per_pixel = DPXReader.get_channels_from_meta(meta)
 
-        file_obj.seek(offset)
-        raw = np.fromfile(file_obj, dtype=np.uint16, count=width * height * components_per_pixel)
-        raw = raw.reshape(height, width, components_per_pixel)
-
-        if meta['endianness'] == '>':
-            raw.byteswap(True)
+        raw = DPXReader.read_scan_lines(file_obj, meta, np.uint16, width * components_per_pixel, step)
+        raw = raw.reshape(-1, width, components_per_pixel)[:, ::step]
 
-        # Convert to float32 and normalize
-        image_data = raw.astype(np.float32)
-        image_data /= 0xFFFF
-
-        return image_data
+        return DPXReader.to_output_dtype(raw, 16, output_dtype)
 
 class ImageSequence:
 
@@ -1,6 +1,6 @@
 # Type Checking Imports
 # ---------------------
-from typing import Callable, Optional, Any, Tuple, FrozenSet
+from typing import Callable, Optional, Any, Dict, Hashable, List, Set, Tuple
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -8,63 +8,209 @@ if TYPE_CHECKING:
 
 # Standard Library Imports
 # ------------------------
-import psutil
+import itertools
+import sys
+import threading
+import weakref
 from collections import OrderedDict
-from functools import wraps
-import pickle
+from dataclasses import dataclass
+from functools import update_wrapper
+
+# Third Party Imports
+# -------------------
+import psutil
 
 
 # Class Definitions
 # -----------------
+@dataclass
+class CacheInfo:
+    """Statistics of an `LRUCache`.
+    """
+    hits: int                   # Number of calls answered from the cache
+    misses: int                 # Number of calls that ran the function
+    evictions: int              # Number of results evicted to stay within the memory limit
+    item_count: int             # Number of results in the cache
+    current_memory: int         # Total size of the results in the cache, in bytes
+    max_memory: int             # Memory limit of the cache, in bytes
+
+
 class LRUCache:
-    def __init__(self, max_memory: Optional[int] = None, memory_pct: 'Number' = 10.0):
+    """A memory-bounded least-recently-used cache decorator.
+
+    The size of each result is measured once, when it is cached, by `sizer`. The default sizer,
+    `get_size`, reads `nbytes` of NumPy arrays, `sizeInBytes` of QImages and falls back to
+    `sys.getsizeof`, so large images are measured without being copied. Results larger than the
+    whole cache are returned without being cached.
+
+    The cache is shared by all threads, and the function runs outside of its lock, so threads
+    missing the cache do not wait for each other. Applied to a method, results are cached per
+    instance, but the instance is only referenced weakly: once it is garbage collected, its
+    results are dropped at the next call of the method.
+
+    Examples:
+        >>> @LRUCache(max_memory=1024)
+        ... def double(value):
+        ...     return value * 2
+        >>> double(2), double(2)
+        (4, 4)
+        >>> info = double.cache_info()
+        >>> info.hits, info.misses
+        (1, 1)
+    """
+
+    def __init__(self, max_memory: Optional[int] = None, memory_pct: 'Number' = 10.0,
+                 sizer: Optional[Callable[[Any], int]] = None):
         """Set max memory based on the percentage of available memory if not provided.
+
+        Args:
+            max_memory (Optional[int]): The memory limit of the cache, in bytes.
+            memory_pct (Number): The memory limit as a percentage of the available memory, if `max_memory` is not given.
+            sizer (Optional[Callable[[Any], int]]): Returns the size of a result in bytes. Defaults to `get_size`.
         """
         self.max_memory = max_memory or int(self._get_available_memory() * float(memory_pct) / 100)
-        self.cache = OrderedDict()
+        self.sizer = sizer or self.get_size
+        # Map each key to its result and the size of the result
+        self.cache: 'OrderedDict[Hashable, Tuple[Any, int]]' = OrderedDict()
         self.current_memory = 0
 
-    def __call__(self, func: Callable) -> Callable:
-        @wraps(func)
-        def wrapped(*args: Any, **kwargs: Any) -> Any:
-            key = self._make_key(args, kwargs)
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        self._lock = threading.Lock()
+        # Tokens stand in for instances in the keys, so that keys do not keep instances alive
+        self._instance_tokens: 'weakref.WeakKeyDictionary[Any, int]' = weakref.WeakKeyDictionary()
+        self._instance_keys: Dict[int, Set[Hashable]] = {}
+        self._dead_tokens: List[int] = []
+        self._token_counter = itertools.count()
+
+    def __call__(self, func: Callable) -> '_CachedFunction':
+        return _CachedFunction(self, func)
+
+    # Public Methods
+    # --------------
+    def call(self, func: Callable, args: Tuple, kwargs: dict, instance: Any = None) -> Any:
+        """Return the cached result of `func`, or call it and cache its result.
+
+        Args:
+            func (Callable): The cached function.
+            args (Tuple): The positional arguments, without the instance.
+            kwargs (dict): The keyword arguments.
+            instance (Any): The instance of a method call, if any.
+        """
+        with self._lock:
+            if self._dead_tokens:
+                self._purge_dead_instances()
+            token = self._get_instance_token(instance) if instance is not None else None
+            key = self._make_key(args, kwargs, token)
             if key in self.cache:
                 # Move the accessed item to the end to mark it as recently used
                 self.cache.move_to_end(key)
-                return self.cache[key]
-            # Call the original function and cache the result
-            result = func(*args, **kwargs)
-            result_size = self._get_size(result)
-            self.cache[key] = result
+                self.hits += 1
+                return self.cache[key][0]
+            self.misses += 1
+
+        # Call the original function outside of the lock, and cache the result
+        result = func(instance, *args, **kwargs) if instance is not None else func(*args, **kwargs)
+        result_size = self.sizer(result)
+        if result_size > self.max_memory:
+            return result
+
+        with self._lock:
+            if key in self.cache:
+                # Another thread cached the same call meanwhile
+                self.current_memory -= self.cache.pop(key)[1]
+            elif isinstance(token, int):
+                self._instance_keys.setdefault(token, set()).add(key)
+            self.cache[key] = (result, result_size)
             self.current_memory += result_size
             # Evict least recently used items if memory limit is exceeded
             while self.current_memory > self.max_memory:
                 self._evict()
-            return result
+        return result
 
-        # Attach cache related attributes to the wrapped function
-        wrapped.cache = self.cache
-        wrapped.get_current_memory = self._get_current_memory
-        wrapped.max_memory = self.max_memory
-        wrapped.clear_cache = self.clear_cache
-        return wrapped
+    def cache_info(self) -> CacheInfo:
+        """Get the statistics of the cache.
+        """
+        with self._lock:
+            return CacheInfo(self.hits, self.misses, self.evictions, len(self.cache), self.current_memory, self.max_memory)
 
-    def _make_key(self, args: Tuple, kwargs: dict) -> Tuple[Any, FrozenSet[Any]]:
-        """Create a unique key based on function arguments.
+    def clear_cache(self) -> None:
+        """Clear the cache and reset memory usage and statistics.
         """
-        return (args, frozenset(kwargs.items()))
+        with self._lock:
+            self.cache.clear()
+            self._instance_keys.clear()
+            self.current_memory = 0
+            self.hits = self.misses = self.evictions = 0
 
-    def _evict(self) -> None:
-        """Evict the least recently used item.
+    @staticmethod
+    def get_size(obj: Any) -> int:
+        """Estimate the size of an object in bytes without serializing it.
+
+        Uses `nbytes` of NumPy arrays and memoryviews, `sizeInBytes` of QImages, the sizes of the items
+        of tuples and lists, e.g. an image with its metadata, and `sys.getsizeof` otherwise.
+
+        Examples:
+            >>> import numpy as np
+            >>> LRUCache.get_size(np.zeros((4, 4), dtype=np.float32))
+            64
         """
-        _, oldest_result = self.cache.popitem(last=False)
-        self.current_memory -= self._get_size(oldest_result)
+        nbytes = getattr(obj, 'nbytes', None)
+        if isinstance(nbytes, int):
+            return nbytes
+        if hasattr(obj, 'sizeInBytes'):
+            return obj.sizeInBytes()
+        if isinstance(obj, (tuple, list)):
+            return sys.getsizeof(obj) + sum(LRUCache.get_size(item) for item in obj)
+        return sys.getsizeof(obj)
 
-    def clear_cache(self) -> None:
-        """Clear the cache and reset memory usage.
+    # Private Methods
+    # ---------------
+    def _make_key(self, args: Tuple, kwargs: dict, token: Optional[Hashable] = None) -> Hashable:
+        """Create a unique key based on function arguments and the token of the instance.
         """
-        self.cache.clear()
-        self.current_memory = 0
+        if kwargs:
+            return (token, args, frozenset(kwargs.items()))
+        return (token, args)
+
+    def _get_instance_token(self, instance: Any) -> Hashable:
+        """Get the token of an instance, registering it to be purged once the instance is garbage collected.
+
+        Instances that cannot be referenced weakly or hashed are used as their own token.
+        """
+        try:
+            token = self._instance_tokens.get(instance)
+            if token is None:
+                token = next(self._token_counter)
+                weakref.finalize(instance, self._dead_tokens.append, token)
+                self._instance_tokens[instance] = token
+            return token
+        except TypeError:
+            return ('instance', instance)
+
+    def _purge_dead_instances(self) -> None:
+        """Drop the results of garbage-collected instances. Must be called with the lock held.
+        """
+        while self._dead_tokens:
+            for key in self._instance_keys.pop(self._dead_tokens.pop(), ()):
+                if key in self.cache:
+                    self.current_memory -= self.cache.pop(key)[1]
+
+    def _evict(self) -> None:
+        """Evict the least recently used item. Must be called with the lock held.
+        """
+        key, (_, oldest_size) = self.cache.popitem(last=False)
+        self.current_memory -= oldest_size
+        self.evictions += 1
+
+        token = key[0]
+        if isinstance(token, int) and token in self._instance_keys:
+            instance_keys = self._instance_keys[token]
+            instance_keys.discard(key)
+            if not instance_keys:
+                del self._instance_keys[token]
 
     def _get_current_memory(self) -> int:
         return self.current_memory
@@ -74,10 +220,52 @@ class LRUCache:
         """
         return psutil.virtual_memory().available
 
-    def _get_size(self, obj: Any) -> int:
-        """Estimate the size of an object using pickle.
-        """
-        return len(pickle.dumps(obj))
+
+class _CachedFunction:
+    """The function returned by `LRUCache`, which binds to instances when used as a method.
+    """
+
+    def __init__(self, lru_cache: LRUCache, func: Callable):
+        update_wrapper(self, func)
+        self._lru_cache = lru_cache
+        self._func = func
+
+        # Expose the cache related attributes on the wrapped function
+        self.cache = lru_cache.cache
+        self.max_memory = lru_cache.max_memory
+        self.get_current_memory = lru_cache._get_current_memory
+        self.clear_cache = lru_cache.clear_cache
+        self.cache_info = lru_cache.cache_info
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        return self._lru_cache.call(self._func, args, kwargs)
+
+    def __get__(self, instance: Any, owner: Optional[type] = None) -> Callable:
+        if instance is None:
+            return self
+        return _BoundCachedFunction(self, instance)
+
+
+class _BoundCachedFunction:
+    """A `_CachedFunction` bound to an instance, with the cache related attributes of the function,
+    e.g. `instance.method.clear_cache()`.
+    """
+
+    __slots__ = ('__func__', '__self__')
+
+    def __init__(self, cached_function: _CachedFunction, instance: Any):
+        self.__func__ = cached_function
+        self.__self__ = instance
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        cached_function = self.__func__
+        return cached_function._lru_cache.call(cached_function._func, args, kwargs, instance=self.__self__)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.__func__, name)
+
+    def __repr__(self) -> str:
+        return f"<bound cached method {self.__func__.__qualname__} of {self.__self__!r}>"
 
 
 if __name__ == "__main__":
@@ -98,3 +286,4 @@ if __name__ == "__main__":
     print("Cache size (number of items):", len(expensive_computation.cache))
     print("Current memory used by cache (bytes):", expensive_computation.get_current_memory())
     print("Max memory allowed for cache (bytes):", expensive_computation.max_memory)
+    print("Statistics:", expensive_computation.cache_info())
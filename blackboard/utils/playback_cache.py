@@ -0,0 +1,339 @@
+# Type Checking Imports
+# ---------------------
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional
+if TYPE_CHECKING:
+    import numpy as np
+    from blackboard.utils.image_utils import ImageSequence
+
+# Standard Library Imports
+# ------------------------
+from enum import Enum
+
+# Third Party Imports
+# -------------------
+from qtpy import QtCore
+
+# Local Imports
+# -------------
+from blackboard.utils.image_utils import ImageReader
+from blackboard.utils.thread_pool import ThreadPoolManager, TaskPriority, CancellationToken
+
+
+# Class Definitions
+# -----------------
+class FrameState(Enum):
+    """The state of a frame in a `PlaybackCache`.
+    """
+    NONE = 'none'           # Not requested, or evicted or cancelled
+    QUEUED = 'queued'
+    DECODING = 'decoding'
+    CACHED = 'cached'
+    FAILED = 'failed'
+
+class PlaybackCache(QtCore.QObject):
+    """Decode the frames of an image sequence around the playhead on worker threads, within a memory budget.
+
+    Each time the playhead moves, the frames of the window around it are requested, nearest first: the
+    frame under the playhead, `ahead_count` frames in the direction of travel and `behind_count` frames
+    behind it. Requests that fall out of the window, e.g. when the user jumps to another frame, are
+    cancelled. Once the size of a frame is known, the window is shrunk to fit in `memory_budget`.
+
+    Decoded frames stay cached after leaving the window, so scrubbing back does not decode them again.
+    When the budget is exceeded, the frames farthest from the playhead are evicted first, relative to
+    the size of the window on their side.
+
+    The cache must be created and used on the GUI thread. Frames are decoded with `ImageReader.read_image`
+    rather than `ImageSequence.read_image`, whose own cache would hold the frames a second time.
+
+    Signals:
+        frame_state_changed (int, FrameState): Emitted with a frame and its new state.
+
+    Examples:
+        >>> playback_cache = PlaybackCache(ImageSequence('/shots/sh010/plate.####.exr'))
+        >>> playback_cache.frame_state_changed.connect(on_frame_state_changed)
+        >>> playback_cache.set_playhead(1001)
+        >>> image_data = playback_cache.get_frame(1001)       # None until the frame is cached
+    """
+
+    DEFAULT_MEMORY_BUDGET = 2 * 1024 ** 3    # 2 GB
+    DEFAULT_AHEAD_COUNT = 48
+    DEFAULT_BEHIND_COUNT = 12
+
+    frame_state_changed = QtCore.Signal(int, object)
+
+    # Emitted from the worker threads with the frame and the token of its request
+    _decode_started = QtCore.Signal(int, object)
+    _frame_decoded = QtCore.Signal(int, object, object)
+    _frame_failed = QtCore.Signal(int, object, object)
+
+    # Initialization and Setup
+    # ------------------------
+    def __init__(self, image_sequence: 'ImageSequence', memory_budget: int = DEFAULT_MEMORY_BUDGET,
+                 ahead_count: int = DEFAULT_AHEAD_COUNT, behind_count: int = DEFAULT_BEHIND_COUNT,
+                 read_image: Optional[Callable[[str], 'np.ndarray']] = None, parent: Optional[QtCore.QObject] = None):
+        """Initialize the cache. No frame is requested until the playhead is set.
+
+        Args:
+            image_sequence (ImageSequence): The sequence whose frames are cached.
+            memory_budget (int): The maximum size of the cached frames in bytes.
+            ahead_count (int): The number of frames prefetched in the direction of travel.
+            behind_count (int): The number of frames prefetched behind the playhead.
+            read_image (Optional[Callable[[str], np.ndarray]]): The function decoding a frame from its path,
+                called on worker threads. Defaults to `ImageReader.read_image`.
+            parent (Optional[QtCore.QObject]): The parent object.
+        """
+        super().__init__(parent)
+
+        # Store the arguments
+        self.image_sequence = image_sequence
+        self.memory_budget = memory_budget
+        self.ahead_count = ahead_count
+        self.behind_count = behind_count
+        self.read_image = read_image or ImageReader.read_image
+
+        self.first_frame, self.last_frame = image_sequence.frame_range()
+
+        # Private Attributes
+        # ------------------
+        self._playhead: Optional[int] = None
+        self._direction = 1
+        self._frames: Dict[int, 'np.ndarray'] = {}
+        self._memory_usage = 0
+        # Size of the last decoded frame, to fit the window in the budget
+        self._frame_size: Optional[int] = None
+        self._requests: Dict[int, CancellationToken] = {}
+        self._request_priorities: Dict[int, TaskPriority] = {}
+        self._states: Dict[int, FrameState] = {}
+
+        self._decode_started.connect(self._on_decode_started)
+        self._frame_decoded.connect(self._on_frame_decoded)
+        self._frame_failed.connect(self._on_frame_failed)
+
+    # Public Methods
+    # --------------
+    def set_playhead(self, frame: int, direction: Optional[int] = None):
+        """Move the playhead, requesting the frames of the new window and cancelling the requests out of it.
+
+        Args:
+            frame (int): The frame under the playhead.
+            direction (Optional[int]): 1 when playing forward, -1 when playing backward. Defaults to the
+                direction the playhead moved in, or the previous direction if it did not move.
+        """
+        frame = int(frame)
+        if direction is None and self._playhead is not None and frame != self._playhead:
+            direction = 1 if frame > self._playhead else -1
+
+        self._playhead = frame
+        if direction is not None:
+            self._direction = 1 if direction >= 0 else -1
+
+        self._update_window()
+
+    def set_memory_budget(self, memory_budget: int):
+        """Set the maximum size of the cached frames in bytes, evicting frames if needed.
+        """
+        self.memory_budget = memory_budget
+        self._evict()
+        self._update_window()
+
+    def get_frame(self, frame: int) -> Optional['np.ndarray']:
+        """Get the image data of a frame if it is cached, without decoding it.
+        """
+        return self._frames.get(frame)
+
+    def get_frame_state(self, frame: int) -> FrameState:
+        """Get the state of a frame.
+        """
+        return self._states.get(frame, FrameState.NONE)
+
+    def get_window_frames(self) -> List[int]:
+        """Get the frames of the window around the playhead, in the order they are requested.
+        """
+        if self._playhead is None or self.first_frame is None:
+            return []
+
+        ahead_count, behind_count = self.ahead_count, self.behind_count
+        if self._frame_size:
+            frame_capacity = max(self.memory_budget // self._frame_size, 1)
+            ahead_count = min(ahead_count, frame_capacity - 1)
+            behind_count = min(behind_count, frame_capacity - 1 - ahead_count)
+
+        frames = [self._playhead]
+        frames.extend(self._playhead + self._direction * offset for offset in range(1, ahead_count + 1))
+        frames.extend(self._playhead - self._direction * offset for offset in range(1, behind_count + 1))
+
+        return [frame for frame in frames if self.first_frame <= frame <= self.last_frame]
+
+    def clear(self):
+        """Cancel all requests and drop the cached frames.
+        """
+        for token in self._requests.values():
+            token.cancel()
+        self._requests.clear()
+        self._request_priorities.clear()
+        self._frames.clear()
+        self._memory_usage = 0
+
+        for frame in list(self._states):
+            self._set_state(frame, FrameState.NONE)
+
+    # Class Properties
+    # ----------------
+    @property
+    def playhead(self) -> Optional[int]:
+        """Get the frame under the playhead.
+        """
+        return self._playhead
+
+    @property
+    def direction(self) -> int:
+        """Get the direction of travel, 1 forward or -1 backward.
+        """
+        return self._direction
+
+    @property
+    def memory_usage(self) -> int:
+        """Get the size of the cached frames in bytes.
+        """
+        return self._memory_usage
+
+    @property
+    def cached_frames(self) -> List[int]:
+        """Get the cached frames, in ascending order.
+        """
+        return sorted(self._frames)
+
+    @property
+    def pending_count(self) -> int:
+        """Get the number of frames queued or being decoded.
+        """
+        return len(self._requests)
+
+    # Private Methods
+    # ---------------
+    def _update_window(self):
+        """Cancel the requests out of the window, and request its frames that are not cached.
+        """
+        window_frames = self.get_window_frames()
+        window_frame_set = set(window_frames)
+
+        for frame in [frame for frame in self._requests if frame not in window_frame_set]:
+            self._cancel_request(frame)
+            self._set_state(frame, FrameState.NONE)
+
+        for frame in window_frames:
+            priority = TaskPriority.INTERACTIVE if frame == self._playhead else TaskPriority.PREFETCH
+
+            # Raise a frame queued for prefetching once the playhead reaches it
+            if self.get_frame_state(frame) is FrameState.QUEUED and self._request_priorities[frame] < priority:
+                self._cancel_request(frame)
+
+            if frame in self._frames or frame in self._requests or self.get_frame_state(frame) is FrameState.FAILED:
+                continue
+
+            self._request(frame, priority)
+
+    def _request(self, frame: int, priority: TaskPriority):
+        """Queue the decode of a frame.
+        """
+        token = CancellationToken()
+        self._requests[frame] = token
+        self._request_priorities[frame] = priority
+        self._set_state(frame, FrameState.QUEUED)
+
+        file_path = self.image_sequence.get_frame_path(frame)
+        ThreadPoolManager.scheduler().submit(
+            self._decode_frame, frame, file_path, token, priority=priority, category='playback', token=token,
+        )
+
+    def _cancel_request(self, frame: int):
+        """Cancel the decode of a frame, if it is requested.
+        """
+        token = self._requests.pop(frame, None)
+        self._request_priorities.pop(frame, None)
+        if token is not None:
+            token.cancel()
+
+    def _decode_frame(self, frame: int, file_path: str, token: CancellationToken):
+        """Decode a frame on a worker thread, reporting the result with queued signals.
+        """
+        self._decode_started.emit(frame, token)
+
+        try:
+            image_data = self.read_image(file_path)
+            if image_data is None:
+                raise ValueError(f"Unable to read the image at {file_path}")
+        except Exception as error:
+            self._frame_failed.emit(frame, token, error)
+            return
+
+        self._frame_decoded.emit(frame, token, image_data)
+
+    def _is_current_request(self, frame: int, token: CancellationToken) -> bool:
+        """Check whether a token belongs to the current request of a frame, not a cancelled one.
+        """
+        return self._requests.get(frame) is token and not token.is_cancelled
+
+    def _on_decode_started(self, frame: int, token: CancellationToken):
+        if self._is_current_request(frame, token):
+            self._set_state(frame, FrameState.DECODING)
+
+    def _on_frame_decoded(self, frame: int, token: CancellationToken, image_data: 'np.ndarray'):
+        """Cache a decoded frame, evicting frames over the budget.
+        """
+        if not self._is_current_request(frame, token):
+            return
+
+        del self._requests[frame]
+        del self._request_priorities[frame]
+
+        is_first_frame_size = self._frame_size is None
+        self._frame_size = image_data.nbytes
+        self._frames[frame] = image_data
+        self._memory_usage += image_data.nbytes
+        self._set_state(frame, FrameState.CACHED)
+
+        self._evict()
+
+        # Fit the window in the budget now that the frame size is known
+        if is_first_frame_size:
+            self._update_window()
+
+    def _on_frame_failed(self, frame: int, token: CancellationToken, error: Exception):
+        if not self._is_current_request(frame, token):
+            return
+
+        del self._requests[frame]
+        del self._request_priorities[frame]
+        self._set_state(frame, FrameState.FAILED)
+
+    def _evict(self):
+        """Evict the frames farthest from the playhead until the cached frames fit in the budget.
+
+        The frame under the playhead is never evicted.
+        """
+        while self._memory_usage > self.memory_budget and len(self._frames) > 1:
+            frame = max((frame for frame in self._frames if frame != self._playhead), key=self._get_window_distance)
+            self._memory_usage -= self._frames.pop(frame).nbytes
+            self._set_state(frame, FrameState.NONE)
+
+    def _get_window_distance(self, frame: int) -> float:
+        """Get the distance of a frame from the playhead, relative to the size of the window on its side.
+        """
+        offset = (frame - (self._playhead or 0)) * self._direction
+        if offset >= 0:
+            return offset / max(self.ahead_count, 1)
+        return -offset / max(self.behind_count, 1)
+
+    def _set_state(self, frame: int, state: FrameState):
+        """Set the state of a frame, emitting `frame_state_changed` if it changed.
+        """
+        if self._states.get(frame, FrameState.NONE) is state:
+            return
+
+        if state is FrameState.NONE:
+            del self._states[frame]
+        else:
+            self._states[frame] = state
+
+        self.frame_state_changed.emit(frame, state)
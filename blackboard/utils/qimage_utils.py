@@ -1,7 +1,15 @@
+# Type Checking Imports
+# ---------------------
+from typing import Callable, Deque, Dict, List, Optional, Tuple
+
 # Standard Library Imports
 # ------------------------
 import os
-from functools import lru_cache
+import sqlite3
+import threading
+import time
+from collections import OrderedDict, defaultdict, deque
+from functools import lru_cache, partial
 
 # Third Party Imports
 # -------------------
@@ -13,6 +21,9 @@ import numpy as np
 # Local Imports
 # -------------
 from blackboard.utils.image_utils import ImageReader
+from blackboard.utils.decode_service import DecodeService
+from blackboard.utils.thread_pool import ThreadPoolManager, TaskPriority
+from blackboard.utils.thumbnail_cache import ThumbnailCache
 
 
 # Class Definitions
@@ -24,12 +35,58 @@ class ThumbnailUtils:
     as well as for generating cached thumbnails for image files.
 
     Methods:
+        create_qimage_from_image_data(image_data: np.ndarray, desired_height: int) -> QtGui.QImage:
+            Creates a `QImage` from a NumPy array, scaling it to a specified height.
+
         create_qpixmap_from_image_data(image_data: np.ndarray, desired_height: int) -> QtGui.QPixmap:
             Creates a `QPixmap` from a NumPy array, scaling it to a specified height.
-        
+
+        get_image_thumbnail(file_path: str, desired_height: int) -> QtGui.QImage:
+            Generates a thumbnail `QImage` for a given image file path, on any thread.
+
         get_pixmap_thumbnail(file_path: str, desired_height: int) -> QtGui.QPixmap:
             Generates a cached thumbnail `QPixmap` for a given image file path.
+
+    Attributes:
+        use_disk_cache (bool): Whether generated thumbnails are also kept in a persistent `ThumbnailCache`,
+            so they are not decoded again on the next launch.
+        decode_service (Optional[DecodeService]): If set, formats Qt cannot read are decoded in its worker
+            processes, so that decoding scales with the cores instead of contending for the GIL.
     """
+    use_disk_cache: bool = True
+    decode_service: Optional[DecodeService] = None
+    disk_cache_format: str = 'PNG'
+
+    _disk_cache: Optional[ThumbnailCache] = None
+    _disk_cache_lock = threading.Lock()
+
+    @classmethod
+    def get_disk_cache(cls) -> Optional[ThumbnailCache]:
+        """Get the persistent thumbnail cache, opening the default one on first use.
+
+        Returns:
+            Optional[ThumbnailCache]: The cache, or None if `use_disk_cache` is False or the cache cannot be opened.
+        """
+        if not cls.use_disk_cache:
+            return None
+
+        with cls._disk_cache_lock:
+            if cls._disk_cache is None:
+                try:
+                    cls._disk_cache = ThumbnailCache()
+                except (OSError, sqlite3.Error):
+                    cls.use_disk_cache = False
+            return cls._disk_cache
+
+    @classmethod
+    def set_disk_cache(cls, disk_cache: Optional[ThumbnailCache]) -> None:
+        """Set the persistent thumbnail cache, or disable it with None.
+        """
+        with cls._disk_cache_lock:
+            cls._disk_cache = disk_cache
+            cls.use_disk_cache = disk_cache is not None
+        cls.get_pixmap_thumbnail.cache_clear()
+
     @staticmethod
     def normalize_to_uint8(image_data: 'np.ndarray') -> 'np.ndarray':
         """Normalizes and converts an image to uint8 format.
@@ -63,20 +120,22 @@ class ThumbnailUtils:
         return image_data.astype(np.uint8)
 
     @staticmethod
-    def create_qpixmap_from_image_data(image_data: 'np.ndarray', desired_height: int = 64) -> QtGui.QPixmap:
-        """Creates a QPixmap from a NumPy array of various data types, scaling it down to
+    def create_qimage_from_image_data(image_data: 'np.ndarray', desired_height: int = 64) -> QtGui.QImage:
+        """Creates a QImage from a NumPy array of various data types, scaling it down to
         a thumbnail size for improved performance.
 
+        Unlike `QPixmap`, `QImage` can be created on any thread, so this is safe to call from worker threads.
+
         Args:
             image_data (np.ndarray): The image data as a NumPy array.
             desired_height (int): The desired height of the thumbnail in pixels.
 
         Returns:
-            QPixmap: The QPixmap created from the image data.
+            QImage: The QImage created from the image data, owning a copy of its pixels.
         """
-        # Return early as empty QPixmap if the image data is invalid
+        # Return early as empty QImage if the image data is invalid
         if image_data is None:
-            return QtGui.QPixmap()
+            return QtGui.QImage()
 
         # Calculate the new width to maintain aspect ratio
         original_height, original_width = image_data.shape[:2]
@@ -92,19 +151,83 @@ class ThumbnailUtils:
         # Ensure the image has 3 channels (RGB)
         if len(img_8bit.shape) == 2 or img_8bit.shape[2] == 1:
             img_8bit = np.stack([img_8bit.squeeze()] * 3, axis=-1)
-        
-        # Convert the image data to QImage
+        img_8bit = np.ascontiguousarray(img_8bit[..., :3])
+
+        # Convert the image data to QImage, copied so that it does not refer to the NumPy buffer
         height, width, num_channel = img_8bit.shape
         bytes_per_line = num_channel * width
-        q_image = QtGui.QImage(img_8bit.data, width, height, bytes_per_line, QtGui.QImage.Format_RGB888)
+        return QtGui.QImage(img_8bit.data, width, height, bytes_per_line, QtGui.QImage.Format_RGB888).copy()
 
-        # Return a QPixmap from the QImage
-        return QtGui.QPixmap.fromImage(q_image)
+    @classmethod
+    def create_qpixmap_from_image_data(cls, image_data: 'np.ndarray', desired_height: int = 64) -> QtGui.QPixmap:
+        """Creates a QPixmap from a NumPy array of various data types, scaling it down to
+        a thumbnail size for improved performance. Must be called on the GUI thread.
+
+        Args:
+            image_data (np.ndarray): The image data as a NumPy array.
+            desired_height (int): The desired height of the thumbnail in pixels.
+
+        Returns:
+            QPixmap: The QPixmap created from the image data.
+        """
+        return QtGui.QPixmap.fromImage(cls.create_qimage_from_image_data(image_data, desired_height))
+
+    @classmethod
+    def get_image_thumbnail(cls, file_path: str, desired_height: int = 64) -> QtGui.QImage:
+        """Generates a thumbnail QImage for a given image file path. Safe to call from worker threads.
+
+        Thumbnails are looked up in the persistent disk cache first, which only needs a `stat` of the file
+        to validate, and generated thumbnails are stored there as compressed 8-bit images.
+
+        Args:
+            file_path (str): Path to the image file.
+            desired_height (int): Desired height of the thumbnail in pixels.
+
+        Returns:
+            QtGui.QImage: The generated thumbnail, or a null QImage if the file does not exist or cannot be read.
+        """
+        # Return early with an empty QImage if the file does not exist
+        if not os.path.isfile(file_path):
+            return QtGui.QImage()
+
+        # Look up the thumbnail in the disk cache
+        disk_cache = cls.get_disk_cache()
+        cache_key = disk_cache.make_key(file_path, desired_height) if disk_cache else None
+        if cache_key and (data := disk_cache.get(cache_key)) is not None:
+            image = QtGui.QImage.fromData(data)
+            if not image.isNull():
+                return image
+
+        # Load the image, letting formats that support it decode at the thumbnail size
+        image_reader = QtGui.QImageReader(file_path)
+        image_size = image_reader.size()
+        if image_size.isValid() and image_size.height() > 0:
+            scaled_width = max(1, round(image_size.width() * desired_height / image_size.height()))
+            image_reader.setScaledSize(QtCore.QSize(scaled_width, desired_height))
+        image = image_reader.read()
+
+        if image.isNull():
+            # Attempt to read the image using a custom method for unsupported formats, at reduced resolution
+            read_image = cls.decode_service.read_image if cls.decode_service else ImageReader.read_image
+            try:
+                image_data = read_image(file_path, target_height=desired_height)
+            except (ValueError, NotImplementedError):
+                image_data = None
+            image = cls.create_qimage_from_image_data(image_data, desired_height=desired_height)
+        elif image.height() != desired_height:
+            # Update the image with the scaled version
+            image = image.scaledToHeight(desired_height, QtCore.Qt.TransformationMode.FastTransformation)
+
+        if cache_key and not image.isNull():
+            disk_cache.put(cache_key, cls.encode_image(image))
+
+        return image
 
     @classmethod
     @lru_cache(maxsize=1024)
     def get_pixmap_thumbnail(cls, file_path: str, desired_height: int = 64) -> QtGui.QPixmap:
-        """Generates a thumbnail QPixmap for a given image file path.
+        """Generates a thumbnail QPixmap for a given image file path. Must be called on the GUI thread,
+        use `get_image_thumbnail` or `ThumbnailPipeline` from other threads.
 
         Args:
             file_path (str): Path to the image file.
@@ -113,43 +236,53 @@ class ThumbnailUtils:
         Returns:
             QtGui.QPixmap: The generated thumbnail as a QPixmap.
         """
-        # Return early with an empty QPixmap if the file does not exist
+        image = cls.get_image_thumbnail(file_path, desired_height)
+        if image.isNull():
+            return cls.get_file_icon_pixmap(file_path, desired_height)
+        return QtGui.QPixmap.fromImage(image)
+
+    @staticmethod
+    def get_file_icon_pixmap(file_path: str, desired_height: int = 64) -> QtGui.QPixmap:
+        """Gets the file type icon of a file that cannot be read as an image. Must be called on the GUI thread.
+
+        Returns:
+            QtGui.QPixmap: The icon, or an empty QPixmap if the file does not exist.
+        """
         if not os.path.isfile(file_path):
             # TODO: Create pixmap to shown that file not found.
             return QtGui.QPixmap()
 
-        # Load the image
-        pixmap = QtGui.QPixmap(file_path)
-
-        if pixmap.isNull():
-            # Attempt to read the image using a custom method for unsupported formats
-            image_data = ImageReader.read_image(file_path)
-            if image_data is not None:
-                pixmap = cls.create_qpixmap_from_image_data(image_data, desired_height=desired_height)
-            else:
-                file_info = QtCore.QFileInfo(file_path)
-                file_icon_provider = QtWidgets.QFileIconProvider()
-                pixmap = file_icon_provider.icon(file_info).pixmap(desired_height)
-        else:
-            # Update the pixmap with the scaled version
-            pixmap = pixmap.scaledToHeight(desired_height, QtCore.Qt.TransformationMode.FastTransformation)
+        # File icons are cheap to get and depend on the theme, so they are not stored in the disk cache
+        file_info = QtCore.QFileInfo(file_path)
+        file_icon_provider = QtWidgets.QFileIconProvider()
+        return file_icon_provider.icon(file_info).pixmap(desired_height)
 
-        return pixmap
+    @classmethod
+    def encode_image(cls, image: QtGui.QImage) -> bytes:
+        """Encodes a QImage as a compressed 8-bit image in `disk_cache_format`.
+        """
+        byte_array = QtCore.QByteArray()
+        buffer = QtCore.QBuffer(byte_array)
+        buffer.open(QtCore.QIODevice.OpenModeFlag.WriteOnly)
+        image.save(buffer, cls.disk_cache_format)
+        buffer.close()
+        return bytes(byte_array)
 
 class ThumbnailLoader(QtCore.QObject):
     """Asynchronous loader for generating and emitting thumbnail images.
 
-    This class emits a signal when the thumbnail is successfully loaded.
+    The loader only creates a `QImage`, which is safe on worker threads, and emits it once loaded,
+    even if it is null. Converting it to a `QPixmap` is left to the GUI thread, see `ThumbnailPipeline`.
 
     Attributes:
         file_path (str): Path to the image file.
         desired_height (int): Desired height of the thumbnail in pixels.
 
     Signals:
-        thumbnail_loaded (str, QtGui.QPixmap): Emitted when the thumbnail is loaded.
+        thumbnail_loaded (str, QtGui.QImage): Emitted when the thumbnail is loaded.
     """
     # Define signal
-    thumbnail_loaded = QtCore.Signal(str, QtGui.QPixmap)
+    thumbnail_loaded = QtCore.Signal(str, QtGui.QImage)
 
     def __init__(self, file_path: str, desired_height: int = 64) -> None:
         """Initialize the ThumbnailLoader with the file path and thumbnail height.
@@ -168,18 +301,194 @@ class ThumbnailLoader(QtCore.QObject):
         """Run the thumbnail loading process and emit the thumbnail_loaded signal.
         """
         # Generate the thumbnail
-        pixmap = ThumbnailUtils.get_pixmap_thumbnail(self.file_path, self.desired_height)
-
-        # Return early if the pixmap is invalid
-        if pixmap.isNull():
-            return
+        try:
+            image = ThumbnailUtils.get_image_thumbnail(self.file_path, self.desired_height)
+        except Exception:
+            image = QtGui.QImage()
 
         # Emit the thumbnail_loaded signal
         try:
-            self.thumbnail_loaded.emit(self.file_path, pixmap)
+            self.thumbnail_loaded.emit(self.file_path, image)
         except RuntimeError:
             pass
 
+class ThumbnailPipeline(QtCore.QObject):
+    """Load thumbnails on worker threads and convert them to pixmaps on the GUI thread.
+
+    Workers only decode `QImage` objects. The decoded images are queued, and converted to `QPixmap`
+    in batches on the GUI thread, each batch within `frame_budget` milliseconds so that the views stay
+    responsive while many thumbnails arrive at once. Requests for a thumbnail that is already being
+    loaded are coalesced, so several views asking for the same thumbnail trigger a single decode.
+
+    Views waiting for a single thumbnail, such as thumbnail widgets, pass a `callback` to `request`, which
+    is called with the pixmap of that thumbnail only. Views showing many thumbnails, such as delegates,
+    connect to `thumbnail_loaded` once instead.
+
+    The pipeline must be created and used on the GUI thread; use the shared `instance()`.
+
+    Signals:
+        thumbnail_loaded (str, int, QtGui.QPixmap): Emitted with the file path, the height and the pixmap
+            of each loaded thumbnail.
+
+    Examples:
+        >>> pipeline = ThumbnailPipeline.instance()
+        >>> pipeline.thumbnail_loaded.connect(on_thumbnail_loaded)
+        >>> pixmap = pipeline.request(file_path, 64)     # None until `thumbnail_loaded` is emitted
+        >>> pixmap = pipeline.request(file_path, 64, callback=widget.set_pixmap)
+    """
+
+    DEFAULT_FRAME_BUDGET = 8.0      # Milliseconds
+    DEFAULT_CACHE_SIZE = 1024
+
+    thumbnail_loaded = QtCore.Signal(str, int, QtGui.QPixmap)
+
+    _instance = None
+
+    def __init__(self, parent: Optional[QtCore.QObject] = None, frame_budget: float = DEFAULT_FRAME_BUDGET,
+                 cache_size: int = DEFAULT_CACHE_SIZE):
+        """Initialize the pipeline.
+
+        Args:
+            parent (Optional[QtCore.QObject]): The parent object.
+            frame_budget (float): The time spent converting images per event loop iteration, in milliseconds.
+            cache_size (int): The number of converted pixmaps kept.
+        """
+        super().__init__(parent)
+
+        # Store the arguments
+        self.frame_budget = frame_budget
+        self.cache_size = cache_size
+
+        # Private Attributes
+        # ------------------
+        # Loaders of the thumbnails being decoded, by file path and height
+        self._loaders: Dict[Tuple[str, int], ThumbnailLoader] = {}
+        self._decoded_images: Deque[Tuple[Tuple[str, int], QtGui.QImage]] = deque()
+        self._pixmaps: 'OrderedDict[Tuple[str, int], QtGui.QPixmap]' = OrderedDict()
+        # Callbacks waiting for the thumbnails being loaded, by file path and height
+        self._callbacks: Dict[Tuple[str, int], List[Callable[[QtGui.QPixmap], None]]] = defaultdict(list)
+
+        self._convert_timer = QtCore.QTimer(self)
+        self._convert_timer.setInterval(0)
+        self._convert_timer.timeout.connect(self._convert_images)
+
+    @classmethod
+    def instance(cls) -> 'ThumbnailPipeline':
+        """Get the pipeline shared by all views, creating it on first use.
+        """
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    # Public Methods
+    # --------------
+    def request(self, file_path: str, desired_height: int = 64, priority: TaskPriority = TaskPriority.VISIBLE,
+                callback: Optional[Callable[[QtGui.QPixmap], None]] = None) -> Optional[QtGui.QPixmap]:
+        """Get the thumbnail of a file, starting to load it if it is not loaded yet.
+
+        Args:
+            file_path (str): Path to the image file.
+            desired_height (int): Desired height of the thumbnail in pixels.
+            priority (TaskPriority): The priority of the decode, if one is started.
+            callback (Optional[Callable[[QtGui.QPixmap], None]]): Called with the pixmap once the thumbnail
+                is loaded, if it is not loaded yet. A callback bound to a `QObject` is dropped when the
+                object is destroyed.
+
+        Returns:
+            Optional[QtGui.QPixmap]: The thumbnail, or None while it is loading, in which case
+                `thumbnail_loaded` is emitted and `callback` is called once it is loaded.
+        """
+        key = (file_path, desired_height)
+        if key in self._pixmaps:
+            self._pixmaps.move_to_end(key)
+            return self._pixmaps[key]
+
+        if callback is not None:
+            self._add_callback(key, callback)
+
+        # Coalesce with the decode already in flight
+        if key in self._loaders:
+            return None
+
+        loader = ThumbnailLoader(file_path, desired_height)
+        loader.thumbnail_loaded.connect(self._on_image_decoded)
+        self._loaders[key] = loader
+        ThreadPoolManager.scheduler().submit(loader.run, priority=priority, category='thumbnail')
+
+        return None
+
+    def is_loading(self, file_path: str, desired_height: int = 64) -> bool:
+        """Check whether a thumbnail is being loaded.
+        """
+        key = (file_path, desired_height)
+        return key in self._loaders
+
+    def clear(self):
+        """Clear the converted pixmaps. Thumbnails being loaded are still delivered.
+        """
+        self._pixmaps.clear()
+
+    # Class Properties
+    # ----------------
+    @property
+    def pending_count(self) -> int:
+        """Get the number of thumbnails being decoded or waiting to be converted.
+        """
+        return len(self._loaders)
+
+    # Private Methods
+    # ---------------
+    def _add_callback(self, key: Tuple[str, int], callback: Callable[[QtGui.QPixmap], None]):
+        """Register a callback for a thumbnail, dropping it if its receiver is destroyed first.
+        """
+        self._callbacks[key].append(callback)
+
+        receiver = getattr(callback, '__self__', None)
+        if isinstance(receiver, QtCore.QObject):
+            receiver.destroyed.connect(partial(self._discard_callback, key, callback))
+
+    def _discard_callback(self, key: Tuple[str, int], callback: Callable[[QtGui.QPixmap], None], *_args):
+        callbacks = self._callbacks.get(key)
+        if callbacks and callback in callbacks:
+            callbacks.remove(callback)
+            if not callbacks:
+                del self._callbacks[key]
+
+    def _on_image_decoded(self, file_path: str, image: QtGui.QImage):
+        """Queue a decoded image to be converted on the GUI thread.
+        """
+        loader = self.sender()
+        self._decoded_images.append(((file_path, loader.desired_height), image))
+        if not self._convert_timer.isActive():
+            self._convert_timer.start()
+
+    def _convert_images(self):
+        """Convert queued images to pixmaps until the frame budget is spent.
+        """
+        deadline = time.perf_counter() + self.frame_budget / 1000
+        while self._decoded_images:
+            key, image = self._decoded_images.popleft()
+            file_path, desired_height = key
+
+            pixmap = QtGui.QPixmap.fromImage(image) if not image.isNull() else ThumbnailUtils.get_file_icon_pixmap(*key)
+            loader = self._loaders.pop(key, None)
+            if loader is not None:
+                loader.deleteLater()
+
+            self._pixmaps[key] = pixmap
+            while len(self._pixmaps) > self.cache_size:
+                self._pixmaps.popitem(last=False)
+
+            for callback in self._callbacks.pop(key, ()):
+                callback(pixmap)
+            self.thumbnail_loaded.emit(file_path, desired_height, pixmap)
+
+            if time.perf_counter() >= deadline:
+                break
+
+        if not self._decoded_images:
+            self._convert_timer.stop()
+
 if __name__ == "__main__":
     # ThumbnailUtils.normalize_to_uint8(np.array([[1, 2, 3], [4, 5, 6], [7, 8, 9]], dtype=np.float32))
     im = ThumbnailUtils.normalize_to_uint8(np.array([[0, 32767, 65535], [16383, 32767, 49151], [8191, 24575, 40959]], dtype=np.uint16))
@@ -1,9 +1,15 @@
 # Type Checking Imports
 # ---------------------
-from typing import Any, Optional, Generator, Callable
+from typing import Any, Optional, Generator, Callable, Dict, List, Tuple
 
 # Standard Library Imports
 # ------------------------
+import heapq
+import itertools
+import threading
+import time
+from enum import IntEnum
+from functools import partial
 from types import GeneratorType
 
 # Third Party Imports
@@ -15,6 +21,9 @@ from qtpy import QtCore
 # -----------------
 class ThreadPoolManager:
     """A singleton manager for Qt QThreadPool.
+
+    The pool is deleted along with the application, e.g. between test sessions, in which case a new pool
+    and scheduler are created the next time they are requested.
     """
 
     _instance = None
@@ -33,11 +42,20 @@ class ThreadPoolManager:
             # Create the singleton instance
             cls._instance = super().__new__(cls)
             cls._instance.pool = QtCore.QThreadPool()
+            cls._instance._scheduler = None
+            cls._instance._max_thread_count = None
 
             # Set the maximum number of threads if specified
             if max_thread_count:
                 cls._instance.set_max_thread_count(max_thread_count)
 
+        # Replace the pool if it was deleted with the application
+        elif cls._is_deleted(cls._instance.pool):
+            cls._instance.pool = QtCore.QThreadPool()
+            cls._instance._scheduler = None
+            if cls._instance._max_thread_count:
+                cls._instance.pool.setMaxThreadCount(cls._instance._max_thread_count)
+
         return cls._instance
 
     @classmethod
@@ -52,7 +70,12 @@ class ThreadPoolManager:
         """
         if max_thread_count <= 0:
             raise ValueError("max_thread_count must be greater than 0")
-        cls()._instance.pool.setMaxThreadCount(max_thread_count)
+
+        instance = cls()._instance
+        instance._max_thread_count = max_thread_count
+        instance.pool.setMaxThreadCount(max_thread_count)
+        if instance._scheduler is not None:
+            instance._scheduler.set_max_concurrency(max_thread_count)
 
     @classmethod
     def thread_pool(cls) -> QtCore.QThreadPool:
@@ -63,6 +86,334 @@ class ThreadPoolManager:
         """
         return cls()._instance.pool
 
+    @classmethod
+    def scheduler(cls) -> 'TaskScheduler':
+        """Get the task scheduler running tasks on the managed thread pool.
+
+        Returns:
+            TaskScheduler: The scheduler instance.
+        """
+        instance = cls()._instance
+        if instance._scheduler is None:
+            instance._scheduler = TaskScheduler(instance.pool)
+        return instance._scheduler
+
+    @staticmethod
+    def _is_deleted(thread_pool: QtCore.QThreadPool) -> bool:
+        """Check whether the C++ object wrapped by a thread pool was deleted.
+        """
+        try:
+            thread_pool.maxThreadCount()
+        except RuntimeError:
+            return True
+        return False
+
+class TaskPriority(IntEnum):
+    """Priority classes of scheduled tasks, from the most to the least urgent.
+    """
+    INTERACTIVE = 3     # Work the user is waiting on, e.g. fetching the rows of a new filter
+    VISIBLE = 2         # Work for what is on screen, e.g. thumbnails of visible rows
+    PREFETCH = 1        # Work likely needed soon, e.g. thumbnails of the next page
+    BACKGROUND = 0      # Work nobody is waiting on, e.g. indexing
+
+class CancellationToken:
+    """A flag shared between the submitter of a task and the task, to cancel it cooperatively.
+
+    Tasks that are still queued when cancelled never run. Running tasks can check `is_cancelled`
+    to stop early, and their result is discarded.
+    """
+
+    def __init__(self):
+        self._event = threading.Event()
+
+    def cancel(self):
+        """Request the cancellation of the tasks holding this token.
+        """
+        self._event.set()
+
+    @property
+    def is_cancelled(self) -> bool:
+        """Check whether cancellation was requested.
+        """
+        return self._event.is_set()
+
+class ScheduledTask(QtCore.QObject):
+    """A task submitted to a `TaskScheduler`.
+
+    Signals:
+        finished (QtCore.Signal): Emitted with the return value of the task.
+        error (QtCore.Signal): Emitted when the task raises an exception, passing the exception.
+        cancelled (QtCore.Signal): Emitted when the task is cancelled, superseded by a newer generation,
+            or dropped after its deadline.
+    """
+    finished = QtCore.Signal(object)
+    error = QtCore.Signal(Exception)
+    cancelled = QtCore.Signal()
+
+    def __init__(self, function: Callable, args: Tuple = (), kwargs: Optional[Dict[str, Any]] = None,
+                 priority: TaskPriority = TaskPriority.BACKGROUND, category: Optional[str] = None,
+                 group: Optional[str] = None, generation: int = 0, deadline: Optional[float] = None,
+                 token: Optional[CancellationToken] = None):
+        """Initialize the task.
+
+        Args:
+            function (Callable): The function to run.
+            args (Tuple): The positional arguments of the function.
+            kwargs (Optional[Dict[str, Any]]): The keyword arguments of the function.
+            priority (TaskPriority): The priority class of the task.
+            category (Optional[str]): The category whose concurrency limit applies to the task.
+            group (Optional[str]): The group whose generations supersede the task.
+            generation (int): The generation of `group` the task was submitted in.
+            deadline (Optional[float]): The `time.monotonic` time after which the task is dropped if it has not started.
+            token (Optional[CancellationToken]): The token cancelling the task. A new token is created if None.
+        """
+        super().__init__()
+        self.function = function
+        self.args = args
+        self.kwargs = kwargs or {}
+        self.priority = TaskPriority(priority)
+        self.category = category
+        self.group = group
+        self.generation = generation
+        self.deadline = deadline
+        self.token = token or CancellationToken()
+
+    def cancel(self):
+        """Cancel the task, see `CancellationToken`.
+        """
+        self.token.cancel()
+
+    @property
+    def is_cancelled(self) -> bool:
+        """Check whether the task was cancelled.
+        """
+        return self.token.is_cancelled
+
+class TaskScheduler:
+    """Run tasks on a thread pool by priority, with cancellation, generations, concurrency limits and deadlines.
+
+    The scheduler keeps queued tasks itself and only hands as many tasks to the thread pool as it may run
+    at once, so a task submitted with a higher priority runs before all queued tasks of lower priorities.
+    Tasks of the same priority run in submission order.
+
+    Examples:
+        >>> scheduler = ThreadPoolManager.scheduler()
+        >>> generation = scheduler.next_generation('thumbnails')        # Cancels the thumbnails of the previous filter
+        >>> task = scheduler.submit(load_thumbnail, path, priority=TaskPriority.VISIBLE,
+        ...                         category='thumbnails', group='thumbnails', timeout=2.0)
+        >>> task.finished.connect(on_thumbnail_loaded)
+    """
+
+    # Initialization and Setup
+    # ------------------------
+    def __init__(self, thread_pool: Optional[QtCore.QThreadPool] = None, max_concurrency: Optional[int] = None):
+        """Initialize the scheduler.
+
+        Args:
+            thread_pool (Optional[QtCore.QThreadPool]): The thread pool running the tasks. Defaults to the shared pool.
+            max_concurrency (Optional[int]): The maximum number of tasks running at once.
+                Defaults to the maximum thread count of the pool.
+        """
+        self._thread_pool = thread_pool or ThreadPoolManager.thread_pool()
+        # Read once, as the pool may be deleted along with the application
+        self._max_concurrency = max_concurrency or self._thread_pool.maxThreadCount()
+
+        self._lock = threading.RLock()
+        # Heap of (-priority, sequence, task)
+        self._pending: List[Tuple[int, int, ScheduledTask]] = []
+        self._sequence = itertools.count()
+        self._running: set = set()
+        self._category_limits: Dict[str, int] = {}
+        self._category_running: Dict[str, int] = {}
+        self._generations: Dict[str, int] = {}
+
+    # Public Methods
+    # --------------
+    def submit(self, function: Callable, *args, priority: TaskPriority = TaskPriority.BACKGROUND,
+               category: Optional[str] = None, group: Optional[str] = None, timeout: Optional[float] = None,
+               token: Optional[CancellationToken] = None, **kwargs) -> ScheduledTask:
+        """Queue a function to run on the thread pool.
+
+        Args:
+            function (Callable): The function to run.
+            *args: The positional arguments of the function.
+            priority (TaskPriority): The priority class of the task. Defaults to `TaskPriority.BACKGROUND`.
+            category (Optional[str]): The category whose concurrency limit applies, see `set_category_limit`.
+            group (Optional[str]): The group whose next generation cancels the task, see `next_generation`.
+            timeout (Optional[float]): The time in seconds after which the task is dropped if it has not started.
+            token (Optional[CancellationToken]): A token to cancel the task with, e.g. shared with other tasks.
+            **kwargs: The keyword arguments of the function.
+
+        Returns:
+            ScheduledTask: The task, whose signals report its result.
+        """
+        with self._lock:
+            task = ScheduledTask(
+                function, args, kwargs, priority=priority, category=category, group=group,
+                generation=self._generations.get(group, 0),
+                deadline=time.monotonic() + timeout if timeout is not None else None,
+                token=token,
+            )
+            heapq.heappush(self._pending, (-task.priority, next(self._sequence), task))
+
+        self._dispatch()
+        return task
+
+    def next_generation(self, group: str) -> int:
+        """Start a new generation of a group, cancelling the queued and running tasks of previous generations.
+
+        Args:
+            group (str): The group, e.g. the view whose filter changed.
+
+        Returns:
+            int: The new generation.
+        """
+        with self._lock:
+            self._generations[group] = self._generations.get(group, 0) + 1
+            for task in self._running:
+                if task.group == group:
+                    task.cancel()
+
+        self._dispatch(purge=True)
+        return self._generations[group]
+
+    def cancel_all(self, group: Optional[str] = None):
+        """Cancel the queued and running tasks of a group, or all tasks if `group` is None.
+        """
+        with self._lock:
+            tasks = list(self._running) + [entry[-1] for entry in self._pending]
+            for task in tasks:
+                if group is None or task.group == group:
+                    task.cancel()
+
+        self._dispatch(purge=True)
+
+    def set_category_limit(self, category: str, limit: Optional[int]):
+        """Limit the number of tasks of a category running at once, e.g. to keep disk reads from
+        using all threads. A limit of None removes the limit.
+        """
+        with self._lock:
+            if limit is None:
+                self._category_limits.pop(category, None)
+            else:
+                self._category_limits[category] = max(int(limit), 1)
+
+        self._dispatch()
+
+    def set_max_concurrency(self, max_concurrency: int):
+        """Set the maximum number of tasks running at once.
+        """
+        with self._lock:
+            self._max_concurrency = max(int(max_concurrency), 1)
+
+        self._dispatch()
+
+    def get_generation(self, group: str) -> int:
+        """Get the current generation of a group.
+        """
+        return self._generations.get(group, 0)
+
+    # Class Properties
+    # ----------------
+    @property
+    def max_concurrency(self) -> int:
+        """Get the maximum number of tasks running at once.
+        """
+        return self._max_concurrency
+
+    @property
+    def pending_count(self) -> int:
+        """Get the number of queued tasks, including cancelled tasks not yet discarded.
+        """
+        return len(self._pending)
+
+    @property
+    def running_count(self) -> int:
+        """Get the number of running tasks.
+        """
+        return len(self._running)
+
+    # Private Methods
+    # ---------------
+    def _is_dropped(self, task: ScheduledTask) -> bool:
+        """Check whether a task is cancelled, superseded by a newer generation of its group, or past its deadline.
+        """
+        if task.group is not None and task.generation < self._generations.get(task.group, 0):
+            task.cancel()
+        elif task.deadline is not None and time.monotonic() > task.deadline:
+            task.cancel()
+        return task.is_cancelled
+
+    def _dispatch(self, purge: bool = False):
+        """Start the queued tasks of highest priority while there are free slots.
+
+        Args:
+            purge (bool): Whether to discard all dropped tasks from the queue first, instead of when they are reached.
+        """
+        dropped_tasks = []
+        started_tasks = []
+
+        with self._lock:
+            if purge:
+                pending = []
+                for entry in self._pending:
+                    if self._is_dropped(entry[-1]):
+                        dropped_tasks.append(entry[-1])
+                    else:
+                        pending.append(entry)
+                heapq.heapify(pending)
+                self._pending = pending
+
+            blocked_entries = []
+            while self._pending and len(self._running) < self.max_concurrency:
+                entry = heapq.heappop(self._pending)
+                task = entry[-1]
+                if self._is_dropped(task):
+                    dropped_tasks.append(task)
+                    continue
+
+                category_limit = self._category_limits.get(task.category)
+                if category_limit is not None and self._category_running.get(task.category, 0) >= category_limit:
+                    blocked_entries.append(entry)
+                    continue
+
+                self._running.add(task)
+                self._category_running[task.category] = self._category_running.get(task.category, 0) + 1
+                started_tasks.append(task)
+
+            for entry in blocked_entries:
+                heapq.heappush(self._pending, entry)
+
+        for task in dropped_tasks:
+            task.cancelled.emit()
+        for task in started_tasks:
+            self._thread_pool.start(partial(self._run_task, task))
+
+    def _run_task(self, task: ScheduledTask):
+        """Run a task in a thread of the pool, then start the next queued tasks.
+        """
+        try:
+            if self._is_dropped(task):
+                task.cancelled.emit()
+                return
+
+            try:
+                result = task.function(*task.args, **task.kwargs)
+            except Exception as e:
+                task.error.emit(e)
+                return
+
+            if task.is_cancelled:
+                task.cancelled.emit()
+            else:
+                task.finished.emit(result)
+
+        finally:
+            with self._lock:
+                self._running.discard(task)
+                self._category_running[task.category] -= 1
+            self._dispatch()
+
 class RunnableTask(QtCore.QRunnable):
     """A Qt runnable task wrapper for executing a task with a 'run' method.
     """
@@ -83,38 +434,105 @@ class RunnableTask(QtCore.QRunnable):
         if hasattr(self.task, 'run') and callable(getattr(self.task, 'run')):
             self.task.run()
 
+class _BatchFlusher:
+    """Emit the partial batches of the running `GeneratorWorker`s on time, from a single thread shared by
+    all of them, while their generators are slow to yield the next item.
+    """
+
+    def __init__(self):
+        # Running workers and their batch interval in seconds
+        self._workers: Dict['GeneratorWorker', float] = {}
+        self._condition = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+
+    def register(self, worker: 'GeneratorWorker', batch_interval: float):
+        """Flush the batches of a worker every `batch_interval` seconds, until it is unregistered.
+        """
+        with self._condition:
+            self._workers[worker] = batch_interval
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name='GeneratorWorkerFlusher', daemon=True)
+                self._thread.start()
+            self._condition.notify()
+
+    def unregister(self, worker: 'GeneratorWorker'):
+        with self._condition:
+            self._workers.pop(worker, None)
+
+    def _run(self):
+        while True:
+            with self._condition:
+                # Sleep until a worker is registered
+                while not self._workers:
+                    self._condition.wait()
+                workers = list(self._workers.items())
+
+            # Flush outside the condition, as emitting may run slots connected directly
+            timeout = min(worker._flush_if_due(batch_interval) for worker, batch_interval in workers)
+
+            with self._condition:
+                self._condition.wait(timeout)
+
 class GeneratorWorker(QtCore.QObject):
     """A worker class that processes items from a generator and emits signals for various events.
 
+    By default each item is emitted with `result`. With `batch_size` set, items are accumulated and
+    emitted as lists with `results_batch` instead, so that a receiver in another thread handles one
+    queued event per batch. A batch is emitted once it holds `batch_size` items, or `batch_interval`
+    milliseconds after its first item was added. A thread shared by all workers emits partial batches
+    on time while the generator is slow to yield the next item.
+
     Signals:
         started (QtCore.Signal): Emitted to indicate fetching has started.
         error (QtCore.Signal): Emitted when an error occurs, passing the exception.
         result (QtCore.Signal): Emitted when a result item is fetched from the generator.
+        results_batch (QtCore.Signal): Emitted with a list of fetched items, in batch mode.
         finished (QtCore.Signal): Emitted when the fetching process has finished.
         loaded_all (QtCore.Signal): Emitted when no more data is available to fetch.
     """
     started = QtCore.Signal()
     error = QtCore.Signal(Exception)
     result = QtCore.Signal(object)
+    # NOTE: Declared as `object` rather than `list`, so the batch is passed by reference instead of
+    #       being converted to a QVariantList item by item.
+    results_batch = QtCore.Signal(object)
     finished = QtCore.Signal()
     loaded_all = QtCore.Signal()
 
-    def __init__(self, generator: Optional[Generator[Any, None, None]] = None, is_pass_error: bool = False, desired_size: Optional[int] = None):
+    # Default number of items per batch, and maximum time in milliseconds between batches
+    DEFAULT_BATCH_SIZE = 500
+    DEFAULT_BATCH_INTERVAL = 16
+
+    _batch_flusher = _BatchFlusher()
+
+    def __init__(self, generator: Optional[Generator[Any, None, None]] = None, is_pass_error: bool = False, desired_size: Optional[int] = None,
+                 batch_size: Optional[int] = None, batch_interval: Optional[float] = DEFAULT_BATCH_INTERVAL):
         """Initialize the GeneratorWorker with the given generator and desired size.
 
         Args:
             generator (Optional[Generator[Any, None, None]]): A generator object that yields items to be processed.
             is_pass_error (bool): If True, passes errors to the error signal; otherwise, raises them.
             desired_size (Optional[int]): The desired number of items to be processed from the generator.
+            batch_size (Optional[int]): If set, emit items in batches of up to this size with `results_batch`
+                instead of one by one with `result`.
+            batch_interval (Optional[float]): The time in milliseconds after which a partial batch is emitted.
+                If None, batches are only emitted when full or at the end.
         """
         super().__init__()
         self.generator = generator
         self.is_pass_error = is_pass_error
         self.desired_size = desired_size
+        self.batch_size = batch_size
+        self.batch_interval = batch_interval
         self._is_stopped = False
         self._is_paused = False
         self._mutex = QtCore.QMutex()
 
+        # The pending batch is shared with the flusher thread, and emitted under the lock to keep batches in order
+        self._batch: List[Any] = []
+        self._batch_start_time = 0.0
+        self._batch_lock = threading.Lock()
+
     def set_generator(self, generator: Generator[Any, None, None], desired_size: Optional[int] = None):
         """Set a new generator to be processed and optionally its desired size.
 
@@ -131,27 +549,48 @@ class GeneratorWorker(QtCore.QObject):
 
     @QtCore.Slot()
     def run(self):
-        """Run the generator, emitting signals for each item, errors, and completion.
+        """Run the generator, emitting signals for each item or batch of items, errors, and completion.
         """
         self.started.emit()
         count = 0
+        self._batch = []
+        batch_interval = self.batch_interval / 1000 if self.batch_interval is not None else None
+
+        # Emit partial batches on time while waiting for the generator
+        is_flushed_on_time = bool(self.batch_size and batch_interval)
+        if is_flushed_on_time:
+            self._batch_flusher.register(self, batch_interval)
 
         # Iterate over the generator and emit each item
         try:
             for item in self.generator:
-                # Lock the mutex to check the stop flag
+                # Lock the mutex once to check the stop and pause flags
                 with QtCore.QMutexLocker(self._mutex):
-                    if self._is_stopped:
-                        break
+                    is_stopped = self._is_stopped
+                    is_paused = self._is_paused
+
+                if is_stopped:
+                    with self._batch_lock:
+                        self._batch.clear()
+                    break
 
-                # Emit each generated item
-                self.result.emit(item)
                 count += 1
+                if not self.batch_size:
+                    # Emit each generated item
+                    self.result.emit(item)
+                else:
+                    with self._batch_lock:
+                        if not self._batch:
+                            self._batch_start_time = time.perf_counter()
+                        self._batch.append(item)
+                        if len(self._batch) >= self.batch_size or (
+                            batch_interval is not None and time.perf_counter() - self._batch_start_time >= batch_interval
+                        ):
+                            self._emit_batch()
 
-                # Lock the mutex to check the pause flag
-                with QtCore.QMutexLocker(self._mutex):
-                    if self._is_paused:
-                        break
+                # The item fetched before the pause is still emitted
+                if is_paused:
+                    break
 
         except Exception as e:
             if self.is_pass_error:
@@ -161,6 +600,14 @@ class GeneratorWorker(QtCore.QObject):
                 raise
 
         finally:
+            if is_flushed_on_time:
+                self._batch_flusher.unregister(self)
+
+            # Emit the remaining items of the last batch
+            with self._batch_lock:
+                if self._batch:
+                    self._emit_batch()
+
             # Emit finished signal
             self.finished.emit()
 
@@ -187,3 +634,27 @@ class GeneratorWorker(QtCore.QObject):
         """
         with QtCore.QMutexLocker(self._mutex):
             self._is_paused = True
+
+    # Private Methods
+    # ---------------
+    def _emit_batch(self):
+        """Emit the pending batch and start a new one. Must be called with the batch lock held.
+        """
+        self.results_batch.emit(self._batch)
+        self._batch = []
+
+    def _flush_if_due(self, batch_interval: float) -> float:
+        """Emit the pending batch if it is `batch_interval` seconds old.
+
+        Returns:
+            float: The number of seconds until the batch should be checked again.
+        """
+        with self._batch_lock:
+            if not self._batch:
+                return batch_interval
+
+            batch_age = time.perf_counter() - self._batch_start_time
+            if batch_age >= batch_interval:
+                self._emit_batch()
+                return batch_interval
+            return batch_interval - batch_age
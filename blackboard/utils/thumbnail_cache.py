@@ -0,0 +1,195 @@
+# Type Checking Imports
+# ---------------------
+from typing import Dict, Optional
+
+# Standard Library Imports
+# ------------------------
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+
+
+# Class Definitions
+# -----------------
+class ThumbnailCache:
+    """A persistent, size-capped store of encoded thumbnails in a single SQLite file.
+
+    Entries are addressed by a digest of the source path, its size and modification time and the
+    requested height, so validating an entry only takes a `stat` of the source file: once the file
+    changes, its key changes and the stale entry is never read again, until it is evicted.
+
+    When the stored thumbnails exceed `max_size`, the least recently used ones are evicted until the
+    store is back below `LOW_WATER_RATIO` of `max_size`. Access times of hits are buffered in memory
+    and written in batches, so reading a warm gallery does not commit once per thumbnail.
+
+    Examples:
+        >>> cache = ThumbnailCache(':memory:')
+        >>> cache.put('key', b'data')
+        >>> cache.get('key')
+        b'data'
+    """
+
+    DEFAULT_MAX_SIZE = 512 * 1024 * 1024    # 512 MB
+    LOW_WATER_RATIO = 0.9
+    ACCESS_FLUSH_COUNT = 256
+
+    # Initialization and Setup
+    # ------------------------
+    def __init__(self, db_path: Optional[str] = None, max_size: int = DEFAULT_MAX_SIZE):
+        """Open the store, creating it and its directory if needed.
+
+        Args:
+            db_path (Optional[str]): The path of the SQLite file. Defaults to `get_default_path()`.
+            max_size (int): The maximum total size of the stored thumbnails, in bytes.
+        """
+        self.db_path = db_path or self.get_default_path()
+        self.max_size = max_size
+
+        if self.db_path != ':memory:':
+            os.makedirs(os.path.dirname(os.path.abspath(self.db_path)), exist_ok=True)
+
+        self._lock = threading.Lock()
+        # Access times of hits not written to the store yet
+        self._pending_accesses: Dict[str, float] = {}
+
+        self._connection = sqlite3.connect(self.db_path, check_same_thread=False)
+        if self.db_path != ':memory:':
+            self._connection.execute('PRAGMA journal_mode=WAL')
+            self._connection.execute('PRAGMA synchronous=NORMAL')
+        self._connection.execute(
+            'CREATE TABLE IF NOT EXISTS thumbnails ('
+            'key TEXT PRIMARY KEY, data BLOB NOT NULL, size INTEGER NOT NULL, last_access REAL NOT NULL)'
+        )
+        self._connection.execute('CREATE INDEX IF NOT EXISTS thumbnails_last_access ON thumbnails (last_access)')
+        self._connection.commit()
+
+        self._total_size = self._connection.execute('SELECT COALESCE(SUM(size), 0) FROM thumbnails').fetchone()[0]
+
+    # Public Methods
+    # --------------
+    @staticmethod
+    def get_default_path() -> str:
+        """Get the default path of the store, in the user cache directory.
+        """
+        cache_home = os.environ.get('XDG_CACHE_HOME') or os.path.expanduser('~/.cache')
+        return os.path.join(cache_home, 'blackboard', 'thumbnails.db')
+
+    @staticmethod
+    def make_key(file_path: str, desired_height: int) -> Optional[str]:
+        """Make the key of a thumbnail of a file from a single `stat` of the file.
+
+        Returns:
+            Optional[str]: The key, or None if the file does not exist.
+        """
+        try:
+            stat_result = os.stat(file_path)
+        except OSError:
+            return None
+
+        key_source = f'{os.path.abspath(file_path)}\0{stat_result.st_size}\0{stat_result.st_mtime_ns}\0{desired_height}'
+        return hashlib.sha1(key_source.encode('utf-8', 'surrogateescape')).hexdigest()
+
+    def get(self, key: str) -> Optional[bytes]:
+        """Get the encoded thumbnail stored under a key, or None if it is not stored.
+        """
+        with self._lock:
+            row = self._connection.execute('SELECT data FROM thumbnails WHERE key = ?', (key,)).fetchone()
+            if row is None:
+                return None
+
+            self._pending_accesses[key] = time.time()
+            if len(self._pending_accesses) >= self.ACCESS_FLUSH_COUNT:
+                self._flush_accesses()
+                self._connection.commit()
+
+            return row[0]
+
+    def put(self, key: str, data: bytes) -> None:
+        """Store an encoded thumbnail under a key, evicting the least recently used ones if the store is full.
+
+        Thumbnails larger than the whole store are not stored.
+        """
+        if len(data) > self.max_size:
+            return
+
+        with self._lock:
+            self._flush_accesses()
+            row = self._connection.execute('SELECT size FROM thumbnails WHERE key = ?', (key,)).fetchone()
+            if row is not None:
+                self._total_size -= row[0]
+
+            self._connection.execute(
+                'INSERT OR REPLACE INTO thumbnails (key, data, size, last_access) VALUES (?, ?, ?, ?)',
+                (key, sqlite3.Binary(data), len(data), time.time())
+            )
+            self._total_size += len(data)
+
+            if self._total_size > self.max_size:
+                self._evict(int(self.max_size * self.LOW_WATER_RATIO))
+            self._connection.commit()
+
+    def clear(self) -> None:
+        """Remove all stored thumbnails.
+        """
+        with self._lock:
+            self._pending_accesses.clear()
+            self._connection.execute('DELETE FROM thumbnails')
+            self._connection.commit()
+            self._total_size = 0
+
+    def close(self) -> None:
+        """Write the buffered access times and close the store.
+        """
+        with self._lock:
+            if self._connection is None:
+                return
+            self._flush_accesses()
+            self._connection.commit()
+            self._connection.close()
+            self._connection = None
+
+    # Class Properties
+    # ----------------
+    @property
+    def total_size(self) -> int:
+        """Get the total size of the stored thumbnails, in bytes.
+        """
+        return self._total_size
+
+    @property
+    def item_count(self) -> int:
+        """Get the number of stored thumbnails.
+        """
+        with self._lock:
+            return self._connection.execute('SELECT COUNT(*) FROM thumbnails').fetchone()[0]
+
+    # Private Methods
+    # ---------------
+    def _flush_accesses(self) -> None:
+        """Write the buffered access times. Must be called with the lock held.
+        """
+        if not self._pending_accesses:
+            return
+
+        self._connection.executemany(
+            'UPDATE thumbnails SET last_access = ? WHERE key = ?',
+            [(access_time, key) for key, access_time in self._pending_accesses.items()]
+        )
+        self._pending_accesses.clear()
+
+    def _evict(self, target_size: int) -> None:
+        """Evict the least recently used thumbnails until the total size is at most `target_size`.
+        Must be called with the lock held.
+        """
+        cursor = self._connection.execute('SELECT key, size FROM thumbnails ORDER BY last_access, rowid')
+        evicted_keys = []
+        for key, size in cursor:
+            if self._total_size <= target_size:
+                break
+            evicted_keys.append((key,))
+            self._total_size -= size
+        cursor.close()
+
+        self._connection.executemany('DELETE FROM thumbnails WHERE key = ?', evicted_keys)
@@ -24,7 +24,7 @@ from tablerqicon import TablerQIcon
 import blackboard as bb
 from blackboard import widgets
 from blackboard.widgets.momentum_scroll_widget import MomentumScrollArea
-from blackboard.widgets.filter_widget import FilterWidget, MultiSelectFilterWidget
+from blackboard.widgets.filter_widget import FilterWidget, MultiSelectFilterWidget, TextFilterWidget
 
 
 # Class Definitions
@@ -915,6 +915,10 @@ class DatabaseViewWidget(DataViewWidget):
                 field_type=field_info.type,
             )
 
+            # Search fields of the full-text index through the index instead of scanning with LIKE
+            if isinstance(filter_widget, TextFilterWidget) and column_name in self._base_model.get_fts_fields():
+                filter_widget.set_full_text_search_enabled()
+
         if filter_widget:
             self.add_filter_widget(filter_widget)
 
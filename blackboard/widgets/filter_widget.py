@@ -508,6 +508,8 @@ class FilterWidget(QtWidgets.QWidget):
         self._initial_focus_widget: QtWidgets.QWidget = None
         self._saved_state = dict()
         self._filter_mode: 'FilterMode' = FilterMode.STANDARD
+        # The condition selected initially and when clearing the filter
+        self._default_operation = self.DEFAULT_OPERATION
 
     def __init_ui(self):
         """Initialize the UI of the widget.
@@ -566,7 +568,7 @@ class FilterWidget(QtWidgets.QWidget):
         # Update the condition combo box
         for condition in self.CONDITIONS:
             self.condition_combo_box.addItem(condition.display_name, condition)
-        self.condition_combo_box.setCurrentText(self.DEFAULT_OPERATION.display_name)
+        self.condition_combo_box.setCurrentText(self._default_operation.display_name)
 
         self.clear_button = QtWidgets.QToolButton(self, icon=self.tabler_icon.clear_all, toolTip="Clear all")
 
@@ -807,8 +809,8 @@ class FilterWidget(QtWidgets.QWidget):
     def clear_filter(self):
         """Clear the filter condition. Must be implemented in subclasses.
         """
-        self.condition_combo_box.setCurrentText(self.DEFAULT_OPERATION.display_name)
-        self.save_state('condition', self.DEFAULT_OPERATION.display_name)
+        self.condition_combo_box.setCurrentText(self._default_operation.display_name)
+        self.save_state('condition', self._default_operation.display_name)
 
     def get_value(self) -> Any:
         """Get the filter values. Must be implemented in subclasses.
@@ -1141,7 +1143,7 @@ class TextFilterWidget(FilterWidget):
     def discard_change(self):
         """Revert the widget to its previously saved state.
         """
-        saved_condition = self.load_state('condition', self.DEFAULT_OPERATION.display_name)
+        saved_condition = self.load_state('condition', self._default_operation.display_name)
         self.condition_combo_box.setCurrentText(saved_condition)
 
         self.text_edit.setText(self.load_state('text', ""))
@@ -1158,6 +1160,18 @@ class TextFilterWidget(FilterWidget):
         
         return self.text_edit.text()
 
+    def set_full_text_search_enabled(self, enabled: bool = True):
+        """Offer the full-text 'Matches' condition and use it by default, for fields in a full-text index.
+        """
+        match_index = self.condition_combo_box.findData(FilterOperation.MATCH)
+        if enabled and match_index == -1:
+            self.condition_combo_box.insertItem(0, FilterOperation.MATCH.display_name, FilterOperation.MATCH)
+        elif not enabled and match_index != -1:
+            self.condition_combo_box.removeItem(match_index)
+
+        self._default_operation = FilterOperation.MATCH if enabled else self.DEFAULT_OPERATION
+        self.condition_combo_box.setCurrentText(self._default_operation.display_name)
+
     def clear_filter(self):
         """Clear all filter settings and reset to the default state.
         """
@@ -7,6 +7,7 @@ from typing import Any, Dict, List, Union, Tuple, Optional, Generator, Iterable
 import uuid
 from numbers import Number
 from collections import defaultdict
+from collections.abc import Mapping
 from functools import partial
 
 # Third Party Imports
@@ -41,12 +42,12 @@ class TreeWidgetItem(QtWidgets.QTreeWidgetItem):
     # Initialization and Setup
     # ------------------------
     def __init__(self, parent: Union[QtWidgets.QTreeWidget, QtWidgets.QTreeWidgetItem], 
-                 item_data: Union[Dict[str, Any], List[Any]] = None, item_id: Any = None):
+                 item_data: Union[Mapping[str, Any], List[Any]] = None, item_id: Any = None):
         """Initialize with the given parent and item data.
 
         Args:
             parent (Union[QtWidgets.QTreeWidget, QtWidgets.QTreeWidgetItem]): Parent widget or item.
-            item_data (Union[Dict[str, Any], List[str]], optional): Data for the item, as a list of values or a dictionary with keys matching the headers of the parent widget. Defaults to `None`.
+            item_data (Union[Mapping[str, Any], List[str]], optional): Data for the item, as a list of values or a mapping, e.g. a dictionary, with keys matching the headers of the parent widget. Defaults to `None`.
             item_id (Any, optional): The ID of the item. Defaults to `None`.
         """
         # Store the item's ID
@@ -55,7 +56,7 @@ class TreeWidgetItem(QtWidgets.QTreeWidgetItem):
         # Determine the format of the data (list or dict) and prepare it for the item
         if isinstance(item_data, list):
             item_values = item_data
-        elif isinstance(item_data, dict):
+        elif isinstance(item_data, Mapping):
             # Retrieve column names from the parent widget
             column_names = TreeUtil.get_column_names(parent)
             # Match data to columns
@@ -525,7 +526,7 @@ class GroupableTreeWidget(MomentumScrollTreeWidget):
         self.highlight_item_delegate.highlight_changed.connect(self.update)
 
         # Connect FetchManager signals
-        self.fetch_manager.data_fetched.connect(self.update_item)
+        self.fetch_manager.data_batch_fetched.connect(self.update_items)
         self.fetch_manager.loaded_all.connect(self.fetch_complete.emit)
 
         self.verticalScrollBar().valueChanged.connect(self._track_scroll_position)
@@ -967,6 +968,25 @@ class GroupableTreeWidget(MomentumScrollTreeWidget):
 
         return tree_item
 
+    def update_items(self, data_dicts: List[Dict[str, Any]], update_key: Optional[Union[str, List[str]]] = None,
+                     add_if_not_exist: bool = True) -> List[Optional[TreeWidgetItem]]:
+        """Update or add several items at once, repainting the tree widget once for all of them.
+
+        Args:
+            data_dicts (List[Dict[str, Any]]): The data of each item.
+            update_key (Optional[Union[str, Tuple[str]]]): The key(s) to use for identifying the items to update.
+                If None, the primary key is used.
+            add_if_not_exist (bool): If True, add new items for data that doesn't match an existing item. Defaults to True.
+
+        Returns:
+            List[Optional[TreeWidgetItem]]: The updated or newly added tree items, in the order of `data_dicts`.
+        """
+        self.setUpdatesEnabled(False)
+        try:
+            return [self.update_item(data_dict, update_key, add_if_not_exist) for data_dict in data_dicts]
+        finally:
+            self.setUpdatesEnabled(True)
+
     def group_by_column(self, column: Union[int, str]):
         """Group the items in the tree widget by the values in the specified column.
 
@@ -1228,20 +1248,34 @@ class GroupableTreeWidget(MomentumScrollTreeWidget):
         visible_height = self.viewport().height()
         estimated_items = (visible_height // self._row_height) + 1 if self._row_height > 0 else self.fetch_manager.DEFAULT_BATCH_SIZE
 
-        # Ensure the batch size is at least the default batch size
-        return max(estimated_items, self.fetch_manager.DEFAULT_BATCH_SIZE)
+        # Ensure the batch size is at least the fetch size chosen from the measured costs
+        return max(estimated_items, self.fetch_manager.batch_controller.fetch_size)
 
     def _track_scroll_position(self, value: int):
-        """Track the scroll position and fetch more data if the threshold is reached.
+        """Track the scroll position and fetch more data once it is within the prefetch distance of the end.
+
+        The prefetch distance grows with the scroll velocity, see `AdaptiveBatchController.prefetch_distance`.
 
         Args:
             value (int): The current scroll value.
         """
+        scroll_units_per_row = self._get_scroll_units_per_row()
+        batch_controller = self.fetch_manager.batch_controller
+        batch_controller.record_scroll(value / scroll_units_per_row)
+
         if not self.fetch_manager.has_more_items_to_fetch:
             return
-        if value >= self.verticalScrollBar().maximum() - self.fetch_manager.THRESHOLD_TO_FETCH_MORE:
+        threshold = max(self.fetch_manager.THRESHOLD_TO_FETCH_MORE, batch_controller.prefetch_distance * scroll_units_per_row)
+        if value >= self.verticalScrollBar().maximum() - threshold:
             self.fetch_manager.fetch_more()
 
+    def _get_scroll_units_per_row(self) -> int:
+        """Get the number of steps of the vertical scroll bar per row.
+        """
+        if self.verticalScrollMode() == QtWidgets.QAbstractItemView.ScrollMode.ScrollPerPixel:
+            return max(self._row_height, 1)
+        return 1
+
     def _restore_color_adaptive_column(self, columns: List[int]):
         """Restore the color adaptive columns.
 
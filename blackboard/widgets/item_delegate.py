@@ -17,8 +17,8 @@ from qtpy import QtCore, QtGui, QtWidgets
 # -------------
 from blackboard.utils.color_utils import ColorUtils
 from blackboard.utils.file_path_utils import SequenceFileUtil
-from blackboard.utils.qimage_utils import ThumbnailUtils, ThumbnailLoader
-from blackboard.utils.thread_pool import ThreadPoolManager, RunnableTask
+from blackboard.utils.qimage_utils import ThumbnailUtils, ThumbnailPipeline
+from blackboard.utils.thread_pool import TaskPriority
 from blackboard.utils.date_utils import DateUtil
 from blackboard.utils.tree_utils import TreeItemUtil
 
@@ -482,8 +482,10 @@ class ThumbnailDelegate(QtWidgets.QStyledItemDelegate):
         self._thumbnail_column = None
         self._source_column = None
         self._sequence_range_column = None
-        self._loading_threads = {}
-        self._loaded_thumbnails = {}
+
+        # Thumbnails are decoded on worker threads and converted to pixmaps by the shared pipeline
+        self._thumbnail_pipeline = ThumbnailPipeline.instance()
+        self._thumbnail_pipeline.thumbnail_loaded.connect(self.on_thumbnail_loaded)
 
     # Public Methods
     # --------------
@@ -550,21 +552,10 @@ class ThumbnailDelegate(QtWidgets.QStyledItemDelegate):
             file_path (str): The path to the file.
 
         Returns:
-            QtGui.QPixmap: The loaded thumbnail image.
+            QtGui.QPixmap: The loaded thumbnail image, or None while it is loading.
         """
-        if file_path in self._loading_threads:
-            return
-
-        if file_path not in self._loaded_thumbnails:
-            worker = ThumbnailLoader(file_path, self.thumbnail_height)
-            worker.thumbnail_loaded.connect(self.on_thumbnail_loaded)
-            self._loading_threads[file_path] = worker
-
-            # Use the shared thread pool to start the worker
-            ThreadPoolManager.thread_pool().start(worker.run)
-            return
-
-        return self._loaded_thumbnails[file_path]
+        # Only visible rows are painted, so their thumbnails go ahead of background work
+        return self._thumbnail_pipeline.request(file_path, self.thumbnail_height, priority=TaskPriority.VISIBLE)
 
     def _paint_pixmap(self, painter: QtGui.QPainter, rect: QtCore.QRect, pixmap: QtGui.QPixmap):
         """Paint the pixmap.
@@ -601,15 +592,18 @@ class ThumbnailDelegate(QtWidgets.QStyledItemDelegate):
         # Restore the painter's state
         painter.restore()
 
-    def on_thumbnail_loaded(self, file_path: str, pixmap: QtGui.QPixmap):
+    def on_thumbnail_loaded(self, file_path: str, desired_height: int, pixmap: QtGui.QPixmap):
         """Handle the event when a thumbnail is loaded.
 
         Args:
             file_path (str): The path to the file.
+            desired_height (int): The height of the thumbnail.
             pixmap (QtGui.QPixmap): The loaded thumbnail image.
         """
-        self._loaded_thumbnails[file_path] = pixmap
-        del self._loading_threads[file_path]
+        if desired_height != self.thumbnail_height or self.parent() is None:
+            return
+
+        # Repaints are coalesced by the viewport, so many thumbnails loaded at once cost a single paint
         self.parent().viewport().update()
 
     def get_sibling_data(self, index: QtCore.QModelIndex, column: int, data_role: QtCore.Qt.ItemDataRole = QtCore.Qt.ItemDataRole.DisplayRole):
@@ -9,8 +9,8 @@ from tablerqicon import TablerQIcon
 
 # Local Imports
 # -------------
-from blackboard.utils.thread_pool import ThreadPoolManager
-from blackboard.utils.qimage_utils import ThumbnailLoader, ThumbnailUtils
+from blackboard.utils.thread_pool import TaskPriority
+from blackboard.utils.qimage_utils import ThumbnailPipeline, ThumbnailUtils
 from blackboard.widgets.tool_bar import OverlayToolBar
 
 
@@ -46,7 +46,7 @@ class ThumbnailWidget(QtWidgets.QWidget):
         """Initialize the attributes.
         """
         self._pixmap = None
-        self._loading_thread = None
+        self._is_loading = False
 
     def __init_ui(self):
         """Initialize the UI of the widget.
@@ -122,23 +122,29 @@ class ThumbnailWidget(QtWidgets.QWidget):
     # Private Methods
     # ---------------
     def _load_thumbnail(self, use_background_thread: bool = True):
-        if self._loading_thread is not None:
+        if self._is_loading:
             return
 
-        # Create a worker for loading the thumbnail
-        self._loading_thread = ThumbnailLoader(self.file_path, self.desired_height)
-        self._loading_thread.thumbnail_loaded.connect(self._on_thumbnail_loaded)
+        if not use_background_thread:
+            # Load the thumbnail on the GUI thread if not using a background thread
+            self._pixmap = ThumbnailUtils.get_pixmap_thumbnail(self.file_path, self.desired_height)
+            self.update()
+            return
 
-        if use_background_thread:
-            ThreadPoolManager.thread_pool().start(self._loading_thread.run)
-        else:
-            # Run the thumbnail loading if not using a background thread
-            self._loading_thread.run()
+        # Decode on a worker thread, sharing the decode with other views asking for the same thumbnail
+        pixmap = ThumbnailPipeline.instance().request(
+            self.file_path, self.desired_height, priority=TaskPriority.VISIBLE, callback=self._on_thumbnail_loaded
+        )
+        if pixmap is not None:
+            self._pixmap = pixmap
+            self.update()
+            return
+
+        self._is_loading = True
 
-    def _on_thumbnail_loaded(self, _file_path: str, pixmap: QtGui.QPixmap):
+    def _on_thumbnail_loaded(self, pixmap: QtGui.QPixmap):
         self._pixmap = pixmap
-        self._loading_thread.deleteLater()
-        self._loading_thread = None
+        self._is_loading = False
         self.update()
 
     def _paint_thumbnail(self, painter: QtGui.QPainter):
@@ -173,7 +179,7 @@ class ThumbnailWidget(QtWidgets.QWidget):
 
     def paintEvent(self, event: QtGui.QPaintEvent):
         painter = QtGui.QPainter(self)
-        if self._loading_thread is None and self._pixmap and not self._pixmap.isNull():
+        if not self._is_loading and self._pixmap and not self._pixmap.isNull():
             self._paint_thumbnail(painter)
         else:
             self._paint_placeholder(painter)
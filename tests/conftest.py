@@ -0,0 +1,11 @@
+import pytest
+from qtpy import QtWidgets
+from blackboard.utils.thread_pool import ThreadPoolManager
+
+
+@pytest.fixture(scope="session")
+def app():
+    # Keep one application alive for the session, as destroying it deletes the shared thread pool
+    app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+    yield app
+    ThreadPoolManager.thread_pool().waitForDone()
@@ -0,0 +1,95 @@
+import time
+import pytest
+from qtpy import QtCore
+from blackboard.utils.data_fetch_manager import AdaptiveBatchController, DataFetcher
+from blackboard.utils.file_index import FileIndex
+from blackboard.utils.file_path_utils import FilePatternQuery
+
+
+def test_adaptive_batch_controller_fits_slices_in_frame_budget():
+    controller = AdaptiveBatchController(frame_budget=8.0, initial_batch_size=50)
+
+    # Cheap items grow the slice at most twofold per slice
+    controller.record_insertion(50, 1.0)
+    assert controller.slice_size == 100
+    controller.record_insertion(100, 2.0)
+    assert controller.slice_size == 200
+
+    # A slice over the budget shrinks the next one right away
+    for _ in range(10):
+        controller.record_insertion(controller.slice_size, controller.slice_size * 1.0)
+    assert controller.slice_size <= 10
+
+    telemetry = controller.telemetry
+    assert len(telemetry) == 12
+    assert [record.item_count for record in telemetry[:2]] == [50, 100]
+    assert telemetry[-1].slice_size == controller.slice_size
+
+def test_adaptive_batch_controller_prefetches_ahead_of_scrolling():
+    controller = AdaptiveBatchController(frame_budget=8.0, initial_batch_size=50)
+    controller.record_insertion(100, 10.0)
+    controller.record_fetch(100, 50.0)
+    assert controller.prefetch_distance == 0
+    assert controller.fetch_size == 80
+
+    # Scroll 100 rows per second, so a fetch covers a second of scrolling and starts ahead of it
+    for step in range(20):
+        controller.record_scroll(step * 10, timestamp=step * 0.1)
+    assert round(controller.scroll_velocity) == 100
+    assert controller.fetch_size == 100
+    assert controller.prefetch_distance == 9
+
+    # Scrolling back does not count, and the velocity is reset after an idle time
+    controller.record_scroll(0, timestamp=2.1)
+    assert controller.scroll_velocity < 100
+    controller.record_scroll(10, timestamp=5.0)
+    assert controller.scroll_velocity == 0.0
+
+def test_data_fetcher_inserts_items_in_slices(app):
+
+    data_fetcher = DataFetcher()
+    data_fetcher.batch_controller.record_insertion(10, 10.0)
+    slices, telemetry, loaded_all = [], [], []
+    data_fetcher.data_batch_fetched.connect(lambda data_slice: (slices.append(data_slice), time.sleep(0.001 * len(data_slice))))
+    data_fetcher.telemetry_recorded.connect(telemetry.append)
+    data_fetcher.loaded_all.connect(lambda: loaded_all.append(True))
+
+    data_fetcher.set_generator({"id": index} for index in range(300))
+    data_fetcher.fetch_all()
+
+    deadline = time.perf_counter() + 10
+    while not loaded_all and time.perf_counter() < deadline:
+        app.processEvents(QtCore.QEventLoop.ProcessEventsFlag.AllEvents, 50)
+
+    # Every item is inserted, in order, in slices sized to the frame budget, before `loaded_all`
+    assert loaded_all
+    assert sum(slices, []) == [{"id": index} for index in range(300)]
+    assert len(slices) == len(telemetry) > 1
+    assert max(len(data_slice) for data_slice in slices) <= 20
+
+@pytest.mark.parametrize("is_indexed", [False, True])
+def test_data_fetcher_delivers_query_results(app, tmp_path, is_indexed):
+    for shot_name in ("shot010", "shot020"):
+        (tmp_path / "shots" / shot_name).mkdir(parents=True)
+        (tmp_path / "shots" / shot_name / "comp.nk").write_text("comp")
+    file_index = FileIndex(str(tmp_path / "file_index.db")) if is_indexed else None
+
+    data_fetcher = DataFetcher()
+    fetched_items, loaded_all = [], []
+    data_fetcher.data_fetched.connect(fetched_items.append)
+    data_fetcher.loaded_all.connect(lambda: loaded_all.append(True))
+
+    # Query results are mappings that compute their fields on access, not dictionaries
+    data_fetcher.set_generator(FilePatternQuery(str(tmp_path / "shots" / "{shot_name}"), file_index=file_index).query_files())
+    data_fetcher.fetch_all()
+
+    deadline = time.perf_counter() + 10
+    while not loaded_all and time.perf_counter() < deadline:
+        app.processEvents(QtCore.QEventLoop.ProcessEventsFlag.AllEvents, 50)
+
+    assert loaded_all
+    assert sorted((item['shot_name'], item['file_name']) for item in fetched_items) == [
+        ("shot010", "comp.nk"), ("shot020", "comp.nk"),
+    ]
+    if file_index is not None:
+        file_index.close()
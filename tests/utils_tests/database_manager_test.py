@@ -1,7 +1,9 @@
 import pytest
+import sqlite3
+import numpy as np
 from pathlib import Path
 from typing import Generator
-from blackboard.utils.database import DatabaseManager
+from blackboard.utils.database import DatabaseManager, IndexPolicy
 
 @pytest.fixture(scope="function")
 def db_manager(tmp_path: Path) -> Generator[DatabaseManager, None, None]:
@@ -97,3 +99,393 @@ def test_delete_table(db_manager: DatabaseManager):
 #     book_id = books_model.insert_record({"title": "Book 1"})
 
 #     ...
+
+def test_query_many_to_many_batched_matches_per_row(db_manager: DatabaseManager):
+    shots_model = db_manager.create_table("shots", {"id": "INTEGER PRIMARY KEY", "name": "TEXT"})
+    tags_model = db_manager.create_table("tags", {"id": "INTEGER PRIMARY KEY", "name": "TEXT"})
+    db_manager.create_junction_table(from_table="shots", to_table="tags", track_field_name="tags")
+
+    for shot_index in range(12):
+        shots_model.insert_record({"name": f"shot_{shot_index:03d}"})
+    for tag_index in range(4):
+        tags_model.insert_record({"name": f"tag_{tag_index}"})
+
+    # Leave some shots without tags to check that untagged rows keep their shape
+    for shot_id in range(1, 13):
+        if shot_id % 3 == 0:
+            continue
+        shots_model.update_record({"tags": [tag_id for tag_id in range(1, 5) if (shot_id + tag_id) % 2]},
+                                  pk_value=shot_id, handle_m2m=True)
+
+    per_row = list(shots_model.query(handle_m2m=True, eager_m2m=False))
+    batched = list(shots_model.query(handle_m2m=True, m2m_batch_size=5))
+
+    assert batched == per_row
+    assert batched[0]["tags"] == [2, 4]
+    assert "tags" not in batched[2]
+
+    # Columns keep the many-to-many field even in chunks that start or end with untagged rows
+    chunks = list(shots_model.query(handle_m2m=True, result_format="columnar", chunk_size=3))
+    assert all(list(chunk) == ["id", "name", "tags"] and len(chunk["tags"]) == len(chunk["id"]) for chunk in chunks)
+    tags = np.concatenate([chunk["tags"] for chunk in chunks]).tolist()
+    assert tags == [row.get("tags", []) for row in batched]
+
+def test_query_columnar_many_to_many_within_variable_limit(db_manager: DatabaseManager):
+    shots_model = db_manager.create_table("shots", {"id": "INTEGER PRIMARY KEY", "name": "TEXT"})
+    tags_model = db_manager.create_table("tags", {"id": "INTEGER PRIMARY KEY", "name": "TEXT"})
+    db_manager.create_junction_table(from_table="shots", to_table="tags", track_field_name="tags")
+    tags_model.insert_record({"name": "hero"})
+    for shot_index in range(30):
+        shots_model.insert_record({"name": f"shot_{shot_index:03d}"})
+        shots_model.update_record({"tags": [1]}, pk_value=shot_index + 1, handle_m2m=True)
+
+    # Lower the limit of SQL variables, as on SQLite builds before 3.32, below the size of a columnar chunk
+    for connection in (db_manager.connection, db_manager.db_connection.get_read_connection()):
+        connection.setlimit(sqlite3.SQLITE_LIMIT_VARIABLE_NUMBER, 10)
+
+    chunks = list(shots_model.query(handle_m2m=True, result_format="columnar", chunk_size=25, m2m_batch_size=5))
+    assert [len(chunk["id"]) for chunk in chunks] == [25, 5]
+    assert np.concatenate([chunk["tags"] for chunk in chunks]).tolist() == [[1]] * 30
+
+def test_schema_catalog_avoids_repeated_pragmas(db_manager: DatabaseManager):
+    shots_model = db_manager.create_table("shots", {"id": "INTEGER PRIMARY KEY", "name": "TEXT"})
+    tags_model = db_manager.create_table("tags", {"id": "INTEGER PRIMARY KEY", "name": "TEXT"})
+    db_manager.create_junction_table(from_table="shots", to_table="tags", track_field_name="tags")
+    shots_model.insert_record({"name": "shot_010"})
+    tags_model.insert_record({"name": "hero"})
+    shots_model.update_record({"tags": [1]}, pk_value=1, handle_m2m=True)
+
+    # Warm up the catalog and disable the periodic `PRAGMA schema_version` check
+    list(shots_model.query(handle_m2m=True))
+    db_manager.db_connection.schema_catalog.check_interval = None
+
+    statements = []
+    db_manager.connection.set_trace_callback(statements.append)
+    rows = list(shots_model.query(handle_m2m=True))
+    db_manager.connection.set_trace_callback(None)
+
+    assert rows == [{"id": 1, "name": "shot_010", "tags": [1]}]
+    assert not [statement for statement in statements if "PRAGMA" in statement.upper()]
+
+def test_schema_catalog_invalidated_by_schema_changes(db_manager: DatabaseManager):
+    test_model = db_manager.create_table("test_table", {"id": "INTEGER PRIMARY KEY", "name": "TEXT"})
+    assert test_model.get_field_names() == ["id", "name"]
+
+    test_model.add_field("age", "INTEGER")
+    assert test_model.get_field_names() == ["id", "name", "age"]
+
+    test_model.delete_field("name")
+    assert test_model.get_field_names() == ["id", "age"]
+
+    # Schema changes made outside the model are picked up through `PRAGMA schema_version`
+    db_manager.connection.execute("ALTER TABLE test_table ADD COLUMN note TEXT")
+    db_manager.db_connection.schema_catalog.validate(force=True)
+    assert test_model.get_field_names() == ["id", "age", "note"]
+
+def test_insert_many_returns_rowids(db_manager: DatabaseManager):
+    test_model = db_manager.create_table("test_table", {"id": "INTEGER PRIMARY KEY", "name": "TEXT"})
+    test_model.insert_record({"name": "existing"})
+
+    rowids = test_model.insert_many(({"name": f"name_{index}"} for index in range(25)), chunk_size=10)
+    assert rowids == list(range(2, 27))
+
+    rowids = test_model.insert_many([{"id": 100, "name": "explicit"}, {"id": None, "name": "generated"}])
+    assert rowids == [100, 101]
+
+    rows = list(test_model.query(fields=["id", "name"], conditions={"id": {"in": rowids}}, as_dict=False))
+    assert rows == [(100, "explicit"), (101, "generated")]
+
+def test_update_upsert_and_delete_many(db_manager: DatabaseManager):
+    test_model = db_manager.create_table("test_table", {"id": "INTEGER PRIMARY KEY", "name": "TEXT"})
+    rowids = test_model.insert_many([{"name": f"name_{index}"} for index in range(5)])
+
+    assert test_model.update_many([{"id": rowid, "name": f"renamed_{rowid}"} for rowid in rowids[:2]], pk_field="id") == 2
+    assert test_model.upsert_many([{"id": rowids[2], "name": "upserted"}, {"id": 50, "name": "new"}]) == 2
+    assert test_model.delete_many(rowids[3:], pk_field="id") == 2
+
+    rows = list(test_model.query(fields=["id", "name"], as_dict=False))
+    assert rows == [(1, "renamed_1"), (2, "renamed_2"), (3, "upserted"), (50, "new")]
+
+def test_transaction_defers_commit_and_rolls_back(db_manager: DatabaseManager):
+    test_model = db_manager.create_table("test_table", {"id": "INTEGER PRIMARY KEY", "name": "TEXT"})
+
+    with pytest.raises(RuntimeError):
+        with db_manager.transaction():
+            test_model.insert_record({"name": "rolled back"})
+            test_model.insert_many([{"name": "also rolled back"}])
+            raise RuntimeError
+
+    with db_manager.transaction():
+        test_model.insert_record({"name": "kept"})
+        try:
+            with db_manager.transaction():
+                test_model.insert_record({"name": "nested rolled back"})
+                raise RuntimeError
+        except RuntimeError:
+            pass
+
+    assert [row["name"] for row in test_model.query(fields=["name"])] == ["kept"]
+
+    # Rolled back schema changes are not kept in the schema catalog
+    with pytest.raises(RuntimeError):
+        with db_manager.transaction():
+            test_model.add_field("age", "INTEGER")
+            assert "age" in test_model.get_field_names()
+            raise RuntimeError
+
+    assert test_model.get_field_names() == ["id", "name"]
+    assert len(list(test_model.query())) == 1
+
+def test_writes_of_other_threads_wait_for_transaction(db_manager: DatabaseManager):
+    import threading
+
+    test_model = db_manager.create_table("test_table", {"id": "INTEGER PRIMARY KEY", "name": "TEXT"})
+    writer_thread = threading.Thread(target=test_model.insert_record, args=({"name": "other thread"},))
+
+    with pytest.raises(RuntimeError):
+        with db_manager.transaction():
+            test_model.insert_record({"name": "rolled back"})
+            writer_thread.start()
+            writer_thread.join(timeout=0.2)
+            # The write of the other thread is not part of this transaction
+            assert writer_thread.is_alive()
+            raise RuntimeError
+
+    writer_thread.join(timeout=5)
+    assert [row["name"] for row in test_model.query(fields=["name"])] == ["other thread"]
+
+def test_read_connections_are_per_thread(db_manager: DatabaseManager):
+    from concurrent.futures import ThreadPoolExecutor
+
+    test_model = db_manager.create_table("test_table", {"id": "INTEGER PRIMARY KEY", "name": "TEXT"})
+    test_model.insert_many([{"name": f"name_{index}"} for index in range(100)])
+
+    database = db_manager.db_connection
+    assert database.connection.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+
+    def read_rows():
+        return database.get_read_connection(), len(list(test_model.query()))
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        results = list(executor.map(lambda _: read_rows(), range(4)))
+
+    assert all(row_count == 100 for _connection, row_count in results)
+    assert database.connection not in [connection for connection, _row_count in results]
+
+    # Reads inside a transaction on the same thread see uncommitted writes
+    with db_manager.transaction():
+        test_model.insert_record({"name": "uncommitted"})
+        assert database.get_read_connection() is database.connection
+        assert len(list(test_model.query())) == 101
+
+def test_query_page_matches_full_query(db_manager: DatabaseManager):
+    test_model = db_manager.create_table("test_table", {"id": "INTEGER PRIMARY KEY", "name": "TEXT", "status": "TEXT"})
+    test_model.insert_many([
+        {"name": f"name_{index % 7}", "status": None if index % 5 == 0 else f"status_{index % 3}"}
+        for index in range(53)
+    ])
+
+    for order_by in ({}, {"name": "ASC"}, {"name": "DESC", "status": "ASC"}, {"status": "DESC"}, {"name": "ASC", "status": "DESC"}):
+        expected_rows = list(test_model.query(fields=["name", "status"], order_by={**order_by, "id": "ASC"}))
+
+        for use_keyset in (True, False):
+            rows, cursor = test_model.query_page(page_size=10, fields=["name", "status"], order_by=order_by, use_keyset=use_keyset)
+            while cursor is not None:
+                page_rows, cursor = test_model.query_page(cursor, page_size=10, fields=["name", "status"], order_by=order_by, use_keyset=use_keyset)
+                rows.extend(page_rows)
+
+            assert rows == [{"name": row["name"], "status": row["status"]} for row in expected_rows]
+
+def test_query_compiler_reuses_templates(db_manager: DatabaseManager):
+    test_model = db_manager.create_table("test_table", {"id": "INTEGER PRIMARY KEY", "name": "TEXT", "status": "TEXT"})
+    test_model.insert_many([{"name": f"name_{index}", "status": "wip" if index % 2 else "done"} for index in range(10)])
+
+    query_compiler = db_manager.db_connection.query_compiler
+    query_compiler.clear()
+
+    def query_ids(conditions, limit=None):
+        return [row["id"] for row in test_model.query(fields=["id"], conditions=conditions, limit=limit)]
+
+    assert query_ids({"status": "wip"}) == [2, 4, 6, 8, 10]
+    assert query_ids({"status": "done"}) == [1, 3, 5, 7, 9]
+    assert (query_compiler.hits, query_compiler.misses) == (1, 1)
+
+    # A different operator or number of IN values is a different shape
+    assert query_ids({"id": {"in": [1, 2]}}) == [1, 2]
+    assert query_ids({"id": {"in": [3, 4, 5]}}) == [3, 4, 5]
+    assert query_ids({"id": {"in": [6, 7, 8]}}, limit=2) == [6, 7]
+    assert query_ids({"id": {"in": [1, 2, 3]}}, limit=1) == [1]
+    assert (query_compiler.hits, query_compiler.misses) == (2, 4)
+
+    with pytest.raises(ValueError):
+        query_ids({"id": {"in": "123"}})
+
+def test_fts_index_search_and_match(db_manager: DatabaseManager):
+    test_model = db_manager.create_table("test_table", {"id": "INTEGER PRIMARY KEY", "name": "TEXT", "description": "TEXT"})
+    test_model.insert_many([
+        {"name": "forest_010", "description": "night forest with fog"},
+        {"name": "forest_020", "description": "forest"},
+        {"name": "city_010", "description": "rainy street at night"},
+    ])
+    test_model.create_fts_index(["name", "description"])
+    assert test_model.get_fts_fields() == ["name", "description"]
+
+    assert [row["id"] for row in test_model.search("forest")] == [2, 1]
+    assert sorted(row["id"] for row in test_model.search("nig")) == [1, 3]
+    assert [row["id"] for row in test_model.search('"forest with"')] == [1]
+    assert [row["id"] for row in test_model.search("city", fields=["description"])] == []
+
+    # Triggers keep the index in sync with inserts, updates and deletes
+    test_model.insert_record({"name": "city_020", "description": "forest edge"})
+    test_model.update_record({"name": "desert_020", "description": "desert"}, pk_value=2)
+    test_model.delete_record(1, pk_field="id")
+    assert [row["id"] for row in test_model.search("forest")] == [4]
+
+    # The match operation uses the index within regular queries
+    rows = test_model.query(fields=["id"], conditions={"description": {"match": '"night"'}})
+    assert [row["id"] for row in rows] == [3]
+
+    # Search text is escaped and the last word is a prefix, while raw queries use the FTS5 syntax
+    test_model.insert_record({"name": "comp-v2", "description": "foreground comp"})
+    def match_ids(operation, text):
+        return sorted(row["id"] for row in test_model.query(fields=["id"], conditions={"description": {operation: text}}))
+    assert match_ids("match", "fore") == [4, 5]
+    assert match_ids("match", "comp-v2") == []
+    assert match_ids("match", "") == []
+    assert sorted(row["id"] for row in test_model.query(fields=["id"], conditions={"name": {"match": "comp-v2"}})) == [5]
+    assert match_ids("match_raw", "forest NOT edge") == []
+    assert match_ids("match_raw", "fore* NOT edge") == [5]
+
+    # Rebuilding the table keeps the index
+    test_model.add_field("status", "TEXT")
+    test_model.insert_record({"name": "forest_030", "description": "forest", "status": "wip"})
+    assert sorted(row["id"] for row in test_model.search("forest")) == [4, 6]
+
+    test_model.delete_field("description")
+    assert test_model.get_fts_fields() == ["name"]
+    assert [row["id"] for row in test_model.search("forest")] == [6]
+
+    test_model.drop_fts_index()
+    with pytest.raises(ValueError):
+        list(test_model.search("forest"))
+
+def test_index_advisor_suggests_and_creates_indexes(db_manager: DatabaseManager):
+    db_manager.create_table("shots", {"id": "INTEGER PRIMARY KEY", "name": "TEXT"})
+    db_manager.create_table("tasks", {
+        "id": "INTEGER PRIMARY KEY",
+        "name": "TEXT",
+        "status": "TEXT",
+        "shot": "INTEGER REFERENCES shots(id)",
+    })
+    task_model = db_manager.get_model("tasks")
+    task_model.insert_many([{"name": f"task_{index}", "status": "wip", "shot": index % 5} for index in range(20)])
+
+    list(task_model.query(fields=["name"], conditions={"status": {"in": ["wip", "review"]}}))
+    list(task_model.query(fields=["name"], conditions={"name": {"contains": "task"}}))
+    list(task_model.query(fields=["name", "shot.name"], order_by={"shot": "ASC"}))
+
+    suggestions = {(suggestion.table_name, suggestion.fields) for suggestion in db_manager.get_index_suggestions()}
+    assert suggestions == {("tasks", ("status",)), ("tasks", ("shot",))}
+
+    index_names = db_manager.create_suggested_indexes()
+    assert set(db_manager.get_advised_indexes()) == set(index_names) == {"_idx_tasks_status", "_idx_tasks_shot"}
+    assert db_manager.get_index_suggestions() == []
+
+    # The same queries now use the indexes
+    list(task_model.query(fields=["name"], conditions={"status": {"in": ["wip", "review"]}}))
+    assert db_manager.get_index_suggestions() == []
+
+    db_manager.drop_advised_index("_idx_tasks_status")
+    assert set(db_manager.get_advised_indexes()) == {"_idx_tasks_shot"}
+    with pytest.raises(ValueError):
+        db_manager.drop_advised_index("sqlite_autoindex_tasks_1")
+
+def test_index_advisor_creates_indexes_outside_of_queries(tmp_path: Path):
+    db_manager = DatabaseManager(str(tmp_path / "test_database.db"), index_policy=IndexPolicy.CREATE)
+    task_model = db_manager.create_table("tasks", {"id": "INTEGER PRIMARY KEY", "name": "TEXT", "status": "TEXT"})
+    task_model.insert_many([{"name": f"task_{index}", "status": "wip"} for index in range(20)])
+    index_advisor = db_manager.db_connection.index_advisor
+
+    # The index is created once the transaction running the query releases the write lock
+    with db_manager.db_connection.transaction():
+        assert len(list(task_model.query(fields=["name"], conditions={"status": "wip"}))) == 20
+        assert not index_advisor.wait_for_creations(timeout=0.2)
+        assert db_manager.get_advised_indexes() == {}
+
+    assert index_advisor.wait_for_creations(timeout=5)
+    assert set(db_manager.get_advised_indexes()) == {"_idx_tasks_status"}
+    assert len(list(task_model.query(fields=["name"], conditions={"status": "wip"}))) == 20
+    db_manager.connection.close()
+
+def test_add_and_delete_field_in_place_or_by_rebuild(db_manager: DatabaseManager):
+    model = db_manager.create_table("shots", {"id": "INTEGER PRIMARY KEY", "name": "TEXT", "status": "TEXT"})
+    model.insert_many([{"name": f"shot_{index}", "status": "wip"} for index in range(25)])
+    model.create_fts_index(["name"])
+    db_manager.cursor.execute("CREATE INDEX shots_status ON shots(status)")
+    db_manager.db_connection.commit()
+
+    # Added and dropped in place
+    model.add_field("frame_count", "INTEGER NOT NULL DEFAULT 0")
+    assert model.get_field_names() == ["id", "name", "status", "frame_count"]
+    model.delete_field("status")
+    assert "shots_status" not in db_manager.db_connection.schema_catalog.get_indexes("shots")
+    assert [row["name"] for row in model.query(fields=["name"], limit=2)] == ["shot_0", "shot_1"]
+
+    # A unique field requires a rebuild, which keeps rowids, indexes and the full-text index
+    db_manager.cursor.execute("CREATE INDEX shots_name ON shots(name)")
+    db_manager.db_connection.commit()
+    progress = []
+    model.REBUILD_CHUNK_SIZE = 10
+    model.add_field("code", "TEXT UNIQUE", progress_callback=lambda copied, total: progress.append((copied, total)))
+    assert progress == [(10, 25), (20, 25), (25, 25)]
+    assert "shots_name" in db_manager.db_connection.schema_catalog.get_indexes("shots")
+    assert model.get_fts_fields() == ["name"]
+    assert [row["id"] for row in model.search("shot_24")] == [25]
+
+    model.delete_field("frame_count", force_rebuild=True)
+    assert model.get_field_names() == ["id", "name", "code"]
+    assert len(list(model.query())) == 25
+
+def test_query_columnar_result_format(db_manager: DatabaseManager):
+    db_manager.create_table("shots", {"id": "INTEGER PRIMARY KEY", "name": "TEXT"})
+    db_manager.create_table("tasks", {
+        "id": "INTEGER PRIMARY KEY",
+        "name": "TEXT",
+        "duration": "REAL",
+        "priority": "INTEGER",
+        "frame_count": "INTEGER NOT NULL",
+        "shot": "INTEGER REFERENCES shots(id)",
+    })
+    db_manager.get_model("shots").insert_many([{"name": f"shot_{index}"} for index in range(3)])
+    task_model = db_manager.get_model("tasks")
+    task_model.insert_many([
+        {"name": f"task_{index}", "duration": index / 2, "priority": None if index == 9 else index, "frame_count": index, "shot": index % 3 + 1}
+        for index in range(10)
+    ])
+
+    fields = ["id", "name", "duration", "priority", "frame_count", "shot.id", "shot.name"]
+    chunks = list(task_model.query(fields=fields, result_format="columnar", chunk_size=4))
+    assert [len(chunk["id"]) for chunk in chunks] == [4, 4, 2]
+
+    # The dtype of a column is the same in every chunk, whether or not the chunk has nulls
+    for field in fields:
+        assert len({chunk[field].dtype for chunk in chunks}) == 1
+
+    columns = {field: np.concatenate([chunk[field] for chunk in chunks]) for field in fields}
+    assert columns["id"].dtype == np.int64
+    assert columns["frame_count"].dtype == np.int64
+    assert columns["duration"].dtype == np.float64
+    assert columns["name"].dtype == object
+    # Integer fields that can hold nulls are float64 with NaN for nulls, including joined fields
+    assert columns["priority"].dtype == np.float64
+    assert columns["shot.id"].dtype == np.float64
+    assert np.isnan(columns["priority"][9])
+
+    # The columns hold the same values as the rows
+    rows = list(task_model.query(fields=fields))
+    for field in fields:
+        expected = [row[field] for row in rows]
+        assert [None if value != value else value for value in columns[field].tolist()] == expected
+
+    with pytest.raises(ValueError):
+        list(task_model.query(result_format="arrow"))
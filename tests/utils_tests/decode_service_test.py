@@ -0,0 +1,53 @@
+import multiprocessing
+import queue
+import cv2
+import numpy as np
+import pytest
+from blackboard.utils.decode_service import DecodeService
+
+# Forking keeps the tests fast, the service defaults to spawning its workers
+pytestmark = pytest.mark.skipif('fork' not in multiprocessing.get_all_start_methods(), reason="requires fork")
+
+
+@pytest.fixture
+def image_path(tmp_path):
+    image_data = np.arange(64 * 48 * 3, dtype=np.uint32).reshape(64, 48, 3).astype(np.uint8)
+    file_path = str(tmp_path / 'image.png')
+    cv2.imwrite(file_path, image_data)
+    return file_path
+
+@pytest.fixture
+def decode_service():
+    decode_service = DecodeService(max_workers=2, max_pending=2, small_file_size=0, mp_context='fork')
+    yield decode_service
+    decode_service.shutdown()
+
+def test_decode_service_returns_pixels_from_workers(decode_service, image_path):
+    expected_image = cv2.cvtColor(cv2.imread(image_path), cv2.COLOR_BGR2RGB)
+    np.testing.assert_array_equal(decode_service.read_image(image_path), expected_image)
+    assert decode_service.read_image(image_path, single_channel=True).shape == (64, 48)
+    assert decode_service.pending_count == 0
+
+def test_decode_service_decodes_small_files_in_thread(image_path):
+    decode_service = DecodeService(max_workers=1, mp_context='fork')
+    future = decode_service.submit(image_path)
+    # Small files are decoded before `submit` returns
+    assert future.done()
+    assert future.result().shape == (64, 48, 3)
+    decode_service.shutdown()
+
+def test_decode_service_bounds_and_cancels_pending_decodes(decode_service, image_path):
+    futures = [decode_service.submit(image_path) for _ in range(2)]
+    with pytest.raises(queue.Full):
+        for _ in range(1000):
+            futures.append(decode_service.submit(image_path, block=False))
+
+    decode_service.cancel_all()
+    for future in futures:
+        assert future.cancelled() or future.result().shape == (64, 48, 3)
+    # Slots are released once the cancelled or finished decodes are done
+    assert decode_service.submit(image_path, timeout=5).result().shape == (64, 48, 3)
+
+def test_decode_service_raises_read_errors(decode_service, tmp_path):
+    with pytest.raises(FileNotFoundError):
+        decode_service.read_image(str(tmp_path / 'missing.png'))
@@ -0,0 +1,104 @@
+import os
+import pytest
+from qtpy import QtCore
+from blackboard.utils.file_index import FileIndex, FileIndexWatcher
+from blackboard.utils.file_path_utils import FilePatternQuery, FilePathWalker
+
+
+@pytest.fixture
+def project_root(tmp_path):
+    for shot_name in ("shot010", "shot020"):
+        render_dir = tmp_path / "shots" / shot_name / "render"
+        render_dir.mkdir(parents=True)
+        for frame in range(1001, 1006):
+            (render_dir / f"beauty.{frame}.exr").write_text("frame")
+        for frame in range(1, 4):
+            (render_dir / f"plate_{frame:04d}.dpx").write_text("frame")
+        (render_dir / "notes.txt").write_text("notes")
+        (render_dir / ".hidden.txt").write_text("hidden")
+    (tmp_path / "shots" / "shot010" / "render" / "temp.log").write_text("log")
+    return tmp_path
+
+@pytest.fixture
+def file_index(tmp_path_factory):
+    file_index = FileIndex(str(tmp_path_factory.mktemp("index") / "file_index.db"))
+    yield file_index
+    file_index.close()
+
+def get_query_results(pattern, file_index=None, **kwargs):
+    results = FilePatternQuery(pattern, file_index=file_index).query_files(**kwargs)
+    return sorted((sorted(result.items()) for result in results), key=str)
+
+def test_index_matches_file_system(project_root, file_index):
+    assert file_index.refresh(str(project_root)) == 6
+
+    indexed_paths = sorted(record.path for record in file_index.iter_files(str(project_root)))
+    assert indexed_paths == sorted(FilePathWalker.traverse_files(project_root, is_skip_hidden=False))
+
+    record = next(record for record in file_index.iter_files(str(project_root / "shots" / "shot020"))
+                  if record.name == "beauty.1001.exr")
+    assert record.sequence == "beauty.####.exr"
+    assert record.size == len("frame")
+    record = next(record for record in file_index.iter_files(str(project_root / "shots" / "shot020"))
+                  if record.name == "plate_0001.dpx")
+    assert record.sequence == "plate_####.dpx"
+
+def test_incremental_refresh(project_root, file_index):
+    file_index.refresh(str(project_root))
+    # Unchanged directories are not scanned again, even by a new instance on the same file
+    reopened_index = FileIndex(file_index.db_path)
+    assert reopened_index.refresh(str(project_root)) == 0
+    reopened_index.close()
+
+    render_dir = project_root / "shots" / "shot010" / "render"
+    (render_dir / "beauty.1006.exr").write_text("frame")
+    (render_dir / "notes.txt").unlink()
+    (project_root / "shots" / "shot020" / "render" / "beauty.1001.exr").rename(project_root / "moved.exr")
+    assert file_index.refresh(str(project_root)) == 3
+
+    indexed_paths = sorted(record.path for record in file_index.iter_files(str(project_root)))
+    assert indexed_paths == sorted(FilePathWalker.traverse_files(project_root, is_skip_hidden=False))
+
+    for path in render_dir.iterdir():
+        path.unlink()
+    render_dir.rmdir()
+    file_index.refresh(str(project_root))
+    assert not file_index.is_indexed(str(render_dir))
+    assert not list(file_index.iter_files(str(render_dir)))
+
+@pytest.mark.parametrize("use_sequence_format", [False, True])
+def test_pattern_query_from_index(project_root, file_index, use_sequence_format):
+    pattern = str(project_root / "shots" / "{shot_name}" / "{department}")
+    # Overlapping filter values match each file once, as on the file system
+    for filters in (None, {'shot_name': ['shot010']}, {'shot_name': ['shot010', 'shot0[1]0', '*']}):
+        kwargs = dict(filters=filters, use_sequence_format=use_sequence_format, excluded_extensions=['log'])
+        assert get_query_results(pattern, file_index, **kwargs) == get_query_results(pattern, **kwargs)
+
+def test_pattern_query_from_index_computes_fields_on_access(project_root, file_index, monkeypatch):
+    file_pattern_query = FilePatternQuery(str(project_root / "shots" / "{shot_name}" / "{department}"), file_index=file_index)
+
+    monkeypatch.setattr(FileIndex, '_get_owner_name', lambda *args: pytest.fail("Owner looked up"))
+    results = list(file_pattern_query.query_files({'shot_name': ['shot020']}))
+    assert sorted(result['file_name'] for result in results) == sorted(
+        path.name for path in (project_root / "shots" / "shot020" / "render").iterdir() if not path.name.startswith('.')
+    )
+    monkeypatch.undo()
+
+    assert all(result['file_owner'] != 'N/A' for result in results)
+
+def test_watcher_updates_index(app, project_root, file_index):
+    watcher = FileIndexWatcher(file_index)
+    watcher.watch(str(project_root))
+    updated_directories = []
+    watcher.directory_updated.connect(updated_directories.append)
+
+    new_dir = project_root / "shots" / "shot030"
+    new_dir.mkdir()
+    event_loop = QtCore.QEventLoop()
+    watcher.directory_updated.connect(lambda _directory: event_loop.quit())
+    QtCore.QTimer.singleShot(5000, event_loop.quit)
+    event_loop.exec_()
+
+    assert str(project_root / "shots") in updated_directories
+    assert file_index.is_indexed(str(new_dir))
+    assert str(new_dir) in watcher.get_watched_directories()
@@ -1,6 +1,6 @@
 import os
 import pytest
-from blackboard.utils.file_path_utils import FileUtil, FilePatternQuery, FilePathWalker
+from blackboard.utils.file_path_utils import FileUtil, FilePatternQuery, FilePathWalker, SequenceFileUtil, FormatStyle
 
 
 # Define a fixture for a sample directory structure
@@ -173,6 +173,36 @@ class TestFilePathWalker:
         result = set(FilePathWalker.traverse_directories(root))
         assert result == expected
 
+    @pytest.mark.parametrize("is_ordered", [True, False])
+    def test_traverse_files_parallel(self, setup_test_directory, is_ordered):
+        root = setup_test_directory
+        serial_files = list(FilePathWalker.traverse_files(root, sort_key=lambda entry: entry.name))
+        parallel_files = list(FilePathWalker.traverse_files(root, sort_key=lambda entry: entry.name,
+                                                            max_workers=4, is_ordered=is_ordered))
+        if is_ordered:
+            assert parallel_files == serial_files
+        else:
+            assert sorted(parallel_files) == sorted(serial_files)
+
+    def test_traverse_files_max_depth(self, setup_test_directory):
+        root = setup_test_directory
+        result_files = set(FilePathWalker.traverse_files(root, max_depth=1, is_return_relative=True, max_workers=4))
+        assert os.path.join("dir1", "file3.txt") in result_files
+        assert os.path.join("dir1", "subdir1", "file1.txt") not in result_files
+        assert os.path.join("dir2", "dir3", "file7.txt") not in result_files
+
+    def test_walk_directories_filter_and_stat(self, setup_test_directory):
+        root = setup_test_directory
+        directories = dict(FilePathWalker.walk_directories(
+            root, max_workers=4, included_extensions=["txt"], is_prefetch_stat=True,
+            directory_filter=lambda entry: entry.name != "dir2",
+        ))
+
+        assert str(root / "dir1" / "subdir1") in directories
+        assert not any(directory.startswith(str(root / "dir2")) for directory in directories)
+        assert [entry.name for entry in directories[str(root / "dir1")]] == ["file3.txt"]
+        assert directories[str(root / "dir1")][0].stat().st_size == len("File 3 content")
+
 class TestFileUtil:
 
     @pytest.mark.parametrize("file_content, expected", [
@@ -193,6 +223,48 @@ class TestFileUtil:
         assert 'file_owner' in file_info
         assert file_info['file_path'] == str(temp_file)
 
+    @pytest.mark.skipif(os.name == 'nt', reason="User names are looked up with pwd")
+    def test_user_names_are_cached_until_expired(self, monkeypatch):
+        import pwd
+        lookup_uids = []
+        get_user_entry = pwd.getpwuid
+
+        def look_up_user(uid):
+            lookup_uids.append(uid)
+            return get_user_entry(uid)
+
+        monkeypatch.setattr(pwd, 'getpwuid', look_up_user)
+        FileUtil.clear_name_cache()
+
+        uid = os.getuid()
+        assert FileUtil.get_user_name(uid) == FileUtil.get_user_name(uid) == get_user_entry(uid).pw_name
+        assert lookup_uids == [uid]
+
+        monkeypatch.setattr(FileUtil, 'NAME_CACHE_TTL', 0)
+        FileUtil.clear_name_cache()
+        FileUtil.get_user_name(uid)
+        FileUtil.get_user_name(uid)
+        assert lookup_uids == [uid, uid, uid]
+
+    def test_extract_file_infos_computes_fields_on_access(self, setup_test_directory, monkeypatch):
+        with os.scandir(setup_test_directory) as entries:
+            file_entries = sorted((entry for entry in entries if entry.is_file()), key=lambda entry: entry.name)
+        file_infos = list(FileUtil.extract_file_infos(file_entries))
+
+        # Reading the name does not stat the file nor look its owner up
+        monkeypatch.setattr(FileUtil, 'get_file_owner', lambda *args: pytest.fail("Owner looked up"))
+        assert [file_info['file_name'] for file_info in file_infos] == [entry.name for entry in file_entries]
+        monkeypatch.undo()
+
+        file_path = str(setup_test_directory / "file1.txt")
+        file_info = next(file_info for file_info in file_infos if file_info.file_path == file_path)
+        assert dict(file_info) == FileUtil.extract_file_info(file_path)
+
+        missing_file_path = str(setup_test_directory / "missing.txt")
+        missing_info, stat_info = FileUtil.extract_file_infos([missing_file_path, (file_path, os.stat(file_path))])
+        assert missing_info['file_owner'] == 'N/A' and missing_info['file_size'] == '0 bytes'
+        assert stat_info['file_size'] == FileUtil.format_size(len("File 1 content"))
+
     @pytest.mark.parametrize("size, precision, expected", [
         (1023, 2, '1023 bytes'),
         (1024, 2, '1.00 kB'),
@@ -203,6 +275,59 @@ class TestFileUtil:
         """Test for format_size method with different sizes and precisions."""
         assert FileUtil.format_size(size, precision) == expected
 
+class TestSequenceFileUtil:
+
+    @pytest.fixture
+    def sequence_directory(self, tmp_path):
+        for frame in (1001, 1002, 1003, 1005):
+            (tmp_path / f"sh010_v002.{frame}.exr").write_bytes(b"x" * frame)
+        for frame in (1, 2):
+            (tmp_path / f"plate.{frame:04d}.0.dpx").write_text("frame")
+        (tmp_path / "sh010_v003.1001.exr").write_text("frame")
+        (tmp_path / "notes.txt").write_text("notes")
+        (tmp_path / ".sh010_v002.1004.exr").write_text("hidden")
+        return tmp_path
+
+    def test_detect_sequences(self, sequence_directory):
+        with os.scandir(sequence_directory) as iterator:
+            sequences, single_entries = SequenceFileUtil.detect_sequences(iterator)
+
+        sequence_by_path = {sequence.get_path(): sequence for sequence in sequences}
+        assert sorted(sequence_by_path) == [
+            str(sequence_directory / "plate.####.0.dpx"),
+            str(sequence_directory / "sh010_v002.####.exr"),
+        ]
+        sequence = sequence_by_path[str(sequence_directory / "sh010_v002.####.exr")]
+        assert sequence.frames == [1001, 1002, 1003, 1005]
+        assert sequence.ranges == ['1001-1003', '1005']
+        assert sequence.missing_frames == [1004]
+        assert sequence.total_size == 1001 + 1002 + 1003 + 1005
+        assert sequence.get_path(FormatStyle.BRACKETS_SEPARATE_RANGES).endswith("sh010_v002.[1001-1003,1005].exr")
+        assert sorted(entry.name for entry in single_entries) == ["notes.txt", "sh010_v003.1001.exr"]
+
+    def test_extract_sequence_file_info(self, sequence_directory):
+        file_info = SequenceFileUtil.extract_file_info(str(sequence_directory / "sh010_v002.####.exr"))
+        assert file_info['sequence_range'] == '1001-1003, 1005'
+        assert file_info['sequence_count'] == 4
+        assert file_info['file_size'] == FileUtil.format_size(1001 + 1002 + 1003 + 1005)
+        assert file_info['file_extension'] == 'exr'
+
+        file_info = SequenceFileUtil.extract_file_info(str(sequence_directory / "sh010_v002.[1001-1002].exr"))
+        assert file_info['sequence_count'] == 2
+
+    def test_query_sequences_from_detected_sequences(self, sequence_directory):
+        assert sorted(FilePathWalker.traverse_files(sequence_directory, use_sequence_format=True, is_return_relative=True)) == [
+            "notes.txt", "plate.####.0.dpx", "sh010_v002.####.exr", "sh010_v003.1001.exr",
+        ]
+
+        results = FilePatternQuery(str(sequence_directory)).query_files(use_sequence_format=True)
+        file_info_by_name = {os.path.basename(file_info['file_path']): file_info for file_info in results}
+        assert sorted(file_info_by_name) == ["notes.txt", "plate.####.0.dpx", "sh010_v002.####.exr", "sh010_v003.1001.exr"]
+        assert file_info_by_name["plate.####.0.dpx"]['sequence_range'] == '1-2'
+        file_info = file_info_by_name["sh010_v002.####.exr"]
+        assert file_info['sequence_range'] == '1001-1003, 1005'
+        assert file_info['file_size'] == FileUtil.format_size(1001 + 1002 + 1003 + 1005)
+
 class TestFilePatternQuery:
 
     def test_file_pattern_query(self, setup_test_directory):
@@ -223,6 +348,52 @@ class TestFilePatternQuery:
         expected_path = os.path.join('dir1', 'subdir1', 'file1.txt')
         assert result['file_path'].endswith(expected_path)
 
+    def test_query_files_computes_fields_on_access(self, setup_test_directory, monkeypatch):
+        file_pattern_query = FilePatternQuery(str(setup_test_directory / "{dir}/{subdir}"))
+
+        # Querying and reading the variables and names does not look the owners up
+        monkeypatch.setattr(FileUtil, 'get_file_owner', lambda *args: pytest.fail("Owner looked up"))
+        results = list(file_pattern_query.query_files({'dir': ['dir1']}))
+        assert [(result['dir'], result['subdir'], result['file_name']) for result in results] == [('dir1', 'subdir1', 'file1.txt')]
+        monkeypatch.undo()
+
+        result = results[0]
+        file_path = str(setup_test_directory / "dir1" / "subdir1" / "file1.txt")
+        assert dict(result) == {'dir': 'dir1', 'subdir': 'subdir1', **FileUtil.extract_file_info(file_path)}
+
+        # Results can be updated like dictionaries
+        result['file_name'] = 'renamed.txt'
+        assert result['file_name'] == 'renamed.txt'
+
+    @pytest.fixture
+    def project_root(self, tmp_path):
+        for project_name in ("ProjectA", "ProjectB", ".ProjectC"):
+            for sequence_name in ("seq_010", "seq_020_extra"):
+                for shot_name in ("shot01", "shot02"):
+                    shot_dir = tmp_path / project_name / sequence_name / shot_name / "work"
+                    shot_dir.mkdir(parents=True)
+                    (shot_dir / "comp.nk").write_text("comp")
+        (tmp_path / "ProjectA" / "seq_010" / "readme.txt").write_text("not a directory")
+        return tmp_path
+
+    @pytest.mark.parametrize("pattern, filters", [
+        ("{project}/seq_{sequence}/{shot}/work", None),
+        ("{project}/seq_{sequence}/{shot}/work", {'project': ['ProjectA'], 'shot': ['shot01', 'shot0*']}),
+        ("{project}/seq_{sequence}_{suffix}/{shot}", {'sequence': ['0[12]0']}),
+        ("{project}/{sequence}", {'project': ['.ProjectC', 'Project?']}),
+        ("ProjectB/seq_010/{shot}/work", {'shot': ['shot02', 'missing']}),
+        ("{project}/seq_{sequence}/{shot}", {'project': ['ProjectB', 'Project*', 'ProjectA'], 'shot': ['shot02', 'shot0[12]']}),
+        ("{project}/seq_{sequence}/{shot}", {'sequence': ['010/shot01', '0*'], 'shot': ['work', '*']}),
+    ])
+    def test_match_search_paths_as_glob(self, project_root, pattern, filters):
+        file_pattern_query = FilePatternQuery(str(project_root / pattern))
+        assert list(file_pattern_query.match_search_paths(filters)) == list(dict.fromkeys(file_pattern_query.construct_search_paths(filters)))
+
+        # Variables are the same as extracted from each file path
+        for data_dict in file_pattern_query.query_files(filters):
+            variables = {name: value for name, value in data_dict.items() if name not in FileUtil.FILE_INFO_FIELDS}
+            assert variables == file_pattern_query.extract_variables(data_dict['file_path'])
+
 
 # Run the tests
 if __name__ == "__main__":
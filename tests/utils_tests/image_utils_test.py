@@ -0,0 +1,162 @@
+import struct
+import numpy as np
+import pytest
+from blackboard.utils.image_utils import ImageReader, DPXReader
+
+
+def pack_10bit_lines(image_data: np.ndarray) -> np.ndarray:
+    """Pack the components of each line back to back from the least significant bit of 32-bit words.
+    """
+    height = image_data.shape[0]
+    components = image_data.reshape(height, -1).astype(np.uint64)
+    words_per_line = -(-components.shape[1] * 10 // 32)
+    bit_positions = np.arange(components.shape[1]) * 10
+    words = np.zeros((height, words_per_line + 1), dtype=np.uint64)
+    for line_index in range(height):
+        values = components[line_index] << (bit_positions & 31).astype(np.uint64)
+        np.bitwise_or.at(words[line_index], bit_positions >> 5, values & 0xFFFFFFFF)
+        np.bitwise_or.at(words[line_index], (bit_positions >> 5) + 1, values >> np.uint64(32))
+    return words[:, :words_per_line].astype(np.uint32)
+
+def encode_rle(image_data: np.ndarray, max_count: int) -> np.ndarray:
+    """Encode pixels as runs of a repeated pixel and of literal pixels.
+    """
+    pixels = image_data.reshape(-1, image_data.shape[-1])
+    datums = []
+    position = 0
+    while position < len(pixels):
+        run_end = position + 1
+        while run_end < len(pixels) and run_end - position < max_count and np.array_equal(pixels[run_end], pixels[position]):
+            run_end += 1
+        if run_end - position > 1:
+            datums += [(run_end - position) << 1 | 1, *pixels[position]]
+        else:
+            datums += [1 << 1, *pixels[position]]
+        position = run_end
+    return np.array(datums)
+
+def write_dpx(file_path, image_data: np.ndarray, depth: int, packing: int = None, rle: bool = False, endianness: str = '>'):
+    """Write a minimal RGB DPX file, uncompressed or run-length encoded.
+    """
+    height, width = image_data.shape[:2]
+    if packing is None:
+        packing = 1 if depth == 10 else 0
+
+    header = bytearray(2048)
+    header[0:4] = b'SDPX' if endianness == '>' else b'XPDS'
+    struct.pack_into(f'{endianness}I', header, 4, len(header))
+    struct.pack_into(f'{endianness}II', header, 772, width, height)
+    header[800] = 50    # RGB
+    header[803] = depth
+    struct.pack_into(f'{endianness}HH', header, 804, packing, 1 if rle else 0)
+
+    if rle:
+        pixel_data = encode_rle(image_data, (1 << (depth - 1)) - 1).astype(f'{endianness}u{depth // 8}')
+    elif depth == 10 and packing == 0:
+        pixel_data = pack_10bit_lines(image_data).astype(f'{endianness}u4')
+    elif depth == 10:
+        pixels = image_data.astype(np.uint32)
+        pixel_data = (pixels[..., 0] << 22) | (pixels[..., 1] << 12) | (pixels[..., 2] << 2)
+        pixel_data = pixel_data.astype(f'{endianness}u4')
+    else:
+        # Pad each line to a 32-bit word
+        lines = image_data.reshape(height, -1).astype(f'{endianness}u2' if depth == 16 else np.uint8)
+        line_size = -(-lines.shape[1] * lines.itemsize // 4) * 4
+        pixel_data = np.zeros((height, line_size), dtype=np.uint8)
+        pixel_data[:, :lines.shape[1] * lines.itemsize] = lines.view(np.uint8)
+
+    with open(file_path, 'wb') as file:
+        file.write(bytes(header))
+        file.write(pixel_data.tobytes())
+
+@pytest.mark.parametrize("depth, max_value", [(8, 0xFF), (10, 0x3FF), (16, 0xFFFF)])
+def test_read_dpx_decimates_rows_and_columns(tmp_path, depth, max_value):
+    rng = np.random.default_rng(0)
+    image_data = rng.integers(0, max_value + 1, size=(64, 48, 3))
+    file_path = str(tmp_path / 'image.dpx')
+    write_dpx(file_path, image_data, depth)
+
+    full_image = DPXReader.read_dpx(file_path)
+    reduced_image = DPXReader.read_dpx(file_path, step=4)
+    assert full_image.shape == (64, 48, 3)
+    assert reduced_image.shape == (16, 12, 3)
+    np.testing.assert_array_equal(reduced_image, full_image[::4, ::4])
+
+    single_channel_image = DPXReader.read_dpx(file_path, step=4, single_channel=True)
+    np.testing.assert_array_equal(single_channel_image, full_image[::4, ::4, 1])
+
+def test_read_image_reduces_dpx_to_target_height(tmp_path):
+    file_path = str(tmp_path / 'image.dpx')
+    write_dpx(file_path, np.zeros((1080, 64, 3)), 8)
+
+    # Decimated images keep twice the target height
+    assert ImageReader.get_reduction_step(file_path, 64) == 8
+    assert ImageReader.get_reduction_step(file_path, 1080) == 1
+    assert ImageReader.read_image(file_path, target_height=64).shape == (135, 8, 3)
+
+def test_read_image_size_from_header(tmp_path):
+    png_path = tmp_path / 'image.png'
+    png_path.write_bytes(b'\x89PNG\r\n\x1a\n' + struct.pack('>I', 13) + b'IHDR' + struct.pack('>II', 4096, 2160) + bytes(5))
+    assert ImageReader.read_image_size(str(png_path)) == (4096, 2160)
+
+    # A JPEG with an APP0 segment before the baseline start of frame
+    jpeg_path = tmp_path / 'image.jpg'
+    jpeg_path.write_bytes(
+        b'\xff\xd8' + b'\xff\xe0' + struct.pack('>H', 6) + b'JFIF' +
+        b'\xff\xc0' + struct.pack('>HBHH', 11, 8, 1080, 1920) + bytes(6)
+    )
+    assert ImageReader.read_image_size(str(jpeg_path)) == (1920, 1080)
+    assert ImageReader.get_reduction_step(str(jpeg_path), 64) == 8
+    assert ImageReader.get_reduction_step(str(jpeg_path), 300) == 2
+
+@pytest.mark.parametrize("depth, packing, endianness", [
+    (8, 0, '>'), (10, 0, '>'), (10, 0, '<'), (10, 1, '>'), (16, 0, '>'), (16, 0, '<'),
+])
+def test_read_dpx_native_values(tmp_path, depth, packing, endianness):
+    rng = np.random.default_rng(0)
+    # An odd width pads the lines and makes packed components straddle words
+    image_data = rng.integers(0, 1 << depth, size=(9, 37, 3))
+    file_path = str(tmp_path / 'image.dpx')
+    write_dpx(file_path, image_data, depth, packing, endianness=endianness)
+
+    native_image = DPXReader.read_dpx(file_path, output_dtype=np.uint16)
+    assert native_image.dtype == np.uint16
+    np.testing.assert_array_equal(native_image, image_data)
+    np.testing.assert_array_equal(DPXReader.read_dpx(file_path, step=3, output_dtype=np.uint16), image_data[::3, ::3])
+
+    normalized_image = DPXReader.read_dpx(file_path, output_dtype=np.float32)
+    np.testing.assert_allclose(normalized_image, image_data / ((1 << depth) - 1), rtol=1e-6)
+
+def test_read_dpx_maps_native_data_without_copy(tmp_path):
+    image_data = np.arange(8 * 12 * 3).reshape(8, 12, 3) % 256
+    file_path = str(tmp_path / 'image.dpx')
+    write_dpx(file_path, image_data, 16, endianness='<')
+
+    native_image = DPXReader.read_dpx(file_path, output_dtype=np.uint16, copy=False)
+    assert not native_image.flags.owndata and not native_image.flags.writeable
+    np.testing.assert_array_equal(native_image, image_data)
+
+    # By default the image is an array of its own, which can be modified in place
+    native_image = DPXReader.read_dpx(file_path, output_dtype=np.uint16)
+    assert native_image.flags.owndata and native_image.flags.writeable
+    native_image += 1
+    np.testing.assert_array_equal(native_image, image_data + 1)
+
+    with pytest.raises(ValueError):
+        DPXReader.read_dpx(file_path, output_dtype=np.uint8)
+
+@pytest.mark.parametrize("depth", [8, 16])
+def test_read_dpx_rle(tmp_path, depth):
+    rng = np.random.default_rng(0)
+    # Runs of repeated pixels longer than a run can hold, between literal pixels
+    image_data = np.repeat(rng.integers(0, 1 << depth, size=(12, 4, 3)), [1, 2, 200, 1], axis=1)
+    file_path = str(tmp_path / 'image.dpx')
+    write_dpx(file_path, image_data, depth, rle=True)
+
+    np.testing.assert_array_equal(DPXReader.read_dpx(file_path, output_dtype=np.uint16), image_data)
+    np.testing.assert_array_equal(DPXReader.read_dpx(file_path, step=2, output_dtype=np.uint16), image_data[::2, ::2])
+
+    with open(file_path, 'r+b') as file:
+        file.truncate(2048 + 16)
+    with pytest.raises(ValueError):
+        DPXReader.read_dpx(file_path)
@@ -0,0 +1,99 @@
+import gc
+import threading
+import weakref
+import numpy as np
+from blackboard.utils.lru_cache import LRUCache
+
+
+def test_lru_cache_sizes_arrays_by_nbytes_and_evicts_least_recent():
+    calls = []
+
+    @LRUCache(max_memory=3 * 1024)
+    def read_frame(frame: int) -> np.ndarray:
+        calls.append(frame)
+        return np.full(256, frame, dtype=np.float32)
+
+    for frame in (1, 2, 3, 1, 4):
+        read_frame(frame)
+
+    # Frame 2 is the least recently used when frame 4 needs room
+    assert calls == [1, 2, 3, 4]
+    assert read_frame.get_current_memory() == 3 * 1024
+    info = read_frame.cache_info()
+    assert (info.hits, info.misses, info.evictions, info.item_count) == (1, 4, 1, 3)
+
+    read_frame(2)
+    assert calls == [1, 2, 3, 4, 2]
+
+    read_frame.clear_cache()
+    assert read_frame.cache_info().item_count == read_frame.get_current_memory() == 0
+
+def test_lru_cache_skips_results_larger_than_the_cache():
+    cache = LRUCache(max_memory=100, sizer=len)
+
+    @cache
+    def make_bytes(size: int) -> bytes:
+        return b'x' * size
+
+    make_bytes(40)
+    make_bytes(1000)
+    assert cache.cache_info().item_count == 1
+    assert cache.current_memory == 40
+
+def test_lru_cache_does_not_keep_instances_alive():
+    class ImageSequence:
+        @LRUCache(max_memory=1024 * 1024)
+        def read_image(self, frame: int) -> np.ndarray:
+            return np.zeros(16, dtype=np.uint8) + frame
+
+    first_sequence, second_sequence = ImageSequence(), ImageSequence()
+    assert first_sequence.read_image(1)[0] == 1
+    assert first_sequence.read_image(1)[0] == 1
+    second_sequence.read_image(1)
+    assert ImageSequence.read_image.cache_info().hits == 1
+
+    sequence_ref = weakref.ref(first_sequence)
+    del first_sequence
+    gc.collect()
+    assert sequence_ref() is None
+
+    # The results of the collected instance are dropped at the next call
+    second_sequence.read_image(2)
+    assert ImageSequence.read_image.cache_info().item_count == 2
+
+def test_lru_cache_attributes_are_exposed_through_instances():
+    class ImageSequence:
+        @LRUCache(max_memory=1024 * 1024)
+        def read_image(self, frame: int) -> np.ndarray:
+            return np.zeros(16, dtype=np.uint8) + frame
+
+    sequence = ImageSequence()
+    sequence.read_image(1)
+    sequence.read_image(1)
+
+    assert sequence.read_image.__name__ == 'read_image'
+    assert sequence.read_image.cache_info().hits == 1
+    assert len(sequence.read_image.cache) == 1
+    assert sequence.read_image.get_current_memory() == 16
+
+    sequence.read_image.clear_cache()
+    assert sequence.read_image.cache_info().item_count == 0
+
+def test_lru_cache_is_thread_safe():
+    @LRUCache(max_memory=64 * 1024)
+    def square(value: int) -> np.ndarray:
+        return np.full(64, value * value, dtype=np.int64)
+
+    def worker(offset: int):
+        for value in range(500):
+            assert square((value + offset) % 200)[0] == ((value + offset) % 200) ** 2
+
+    threads = [threading.Thread(target=worker, args=(offset,)) for offset in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    info = square.cache_info()
+    assert info.hits + info.misses == 8 * 500
+    assert info.current_memory == info.item_count * 512 <= 64 * 1024
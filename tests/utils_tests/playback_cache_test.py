@@ -0,0 +1,98 @@
+import threading
+import pytest
+import numpy as np
+from qtpy import QtCore
+from blackboard.utils.playback_cache import PlaybackCache, FrameState
+from blackboard.utils.thread_pool import ThreadPoolManager
+
+
+FRAME_SIZE = 1000
+
+
+class FakeSequence:
+    def __init__(self, first_frame: int, last_frame: int):
+        self.first_frame, self.last_frame = first_frame, last_frame
+
+    def frame_range(self):
+        return self.first_frame, self.last_frame
+
+    def get_frame_path(self, frame):
+        return str(frame)
+
+def read_frame(file_path: str) -> np.ndarray:
+    if file_path == '13':
+        raise FileNotFoundError(file_path)
+    return np.full(FRAME_SIZE, int(file_path) % 256, dtype=np.uint8)
+
+def wait_until(condition, timeout: int = 10000):
+    event_loop = QtCore.QEventLoop()
+    check_timer = QtCore.QTimer()
+    check_timer.timeout.connect(lambda: condition() and event_loop.quit())
+    check_timer.start(5)
+    QtCore.QTimer.singleShot(timeout, event_loop.quit)
+    event_loop.exec_()
+    check_timer.stop()
+    return condition()
+
+def test_prefetches_window_in_direction_of_travel(app):
+    playback_cache = PlaybackCache(FakeSequence(1, 100), ahead_count=4, behind_count=2, read_image=read_frame)
+    states = []
+    playback_cache.frame_state_changed.connect(lambda frame, state: states.append((frame, state)))
+
+    playback_cache.set_playhead(20)
+    playback_cache.set_playhead(19)
+    assert playback_cache.direction == -1
+    assert playback_cache.get_window_frames() == [19, 18, 17, 16, 15, 20, 21]
+
+    assert wait_until(lambda: not playback_cache.pending_count)
+    # Frames ahead of the first playhead left the window when the direction changed
+    assert playback_cache.cached_frames == [15, 16, 17, 18, 19, 20, 21]
+    assert playback_cache.get_frame_state(22) is FrameState.NONE
+    assert playback_cache.get_frame(17)[0] == 17
+    assert [state for frame, state in states if frame == 17] == [FrameState.QUEUED, FrameState.DECODING, FrameState.CACHED]
+
+def test_failed_frames_are_reported(app):
+    playback_cache = PlaybackCache(FakeSequence(1, 100), ahead_count=2, behind_count=0, read_image=read_frame)
+    playback_cache.set_playhead(12)
+
+    assert wait_until(lambda: not playback_cache.pending_count)
+    assert playback_cache.get_frame_state(13) is FrameState.FAILED
+    assert playback_cache.cached_frames == [12, 14]
+
+def test_jump_cancels_requests_out_of_window(app):
+    release = threading.Event()
+    decoded_files = []
+
+    def read_blocking(file_path):
+        release.wait(10)
+        decoded_files.append(file_path)
+        return read_frame(file_path)
+
+    playback_cache = PlaybackCache(FakeSequence(1, 1000), ahead_count=20, behind_count=0, read_image=read_blocking)
+    playback_cache.set_playhead(1)
+    playback_cache.set_playhead(500)
+    assert all(playback_cache.get_frame_state(frame) is FrameState.NONE for frame in range(2, 22))
+
+    release.set()
+    assert wait_until(lambda: not playback_cache.pending_count)
+    # Only the decodes already running when jumping may have completed
+    assert len([file_path for file_path in decoded_files if int(file_path) < 500]) <= ThreadPoolManager.scheduler().max_concurrency
+    assert set(range(500, 521)) <= set(playback_cache.cached_frames)
+
+def test_memory_budget_evicts_farthest_frames(app):
+    playback_cache = PlaybackCache(FakeSequence(1, 100), memory_budget=FRAME_SIZE * 5, ahead_count=10, behind_count=10,
+                                   read_image=read_frame)
+    playback_cache.set_playhead(50)
+    assert wait_until(lambda: not playback_cache.pending_count)
+
+    # The window shrinks to the budget once the frame size is known
+    assert playback_cache.memory_usage <= FRAME_SIZE * 5
+    assert playback_cache.cached_frames == [50, 51, 52, 53, 54]
+
+    playback_cache.set_playhead(80)
+    assert wait_until(lambda: not playback_cache.pending_count)
+    assert playback_cache.cached_frames == [80, 81, 82, 83, 84]
+
+    playback_cache.clear()
+    assert playback_cache.memory_usage == 0
+    assert playback_cache.get_frame_state(80) is FrameState.NONE
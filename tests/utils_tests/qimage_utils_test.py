@@ -1,6 +1,7 @@
 import pytest
 import numpy as np
-from blackboard.utils.qimage_utils import ThumbnailUtils
+from qtpy import QtCore, QtGui
+from blackboard.utils.qimage_utils import ThumbnailUtils, ThumbnailPipeline
 
 
 @pytest.mark.parametrize("image_data, expected_output", [
@@ -42,5 +43,89 @@ def test_normalize_to_uint8(image_data, expected_output):
     # Assert that the result matches the expected output
     np.testing.assert_array_equal(result, expected_output)
 
+@pytest.fixture(scope="module", autouse=True)
+def disable_disk_cache():
+    # Keep the tests from writing to the user thumbnail cache
+    ThumbnailUtils.set_disk_cache(None)
+
+def write_images(directory, count: int):
+    file_paths = []
+    for index in range(count):
+        image = QtGui.QImage(16, 8, QtGui.QImage.Format_RGB888)
+        image.fill(QtGui.QColor.fromHsv(index % 360, 255, 255))
+        file_path = str(directory / f'image_{index:05d}.png')
+        image.save(file_path)
+        file_paths.append(file_path)
+    return file_paths
+
+def wait_for_thumbnails(pipeline: ThumbnailPipeline, timeout: int = 60000):
+    event_loop = QtCore.QEventLoop()
+    check_timer = QtCore.QTimer()
+    check_timer.timeout.connect(lambda: pipeline.pending_count or event_loop.quit())
+    check_timer.start(10)
+    QtCore.QTimer.singleShot(timeout, event_loop.quit)
+    event_loop.exec_()
+    check_timer.stop()
+
+def test_get_image_thumbnail_scales_to_height(app, tmp_path):
+    file_path, = write_images(tmp_path, 1)
+    image = ThumbnailUtils.get_image_thumbnail(file_path, 4)
+    assert (image.width(), image.height()) == (8, 4)
+    assert ThumbnailUtils.get_image_thumbnail(str(tmp_path / 'missing.png'), 4).isNull()
+
+def test_thumbnail_pipeline_coalesces_requests(app, tmp_path):
+    file_path, = write_images(tmp_path, 1)
+    pipeline = ThumbnailPipeline()
+    loaded = []
+    pipeline.thumbnail_loaded.connect(lambda *args: loaded.append(args))
+
+    # Two views ask for the same thumbnail before it is decoded
+    assert pipeline.request(file_path, 4) is None
+    assert pipeline.request(file_path, 4) is None
+    assert pipeline.pending_count == 1
+    wait_for_thumbnails(pipeline)
+
+    assert len(loaded) == 1
+    assert loaded[0][:2] == (file_path, 4)
+    assert loaded[0][2].height() == 4
+    assert pipeline.request(file_path, 4).cacheKey() == loaded[0][2].cacheKey()
+
+def test_thumbnail_pipeline_calls_back_per_thumbnail(app, tmp_path):
+    first_path, second_path = write_images(tmp_path, 2)
+    pipeline = ThumbnailPipeline()
+    loaded = {first_path: [], second_path: []}
+
+    pipeline.request(first_path, 4, callback=loaded[first_path].append)
+    pipeline.request(second_path, 4, callback=loaded[second_path].append)
+
+    # Callbacks bound to a destroyed object are dropped
+    class Receiver(QtCore.QObject):
+        def on_loaded(self, pixmap):
+            pytest.fail("Destroyed receiver called back")
+
+    receiver = Receiver()
+    pipeline.request(first_path, 4, callback=receiver.on_loaded)
+    receiver.deleteLater()
+    QtCore.QCoreApplication.sendPostedEvents(receiver, QtCore.QEvent.DeferredDelete)
+    wait_for_thumbnails(pipeline)
+
+    # Each callback receives its own thumbnail only
+    assert [pixmap.cacheKey() for pixmap in loaded[first_path]] == [pipeline.request(first_path, 4).cacheKey()]
+    assert [pixmap.cacheKey() for pixmap in loaded[second_path]] == [pipeline.request(second_path, 4).cacheKey()]
+
+def test_thumbnail_pipeline_loads_many_thumbnails_concurrently(app, tmp_path):
+    file_paths = write_images(tmp_path, 10000)
+    pipeline = ThumbnailPipeline(cache_size=len(file_paths))
+    loaded = []
+    pipeline.thumbnail_loaded.connect(lambda file_path, _height, pixmap: loaded.append((file_path, pixmap.isNull())))
+
+    for file_path in file_paths * 2:
+        pipeline.request(file_path, 4)
+    wait_for_thumbnails(pipeline)
+
+    assert pipeline.pending_count == 0
+    assert sorted(file_path for file_path, _ in loaded) == file_paths
+    assert not any(is_null for _, is_null in loaded)
+
 if __name__ == "__main__":
     pytest.main()
@@ -0,0 +1,134 @@
+import pytest
+import threading
+from blackboard.utils.thread_pool import GeneratorWorker
+
+
+def run_worker(worker: GeneratorWorker):
+    items, batches, loaded_all = [], [], []
+    worker.result.connect(items.append)
+    worker.results_batch.connect(batches.append)
+    worker.loaded_all.connect(lambda: loaded_all.append(True))
+    worker.run()
+    return items, batches, bool(loaded_all)
+
+def test_generator_worker_emits_each_item():
+    items, batches, loaded_all = run_worker(GeneratorWorker((index for index in range(5))))
+    assert items == [0, 1, 2, 3, 4]
+    assert batches == []
+    assert loaded_all
+
+@pytest.mark.parametrize("batch_size, expected_sizes", [(2, [2, 2, 1]), (5, [5]), (10, [5])])
+def test_generator_worker_emits_batches(batch_size, expected_sizes):
+    worker = GeneratorWorker((index for index in range(5)), batch_size=batch_size, batch_interval=None)
+    items, batches, loaded_all = run_worker(worker)
+    assert items == []
+    assert [len(batch) for batch in batches] == expected_sizes
+    assert sum(batches, []) == [0, 1, 2, 3, 4]
+    assert loaded_all
+
+def test_generator_worker_flushes_batches_by_time():
+    # With no time budget left, every item is emitted as soon as it arrives
+    worker = GeneratorWorker((index for index in range(3)), batch_size=100, batch_interval=0)
+    _items, batches, _loaded_all = run_worker(worker)
+    assert batches == [[0], [1], [2]]
+
+def test_generator_worker_flushes_batches_while_generator_is_slow():
+    from qtpy import QtCore
+
+    # Partial batches are emitted by the flusher thread, so receive them in the emitting thread
+    batches = []
+    flushed = threading.Event()
+    worker = GeneratorWorker(batch_size=100, batch_interval=20)
+    worker.results_batch.connect(batches.append, QtCore.Qt.ConnectionType.DirectConnection)
+    worker.results_batch.connect(lambda batch: flushed.set(), QtCore.Qt.ConnectionType.DirectConnection)
+
+    def slow_generator():
+        yield 0
+        # The first item is emitted on time although the next one takes much longer
+        flushed_on_time = flushed.wait(2)
+        yield 1
+        yield flushed_on_time
+
+    worker.generator = slow_generator()
+    worker.run()
+    assert batches[0] == [0]
+    assert sum(batches, []) == [0, 1, True]
+
+    # Later runs share the same flusher thread
+    batches.clear()
+    flushed.clear()
+    worker.generator = slow_generator()
+    worker.run()
+    assert sum(batches, []) == [0, 1, True]
+    assert [thread.name for thread in threading.enumerate()].count('GeneratorWorkerFlusher') == 1
+
+def test_generator_worker_pause_keeps_remaining_items():
+    generator = (index for index in range(10))
+    worker = GeneratorWorker(batch_size=100, batch_interval=None)
+
+    def pause_at_third_item():
+        for item in generator:
+            if item == 2:
+                worker.pause()
+            yield item
+
+    worker.generator = pause_at_third_item()
+    _items, batches, loaded_all = run_worker(worker)
+    # The item fetched when the pause is noticed is still emitted, the rest stays in the generator
+    assert batches == [[0, 1, 2]]
+    assert list(generator) == [3, 4, 5, 6, 7, 8, 9]
+    assert not loaded_all
+
+def test_task_scheduler_runs_by_priority_and_cancels(app):
+    from qtpy import QtCore
+    from blackboard.utils.thread_pool import TaskScheduler, TaskPriority
+
+    thread_pool = QtCore.QThreadPool()
+    thread_pool.setMaxThreadCount(1)
+    scheduler = TaskScheduler(thread_pool)
+
+    started = []
+    release = threading.Event()
+    blocker = scheduler.submit(release.wait)
+
+    # Queued behind the running task, in submission order within each priority
+    tasks = [
+        scheduler.submit(started.append, 'prefetch', priority=TaskPriority.PREFETCH),
+        scheduler.submit(started.append, 'background', priority=TaskPriority.BACKGROUND),
+        scheduler.submit(started.append, 'visible_1', priority=TaskPriority.VISIBLE, group='view'),
+        scheduler.submit(started.append, 'visible_2', priority=TaskPriority.VISIBLE),
+        scheduler.submit(started.append, 'interactive', priority=TaskPriority.INTERACTIVE),
+        scheduler.submit(started.append, 'expired', priority=TaskPriority.INTERACTIVE, timeout=0),
+    ]
+    try:
+        tasks[1].cancel()
+        assert scheduler.next_generation('view') == 1
+        # The cancelled, superseded and expired tasks are discarded
+        assert scheduler.pending_count == 3
+    finally:
+        release.set()
+        assert thread_pool.waitForDone(5000)
+
+    assert started == ['interactive', 'visible_2', 'prefetch']
+    assert scheduler.running_count == scheduler.pending_count == 0
+
+def test_thread_pool_manager_replaces_deleted_pool(app, monkeypatch):
+    from blackboard.utils.thread_pool import ThreadPoolManager
+
+    max_thread_count = ThreadPoolManager.thread_pool().maxThreadCount()
+    ThreadPoolManager.set_max_thread_count(3)
+    try:
+        thread_pool, scheduler = ThreadPoolManager.thread_pool(), ThreadPoolManager.scheduler()
+        assert scheduler.max_concurrency == 3
+
+        # As if the application deleted the pool
+        monkeypatch.setattr(ThreadPoolManager, '_is_deleted', staticmethod(lambda thread_pool: True))
+        new_thread_pool = ThreadPoolManager.thread_pool()
+        monkeypatch.undo()
+
+        assert new_thread_pool is not thread_pool
+        assert new_thread_pool.maxThreadCount() == 3
+        assert ThreadPoolManager.scheduler() is not scheduler
+        assert ThreadPoolManager.scheduler().max_concurrency == 3
+    finally:
+        ThreadPoolManager.set_max_thread_count(max_thread_count)
@@ -0,0 +1,51 @@
+import os
+from blackboard.utils.thumbnail_cache import ThumbnailCache
+
+
+def test_thumbnail_cache_persists_thumbnails(tmp_path):
+    db_path = str(tmp_path / 'thumbnails.db')
+    cache = ThumbnailCache(db_path)
+    cache.put('key', b'thumbnail')
+    cache.close()
+
+    cache = ThumbnailCache(db_path)
+    assert cache.get('key') == b'thumbnail'
+    assert cache.get('missing') is None
+    assert cache.total_size == len(b'thumbnail')
+
+def test_thumbnail_cache_key_changes_with_file(tmp_path):
+    file_path = tmp_path / 'image.png'
+    file_path.write_bytes(b'a')
+    key = ThumbnailCache.make_key(str(file_path), 64)
+    assert key == ThumbnailCache.make_key(str(file_path), 64)
+    assert key != ThumbnailCache.make_key(str(file_path), 128)
+
+    file_path.write_bytes(b'ab')
+    assert key != ThumbnailCache.make_key(str(file_path), 64)
+    assert ThumbnailCache.make_key(str(tmp_path / 'missing.png'), 64) is None
+
+def test_thumbnail_cache_evicts_least_recently_used(tmp_path):
+    cache = ThumbnailCache(str(tmp_path / 'thumbnails.db'), max_size=350)
+    for key in ('a', 'b', 'c'):
+        cache.put(key, bytes(100))
+    # Reading 'a' makes 'b' the least recently used
+    assert cache.get('a') is not None
+    cache.put('d', bytes(100))
+
+    assert cache.get('b') is None
+    assert all(cache.get(key) is not None for key in ('a', 'c', 'd'))
+    assert cache.total_size == 300 and cache.item_count == 3
+
+    # Thumbnails larger than the whole cache are not stored
+    cache.put('e', bytes(351))
+    assert cache.get('e') is None
+
+def test_thumbnail_cache_replaces_and_clears(tmp_path):
+    cache = ThumbnailCache(str(tmp_path / 'thumbnails.db'))
+    cache.put('key', bytes(10))
+    cache.put('key', bytes(20))
+    assert cache.total_size == 20 and cache.item_count == 1
+
+    cache.clear()
+    assert cache.total_size == cache.item_count == 0
+    assert os.path.isfile(cache.db_path)